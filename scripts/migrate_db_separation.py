@@ -13,6 +13,14 @@ from pathlib import Path
 
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from app.schema_migrations import get_version, record_version
+
+# schema_version 기록 (구성요소, 버전, 이름) - 이미 적용된 DB에서는 다시 실행하지 않음
+MIGRATION_COMPONENT = 'db_separation'
+MIGRATION_VERSION = 1
+MIGRATION_NAME = 'separate_default_db_and_qc_spec'
 
 def backup_database(db_path):
     """데이터베이스 백업"""
@@ -345,6 +353,14 @@ def main():
     if not os.path.exists(db_path):
         print(f"❌ 데이터베이스 파일을 찾을 수 없습니다: {db_path}")
         return
+
+    conn = sqlite3.connect(db_path)
+    try:
+        if get_version(conn, MIGRATION_COMPONENT) >= MIGRATION_VERSION:
+            print("✓ 이미 적용된 마이그레이션입니다 (schema_version). 스킵.")
+            return
+    finally:
+        conn.close()
     
     # 1. 백업
     backup_path = backup_database(db_path)
@@ -368,7 +384,9 @@ def main():
         # 7. 샘플 데이터 추가
         add_sample_qc_specs(conn)
         
-        # 8. 완료
+        # 8. 완료 (schema_version 기록)
+        record_version(conn, MIGRATION_COMPONENT, MIGRATION_VERSION, MIGRATION_NAME)
+        conn.commit()
         conn.close()
         
         print("=" * 60)
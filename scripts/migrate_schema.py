@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+스키마 마이그레이션 실행/상태 확인 스크립트
+
+schema_version 테이블 기준으로 미적용 단계만 실행합니다 (src/app/schema_migrations.py).
+애플리케이션 시작 시에도 같은 단계가 자동으로 적용되므로, 이 스크립트는 백업 후 미리 적용하거나
+적용 상태를 확인할 때 사용합니다.
+
+대체된 스크립트:
+- migrate_column_unification.py / migrate_add_module_part_to_qc_checklist.py
+  → app.schema v3 (unify_module_part_columns), v4 (unique_checklist_per_module_part)
+
+사용법:
+    python scripts/migrate_schema.py --status
+    python scripts/migrate_schema.py [--db-path PATH] [--component app.schema db_schema] [--skip-backup]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.schema_migrations import get_history, get_version
+
+COMPONENTS = ('app.schema', 'db_schema')
+
+
+def load_schema_module(component):
+    """구성요소 이름 → 스키마 모듈 (DBSchema, SCHEMA_MIGRATIONS 제공)"""
+    if component == 'app.schema':
+        import app.schema as module
+    else:
+        import db_schema as module
+    return module
+
+
+def backup_database(db_path):
+    """
+    데이터베이스 백업 (SQLite 온라인 백업 API)
+
+    WAL 모드에서는 커밋된 페이지가 아직 -wal 파일에만 있을 수 있으므로 파일 복사 대신
+    Connection.backup()으로 WAL 내용까지 포함한 일관된 사본을 만듭니다.
+    """
+    backup_path = f"{db_path}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    source = sqlite3.connect(db_path)
+    target = sqlite3.connect(backup_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+    print(f"✅ 데이터베이스 백업 완료: {backup_path}")
+    return backup_path
+
+
+def print_status(db_path):
+    """구성요소별 적용 버전 / 미적용 단계 출력"""
+    conn = sqlite3.connect(db_path)
+    try:
+        for component in COMPONENTS:
+            migrations = load_schema_module(component).SCHEMA_MIGRATIONS
+            version = get_version(conn, component)
+            pending = [m.name for m in migrations.migrations[version:]]
+            print(f"{component}: v{version} / v{migrations.target_version}"
+                  + (f" (미적용: {', '.join(pending)})" if pending else " (최신)"))
+        print()
+        for component, version, name, applied_at in get_history(conn):
+            print(f"  {applied_at}  {component} v{version}  {name}")
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스키마 마이그레이션 (schema_version 기준 미적용 단계만 실행)')
+    parser.add_argument('--db-path', type=str, help='데이터베이스 파일 경로 (기본값: data/local_db.sqlite)')
+    parser.add_argument('--component', nargs='+', choices=COMPONENTS, default=['app.schema'],
+                        help='마이그레이션할 구성요소 (기본값: app.schema)')
+    parser.add_argument('--status', action='store_true', help='적용 상태만 출력')
+    parser.add_argument('--skip-backup', action='store_true', help='DB 파일 백업 스킵')
+    args = parser.parse_args()
+
+    db_path = args.db_path or os.path.join(project_root, 'data', 'local_db.sqlite')
+    if not os.path.exists(db_path):
+        print(f"❌ 데이터베이스 파일을 찾을 수 없습니다: {db_path}")
+        return 1
+
+    if args.status:
+        print_status(db_path)
+        return 0
+
+    if not args.skip_backup:
+        backup_database(db_path)
+
+    try:
+        for component in args.component:
+            schema = load_schema_module(component).DBSchema(db_path)
+            applied = schema.applied_migrations
+            schema.close()
+            if applied:
+                for migration in applied:
+                    print(f"✅ {component} v{migration.version} ({migration.name}) 적용")
+            else:
+                print(f"✓ {component}: 이미 최신 상태입니다.")
+    except Exception as e:
+        print(f"\n❌ 마이그레이션 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    print()
+    print_status(db_path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
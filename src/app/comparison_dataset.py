@@ -0,0 +1,325 @@
+# 비교 데이터셋 모듈
+# merged_df(긴 형식: 파일 × 파라미터 행)를 파라미터 키 테이블 + (파라미터 × 파일) 값 행렬로 변환
+
+import numpy as np
+import pandas as pd
+
+KEY_COLUMNS = ["Module", "Part", "ItemName"]
+CATEGORY_COLUMNS = ["Module", "Part", "ItemName", "ItemType", "Model"]
+
+# 파일에 값이 없는 셀의 표시 문자열 / 코드
+MISSING_TEXT = "-"
+MISSING_CODE = -1
+
+# 차이 유형 (셀별 비트 플래그, 한 셀이 여러 유형에 해당할 수 있음)
+DIFF_MISSING_IN_DEFAULT = 1   # 파일에는 있지만 Default DB에 없는 파라미터
+DIFF_MISSING_IN_FILE = 2      # 다른 파일에는 있지만 이 파일에 없는 파라미터
+DIFF_VALUE = 4                # 값이 있는 파일끼리 값이 다른 파라미터
+
+DIFF_TYPE_LABELS = {
+    DIFF_VALUE: "값 차이",
+    DIFF_MISSING_IN_FILE: "파일에 없음",
+    DIFF_MISSING_IN_DEFAULT: "Default DB에 없음",
+}
+
+# diff_filter_var 값 → 포함할 차이 유형 플래그
+DIFF_FILTERS = {
+    "all": DIFF_MISSING_IN_DEFAULT | DIFF_MISSING_IN_FILE | DIFF_VALUE,
+    "missing": DIFF_MISSING_IN_DEFAULT | DIFF_MISSING_IN_FILE,
+    "missing_file": DIFF_MISSING_IN_FILE,
+    "missing_default": DIFF_MISSING_IN_DEFAULT,
+    "value": DIFF_VALUE,
+}
+
+
+def categorize_columns(df, columns=CATEGORY_COLUMNS):
+    """
+    반복되는 문자열 컬럼을 categorical(사전 인코딩)로 변환
+
+    파일 수만큼 중복되는 Module/Part/ItemName/ItemType/Model 문자열을
+    고유값 사전 + 정수 코드로 바꿔 메모리를 고유값 수에 비례하게 만듭니다.
+    """
+    for col in columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+class ComparisonDataset:
+    """
+    파일 간 파라미터 비교용 컬럼형 데이터셋
+
+    - keys: (Module, Part, ItemName) 고유 키 테이블 (정렬됨, categorical)
+    - value_codes: (파라미터 수 × 파일 수) int32 행렬, 값 사전(value_categories)의 코드 (없으면 -1)
+    - item_types / item_descriptions: 키별 첫 번째 ItemType / ItemDescription
+    - has_difference: 키별 파일 간 값 차이 여부 (값이 있는 파일끼리 비교)
+    - cell_diffs: (파라미터 수 × 파일 수) int8 차이 유형 플래그 (Default DB 비교 제외)
+    - module_counts / part_counts: 모듈별·파트별 (전체 수, 차이 수)
+    """
+
+    def __init__(self, keys, value_codes, value_categories, file_names,
+                 item_types=None, item_descriptions=None):
+        self.keys = keys
+        self.value_codes = value_codes
+        self.value_categories = value_categories
+        self.file_names = list(file_names)
+        self.item_types = item_types
+        self.item_descriptions = item_descriptions
+
+        # (module, part, item_name) → 행 번호
+        self._key_lookup = {
+            key: row for row, key in enumerate(zip(*(keys[col].tolist() for col in KEY_COLUMNS)))
+        }
+
+        # 차이 플래그 및 모듈/파트별 집계 (로드 시 한 번만 계산)
+        self._present = self._present_mask()
+        self.has_difference = self._compute_has_difference()
+        self.cell_diffs = self._compute_cell_diffs()
+        self.diff_count = int(self.has_difference.sum())
+        self.module_counts, self.part_counts = self._compute_group_counts()
+
+    @classmethod
+    def from_frame(cls, df, file_names):
+        """
+        긴 형식 merged_df로부터 데이터셋 생성
+
+        groupby(["Module", "Part", "ItemName"]) 후 파일별 첫 번째 ItemValue를 취하던
+        기존 뷰 로직과 같은 결과를 한 번의 벡터 연산으로 만듭니다.
+
+        Args:
+            df: Module, Part, ItemName, Model, ItemValue 컬럼을 가진 DataFrame
+            file_names: 값 행렬의 열 순서가 될 파일(Model) 이름 리스트
+        """
+        file_names = list(file_names)
+        if df is None or df.empty or not all(col in df.columns for col in KEY_COLUMNS + ["Model", "ItemValue"]):
+            return cls.empty(file_names)
+
+        frame = df.dropna(subset=KEY_COLUMNS)
+        # (키, 파일)별 첫 번째 행만 사용
+        frame = frame.drop_duplicates(subset=KEY_COLUMNS + ["Model"], keep="first")
+
+        key_frame = (
+            frame[KEY_COLUMNS].astype(str).drop_duplicates()
+            .sort_values(KEY_COLUMNS, kind="mergesort").reset_index(drop=True)
+        )
+        key_index = pd.MultiIndex.from_frame(key_frame)
+        rows = key_index.get_indexer(pd.MultiIndex.from_frame(frame[KEY_COLUMNS].astype(str)))
+        # 확장자만 다른 파일(A.txt / A.csv)은 같은 Model 이름을 가지므로 고유 이름 기준으로 인덱싱하고,
+        # 기존 뷰처럼 같은 이름의 열에는 같은 값(해당 Model의 첫 번째 행)을 표시
+        model_names = pd.Index(file_names).unique()
+        cols = model_names.get_indexer(frame["Model"].astype(str))
+
+        # ItemValue 사전 인코딩 (기존 뷰처럼 str() 변환 기준)
+        value_text = frame["ItemValue"].astype(object).map(str)
+        codes, categories = pd.factorize(value_text, sort=False)
+
+        value_codes = np.full((len(key_frame), len(model_names)), MISSING_CODE, dtype=np.int32)
+        valid = cols >= 0
+        value_codes[rows[valid], cols[valid]] = codes[valid]
+        if len(model_names) != len(file_names):
+            value_codes = value_codes[:, model_names.get_indexer(file_names)]
+
+        item_types = cls._first_per_key(frame, rows, len(key_frame), "ItemType")
+        item_descriptions = cls._first_per_key(frame, rows, len(key_frame), "ItemDescription")
+
+        keys = categorize_columns(key_frame, KEY_COLUMNS)
+        return cls(keys, value_codes, np.asarray(categories, dtype=object), file_names,
+                   item_types, item_descriptions)
+
+    @classmethod
+    def empty(cls, file_names=()):
+        keys = pd.DataFrame({col: pd.Categorical([]) for col in KEY_COLUMNS})
+        codes = np.empty((0, len(file_names)), dtype=np.int32)
+        return cls(keys, codes, np.empty(0, dtype=object), file_names)
+
+    @staticmethod
+    def _first_per_key(frame, rows, n_keys, column):
+        """키별 첫 번째 non-null 값 (없으면 None)"""
+        if column not in frame.columns:
+            return None
+        values = frame[column].astype(object)
+        mask = values.notna().to_numpy()
+        result = pd.Series(values.to_numpy()[mask]).groupby(rows[mask]).first()
+        out = pd.Series([None] * n_keys, dtype=object)
+        out.iloc[result.index.to_numpy()] = result.to_numpy()
+        return out.astype("category")
+
+    def _normalized_codes(self):
+        """값 자체가 "-"인 셀도 기존 뷰처럼 결측(MISSING_CODE)으로 취급한 값 코드"""
+        codes = self.value_codes
+        missing_codes = np.flatnonzero(self.value_categories == MISSING_TEXT)
+        if len(missing_codes):
+            codes = np.where(np.isin(codes, missing_codes), MISSING_CODE, codes)
+        return codes
+
+    def _present_mask(self):
+        """값이 있는 셀 마스크"""
+        return self._normalized_codes() >= 0
+
+    def _compute_has_difference(self):
+        """행별 고유 값 코드 수(결측 제외)가 2 이상인지 벡터 연산으로 계산"""
+        codes = self.value_codes
+        if codes.size == 0:
+            return np.zeros(len(codes), dtype=bool)
+
+        ordered = np.sort(self._normalized_codes(), axis=1)
+        present = ordered >= 0
+        new_value = np.ones_like(present)
+        new_value[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+        distinct = (present & new_value).sum(axis=1)
+        return distinct > 1
+
+    def _compute_cell_diffs(self):
+        """파일에 없음 / 값 차이 셀 플래그 (한 번의 벡터 연산)"""
+        present = self._present
+        flags = np.zeros(present.shape, dtype=np.int8)
+        flags[~present & present.any(axis=1)[:, None]] = DIFF_MISSING_IN_FILE
+        flags[present & self.has_difference[:, None]] |= DIFF_VALUE
+        return flags
+
+    def _compute_group_counts(self):
+        """모듈별 / (모듈, 파트)별 (전체 수, 차이 수)"""
+        if len(self.keys) == 0:
+            return {}, {}
+        frame = pd.DataFrame({
+            "Module": self.keys["Module"].astype(str).to_numpy(),
+            "Part": self.keys["Part"].astype(str).to_numpy(),
+            "diff": self.has_difference,
+        })
+        module_agg = frame.groupby("Module", sort=True)["diff"].agg(["size", "sum"])
+        part_agg = frame.groupby(["Module", "Part"], sort=True)["diff"].agg(["size", "sum"])
+        module_counts = {
+            module: (int(total), int(diff))
+            for module, total, diff in zip(module_agg.index, module_agg["size"], module_agg["sum"])
+        }
+        part_counts = {
+            key: (int(total), int(diff))
+            for key, total, diff in zip(part_agg.index, part_agg["size"], part_agg["sum"])
+        }
+        return module_counts, part_counts
+
+    # ------------------------------------------------------------
+    # 조회 API
+    # ------------------------------------------------------------
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def modules(self):
+        return sorted(self.keys["Module"].unique().tolist())
+
+    @property
+    def parts(self):
+        return sorted(self.keys["Part"].unique().tolist())
+
+    def find(self, module, part, item_name):
+        """키의 행 번호 (없으면 None)"""
+        return self._key_lookup.get((module, part, item_name))
+
+    def key(self, row):
+        return tuple(self.keys[col].iat[row] for col in KEY_COLUMNS)
+
+    def file_values(self, row):
+        """행의 파일별 값 문자열 리스트 (없는 파일은 "-")"""
+        categories = self.value_categories
+        return [categories[code] if code >= 0 else MISSING_TEXT for code in self.value_codes[row]]
+
+    def iter_rows(self, diff_only=False):
+        """
+        (module, part, item_name, file_values, has_difference) 를 키 정렬 순서로 순회
+
+        Args:
+            diff_only: True면 파일 간 값 차이가 있는 행만 순회
+        """
+        columns = [self.keys[col].tolist() for col in KEY_COLUMNS]
+        flags = self.has_difference
+        for row, (module, part, item_name) in enumerate(zip(*columns)):
+            if diff_only and not flags[row]:
+                continue
+            yield module, part, item_name, self.file_values(row), bool(flags[row])
+
+    def classify_differences(self, in_default_db=None):
+        """
+        (파라미터, 파일) 셀 전체를 차이 유형으로 분류
+
+        파일에 없음 / 값 차이는 로드 시 계산한 플래그를 사용하고, Default DB에 없음은
+        in_default_db 행 마스크로 값이 있는 셀에 더합니다.
+
+        Args:
+            in_default_db: 행별 Default DB 존재 여부 (bool 배열, None이면 Default DB 비교 생략)
+
+        Returns:
+            DiffResult
+        """
+        flags = self.cell_diffs
+        if in_default_db is not None and len(self):
+            missing = self._present & ~np.asarray(in_default_db, dtype=bool)[:, None]
+            flags = flags | np.where(missing, DIFF_MISSING_IN_DEFAULT, 0).astype(np.int8)
+        row_index, file_index = np.nonzero(flags)
+        return DiffResult(row_index.astype(np.int32), file_index.astype(np.int32),
+                          flags[row_index, file_index], len(self))
+
+    def item_meta(self, module, part, item_name, default_type='double'):
+        """키의 (ItemType, ItemDescription) 반환"""
+        row = self.find(module, part, item_name)
+        item_type, description = default_type, ''
+        if row is None:
+            return item_type, description
+        if self.item_types is not None and pd.notna(self.item_types.iat[row]):
+            item_type = self.item_types.iat[row]
+        if self.item_descriptions is not None and pd.notna(self.item_descriptions.iat[row]):
+            description = self.item_descriptions.iat[row]
+        return item_type, description
+
+
+class DiffResult:
+    """
+    차이 분류 결과 (차이가 있는 셀만 보관하는 압축 인덱스 배열)
+
+    - row_index / file_index: 셀의 파라미터 행 / 파일 열 번호 (int32, 행 우선 순서)
+    - diff_flags: 셀의 차이 유형 플래그 (int8)
+    - row_flags: 행별 차이 유형 플래그 (셀 플래그의 OR)
+
+    diff_filter_var 변경은 재분류 없이 mask()/rows()로 처리합니다.
+    """
+
+    def __init__(self, row_index, file_index, diff_flags, n_rows):
+        self.row_index = row_index
+        self.file_index = file_index
+        self.diff_flags = diff_flags
+        self.row_flags = np.zeros(n_rows, dtype=np.int8)
+        np.bitwise_or.at(self.row_flags, row_index, diff_flags)
+
+    def __len__(self):
+        return len(self.diff_flags)
+
+    def mask(self, filter_type="all"):
+        """filter_type에 해당하는 셀 마스크"""
+        return (self.diff_flags & DIFF_FILTERS.get(filter_type, DIFF_FILTERS["all"])) != 0
+
+    def rows(self, filter_type="all"):
+        """filter_type에 해당하는 셀이 있는 행 번호 (오름차순 = 키 정렬 순서)"""
+        return np.unique(self.row_index[self.mask(filter_type)])
+
+    def row_counts(self):
+        """차이 유형별 행 수 {레이블: 수}"""
+        return {label: int(((self.row_flags & flag) != 0).sum()) for flag, label in DIFF_TYPE_LABELS.items()}
+
+    def row_labels(self, row):
+        """행의 차이 유형 레이블 리스트"""
+        flags = int(self.row_flags[row])
+        return [label for flag, label in DIFF_TYPE_LABELS.items() if flags & flag]
+
+
+def build_comparison_data(merged_df, file_names):
+    """
+    로드한 긴 형식 merged_df로부터 (ComparisonDataset, ItemValueStore) 생성
+
+    뷰는 데이터셋, Custom QC 검수는 값 저장소만 사용하므로 호출자는 merged_df를 보관하지 않습니다
+    (메모리가 행 수가 아닌 고유값 수에 비례).
+    """
+    from app.item_value_store import ItemValueStore
+    if merged_df is None:
+        return None, None
+    categorize_columns(merged_df)
+    return ComparisonDataset.from_frame(merged_df, file_names), ItemValueStore.from_frame(merged_df)
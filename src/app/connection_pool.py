@@ -0,0 +1,125 @@
+# SQLite 연결 풀 모듈
+# DBSchema.get_connection()이 호출마다 sqlite3.connect/close를 반복하지 않도록 연결을 재사용
+
+import queue
+import sqlite3
+import threading
+import time
+
+# settings.json "service_config" → "database" 기본값
+DEFAULT_POOL_SIZE = 4
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0  # 초, 유휴 연결을 이 시간 이상 쉬었다가 꺼낼 때만 검사
+DEFAULT_BUSY_TIMEOUT = 5.0  # 초, sqlite3.connect(timeout=...)
+
+
+class SQLiteConnectionPool:
+    """
+    스레드 안전한 SQLite 연결 풀
+
+    - pool_size: 유휴 상태로 보관할 최대 연결 수. 풀이 비어 있으면 새 연결을 만들고
+      (중첩 get_connection 호출에서도 대기/교착 없음), 반납 시 풀이 가득 차 있으면 닫습니다.
+    - 반납 시 커밋되지 않은 트랜잭션은 롤백하여, 매번 연결을 닫던 기존 동작과 같게 유지합니다.
+    - 오래 쉰 연결은 꺼낼 때 SELECT 1로 상태를 확인하고, 실패하면 새 연결로 교체합니다.
+    - init_statements: 새 연결마다 실행할 SQL (저장소 프로필 PRAGMA 등)
+    """
+
+    def __init__(self, db_path, pool_size=DEFAULT_POOL_SIZE,
+                 health_check_interval=DEFAULT_HEALTH_CHECK_INTERVAL,
+                 timeout=DEFAULT_BUSY_TIMEOUT, row_factory=None, init_statements=()):
+        self.db_path = db_path
+        self.pool_size = max(0, int(pool_size))
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        self.row_factory = row_factory
+        self.init_statements = list(init_statements)
+
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # 통계 정보
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        for statement in self.init_statements:
+            conn.execute(statement)
+        conn.row_factory = self.row_factory
+        with self._lock:
+            self._created += 1
+        return conn
+
+    def _is_healthy(self, conn):
+        try:
+            conn.execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn):
+        with self._lock:
+            self._discarded += 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def acquire(self):
+        """연결 꺼내기 (유휴 연결이 없거나 풀이 종료된 경우 새로 생성)"""
+        while not self._closed:
+            try:
+                conn, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+
+            idle_for = time.monotonic() - released_at
+            if idle_for >= self.health_check_interval and not self._is_healthy(conn):
+                self._discard(conn)
+                continue
+
+            with self._lock:
+                self._reused += 1
+            return conn
+        return self._connect()
+
+    def release(self, conn):
+        """연결 반납 (미완료 트랜잭션 롤백, 풀이 가득 차거나 종료된 경우 닫기)"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = self.row_factory
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+
+        if self._closed or self._idle.qsize() >= self.pool_size:
+            self._discard(conn)
+            return
+        self._idle.put((conn, time.monotonic()))
+
+    def close_all(self):
+        """풀 종료: 유휴 연결을 모두 닫고, 이후 연결은 반납 시 바로 닫음 (호출 1회용)"""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def get_stats(self):
+        """풀 통계 정보"""
+        with self._lock:
+            return {
+                'pool_size': self.pool_size,
+                'idle': self._idle.qsize(),
+                'created': self._created,
+                'reused': self._reused,
+                'discarded': self._discarded,
+            }
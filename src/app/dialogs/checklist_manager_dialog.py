@@ -486,6 +486,8 @@ class ChecklistManagerDialog:
                       "관리자에 의한 삭제", "Admin"))
 
                 conn.commit()
+                from app.qc.core.checklist_provider import bump_checklist_version
+                bump_checklist_version()
 
             self._refresh_checklist()
             self._refresh_audit_log()
@@ -536,6 +538,8 @@ class ChecklistManagerDialog:
                       f"{action_text}", "Admin"))
 
                 conn.commit()
+                from app.qc.core.checklist_provider import bump_checklist_version
+                bump_checklist_version()
 
             self._refresh_checklist()
             self._refresh_audit_log()
@@ -629,6 +633,8 @@ class ChecklistManagerDialog:
                     """, ("ADD", "QC_Checklist_Items", f"CSV Import: {imported_count}개 항목", "Admin"))
 
                     conn.commit()
+                    from app.qc.core.checklist_provider import bump_checklist_version
+                    bump_checklist_version()
 
             self._refresh_checklist()
             self._refresh_audit_log()
@@ -887,6 +893,8 @@ class ChecklistItemDialog:
                     """, ("MODIFY", "QC_Checklist_Items", item_id, item_name, "항목 수정", "Admin"))
 
                 conn.commit()
+                from app.qc.core.checklist_provider import bump_checklist_version
+                bump_checklist_version()
 
             self.result = True
             self.dialog.destroy()
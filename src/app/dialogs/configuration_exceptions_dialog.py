@@ -358,6 +358,8 @@ class ConfigurationExceptionsDialog:
                       "예외 제거", "Admin"))
 
                 conn.commit()
+                from app.qc.core.checklist_provider import bump_checklist_version
+                bump_checklist_version()
 
             self._refresh_exceptions()
             messagebox.showinfo("성공", "예외가 제거되었습니다.")
@@ -519,6 +521,8 @@ class AddExceptionDialog:
                       reason, approver))
 
                 conn.commit()
+                from app.qc.core.checklist_provider import bump_checklist_version
+                bump_checklist_version()
 
             self.result = True
             self.dialog.destroy()
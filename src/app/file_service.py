@@ -2,11 +2,28 @@
 # manager.py에서 추출된 파일 I/O 관련 기능들
 
 import os
-import pandas as pd
 import sqlite3
 from tkinter import filedialog, messagebox
 
 
+def save_dataframe(df, file_path):
+    """
+    DataFrame을 확장자에 맞는 형식으로 저장 (대화상자 없음 - 백그라운드 작업에서 호출 가능)
+    
+    Args:
+        df: 저장할 DataFrame
+        file_path: .xlsx/.xls면 Excel, 그 외에는 CSV(utf-8-sig)
+        
+    Returns:
+        str: 저장된 파일 경로
+    """
+    if file_path.lower().endswith(('.xlsx', '.xls')):
+        df.to_excel(file_path, index=False)
+    else:
+        df.to_csv(file_path, index=False, encoding='utf-8-sig')
+    return file_path
+
+
 def export_dataframe_to_file(df, default_filename="export", title="데이터 내보내기"):
     """
     DataFrame을 파일로 내보내기
@@ -36,10 +53,7 @@ def export_dataframe_to_file(df, default_filename="export", title="데이터 내
         )
         
         if filename:
-            if filename.endswith('.xlsx'):
-                df.to_excel(filename, index=False)
-            else:
-                df.to_csv(filename, index=False, encoding='utf-8-sig')
+            save_dataframe(df, filename)
             
             messagebox.showinfo("완료", f"데이터가 성공적으로 내보내졌습니다:\n{filename}")
             return filename
@@ -64,6 +78,8 @@ def export_tree_data_to_file(tree_widget, columns, file_names=None, title="보
     Returns:
         str: 저장된 파일 경로 (취소시 None)
     """
+    import pandas as pd
+    
     try:
         file_path = filedialog.asksaveasfilename(
             defaultextension=".xlsx",
@@ -212,6 +228,8 @@ def load_and_merge_files(file_paths):
 
 def load_db_file(file_path, file_name):
     """SQLite DB 파일 로드"""
+    import pandas as pd
+    
     try:
         conn = sqlite3.connect(file_path)
         
@@ -239,6 +257,8 @@ def load_db_file(file_path, file_name):
 
 def load_csv_file(file_path, file_name):
     """CSV 파일 로드"""
+    import pandas as pd
+    
     try:
         # 여러 인코딩 시도
         encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
@@ -262,6 +282,8 @@ def load_csv_file(file_path, file_name):
 
 def load_txt_file(file_path, file_name):
     """텍스트 파일 로드 (탭 구분)"""
+    import pandas as pd
+    
     try:
         # 여러 인코딩 시도
         encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
@@ -285,6 +307,8 @@ def load_txt_file(file_path, file_name):
 
 def merge_dataframes(dataframes):
     """여러 DataFrame들을 병합"""
+    import pandas as pd
+    
     try:
         if not dataframes:
             return None
@@ -0,0 +1,92 @@
+# 인덱스 카탈로그 모듈
+# 자주 실행되는 조회(Default DB / Check list / 예외 / 감사 로그)의 접근 경로를 덮는 인덱스를 한 곳에서 관리
+
+from collections import namedtuple
+
+from app.startup_profiler import profiled
+
+# name: 인덱스 이름, table: 대상 테이블, columns: 인덱스 컬럼 (순서 중요)
+IndexSpec = namedtuple('IndexSpec', ['name', 'table', 'columns'])
+
+# 테이블 구조는 마이그레이션 단계(Phase 1 / 1.5 / 2)에 따라 다르므로,
+# 대상 테이블이나 컬럼이 없는 항목은 건너뜁니다.
+INDEX_CATALOG = (
+    # ConfigurationService.get_default_values_by_configuration: WHERE configuration_id = ? ORDER BY parameter_name
+    IndexSpec('idx_default_values_configuration', 'Default_DB_Values', ('configuration_id', 'parameter_name')),
+    # ChecklistProvider.get_exception_item_ids: WHERE configuration_id = ?
+    IndexSpec('idx_checklist_exceptions_configuration', 'Equipment_Checklist_Exceptions',
+              ('configuration_id', 'checklist_item_id')),
+    # DBSchema.get_equipment_checklist_items: 예외 서브쿼리 / 매핑 조인 (equipment_type_id 기준)
+    IndexSpec('idx_checklist_exceptions_type', 'Equipment_Checklist_Exceptions',
+              ('equipment_type_id', 'checklist_item_id')),
+    IndexSpec('idx_checklist_mapping_type', 'Equipment_Checklist_Mapping', ('equipment_type_id', 'checklist_item_id')),
+    # DBSchema.get_equipment_checklist_items: WHERE is_common = 1 ORDER BY severity_level, item_name
+    IndexSpec('idx_checklist_items_common', 'QC_Checklist_Items', ('is_common', 'severity_level', 'item_name')),
+    # ChecklistProvider.get_active_items: WHERE is_active = 1 ORDER BY module, part, item_name
+    IndexSpec('idx_checklist_items_active', 'QC_Checklist_Items', ('is_active', 'module', 'part', 'item_name')),
+    IndexSpec('idx_qc_checklist_module_part', 'QC_Checklist_Items', ('module', 'part')),
+    # get_checklist_audit_log: ORDER BY timestamp DESC LIMIT ?
+    IndexSpec('idx_checklist_audit_timestamp', 'Checklist_Audit_Log', ('timestamp',)),
+    # Phase 2: 출고 장비 파라미터
+    IndexSpec('idx_shipped_params_equipment', 'Shipped_Equipment_Parameters', ('shipped_equipment_id',)),
+    IndexSpec('idx_shipped_params_name', 'Shipped_Equipment_Parameters', ('parameter_name',)),
+)
+
+
+def _table_columns(cursor, table):
+    cursor.execute(f'PRAGMA table_info("{table}")')
+    return {row[1] for row in cursor.fetchall()}
+
+
+def _existing_indexes(cursor, table):
+    """테이블의 인덱스 {이름: (컬럼, ...)} (UNIQUE 제약 자동 인덱스 포함)"""
+    cursor.execute(f'PRAGMA index_list("{table}")')
+    names = [row[1] for row in cursor.fetchall()]
+    indexes = {}
+    for name in names:
+        cursor.execute(f'PRAGMA index_info("{name}")')
+        indexes[name] = tuple(row[2] for row in sorted(cursor.fetchall(), key=lambda row: row[0]))
+    return indexes
+
+
+@profiled('ensure_indexes')
+def ensure_indexes(conn, catalog=INDEX_CATALOG):
+    """
+    카탈로그의 인덱스를 생성/갱신
+
+    - 대상 테이블 또는 컬럼이 없으면 건너뜀 (skipped)
+    - 같은 컬럼으로 시작하는 인덱스(UNIQUE 자동 인덱스 포함)가 이미 있으면 중복 생성하지 않음 (covered)
+    - 같은 이름의 인덱스가 다른 컬럼으로 정의되어 있으면 삭제 후 다시 생성 (rebuilt)
+
+    Returns:
+        dict: {'created': [...], 'rebuilt': [...], 'covered': [...], 'skipped': [...]}
+    """
+    cursor = conn.cursor()
+    report = {'created': [], 'rebuilt': [], 'covered': [], 'skipped': []}
+
+    for spec in catalog:
+        columns = _table_columns(cursor, spec.table)
+        if not columns or not set(spec.columns) <= columns:
+            report['skipped'].append(spec.name)
+            continue
+
+        indexes = _existing_indexes(cursor, spec.table)
+        current = indexes.pop(spec.name, None)
+        if current == spec.columns:
+            continue
+
+        if current is None and any(cols[:len(spec.columns)] == spec.columns for cols in indexes.values()):
+            report['covered'].append(spec.name)
+            continue
+
+        if current is not None:
+            cursor.execute(f'DROP INDEX IF EXISTS "{spec.name}"')
+            report['rebuilt'].append(spec.name)
+        else:
+            report['created'].append(spec.name)
+
+        column_sql = ', '.join(f'"{col}"' for col in spec.columns)
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS "{spec.name}" ON "{spec.table}"({column_sql})')
+
+    conn.commit()
+    return report
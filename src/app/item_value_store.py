@@ -0,0 +1,60 @@
+# 항목 값 저장소 모듈
+# merged_df(긴 형식)에서 (Model, ItemName) / (Model, Module, Part, ItemName) → 값 사전을 한 번 만들어 O(1) 조회
+
+import pandas as pd
+
+VALUE_COLUMNS = ["Model", "ItemName", "ItemValue"]
+
+
+def _first_values(df, key_columns):
+    """키별 첫 번째 행의 ItemValue 사전 (키 컬럼이 비어 있는 행 제외)"""
+    frame = df[key_columns + ["ItemValue"]].dropna(subset=key_columns)
+    frame = frame.drop_duplicates(subset=key_columns, keep="first")
+    keys = zip(*(frame[col].astype(object).tolist() for col in key_columns))
+    return dict(zip(keys, frame["ItemValue"].astype(object).tolist()))
+
+
+class ItemValueStore:
+    """
+    파일(Model)별 항목 값 조회용 저장소
+
+    기존 merged_df[(ItemName == name) & (Model == file)].iloc[0] 조회와 같은 값(파일 내 첫 번째 행)을
+    사전 조회로 반환합니다. 로드할 때 한 번만 만들고, file_tokens는 파일 내용이 바뀌었는지
+    비교하는 데 씁니다 (증분 QC 검수).
+    """
+
+    def __init__(self, item_values, keyed_values, file_tokens):
+        self.item_values = item_values      # (Model, ItemName) → 값
+        self.keyed_values = keyed_values    # (Model, Module, Part, ItemName) → 값
+        self.file_tokens = file_tokens      # Model → 내용 해시
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        merged_df로부터 저장소 생성
+
+        Args:
+            df: Model, ItemName, ItemValue (및 Module, Part) 컬럼을 가진 DataFrame
+        """
+        if df is None or df.empty or not all(col in df.columns for col in VALUE_COLUMNS):
+            return cls({}, {}, {})
+
+        item_values = _first_values(df, ["Model", "ItemName"])
+        keyed_values = {}
+        if "Module" in df.columns and "Part" in df.columns:
+            keyed_values = _first_values(df, ["Model", "Module", "Part", "ItemName"])
+
+        hashes = pd.util.hash_pandas_object(df[VALUE_COLUMNS], index=False)
+        file_tokens = hashes.groupby(df["Model"].astype(object).to_numpy()).sum().to_dict()
+        return cls(item_values, keyed_values, file_tokens)
+
+    def __len__(self):
+        return len(self.item_values)
+
+    def get(self, model, item_name, default=None):
+        """(파일, ItemName)의 첫 번째 값"""
+        return self.item_values.get((model, item_name), default)
+
+    def get_keyed(self, model, module, part, item_name, default=None):
+        """(파일, Module, Part, ItemName)의 첫 번째 값"""
+        return self.keyed_values.get((model, module, part, item_name), default)
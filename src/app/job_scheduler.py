@@ -0,0 +1,302 @@
+# 백그라운드 작업 스케줄러 모듈
+# 오래 걸리는 작업(파일 로드, QC 검수, 내보내기)을 워커 풀에서 실행하고 결과는 after() 폴링으로 UI 스레드에 전달
+
+import itertools
+import queue
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# 작업 상태
+JOB_PENDING = 'pending'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+# 워커 → UI 이벤트 (kind: 'progress' | 'finished')
+JobEvent = namedtuple('JobEvent', ['kind', 'job', 'value', 'message'])
+
+DEFAULT_POLL_INTERVAL = 50  # ms
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청에 따라 작업 함수가 중단될 때 발생"""
+
+
+class Job:
+    """
+    작업 핸들
+
+    작업 함수(스레드 작업)는 첫 번째 인자로 Job을 받아 report()로 진행 상황을 알리고,
+    check_cancelled()로 취소 요청을 확인합니다. 콜백(on_done/on_error/on_progress/on_cancel)은
+    항상 UI 스레드에서 호출됩니다.
+    """
+
+    def __init__(self, job_id, name, events, on_done=None, on_error=None,
+                 on_progress=None, on_cancel=None):
+        self.id = job_id
+        self.name = name
+        self.status = JOB_PENDING
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+
+        self._events = events
+        self._cancel_event = threading.Event()
+        self._cancel_callbacks = []
+        self._lock = threading.Lock()
+        self._process_future = None
+
+    def __repr__(self):
+        return f"Job({self.id}, {self.name!r}, {self.status})"
+
+    @property
+    def cancelled(self):
+        """취소 요청 여부"""
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self):
+        return self.status in (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+    def cancel(self):
+        """취소 요청 (시작 전이면 실행하지 않고, 실행 중이면 작업 함수가 확인 후 중단)"""
+        with self._lock:
+            if self._cancel_event.is_set():
+                return
+            self._cancel_event.set()
+            callbacks = list(self._cancel_callbacks)
+        # 프로세스 작업은 시작 전이면 future 취소 (스레드 작업은 _run()에서 취소 여부 확인)
+        if self._process_future is not None:
+            self._process_future.cancel()
+        for callback in callbacks:
+            callback()
+
+    def add_cancel_callback(self, callback):
+        """취소 요청 시 호출할 함수 등록 (이미 취소되었으면 즉시 호출)"""
+        with self._lock:
+            if not self._cancel_event.is_set():
+                self._cancel_callbacks.append(callback)
+                return
+        callback()
+
+    def check_cancelled(self):
+        """취소 요청이 있으면 JobCancelled 발생 (작업 함수에서 호출)"""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def report(self, value, message=None):
+        """진행률(0~100)과 상태 문자열 보고 (작업 함수에서 호출)"""
+        self._events.put(JobEvent('progress', self, value, message))
+
+
+class JobScheduler:
+    """
+    Tk 안전 백그라운드 작업 스케줄러
+
+    - submit(): 스레드 풀(기본) 또는 프로세스 풀에서 작업 실행, Job 핸들 반환
+    - 워커는 이벤트 큐에만 쓰고, UI 스레드가 after()로 큐를 비우며 콜백을 호출
+    - 여러 작업을 동시에 실행할 수 있으며, 진행 중인 작업 목록은 status_callback으로 알림
+    """
+
+    def __init__(self, root, max_workers=4, poll_interval=DEFAULT_POLL_INTERVAL, status_callback=None):
+        """
+        Args:
+            root: after()를 제공하는 Tk 위젯 (None이면 poll()을 직접 호출해야 함)
+            max_workers: 스레드 풀 워커 수
+            poll_interval: 이벤트 폴링 주기 (ms)
+            status_callback: 진행 중인 작업 목록이 바뀔 때 상태 문자열로 호출 (상태 표시줄 연동)
+        """
+        self.root = root
+        self.poll_interval = poll_interval
+        self.status_callback = status_callback
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Job")
+        self._process_executor = None
+        self._events = queue.Queue()
+        self._ids = itertools.count(1)
+        self._jobs = {}
+        self._poll_scheduled = False
+
+    # ------------------------------------------------------------
+    # 작업 제출
+    # ------------------------------------------------------------
+    def submit(self, func, *args, name="", on_done=None, on_error=None, on_progress=None,
+               on_cancel=None, use_process=False, **kwargs):
+        """
+        작업 제출
+
+        Args:
+            func: 스레드 작업은 func(job, *args, **kwargs),
+                  프로세스 작업(use_process=True)은 func(*args, **kwargs) (pickle 가능해야 함)
+            name: 상태 표시줄에 표시할 작업 이름
+            on_done(result) / on_error(exception) / on_progress(value, message) / on_cancel():
+                UI 스레드에서 호출되는 콜백
+            use_process: True면 프로세스 풀에서 실행 (진행률 보고 불가, 시작 전까지만 취소 가능)
+
+        Returns:
+            Job
+        """
+        job = Job(next(self._ids), name, self._events, on_done, on_error, on_progress, on_cancel)
+        self._jobs[job.id] = job
+
+        if use_process:
+            future = self._get_process_executor().submit(func, *args, **kwargs)
+            job.status = JOB_RUNNING
+            job._process_future = future
+            future.add_done_callback(lambda f: self._process_finished(job, f))
+        else:
+            self._executor.submit(self._run, job, func, args, kwargs)
+
+        self._notify_status()
+        self._schedule_poll()
+        return job
+
+    def _run(self, job, func, args, kwargs):
+        """워커 스레드에서 작업 실행 (결과/예외는 Job에 기록 후 완료 이벤트)"""
+        if job.cancelled:
+            job.status = JOB_CANCELLED
+        else:
+            job.status = JOB_RUNNING
+            try:
+                job.result = func(job, *args, **kwargs)
+                job.status = JOB_CANCELLED if job.cancelled else JOB_DONE
+            except JobCancelled:
+                job.status = JOB_CANCELLED
+            except Exception as e:
+                job.error = e
+                job.status = JOB_FAILED
+        self._events.put(JobEvent('finished', job, None, None))
+
+    def _process_finished(self, job, future):
+        if future.cancelled():
+            job.status = JOB_CANCELLED
+        elif future.exception() is not None:
+            job.error = future.exception()
+            job.status = JOB_FAILED
+        else:
+            job.result = future.result()
+            job.status = JOB_CANCELLED if job.cancelled else JOB_DONE
+        self._events.put(JobEvent('finished', job, None, None))
+
+    def _get_process_executor(self):
+        if self._process_executor is None:
+            # 프로세스 풀 모듈은 첫 프로세스 작업 시 로드 (시작 시간 단축)
+            from concurrent.futures import ProcessPoolExecutor
+            self._process_executor = ProcessPoolExecutor()
+        return self._process_executor
+
+    # ------------------------------------------------------------
+    # UI 스레드 폴링
+    # ------------------------------------------------------------
+    @property
+    def active_jobs(self):
+        """완료되지 않은 작업 목록 (제출 순서)"""
+        return list(self._jobs.values())
+
+    def _schedule_poll(self):
+        if self.root is None or self._poll_scheduled:
+            return
+        self._poll_scheduled = True
+        self.root.after(self.poll_interval, self._poll_tick)
+
+    def _poll_tick(self):
+        self._poll_scheduled = False
+        self.poll()
+        if self._jobs:
+            self._schedule_poll()
+
+    def poll(self):
+        """
+        쌓인 이벤트를 처리하고 콜백 호출 (UI 스레드에서만 호출)
+
+        한 번의 폴링에서 같은 작업의 진행률 이벤트는 마지막 것만 전달합니다.
+
+        Returns:
+            list: 이번 폴링에서 끝난 Job 목록
+        """
+        progress = {}
+        finished = []
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if event.kind == 'progress':
+                progress[event.job.id] = event
+            else:
+                finished.append(event.job)
+
+        for event in progress.values():
+            job = event.job
+            job.progress = event.value
+            if event.message is not None:
+                job.message = event.message
+            if job.on_progress and not job.done:
+                self._call(job, job.on_progress, job.progress, job.message)
+
+        # 상태 표시줄을 먼저 갱신 (완료 콜백이 설정한 상태 문자열이 남도록)
+        for job in finished:
+            self._jobs.pop(job.id, None)
+        if finished:
+            self._notify_status()
+
+        for job in finished:
+            if job.status == JOB_DONE and job.on_done:
+                self._call(job, job.on_done, job.result)
+            elif job.status == JOB_FAILED:
+                if job.on_error:
+                    self._call(job, job.on_error, job.error)
+                else:
+                    print(f"작업 실패 ({job.name}): {job.error}")
+            elif job.status == JOB_CANCELLED and job.on_cancel:
+                self._call(job, job.on_cancel)
+        return finished
+
+    @staticmethod
+    def _call(job, callback, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"작업 콜백 오류 ({job.name}): {e}")
+
+    def _notify_status(self):
+        if not self.status_callback:
+            return
+        names = [job.name for job in self._jobs.values() if job.name]
+        if names:
+            self.status_callback(f"⏳ 작업 {len(self._jobs)}개 진행 중: {', '.join(names)}")
+        else:
+            self.status_callback(None)
+
+    def wait(self, timeout=None):
+        """
+        모든 작업이 끝날 때까지 poll()을 반복 (테스트/종료 처리용, UI 스레드에서 호출)
+
+        Returns:
+            bool: 시간 안에 모든 작업이 끝났는지 여부
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._jobs:
+            self.poll()
+            if not self._jobs or (deadline is not None and time.monotonic() >= deadline):
+                break
+            time.sleep(0.01)
+        return not self._jobs
+
+    def shutdown(self, cancel=True):
+        """스케줄러 종료 (cancel=True면 진행 중인 작업에 취소 요청)"""
+        if cancel:
+            for job in list(self._jobs.values()):
+                job.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=cancel)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=False, cancel_futures=cancel)
@@ -51,13 +51,20 @@ class LoadingDialog:
     """
     로딩 중임을 알려주는 대화 상자 클래스
     """
-    def __init__(self, parent):
+    def __init__(self, parent, on_cancel=None):
+        """
+        Args:
+            parent: 부모 윈도우
+            on_cancel: 취소 시 호출할 콜백 (지정하면 취소 버튼 표시)
+        """
         self.top = tk.Toplevel(parent)
         self.top.title("로딩 중...")
+        self.on_cancel = on_cancel
+        self.cancelled = False
         
         # 기본 크기 설정
         window_width = 300
-        window_height = 100
+        window_height = 135 if on_cancel else 100
         self.top.geometry(f'{window_width}x{window_height}')
         
         # 모달 설정
@@ -81,17 +88,40 @@ class LoadingDialog:
         self.percentage_label = ttk.Label(self.top, text="0%")
         self.percentage_label.pack(pady=5)
         
-        # 창 닫기 버튼 비활성화
-        self.top.protocol("WM_DELETE_WINDOW", lambda: None)
+        # 취소 가능한 작업이면 취소 버튼 제공, 아니면 창 닫기 버튼 비활성화
+        if on_cancel:
+            self.cancel_button = ttk.Button(self.top, text="취소", command=self.cancel)
+            self.cancel_button.pack(pady=(0, 5))
+            self.top.protocol("WM_DELETE_WINDOW", self.cancel)
+        else:
+            self.top.protocol("WM_DELETE_WINDOW", lambda: None)
         
         # 부모 창 중앙에 배치
         center_dialog_on_parent(self.top, parent)
-    def update_progress(self, value, status_text=None):
+    def update_progress(self, value, status_text=None, refresh=True):
+        """
+        진행률 갱신
+
+        Args:
+            refresh: True면 즉시 화면 갱신 (메인 스레드에서 동기 작업 중일 때),
+                     after() 콜백에서 호출할 때는 False (이벤트 루프가 갱신)
+        """
         self.progress_var.set(value)
         self.percentage_label.config(text=f"{int(value)}%")
         if status_text:
             self.status_label.config(text=status_text)
-        self.top.update()
+        if refresh:
+            self.top.update()
+    def cancel(self):
+        """취소 요청 (콜백 호출 후 버튼 비활성화)"""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.status_label.config(text="취소 중...")
+        if hasattr(self, 'cancel_button'):
+            self.cancel_button.config(state="disabled")
+        if self.on_cancel:
+            self.on_cancel()
     def close(self):
         self.top.grab_release()
         self.top.destroy()
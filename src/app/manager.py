@@ -3,9 +3,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import sys, os
+import json
 from datetime import datetime
 from app.schema import DBSchema
 from app.loading import LoadingDialog
+from app.job_scheduler import JobScheduler
+from app.startup import StartupTimer, SplashScreen, LazyTabs
+from app.startup_profiler import profiled, set_active_timer
+from app.widgets import VirtualTreeview
 # Default DB 기능 제거됨 - 리팩토링으로 중복 코드 정리
 from app.utils import create_treeview_with_scrollbar, create_label_entry_pair, format_num_value
 from app.data_utils import numeric_sort_key, calculate_string_similarity
@@ -45,7 +50,14 @@ except ImportError:
 # 첫 번째 DBManager 클래스 제거됨 - 중복 코드 정리
 
 class DBManager:
-    def __init__(self):
+    def __init__(self, startup=None):
+        """
+        Args:
+            startup: 시작 단계 시간 기록용 StartupTimer (None이면 새로 생성)
+        """
+        self.startup = startup or StartupTimer()
+        set_active_timer(self.startup)  # DBSchema / ServiceFactory 하위 단계 기록 (시작 완료 시 해제)
+        
         # 🆕 새로운 설정 시스템 사용 (기존 코드 유지)
         if USE_NEW_CONFIG:
             self.config = AppConfig()
@@ -57,29 +69,45 @@ class DBManager:
         self.selected_equipment_type_id = None
         self.file_names = []
         self.folder_path = ""
-        self.merged_df = None
+        self.comparison_dataset = None  # 파라미터 × 파일 비교 데이터셋 (로드한 긴 형식 프레임은 보관하지 않음)
+        self.item_value_store = None  # (파일, ItemName) → 값 저장소 (Custom QC 검수용)
         self.context_menu = None
         
         # QC 엔지니어용 탭 프레임들을 저장할 변수들
         self.qc_check_frame = None
         self.default_db_frame = None
         
-        try:
-            self.db_schema = DBSchema()
-        except Exception as e:
-            print(f"DB 스키마 초기화 실패: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            self.db_schema = None
+        # 창을 먼저 만들고 구성이 끝날 때까지 숨긴 채 스플래시 표시
+        with self.startup.phase('window'):
+            # 🆕 아이콘 로드 개선 (기존 코드와 호환)
+            if USE_NEW_CONFIG:
+                self._setup_window_with_new_config()
+            else:
+                self._setup_window_legacy()
+            self.window.withdraw()
+            self.splash = SplashScreen(self.window)
+        
+        self.splash.set_status("데이터베이스 초기화 중...")
+        with self.startup.phase('database'):
+            try:
+                self.db_schema = DBSchema(**self._load_database_config())
+            except Exception as e:
+                print(f"DB 스키마 초기화 실패: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                self.db_schema = None
 
         # 서비스 레이어 초기화 (DB 스키마 초기화 후)
-        self._setup_service_layer()
+        self.splash.set_status("서비스 초기화 중...")
+        with self.startup.phase('services'):
+            self._setup_service_layer()
         
-        # 🆕 아이콘 로드 개선 (기존 코드와 호환)
-        if USE_NEW_CONFIG:
-            self._setup_window_with_new_config()
-        else:
-            self._setup_window_legacy()
+        # 백그라운드 작업 스케줄러 (파일 로드, QC 검수, 내보내기 - 결과는 after() 폴링으로 전달)
+        self.job_scheduler = JobScheduler(self.window, status_callback=self._on_job_status)
+        
+        # 창 닫기 시 DB 연결 풀 / 서비스 정리
+        self.window.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self._schedule_db_maintenance()
         
         # 바인딩 설정
         for key in ('<Control-o>', '<Control-O>'):
@@ -109,8 +137,25 @@ class DBManager:
         # 🆕 FileService 초기화 (파일 처리 관리)
         self.file_service = FileService()
         
-        # 기본적으로는 장비 생산 엔지니어용 탭만 생성
-        self.create_comparison_tabs()
+        # 기본적으로는 장비 생산 엔지니어용 탭만 생성 (첫 탭 외에는 처음 선택할 때 생성)
+        self.splash.set_status("화면 구성 중...")
+        with self.startup.phase('tabs'):
+            self.create_comparison_tabs()
+        
+        # 이벤트 루프가 시작되어 첫 화면을 그린 뒤 준비 완료 처리
+        self.window.after_idle(self._on_startup_ready)
+    
+    def _on_startup_ready(self):
+        """스플래시를 닫고 메인 창 표시, 시작 시간 기록 후 <<StartupReady>> 이벤트 발생"""
+        if self.splash is not None:
+            self.splash.close()
+            self.splash = None
+        self.window.deiconify()
+        report_path = self.startup.finish()
+        self.update_log(f"⏱ {self.startup.summary()}")
+        if report_path:
+            self.update_log(f"⏱ 시작 프로파일 보고서 저장: {report_path}")
+        self.window.event_generate("<<StartupReady>>", when="tail")
 
     def _setup_window_with_new_config(self):
         """새로운 설정 시스템을 사용한 윈도우 설정"""
@@ -154,12 +199,60 @@ class DBManager:
         self.main_notebook.pack(expand=True, fill=tk.BOTH)
         self.comparison_notebook = ttk.Notebook(self.main_notebook)
         self.main_notebook.add(self.comparison_notebook, text="DB 비교")
+        self.comparison_tabs = LazyTabs(self.comparison_notebook)
         self.log_text = tk.Text(self.window, height=5, state=tk.DISABLED)
         self.log_text.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
         log_scrollbar = ttk.Scrollbar(self.log_text, orient="vertical", command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=log_scrollbar.set)
         log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
+    def _load_database_config(self):
+        """settings.json의 service_config.database (연결 풀 / 저장소 프로필 설정) 로드"""
+        self._db_maintenance_interval_ms = 30 * 60 * 1000
+        config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "config", "settings.json")
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                database_config = json.load(f).get('service_config', {}).get('database', {})
+        except (OSError, ValueError):
+            return {}
+        self._db_maintenance_interval_ms = int(database_config.get('maintenance_interval_minutes', 30) * 60 * 1000)
+        return {key: database_config[key] for key in ('pool_size', 'health_check_interval', 'storage_profile')
+                if key in database_config}
+    
+    def _schedule_db_maintenance(self):
+        """주기적 WAL 체크포인트 / PRAGMA optimize 예약"""
+        interval = getattr(self, '_db_maintenance_interval_ms', 0)
+        if not self.db_schema or interval <= 0:
+            return
+        self._db_maintenance_job = self.window.after(interval, self._run_db_maintenance)
+    
+    def _run_db_maintenance(self):
+        try:
+            self.db_schema.run_maintenance()
+        except Exception as e:
+            self.update_log(f"DB 유지보수(체크포인트) 중 오류: {str(e)}")
+        self._schedule_db_maintenance()
+    
+    def on_closing(self):
+        """애플리케이션 종료: 서비스 팩토리 정리 및 DB 연결 풀 종료 후 창 닫기"""
+        try:
+            if getattr(self, '_db_maintenance_job', None):
+                self.window.after_cancel(self._db_maintenance_job)
+            self.job_scheduler.shutdown()
+            if self.service_factory:
+                self.service_factory.cleanup()
+            if self.db_schema:
+                self.db_schema.close()
+        except Exception as e:
+            print(f"종료 정리 중 오류: {str(e)}")
+        finally:
+            self.window.destroy()
+    
+    def _on_job_status(self, text):
+        """백그라운드 작업 목록 변경 시 상태 표시줄 갱신 (작업이 모두 끝나면 None)"""
+        self.status_bar.config(text=text or "Ready")
+    
+    @profiled('DBManager._setup_service_layer')
     def _setup_service_layer(self):
         """🆕 새로운 서비스 레이어 초기화"""
         self.service_factory = None
@@ -253,6 +346,21 @@ class DBManager:
             ]),
         ]
         
+        # 로컬 DB 저장소 프로필 정보
+        if self.db_schema:
+            try:
+                storage = self.db_schema.get_storage_info()
+                sections.append(("Storage (local_db.sqlite)", [
+                    ("Profile", storage['profile']),
+                    ("Journal Mode", storage['journal_mode']),
+                    ("Synchronous", storage['synchronous']),
+                    ("Page Cache", storage['cache_size']),
+                    ("Memory Map", storage['mmap_size']),
+                    ("Temp Store", storage['temp_store']),
+                ]))
+            except Exception as e:
+                self.update_log(f"저장소 정보 조회 중 오류: {str(e)}")
+        
         for section_title, items in sections:
             # 섹션 프레임
             section_frame = ttk.LabelFrame(container, text=section_title, padding="10")
@@ -814,7 +922,7 @@ class DBManager:
         # 모든 탭 업데이트
         if hasattr(self, 'update_all_tabs'):
             # 탭 업데이트는 파일이 로드된 경우에만
-            if self.merged_df is not None:
+            if self.comparison_dataset is not None:
                 self.update_all_tabs()
 
     def enable_maint_features(self):
@@ -852,10 +960,13 @@ class DBManager:
             traceback.print_exc()
 
     def create_comparison_tabs(self):
-        """비교 관련 탭 생성 - 기본 기능만"""
+        """비교 관련 탭 생성 - 기본 기능만 (첫 탭 외에는 처음 선택할 때 생성)"""
+        # 이전에 만든(이미 제거된) 탭 위젯 참조 정리 - 지연 탭이 생성되기 전 갱신 호출은 건너뜀
+        for attr in ('comparison_tree', 'comparison_context_menu', 'diff_only_tree'):
+            self.__dict__.pop(attr, None)
         self.create_grid_view_tab()
-        self.create_comparison_tab()
-        self.create_diff_only_tab()
+        self.comparison_tabs.add("📋 전체 목록", self.create_comparison_tab)
+        self.comparison_tabs.add("🔍 차이점 분석", self.create_diff_only_tab)
         # 보고서, 간단 비교, 고급 분석은 QC 탭으로 이동
 
     def create_qc_tabs_with_advanced_features(self):
@@ -945,42 +1056,48 @@ class DBManager:
         for item in self.qc_report_tree.get_children():
             self.qc_report_tree.delete(item)
             
-        if self.merged_df is not None:
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            for (module, part, item_name), group in grouped:
-                values = [module, part, item_name]
-                for fname in self.file_names:
-                    model_data = group[group["Model"] == fname]
-                    if not model_data.empty:
-                        values.append(str(model_data["ItemValue"].iloc[0]))
-                    else:
-                        values.append("-")
-                self.qc_report_tree.insert("", "end", values=values)
+        if self.comparison_dataset is not None:
+            for module, part, item_name, file_values, _ in self.comparison_dataset.iter_rows():
+                self.qc_report_tree.insert("", "end", values=[module, part, item_name] + file_values)
+
+    def create_diff_only_tab(self, diff_tab=None):
+        """
+        차이만 보기 탭 생성
 
-    def create_diff_only_tab(self):
-        """차이만 보기 탭 생성"""
-        diff_tab = ttk.Frame(self.comparison_notebook)
-        self.comparison_notebook.add(diff_tab, text="🔍 차이점 분석")
+        Args:
+            diff_tab: 내용을 채울 탭 프레임 (None이면 새 탭 추가)
+        """
+        if diff_tab is None:
+            diff_tab = ttk.Frame(self.comparison_notebook)
+            self.comparison_notebook.add(diff_tab, text="🔍 차이점 분석")
         
         # 상단 정보 패널
         control_frame = ttk.Frame(diff_tab)
         control_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self.diff_only_count_label = ttk.Label(control_frame, text="값이 다른 항목: 0개")
+        # 차이 유형 필터 - 미리 분류한 결과에 마스크만 적용 (재분류 없음)
+        ttk.Label(control_frame, text="필터:").pack(side=tk.LEFT, padx=(5, 5))
+        if not hasattr(self, 'diff_filter_var'):
+            self.diff_filter_var = tk.StringVar(value="value")
+        for text, value in (("값 차이", "value"), ("파일에 없음", "missing_file"),
+                            ("Default DB에 없음", "missing_default"), ("모든 차이", "all")):
+            ttk.Radiobutton(
+                control_frame, text=text, value=value,
+                variable=self.diff_filter_var, command=self.update_diff_only_view
+            ).pack(side=tk.LEFT, padx=5)
+        
+        self.diff_only_count_label = ttk.Label(control_frame, text="차이 항목: 0개")
         self.diff_only_count_label.pack(side=tk.RIGHT, padx=10)
         
         # 트리뷰 생성
-        if self.file_names:
-            columns = ["Module", "Part", "ItemName"] + self.file_names
-        else:
-            columns = ["Module", "Part", "ItemName"]
+        columns = ["Module", "Part", "ItemName"] + list(self.file_names) + ["차이 유형"]
             
-        self.diff_only_tree = ttk.Treeview(diff_tab, columns=columns, show="headings", selectmode="extended")
+        self.diff_only_tree = VirtualTreeview(diff_tab, columns=columns, show="headings", selectmode="extended")
         
         # 헤딩 설정
         for col in columns:
             self.diff_only_tree.heading(col, text=col)
-            if col in ["Module", "Part", "ItemName"]:
+            if col in ["Module", "Part", "ItemName", "차이 유형"]:
                 self.diff_only_tree.column(col, width=120)
             else:
                 self.diff_only_tree.column(col, width=150)
@@ -999,51 +1116,61 @@ class DBManager:
         self.update_diff_only_view()
 
     def update_diff_only_view(self):
-        """차이점만 보기 탭 업데이트 - 하이라이트 제거"""
+        """차이점만 보기 탭 업데이트 - 차이 유형 필터(diff_filter_var)는 분류 결과의 마스크로 적용"""
         if not hasattr(self, 'diff_only_tree'):
             return
             
-        for item in self.diff_only_tree.get_children():
-            self.diff_only_tree.delete(item)
+        self.diff_only_tree.clear()
         
         diff_count = 0
-        if self.merged_df is not None:
+        counts_text = ""
+        dataset = self.comparison_dataset
+        if dataset is not None:
             # 컬럼 업데이트
-            columns = ["Module", "Part", "ItemName"] + self.file_names
+            columns = ["Module", "Part", "ItemName"] + self.file_names + ["차이 유형"]
             self.diff_only_tree["columns"] = columns
             
             for col in columns:
                 self.diff_only_tree.heading(col, text=col)
-                if col in ["Module", "Part", "ItemName"]:
+                if col in ["Module", "Part", "ItemName", "차이 유형"]:
                     self.diff_only_tree.column(col, width=120)
                 else:
                     self.diff_only_tree.column(col, width=150)
             
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            
-            for (module, part, item_name), group in grouped:
-                # 각 파일별 값 추출
-                file_values = {}
-                for model in self.file_names:
-                    model_data = group[group["Model"] == model]
-                    if not model_data.empty:
-                        file_values[model] = str(model_data["ItemValue"].iloc[0])
-                    else:
-                        file_values[model] = "-"
-                
-                # 차이점이 있는지 확인
-                unique_values = set(v for v in file_values.values() if v != "-")
-                if len(unique_values) > 1:
-                    # 차이점이 있는 항목만 추가 (하이라이트 없이)
-                    row_values = [module, part, item_name]
-                    row_values.extend([file_values.get(model, "-") for model in self.file_names])
-                    
-                    self.diff_only_tree.insert("", "end", values=row_values)
-                    diff_count += 1
+            diff_result = self._get_diff_result()
+            filter_type = self.diff_filter_var.get() if hasattr(self, 'diff_filter_var') else "value"
+            for row in diff_result.rows(filter_type):
+                module, part, item_name = dataset.key(row)
+                row_values = ([module, part, item_name] + dataset.file_values(row)
+                              + [", ".join(diff_result.row_labels(row))])
+                self.diff_only_tree.insert("", "end", values=row_values)
+                diff_count += 1
+            counts_text = " (" + ", ".join(
+                f"{label} {count}" for label, count in diff_result.row_counts().items()) + ")"
         
         # 차이점 카운트 업데이트
         if hasattr(self, 'diff_only_count_label'):
-            self.diff_only_count_label.config(text=f"값이 다른 항목: {diff_count}개")
+            self.diff_only_count_label.config(text=f"차이 항목: {diff_count}개{counts_text}")
+
+    def _get_diff_result(self):
+        """
+        비교 데이터셋의 차이 분류 결과 (데이터셋 또는 Default DB 인덱스가 바뀌었을 때만 다시 분류)
+
+        Default DB 존재 여부는 check_if_parameter_exists와 같은 (소문자 Module, ItemName) 기준입니다.
+        """
+        dataset = self.comparison_dataset
+        default_index = self.get_default_parameter_index()
+        cached = getattr(self, '_diff_result_cache', None)
+        if cached is not None and cached[0] is dataset and cached[1] is default_index:
+            return cached[2]
+
+        in_default_db = None
+        if default_index:
+            modules = dataset.keys["Module"].astype(str).str.lower().tolist()
+            in_default_db = [key in default_index for key in zip(modules, dataset.keys["ItemName"].tolist())]
+        diff_result = dataset.classify_differences(in_default_db)
+        self._diff_result_cache = (dataset, default_index, diff_result)
+        return diff_result
 
     def create_report_tab(self):
         report_tab = ttk.Frame(self.comparison_notebook)
@@ -1068,23 +1195,42 @@ class DBManager:
     def update_report_view(self):
         for item in self.report_tree.get_children():
             self.report_tree.delete(item)
-        if self.merged_df is not None:
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
-            for (module, part, item_name), group in grouped:
-                values = [module, part, item_name]
-                for fname in self.file_names:
-                    values.append(group[fname].iloc[0] if fname in group else "")
-                self.report_tree.insert("", "end", values=values)
+        if self.comparison_dataset is not None:
+            for module, part, item_name, file_values, _ in self.comparison_dataset.iter_rows():
+                self.report_tree.insert("", "end", values=[module, part, item_name] + file_values)
 
     def export_report(self):
-        """보고서 내보내기 기능"""
+        """보고서 내보내기 기능 (파일 쓰기는 백그라운드 작업)"""
+        import pandas as pd
+        from app.file_service import save_dataframe
+        
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel 파일", "*.xlsx"), ("CSV 파일", "*.csv"), ("모든 파일", "*.*")],
+            title="보고서 내보내기"
+        )
+        if not file_path:
+            return None
+        
         try:
-            columns = ["Module", "Part", "ItemName"]
-            return self.file_service.export_tree_data(
-                self.report_tree, columns, self.file_names, "보고서 내보내기"
-            )
+            # TreeView 데이터는 UI 스레드에서 추출
+            columns = ["Module", "Part", "ItemName"] + list(self.file_names)
+            data = [self.report_tree.item(item)["values"] for item in self.report_tree.get_children()]
         except Exception as e:
             messagebox.showerror("오류", f"보고서 내보내기 중 오류 발생: {str(e)}")
+            return None
+        
+        def on_done(path):
+            self.file_service.last_export_path = os.path.dirname(path)
+            self.update_log(f"📥 보고서 내보내기: {path}")
+            messagebox.showinfo("완료", "보고서가 성공적으로 저장되었습니다.")
+        
+        self.job_scheduler.submit(
+            lambda job: save_dataframe(pd.DataFrame(data, columns=columns), file_path),
+            name="보고서 내보내기", on_done=on_done,
+            on_error=lambda e: messagebox.showerror("오류", f"보고서 내보내기 중 오류 발생: {str(e)}")
+        )
+        return file_path
 
 
     def load_folder(self, event=None):
@@ -1104,67 +1250,64 @@ class DBManager:
         if not files:
             self.status_bar.config(text="파일 선택이 취소되었습니다.")
             return
-        loading_dialog = LoadingDialog(self.window)
+        # 병렬 로더: 백그라운드 작업에서 워커 풀로 파싱하고 비교 데이터셋/값 저장소까지 만든 뒤
+        # UI 스레드에는 위젯 갱신만 남김 (진행 상황은 작업 스케줄러가 전달)
+        from app.parallel_loader import ParallelFileLoader, LoadResult
+        loader = ParallelFileLoader(files)
+        loading_dialog = LoadingDialog(self.window, on_cancel=lambda: job.cancel())
+        loading_dialog.update_progress(0, "파일 로딩 준비 중...")
+
+        def load(job):
+            from app.comparison_dataset import build_comparison_data
+            job.add_cancel_callback(loader.cancel)
+            result = loader.load(progress_callback=lambda event: job.report(
+                (event.completed / event.total) * 70,
+                f"파일 로딩 중... ({event.completed}/{event.total})"
+            ))
+            if result.cancelled or result.merged_df is None:
+                return result, (None, None)
+            job.check_cancelled()
+            job.report(75, "데이터 병합 중...")
+            comparison_data = build_comparison_data(result.merged_df, result.file_names)
+            # 긴 형식 프레임은 UI 스레드로 넘기지 않음
+            return result._replace(merged_df=None), comparison_data
+
+        job = self.job_scheduler.submit(
+            load, name="DB 파일 로드",
+            on_progress=lambda value, message: loading_dialog.update_progress(value, message, refresh=False),
+            on_done=lambda loaded: self._on_folder_loaded(loaded[0], loading_dialog, files, loaded[1]),
+            on_cancel=lambda: self._on_folder_loaded(LoadResult(None, [], {}, [], True), loading_dialog, files),
+            on_error=lambda e: self._on_folder_loaded(LoadResult(None, [], {}, [("", str(e))], False),
+                                                      loading_dialog, files)
+        )
+
+    def _on_folder_loaded(self, result, loading_dialog, files, comparison_data=(None, None)):
+        """
+        파일 로드 작업 완료 처리 (UI 스레드, 위젯 갱신만 수행)
+
+        Args:
+            result: LoadResult (merged_df는 작업에서 비교 데이터로 변환한 뒤 비워짐)
+            comparison_data: 작업에서 만든 (ComparisonDataset, ItemValueStore)
+        """
+        dataset, store = comparison_data
         try:
-            import pandas as pd
-            import os
-            import sqlite3
-            df_list = []
-            self.file_names = []
-            # 🆕 QC 파일 선택을 위한 uploaded_files 딕셔너리 생성
-            self.uploaded_files = {}
-            total_files = len(files)
-            loading_dialog.update_progress(0, "파일 로딩 준비 중...")
-            for idx, file in enumerate(files, 1):
-                try:
-                    progress = (idx / total_files) * 70
-                    loading_dialog.update_progress(
-                        progress,
-                        f"파일 로딩 중... ({idx}/{total_files})"
-                    )
-                    file_name = os.path.basename(file)
-                    base_name = os.path.splitext(file_name)[0]
-                    ext = os.path.splitext(file_name)[1].lower()
-                    if ext == '.txt':
-                        df = pd.read_csv(file, delimiter="\t", dtype=str)
-                        # 텍스트 파일의 필수 컬럼 확인 및 추가
-                        required_columns = ['Module', 'Part', 'ItemName', 'ItemType', 'ItemValue', 'ItemDescription']
-                        if all(col in df.columns for col in required_columns):
-                            # 표준 텍스트 파일 형식: ItemType 정보 보존
-                            df = df[required_columns].copy()
-                        else:
-                            # 호환성을 위한 fallback: 기본 컬럼명 추가
-                            if 'ItemType' not in df.columns:
-                                df['ItemType'] = 'double'  # 기본값
-                            if 'ItemDescription' not in df.columns:
-                                df['ItemDescription'] = ''
-                    elif ext == '.csv':
-                        df = pd.read_csv(file, dtype=str)
-                        # CSV 파일에서도 ItemType 보존 시도
-                        if 'ItemType' not in df.columns:
-                            df['ItemType'] = 'double'  # 기본값
-                    elif ext == '.db':
-                        conn = sqlite3.connect(file)
-                        df = pd.read_sql("SELECT * FROM main_table", conn)
-                        conn.close()
-                        # DB 파일에서도 ItemType 보존 시도
-                        if 'ItemType' not in df.columns:
-                            df['ItemType'] = 'double'  # 기본값
-                    
-                    df["Model"] = base_name
-                    df_list.append(df)
-                    self.file_names.append(base_name)
-                    # 🆕 QC 파일 선택을 위해 파일 정보 저장
-                    self.uploaded_files[file_name] = file
-                except Exception as e:
-                    messagebox.showwarning(
-                        "경고", 
-                        f"'{file_name}' 파일 로드 중 오류 발생:\n{str(e)}"
-                    )
-            if df_list:
+            if result.cancelled:
+                loading_dialog.close()
+                self.status_bar.config(text="파일 로드가 취소되었습니다.")
+                self.update_log("[파일 로드] 사용자에 의해 취소되었습니다.")
+                return
+            if result.errors:
+                messagebox.showwarning(
+                    "경고",
+                    "다음 파일 로드 중 오류 발생:\n" +
+                    "\n".join(f"• {name}: {msg}" for name, msg in result.errors)
+                )
+            if dataset is not None:
+                self.file_names = result.file_names
+                # 🆕 QC 파일 선택을 위해 파일 정보 저장
+                self.uploaded_files = result.uploaded_files
                 self.folder_path = os.path.dirname(files[0])
-                loading_dialog.update_progress(75, "데이터 병합 중...")
-                self.merged_df = pd.concat(df_list, ignore_index=True)
+                self.comparison_dataset, self.item_value_store = dataset, store
                 loading_dialog.update_progress(85, "화면 업데이트 중...")
                 self.update_all_tabs()
                 loading_dialog.update_progress(100, "완료!")
@@ -1175,13 +1318,13 @@ class DBManager:
                 
                 messagebox.showinfo(
                     "로드 완료",
-                    f"총 {len(df_list)}개의 DB 파일을 성공적으로 로드했습니다.\n"
+                    f"총 {len(self.file_names)}개의 DB 파일을 성공적으로 로드했습니다.\n"
                     f"• 폴더: {self.folder_path}\n"
                     f"• 파일: {', '.join(self.file_names)}\n"
                     f"• QC 검수 파일 선택 가능: {len(self.uploaded_files)}개"
                 )
                 self.status_bar.config(
-                    text=f"총 {len(df_list)}개의 DB 파일이 로드되었습니다. "
+                    text=f"총 {len(self.file_names)}개의 DB 파일이 로드되었습니다. "
                          f"(폴더: {os.path.basename(self.folder_path)})"
                 )
             else:
@@ -1235,7 +1378,7 @@ class DBManager:
 
         
         # 메인 트리뷰 생성 (계층 구조)
-        self.grid_tree = ttk.Treeview(grid_frame, selectmode="extended")
+        self.grid_tree = VirtualTreeview(grid_frame, selectmode="extended")
         
         # 동적 컬럼 설정
         if self.file_names:
@@ -1273,10 +1416,9 @@ class DBManager:
             return
             
         # 기존 데이터 삭제
-        for item in self.grid_tree.get_children():
-            self.grid_tree.delete(item)
+        self.grid_tree.clear()
         
-        if self.merged_df is None or self.merged_df.empty:
+        if self.comparison_dataset is None or len(self.comparison_dataset) == 0:
             # 통계 정보 초기화
             if hasattr(self, 'grid_total_label'):
                 self.grid_total_label.config(text="총 파라미터: 0개")
@@ -1338,69 +1480,35 @@ class DBManager:
                                     background="#FFECB3", 
                                     foreground="#E65100")
         
-        # 계층 구조 데이터 구성
-        modules_data = {}
-        total_params = 0
-        diff_count = 0
-        
-        grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
+        # 계층 구조 데이터 추가 - 비교 데이터셋은 (Module, Part, ItemName) 정렬 상태이며
+        # 차이 플래그와 모듈/파트별 집계가 미리 계산되어 있음
+        dataset = self.comparison_dataset
+        module_node = part_node = None
+        current_module = current_part = None
         
-        for (module, part, item_name), group in grouped:
-            if module not in modules_data:
-                modules_data[module] = {}
-            if part not in modules_data[module]:
-                modules_data[module][part] = {}
-            
-            # 각 파일별 값 수집
-            values = []
-            for model in self.file_names:
-                model_data = group[group["Model"] == model]
-                if not model_data.empty:
-                    values.append(str(model_data["ItemValue"].iloc[0]))
+        for module_name, part_name, item_name, values, has_difference in dataset.iter_rows():
+            if module_name != current_module:
+                current_module, current_part = module_name, None
+                module_total, module_diff = dataset.module_counts[module_name]
+                
+                # 모듈 표시 - 파란색 통일
+                if module_diff == 0:
+                    module_text = f"📁 {module_name} ({module_total})"
                 else:
-                    values.append("-")
-            
-            # 값 차이 확인 (빈 값 제외)
-            non_empty_values = [v for v in values if v != "-"]
-            has_difference = len(set(non_empty_values)) > 1 if len(non_empty_values) > 1 else False
-            
-            modules_data[module][part][item_name] = {
-                "values": values,
-                "has_difference": has_difference
-            }
-            total_params += 1
-            if has_difference:
-                diff_count += 1
-        
-        # 트리뷰에 계층 구조로 데이터 추가
-        for module_name in sorted(modules_data.keys()):
-            # 모듈 레벨 통계 계산
-            module_total = sum(len(modules_data[module_name][part]) for part in modules_data[module_name])
-            module_diff = sum(1 for part in modules_data[module_name] 
-                            for item in modules_data[module_name][part] 
-                            if modules_data[module_name][part][item]["has_difference"])
-            
-            # 모듈 표시 - 파란색 통일
-            if module_diff == 0:
-                module_text = f"📁 {module_name} ({module_total})"
-            else:
-                module_text = f"📁 {module_name} ({module_total}) Diff: {module_diff}"
-            module_tag = "module"
-            
-            # 모듈 노드 추가
-            module_node = self.grid_tree.insert("", "end", 
-                                               text=module_text, 
-                                               values=[""] * len(columns), 
-                                               open=True,
-                                               tags=(module_tag,))
-            
-            for part_name in sorted(modules_data[module_name].keys()):
-                # 파트 레벨 통계 계산
-                part_total = len(modules_data[module_name][part_name])
-                part_diff = sum(1 for item in modules_data[module_name][part_name] 
-                              if modules_data[module_name][part_name][item]["has_difference"])
+                    module_text = f"📁 {module_name} ({module_total}) Diff: {module_diff}"
+                
+                # 모듈 노드 추가
+                module_node = self.grid_tree.insert("", "end", 
+                                                   text=module_text, 
+                                                   values=[""] * len(columns), 
+                                                   open=True,
+                                                   tags=("module",))
+            
+            if part_name != current_part:
+                current_part = part_name
+                part_total, part_diff = dataset.part_counts[(module_name, part_name)]
                 
-                # 파트 표시 - 차이가 없으면 초록색, 있으면 회색
+                # 파트 표시 - 차이가 없으면 초록색, 있으면 빨간색
                 if part_diff == 0:
                     part_text = f"📂 {part_name} ({part_total})"
                     part_tag = "part_clean"
@@ -1414,36 +1522,34 @@ class DBManager:
                                                  values=[""] * len(columns), 
                                                  open=True,
                                                  tags=(part_tag,))
-                
-                for item_name in sorted(modules_data[module_name][part_name].keys()):
-                    # 파라미터 노드 추가 - 기본 크기, 차이점에 따라 색상 구분
-                    item_data = modules_data[module_name][part_name][item_name]
-                    values = item_data["values"]
-                    has_difference = item_data["has_difference"]
-                    
-                    # 태그 선택
-                    tag = "parameter_different" if has_difference else "parameter_same"
-                    
-                    self.grid_tree.insert(part_node, "end", 
-                                        text=item_name, 
-                                        values=values, 
-                                        tags=(tag,))
+            
+            # 파라미터 노드 추가 - 기본 크기, 차이점에 따라 색상 구분
+            tag = "parameter_different" if has_difference else "parameter_same"
+            self.grid_tree.insert(part_node, "end", 
+                                text=item_name, 
+                                values=values, 
+                                tags=(tag,))
         
         # 통계 정보 업데이트
         if hasattr(self, 'grid_total_label'):
-            self.grid_total_label.config(text=f"총 파라미터: {total_params}")
-            self.grid_modules_label.config(text=f"모듈 수: {len(modules_data)}")
-            
-            total_parts = sum(len(parts) for parts in modules_data.values())
-            self.grid_parts_label.config(text=f"파트 수: {total_parts}")
+            self.grid_total_label.config(text=f"총 파라미터: {len(dataset)}")
+            self.grid_modules_label.config(text=f"모듈 수: {len(dataset.module_counts)}")
+            self.grid_parts_label.config(text=f"파트 수: {len(dataset.part_counts)}")
             
             # 차이점 개수도 표시
             if hasattr(self, 'grid_diff_label'):
-                self.grid_diff_label.config(text=f"값이 다른 항목: {diff_count}")
+                self.grid_diff_label.config(text=f"값이 다른 항목: {dataset.diff_count}")
+
+    def create_comparison_tab(self, comparison_frame=None):
+        """
+        전체 목록 탭 생성
 
-    def create_comparison_tab(self):
-        comparison_frame = ttk.Frame(self.comparison_notebook)
-        self.comparison_notebook.add(comparison_frame, text="📋 전체 목록")
+        Args:
+            comparison_frame: 내용을 채울 탭 프레임 (None이면 새 탭 추가)
+        """
+        if comparison_frame is None:
+            comparison_frame = ttk.Frame(self.comparison_notebook)
+            self.comparison_notebook.add(comparison_frame, text="📋 전체 목록")
         style = ttk.Style()
         style.configure("Custom.Treeview", rowheight=22)
         
@@ -1523,7 +1629,7 @@ class DBManager:
             columns = ["Checkbox", "Module", "Part", "ItemName"] + self.file_names
         else:
             columns = ["Module", "Part", "ItemName"] + self.file_names
-        self.comparison_tree = ttk.Treeview(comparison_frame, selectmode="extended", style="Custom.Treeview")
+        self.comparison_tree = VirtualTreeview(comparison_frame, selectmode="extended", style="Custom.Treeview")
         self.comparison_tree["columns"] = columns
         self.comparison_tree.heading("#0", text="", anchor="w")
         self.comparison_tree.column("#0", width=0, stretch=False)
@@ -1678,26 +1784,22 @@ class DBManager:
     def _update_comparison_filter_options(self):
         """전체 목록 탭 필터 옵션 업데이트"""
         try:
-            if not hasattr(self, 'merged_df') or self.merged_df is None:
+            if self.comparison_dataset is None:
                 return
                 
             # Module 옵션 업데이트
-            if 'Module' in self.merged_df.columns:
-                modules = sorted(self.merged_df['Module'].dropna().unique())
-                module_values = ["All"] + list(modules)
-                if hasattr(self, 'comparison_module_filter_combo'):
-                    self.comparison_module_filter_combo['values'] = module_values
-                    if not self.comparison_module_filter_var.get():
-                        self.comparison_module_filter_var.set("All")
-            
+            module_values = ["All"] + self.comparison_dataset.modules
+            if hasattr(self, 'comparison_module_filter_combo'):
+                self.comparison_module_filter_combo['values'] = module_values
+                if not self.comparison_module_filter_var.get():
+                    self.comparison_module_filter_var.set("All")
+
             # Part 옵션 업데이트
-            if 'Part' in self.merged_df.columns:
-                parts = sorted(self.merged_df['Part'].dropna().unique())
-                part_values = ["All"] + list(parts)
-                if hasattr(self, 'comparison_part_filter_combo'):
-                    self.comparison_part_filter_combo['values'] = part_values
-                    if not self.comparison_part_filter_var.get():
-                        self.comparison_part_filter_var.set("All")
+            part_values = ["All"] + self.comparison_dataset.parts
+            if hasattr(self, 'comparison_part_filter_combo'):
+                self.comparison_part_filter_combo['values'] = part_values
+                if not self.comparison_part_filter_var.get():
+                    self.comparison_part_filter_var.set("All")
                         
         except Exception as e:
             print(f"Comparison filter options update error: {e}")
@@ -1712,20 +1814,15 @@ class DBManager:
         # 체크된 항목들 수집
         selected_items = []
         if any(self.item_checkboxes.values()):
-            # 체크박스가 하나라도 선택된 경우
+            # 체크박스가 하나라도 선택된 경우 - 트리뷰 행을 키로 한 번만 색인
+            row_ids = {}
+            for child_id in self.comparison_tree.get_children():
+                values = self.comparison_tree.item(child_id, 'values')
+                if len(values) >= 4:
+                    row_ids[f"{values[1]}_{values[2]}_{values[3]}"] = child_id
             for item_key, is_checked in self.item_checkboxes.items():
-                if is_checked:
-                    # item_key에서 module, part, item_name 분리
-                    parts = item_key.split('_')
-                    if len(parts) >= 3:
-                        module, part, item_name = parts[0], parts[1], '_'.join(parts[2:])
-                        
-                        # 트리뷰에서 해당 항목 찾기
-                        for child_id in self.comparison_tree.get_children():
-                            values = self.comparison_tree.item(child_id, 'values')
-                            if len(values) >= 4 and values[1] == module and values[2] == part and values[3] == item_name:
-                                selected_items.append(child_id)
-                                break
+                if is_checked and item_key in row_ids:
+                    selected_items.append(row_ids[item_key])
         else:
             # 체크박스가 선택되지 않은 경우, 트리뷰에서 직접 선택된 항목 사용
             selected_items = self.comparison_tree.selection()
@@ -2044,26 +2141,11 @@ class DBManager:
                 except (ValueError, TypeError):
                     pass
             
-            # ItemType 정보 추출 (merged_df에서 해당 파라미터의 ItemType 찾기)
+            # ItemType 정보 추출 (비교 데이터셋에서 해당 파라미터의 ItemType 찾기)
             item_type = 'double'  # 기본값
             item_description = ''  # 기본값
-            if hasattr(self, 'merged_df') and self.merged_df is not None:
-                # 현재 아이템과 동일한 Module, Part, ItemName을 가진 행에서 ItemType과 ItemDescription 찾기
-                matching_rows = self.merged_df[
-                    (self.merged_df['Module'] == module) & 
-                    (self.merged_df['Part'] == part) & 
-                    (self.merged_df['ItemName'] == item_name)
-                ]
-                if not matching_rows.empty:
-                    if 'ItemType' in matching_rows.columns:
-                        item_type_values = matching_rows['ItemType'].dropna().unique()
-                        if len(item_type_values) > 0:
-                            item_type = item_type_values[0]  # 첫 번째 값 사용
-                    
-                    if 'ItemDescription' in matching_rows.columns:
-                        item_desc_values = matching_rows['ItemDescription'].dropna().unique()
-                        if len(item_desc_values) > 0:
-                            item_description = item_desc_values[0]  # 첫 번째 값 사용
+            if self.comparison_dataset is not None:
+                item_type, item_description = self.comparison_dataset.item_meta(module, part, item_name)
             
             stats_info = {
                 'param_name': param_name,
@@ -2112,8 +2194,7 @@ class DBManager:
         Returns:
             tuple: (추가된 개수, 업데이트된 개수, 제외된 개수)
         """
-        added_count = 0
-        updated_count = 0
+        records = []
         skipped_count = 0
         
         for param_name, stats in stats_analysis.items():
@@ -2122,47 +2203,44 @@ class DBManager:
                 self.update_log(f"'{param_name}' 제외 - 낮은 신뢰도: {stats['confidence_score']*100:.1f}%")
                 continue
             
-            try:
-                # 기존 항목 확인
-                existing_stats = self.db_schema.get_parameter_statistics(type_id, param_name)
-                
-                # 최소/최대 사양 계산 (수치인 경우)
-                min_spec = None
-                max_spec = None
-                if stats['is_numeric']:
-                    # 평균 ± 2σ 범위를 사양으로 설정
-                    mean = stats['mean']
-                    std = stats['std']
-                    min_spec = str(round(mean - 2 * std, 3))
-                    max_spec = str(round(mean + 2 * std, 3))
-                
-                record_id = self.db_schema.add_default_value(
-                    type_id, 
-                    param_name, 
-                    stats['most_common_value'],
-                    min_spec,
-                    max_spec,
-                    stats['occurrence_count'],
-                    stats['total_files'],
-                    stats['source_files'],
-                    description=stats.get('item_description', ''),
-                    module_name=stats.get('module', ''),
-                    part_name=stats.get('part', ''),
-                    item_type=stats.get('item_type', 'double')
-                )
-                
-                if existing_stats:
-                    updated_count += 1
-                    self.update_log(f"'{param_name}' 업데이트 완료 - 신뢰도: {stats['confidence_score']*100:.1f}%")
-                else:
-                    added_count += 1
-                    self.update_log(f"'{param_name}' 추가 완료 - 신뢰도: {stats['confidence_score']*100:.1f}%")
-                
-            except Exception as e:
-                skipped_count += 1
-                self.update_log(f"'{param_name}' 처리 실패: {e}")
+            # 최소/최대 사양 계산 (수치인 경우)
+            min_spec = None
+            max_spec = None
+            if stats['is_numeric']:
+                # 평균 ± 2σ 범위를 사양으로 설정
+                mean = stats['mean']
+                std = stats['std']
+                min_spec = str(round(mean - 2 * std, 3))
+                max_spec = str(round(mean + 2 * std, 3))
+            
+            records.append({
+                'parameter_name': param_name,
+                'default_value': stats['most_common_value'],
+                'min_spec': min_spec,
+                'max_spec': max_spec,
+                'occurrence_count': stats['occurrence_count'],
+                'total_files': stats['total_files'],
+                'confidence_score': stats['confidence_score'],
+                'source_files': stats['source_files'],
+                'description': stats.get('item_description', ''),
+                'module': stats.get('module', ''),
+                'part': stats.get('part', ''),
+                'item_type': stats.get('item_type', 'double'),
+            })
+        
+        if not records:
+            return 0, 0, skipped_count
+        
+        # 단일 트랜잭션으로 추가/업데이트 (감사 로그 포함)
+        try:
+            result = self.db_schema.bulk_upsert_default_values(type_id, records)
+        except Exception as e:
+            self.update_log(f"파라미터 일괄 저장 실패 (전체 롤백): {e}")
+            return 0, 0, skipped_count + len(records)
         
-        return added_count, updated_count, skipped_count
+        self.update_log(f"Default DB 일괄 저장 완료 - 추가 {result['added']}개, "
+                        f"업데이트 {result['updated']}개, 제외 {skipped_count + result['skipped']}개")
+        return result['added'], result['updated'], skipped_count + result['skipped']
 
     def add_parameters_simple(self, type_id, selected_items):
         """
@@ -2176,59 +2254,42 @@ class DBManager:
         Returns:
             int: 추가된 항목 개수
         """
-        count = 0
+        records = []
+        col_offset = 1 if self.maint_mode else 0  # 유지보수 모드 여부에 따라 인덱스 조정
+        source_file = self.file_names[0] if self.file_names else ""
+        
         for item_id in selected_items:
             item_values = self.comparison_tree.item(item_id, "values")
-            
-            # 유지보수 모드 여부에 따라 인덱스 조정
-            col_offset = 1 if self.maint_mode else 0
             module, part, item_name = item_values[col_offset], item_values[col_offset+1], item_values[col_offset+2]
             
-            # 첫 번째 파일의 값을 사용
-            value = item_values[col_offset+3] 
+            # 첫 번째 파일의 값을 사용 (ItemName만 사용하여 통일)
+            value = item_values[col_offset+3]
             
-            param_name = item_name  # ItemName만 사용하여 통일
-            
-            # merged_df에서 ItemType과 ItemDescription 정보 추출
+            # 비교 데이터셋에서 ItemType과 ItemDescription 정보 추출
             item_type = 'double'  # 기본값
             item_description = ''  # 기본값
-            if hasattr(self, 'merged_df') and self.merged_df is not None:
-                matching_rows = self.merged_df[
-                    (self.merged_df['Module'] == module) & 
-                    (self.merged_df['Part'] == part) & 
-                    (self.merged_df['ItemName'] == item_name)
-                ]
-                if not matching_rows.empty:
-                    if 'ItemType' in matching_rows.columns:
-                        item_type_values = matching_rows['ItemType'].dropna().unique()
-                        if len(item_type_values) > 0:
-                            item_type = item_type_values[0]
-                    
-                    if 'ItemDescription' in matching_rows.columns:
-                        item_desc_values = matching_rows['ItemDescription'].dropna().unique()
-                        if len(item_desc_values) > 0:
-                            item_description = item_desc_values[0]
-            
-            try:
-                record_id = self.db_schema.add_default_value(
-                    type_id, param_name, value, None, None, 1, 1, self.file_names[0],
-                    description=item_description,
-                    module_name=module,
-                    part_name=part,
-                    item_type=item_type
-                )
-                
-                self.db_schema.log_change_history(
-                    "add", "parameter", param_name, "", 
-                    f"default: {value}, source: {self.file_names[0]}", "admin"
-                )
-                
-                count += 1
-                self.update_log(f"'{param_name}' 추가 성공 (ID: {record_id})")
-            except Exception as e:
-                self.update_log(f"'{param_name}' 추가 실패: {e}")
+            if self.comparison_dataset is not None:
+                item_type, item_description = self.comparison_dataset.item_meta(module, part, item_name)
+            
+            records.append({
+                'parameter_name': item_name,
+                'default_value': value,
+                'source_files': source_file,
+                'description': item_description,
+                'module': module,
+                'part': part,
+                'item_type': item_type,
+            })
+        
+        # 단일 트랜잭션으로 추가 (기존 파라미터는 건너뜀, 감사 로그 포함)
+        try:
+            result = self.db_schema.bulk_upsert_default_values(type_id, records, update_existing=False)
+        except Exception as e:
+            self.update_log(f"파라미터 일괄 추가 실패 (전체 롤백): {e}")
+            return 0
         
-        return count
+        self.update_log(f"Default DB 일괄 추가 완료 - 추가 {result['added']}개, 건너뜀 {result['skipped']}개")
+        return result['added']
 
     def on_search_changed(self, event=None):
         """검색어 변경 시 필터링"""
@@ -2255,8 +2316,9 @@ class DBManager:
         self.update_checked_count()
 
     def update_comparison_view(self, search_filter=""):
-        for item in self.comparison_tree.get_children():
-            self.comparison_tree.delete(item)
+        if not hasattr(self, 'comparison_tree'):
+            return  # 탭이 아직 생성되지 않음 (처음 선택할 때 생성하며 갱신)
+        self.comparison_tree.clear()
         
         saved_checkboxes = self.item_checkboxes.copy()
         self.item_checkboxes.clear()
@@ -2270,31 +2332,14 @@ class DBManager:
         total_items = 0
         filtered_items = 0
         
-        if self.merged_df is not None:
-            # 파라미터별로 그룹화하여 비교
-            grouped = self.merged_df.groupby(["Module", "Part", "ItemName"])
+        if self.comparison_dataset is not None:
+            # Default DB 존재 인덱스 (갱신당 한 번 조회)
+            existing_index = self.get_default_parameter_index()
             
-            for (module, part, item_name), group in grouped:
+            # 파라미터별 파일 값 비교 (비교 데이터셋 사용) - 가상 트리뷰 모델에 전체 행 등록
+            for module, part, item_name, file_values, has_difference in self.comparison_dataset.iter_rows():
                 total_items += 1
                 
-                # 검색 필터링 적용
-                if search_filter and search_filter not in item_name.lower():
-                    continue
-                
-                # Module 필터링 적용
-                if hasattr(self, 'comparison_module_filter_var'):
-                    module_filter = self.comparison_module_filter_var.get()
-                    if module_filter and module_filter != "All" and module != module_filter:
-                        continue
-                
-                # Part 필터링 적용
-                if hasattr(self, 'comparison_part_filter_var'):
-                    part_filter = self.comparison_part_filter_var.get()
-                    if part_filter and part_filter != "All" and part != part_filter:
-                        continue
-                
-                filtered_items += 1
-                
                 values = []
                 
                 if self.maint_mode:
@@ -2306,35 +2351,24 @@ class DBManager:
                     values.append(checkbox_state)
                 
                 values.extend([module, part, item_name])
-                
-                # 각 파일별 값 추출 및 비교
-                file_values = []
-                for model in self.file_names:
-                    model_data = group[group["Model"] == model]
-                    if not model_data.empty:
-                        value = model_data["ItemValue"].iloc[0]
-                        file_values.append(str(value))
-                    else:
-                        file_values.append("-")
-                
                 values.extend(file_values)
                 
-                # 차이점 검사 - 모든 값이 동일한지 확인
-                unique_values = set(v for v in file_values if v != "-")
-                has_difference = len(unique_values) > 1
-                
                 tags = []
                 if has_difference:
                     tags.append("different")
-                    diff_count += 1
                 
-                # Default DB에 존재하는지 확인
-                is_existing = self.check_if_parameter_exists(module, part, item_name)
-                if is_existing:
+                # Default DB에 존재하는지 확인 (ItemName 기준)
+                if (str(module).lower(), item_name) in existing_index:
                     tags.append("existing")
                 
                 self.comparison_tree.insert("", "end", values=values, tags=tuple(tags))
             
+            # 검색 / Module / Part 필터는 모델 수준 필터로 적용 (행 재생성 없음)
+            row_filter = self._build_comparison_row_filter(search_filter)
+            self.comparison_tree.set_filter(row_filter)
+            filtered_items = self.comparison_tree.visible_count()
+            diff_count = self.comparison_tree.visible_count(lambda row: "different" in row['tags'])
+            
             # 스타일 설정
             self.comparison_tree.tag_configure("different", background="#FFECB3", foreground="#E65100")
             self.comparison_tree.tag_configure("existing", foreground="#1976D2")
@@ -2370,6 +2404,29 @@ class DBManager:
             else:
                 self.comparison_filter_result_label.config(text="")
 
+    def _build_comparison_row_filter(self, search_filter=""):
+        """전체 목록 탭의 검색어 / Module / Part 필터를 가상 트리뷰 행 필터로 변환"""
+        module_filter = self.comparison_module_filter_var.get() if hasattr(self, 'comparison_module_filter_var') else ""
+        part_filter = self.comparison_part_filter_var.get() if hasattr(self, 'comparison_part_filter_var') else ""
+        module_filter = "" if module_filter == "All" else module_filter
+        part_filter = "" if part_filter == "All" else part_filter
+        if not (search_filter or module_filter or part_filter):
+            return None
+        
+        col_offset = 1 if self.maint_mode else 0
+        
+        def row_filter(row):
+            module, part, item_name = row['values'][col_offset:col_offset + 3]
+            if search_filter and search_filter not in str(item_name).lower():
+                return False
+            if module_filter and module != module_filter:
+                return False
+            if part_filter and part != part_filter:
+                return False
+            return True
+        
+        return row_filter
+
     def create_comparison_context_menu(self):
         self.comparison_context_menu = tk.Menu(self.window, tearoff=0)
         self.comparison_context_menu.add_command(label="선택한 항목을 Default DB에 추가", command=self.add_to_default_db)
@@ -2436,20 +2493,19 @@ class DBManager:
         checked_count = sum(1 for checked in self.item_checkboxes.values() if checked)
         self.selected_count_label.config(text=f"체크된 항목: {checked_count}개")
 
-    def check_if_parameter_exists(self, module, part, item_name):
+    def get_default_parameter_index(self):
+        """Default DB 존재 인덱스 {(소문자 장비 유형명, 파라미터명)} 조회 (DBSchema 캐시 사용)"""
+        if self.db_schema is None:
+            return frozenset()
         try:
-            equipment_types = self.db_schema.get_equipment_types()
-            for type_id, type_name, _ in equipment_types:
-                if type_name.lower() == module.lower():
-                    default_values = self.db_schema.get_default_values(type_id)
-                    for _, param_name, _, _, _, _ in default_values:
-                        # ItemName만으로 체크하도록 통일
-                        if param_name == item_name:
-                            return True
-            return False
+            return self.db_schema.get_default_parameter_index()
         except Exception as e:
-            self.update_log(f"DB_ItemName 존재 여부 확인 중 오류: {str(e)}")
-            return False
+            self.update_log(f"DB_ItemName 존재 인덱스 조회 중 오류: {str(e)}")
+            return frozenset()
+
+    def check_if_parameter_exists(self, module, part, item_name):
+        # ItemName만으로 체크하도록 통일
+        return (str(module).lower(), item_name) in self.get_default_parameter_index()
 
     def disable_maint_features(self):
         """유지보수 모드 비활성화 - QC 엔지니어용 탭들을 제거합니다."""
@@ -6077,6 +6133,7 @@ class DBManager:
             if success:
                 self.custom_qc_config.save_config()
                 self.load_qc_specs_for_selected_type()
+                self.refresh_custom_qc_inspection(equipment_type)
                 self.update_log(f"✅ QC 스펙 추가: {equipment_type} - {item_name_var.get()}")
                 dialog.destroy()
                 messagebox.showinfo("성공", "QC 스펙이 추가되었습니다.")
@@ -6168,6 +6225,7 @@ class DBManager:
             self.custom_qc_config.add_spec_item(equipment_type, updated_spec)
             self.custom_qc_config.save_config()
             self.load_qc_specs_for_selected_type()
+            self.refresh_custom_qc_inspection(equipment_type)
             self.update_log(f"✅ QC 스펙 수정: {equipment_type} - {old_item_name}")
             dialog.destroy()
             messagebox.showinfo("성공", "QC 스펙이 수정되었습니다.")
@@ -6194,6 +6252,7 @@ class DBManager:
             
             self.custom_qc_config.save_config()
             self.load_qc_specs_for_selected_type()
+            self.refresh_custom_qc_inspection(equipment_type)
             self.update_log(f"✅ {len(selected)}개 QC 스펙 삭제: {equipment_type}")
             messagebox.showinfo("완료", f"{len(selected)}개 항목이 삭제되었습니다.")
     
@@ -6736,20 +6795,30 @@ class DBManager:
             import traceback
             traceback.print_exc()
     
-    def run_custom_qc_inspection(self):
-        """QC 스펙 관리 탭의 스펙으로 검수 실행"""
+    def run_custom_qc_inspection(self, quiet=False):
+        """
+        QC 스펙 관리 탭의 스펙으로 검수 실행
+
+        이전 검수 결과를 (스펙, 파일) 셀 단위로 기억하여, 바뀐 스펙/파일의 셀만 다시 평가하고
+        트리뷰도 해당 행만 갱신합니다.
+
+        Args:
+            quiet: True이면 경고 대화상자 없이 건너뜀 (스펙 수정 후 자동 재검수)
+        """
+        from app.qc_incremental import IncrementalQCInspector
         
         # 1. Equipment Type 확인
         equipment_type = self.qc_selected_equipment_type.get()
         
         if not equipment_type:
-            messagebox.showwarning("경고", "Equipment Type을 선택하세요.")
+            if not quiet:
+                messagebox.showwarning("경고", "Equipment Type을 선택하세요.")
             return
         
         # 2. QC 스펙 로드 (QC 스펙 관리 탭에서 정의한 스펙)
         specs = self.custom_qc_config.get_specs(equipment_type)
         
-        if not specs:
+        if not specs and not quiet:
             messagebox.showwarning("경고", 
                 f"'{equipment_type}'에 등록된 QC 스펙이 없습니다.\n"
                 "먼저 'QC 스펙 관리' 탭에서 스펙을 추가하세요."
@@ -6757,177 +6826,52 @@ class DBManager:
             return
         
         # 3. 검수할 파일 데이터 확인
-        if not self.merged_df or self.merged_df.empty:
-            messagebox.showwarning("경고", "검수할 DB 파일을 먼저 불러오세요.")
+        if self.item_value_store is None or len(self.item_value_store) == 0:
+            if not quiet:
+                messagebox.showwarning("경고", "검수할 DB 파일을 먼저 불러오세요.")
             return
         
-        # 4. 트리뷰 초기화
-        for item in self.qc_inspection_tree.get_children():
-            self.qc_inspection_tree.delete(item)
-        
-        # 5. 검수 실행
+        # 검수 작업이 진행 중이면 끝난 뒤 한 번 더 실행 (검수기는 한 작업만 사용)
+        running = getattr(self, '_qc_inspection_job', None)
+        if running is not None and not running.done:
+            self._qc_inspection_rerun = True
+            return
+        self._qc_inspection_rerun = False
+        
+        # 4. 증분 검수기 준비 (Equipment Type이나 트리뷰가 바뀌면 처음부터)
+        inspector = getattr(self, '_qc_inspector', None)
+        if (inspector is None or inspector.equipment_type != equipment_type
+                or getattr(self, '_qc_inspector_tree', None) is not self.qc_inspection_tree):
+            for item in self.qc_inspection_tree.get_children():
+                self.qc_inspection_tree.delete(item)
+            inspector = IncrementalQCInspector(equipment_type)
+            self._qc_inspector = inspector
+            self._qc_inspector_tree = self.qc_inspection_tree
+            self._qc_inspection_iids = {}
+            self._qc_inspection_numbers = {}
+        
+        # 5. 검수 실행 (백그라운드 작업, 결과는 UI 스레드에서 트리뷰에 반영)
         self.qc_inspection_status_label.config(text="🔄 검수 진행 중...", foreground="orange")
-        self.window.update()
         
-        results = []
-        pass_count = 0
-        fail_count = 0
+        previous_rows = list(inspector.rows)
+        store = self.item_value_store
+        specs = [dict(spec) for spec in specs]
+        file_names = list(self.file_names)
+        
+        def inspect(job):
+            return inspector.update(specs, file_names, store.get, store.file_tokens)
         
+        self._qc_inspection_job = self.job_scheduler.submit(
+            inspect, name="QC 검수",
+            on_done=lambda delta: self._on_custom_qc_inspected(inspector, delta, previous_rows),
+            on_error=self._on_custom_qc_failed
+        )
+    
+    def _on_custom_qc_inspected(self, inspector, delta, previous_rows):
+        """QC 검수 작업 완료: 트리뷰/요약 갱신"""
         try:
-            for idx, spec in enumerate(specs, 1):
-                if not spec.get('enabled', True):
-                    continue  # 비활성화된 항목 건너뛰기
-                
-                item_name = spec['item_name']
-                min_spec = spec.get('min_spec')
-                max_spec = spec.get('max_spec')
-                item_value = spec.get('item_value')  # 참고값 (정확한 값 매칭용)
-                unit = spec.get('unit', '')
-
-                # 각 파일에서 해당 ItemName의 값 찾기
-                for file_name in self.file_names:
-                    # merged_df에서 해당 ItemName과 Model 찾기
-                    matching_rows = self.merged_df[
-                        (self.merged_df['ItemName'] == item_name) &
-                        (self.merged_df['Model'] == file_name)
-                    ]
-
-                    if not matching_rows.empty:
-                        measured_value = matching_rows.iloc[0]['ItemValue']
-
-                        # ===== 3가지 검증 모드 =====
-                        result = ""
-                        tag = ""
-                        deviation = ""
-                        display_min = min_spec if min_spec is not None else ""
-                        display_max = max_spec if max_spec is not None else ""
-
-                        # 모드 1: MinSpec, MaxSpec 있음 → 범위 검증
-                        if min_spec is not None and max_spec is not None:
-                            try:
-                                measured_float = float(measured_value)
-
-                                if min_spec <= measured_float <= max_spec:
-                                    result = "✅ Pass"
-                                    tag = 'pass'
-                                    pass_count += 1
-                                else:
-                                    result = "❌ Fail"
-                                    tag = 'fail'
-                                    fail_count += 1
-
-                                # 편차 계산
-                                if measured_float < min_spec:
-                                    deviation = f"▼ {min_spec - measured_float:.3f}"
-                                elif measured_float > max_spec:
-                                    deviation = f"▲ {measured_float - max_spec:.3f}"
-
-                                # 결과 추가
-                                self.qc_inspection_tree.insert('', 'end', values=(
-                                    len(results) + 1,
-                                    item_name,
-                                    display_min,
-                                    display_max,
-                                    unit,
-                                    measured_float,
-                                    result,
-                                    deviation,
-                                    file_name
-                                ), tags=(tag,))
-
-                                results.append({
-                                    'item_name': item_name,
-                                    'min_spec': min_spec,
-                                    'max_spec': max_spec,
-                                    'unit': unit,
-                                    'measured_value': measured_float,
-                                    'result': result,
-                                    'deviation': deviation,
-                                    'file_name': file_name,
-                                    'equipment_type': equipment_type
-                                })
-
-                            except ValueError:
-                                # 숫자로 변환 불가능한 경우
-                                self.qc_inspection_tree.insert('', 'end', values=(
-                                    len(results) + 1,
-                                    item_name,
-                                    display_min,
-                                    display_max,
-                                    unit,
-                                    measured_value,
-                                    "⚠️ Error",
-                                    "값 변환 불가",
-                                    file_name
-                                ), tags=('error',))
-
-                        # 모드 2: MinSpec, MaxSpec 없고 ItemValue 있음 → 정확한 값 매칭
-                        elif item_value:
-                            # 대소문자 무시 문자열 비교
-                            if str(measured_value).upper() == str(item_value).upper():
-                                result = "✅ Pass"
-                                tag = 'pass'
-                                pass_count += 1
-                                deviation = ""
-                            else:
-                                result = "❌ Fail"
-                                tag = 'fail'
-                                fail_count += 1
-                                deviation = f"기대값: {item_value}"
-
-                            # 결과 추가
-                            self.qc_inspection_tree.insert('', 'end', values=(
-                                len(results) + 1,
-                                item_name,
-                                f"={item_value}",  # MinSpec 컬럼에 기대값 표시
-                                "",  # MaxSpec는 빈칸
-                                unit,
-                                measured_value,
-                                result,
-                                deviation,
-                                file_name
-                            ), tags=(tag,))
-
-                            results.append({
-                                'item_name': item_name,
-                                'expected_value': item_value,
-                                'unit': unit,
-                                'measured_value': measured_value,
-                                'result': result,
-                                'deviation': deviation,
-                                'file_name': file_name,
-                                'equipment_type': equipment_type
-                            })
-
-                        # 모드 3: MinSpec, MaxSpec, ItemValue 모두 없음 → 항목 존재만 확인
-                        else:
-                            result = "✅ Pass"
-                            tag = 'pass'
-                            pass_count += 1
-                            deviation = "존재 확인"
-
-                            # 결과 추가
-                            self.qc_inspection_tree.insert('', 'end', values=(
-                                len(results) + 1,
-                                item_name,
-                                "존재",
-                                "",
-                                unit,
-                                measured_value,
-                                result,
-                                deviation,
-                                file_name
-                            ), tags=(tag,))
-
-                            results.append({
-                                'item_name': item_name,
-                                'unit': unit,
-                                'measured_value': measured_value,
-                                'result': result,
-                                'deviation': deviation,
-                                'file_name': file_name,
-                                'equipment_type': equipment_type
-                            })
+            self._apply_qc_inspection_delta(inspector, delta, previous_rows)
+            pass_count, fail_count = inspector.counts()
             
             # 6. 요약 통계 표시
             total = pass_count + fail_count
@@ -6942,22 +6886,76 @@ class DBManager:
             self.qc_inspection_status_label.config(text="✅ 검수 완료", foreground="green")
             
             # 결과 저장 (Export용)
-            self.qc_inspection_results = results
+            self.qc_inspection_results = inspector.records()
             
             self.update_log(
-                f"✅ QC 검수 완료: {equipment_type} / {total}개 항목 / "
-                f"Pass {pass_count} / Fail {fail_count}"
+                f"✅ QC 검수 완료: {inspector.equipment_type} / {total}개 항목 / "
+                f"Pass {pass_count} / Fail {fail_count} "
+                f"(재평가 {delta.evaluated}셀, 변경 {len(delta.added) + len(delta.updated) + len(delta.removed)}행)"
             )
             
             if fail_count > 0:
                 self.update_log(f"⚠️ {fail_count}개 항목이 스펙을 벗어났습니다.")
             
         except Exception as e:
-            self.qc_inspection_status_label.config(text="❌ 검수 실패", foreground="red")
-            messagebox.showerror("오류", f"QC 검수 중 오류 발생:\n{str(e)}")
-            self.update_log(f"❌ QC 검수 오류: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self._on_custom_qc_failed(e)
+            return
+        
+        if self._qc_inspection_rerun:
+            self.run_custom_qc_inspection(quiet=True)
+    
+    def _on_custom_qc_failed(self, error):
+        """QC 검수 작업 실패 처리"""
+        # 결과 상태를 알 수 없으므로 다음 실행은 처음부터
+        self._qc_inspector = None
+        self._qc_inspection_rerun = False
+        self.qc_inspection_status_label.config(text="❌ 검수 실패", foreground="red")
+        messagebox.showerror("오류", f"QC 검수 중 오류 발생:\n{str(error)}")
+        self.update_log(f"❌ QC 검수 오류: {str(error)}")
+    
+    def _apply_qc_inspection_delta(self, inspector, delta, previous_rows):
+        """증분 검수 결과를 트리뷰에 반영 (추가/변경/삭제/번호가 바뀐 행만 갱신)"""
+        tree = self.qc_inspection_tree
+        iids = self._qc_inspection_iids
+        previous_numbers = self._qc_inspection_numbers
+        
+        for key in delta.removed:
+            iid = iids.pop(key, None)
+            if iid is not None:
+                tree.delete(iid)
+        
+        # 남아 있는 행의 순서가 바뀌었으면(스펙 수정 시 목록 끝으로 이동 등) 위치 이동
+        current = set(delta.rows)
+        reordered = [key for key in previous_rows if key in current] != \
+            [key for key in delta.rows if key in iids]
+        
+        numbers = inspector.row_numbers()
+        updated = set(delta.updated)
+        for index, key in enumerate(delta.rows):
+            cell = inspector.cells[key]
+            iid = iids.get(key)
+            if iid is None:
+                iids[key] = tree.insert('', index, values=(numbers[key],) + cell.row_values,
+                                        tags=(cell.tag,))
+                continue
+            if key in updated:
+                tree.item(iid, values=(numbers[key],) + cell.row_values, tags=(cell.tag,))
+            elif previous_numbers.get(key) != numbers[key]:
+                tree.set(iid, 'no', numbers[key])
+            if reordered:
+                tree.move(iid, '', index)
+        
+        self._qc_inspection_numbers = numbers
+    
+    def refresh_custom_qc_inspection(self, equipment_type):
+        """스펙 변경 후, 같은 Equipment Type의 검수 결과가 표시 중이면 증분 재검수"""
+        inspector = getattr(self, '_qc_inspector', None)
+        if inspector is None or inspector.equipment_type != equipment_type:
+            return
+        if not hasattr(self, 'qc_selected_equipment_type') or \
+                self.qc_selected_equipment_type.get() != equipment_type:
+            return
+        self.run_custom_qc_inspection(quiet=True)
     
     def export_qc_inspection_results(self):
         """QC 검수 결과 내보내기"""
@@ -6974,19 +6972,19 @@ class DBManager:
         )
         
         if filepath:
-            try:
-                df = pd.DataFrame(self.qc_inspection_results)
-                
-                if filepath.endswith('.xlsx'):
-                    df.to_excel(filepath, index=False)
-                else:
-                    df.to_csv(filepath, index=False, encoding='utf-8-sig')
-                
-                messagebox.showinfo("완료", f"검수 결과가 저장되었습니다:\n{filepath}")
-                self.update_log(f"📥 검수 결과 내보내기: {filepath}")
-                
-            except Exception as e:
-                messagebox.showerror("오류", f"결과 내보내기 실패:\n{str(e)}")
+            from app.file_service import save_dataframe
+            records = list(self.qc_inspection_results)
+            
+            def on_done(path):
+                messagebox.showinfo("완료", f"검수 결과가 저장되었습니다:\n{path}")
+                self.update_log(f"📥 검수 결과 내보내기: {path}")
+            
+            # 파일 쓰기(Excel)는 백그라운드 작업으로 실행
+            self.job_scheduler.submit(
+                lambda job: save_dataframe(pd.DataFrame(records), filepath),
+                name="검수 결과 내보내기", on_done=on_done,
+                on_error=lambda e: messagebox.showerror("오류", f"결과 내보내기 실패:\n{str(e)}")
+            )
     
     def goto_qc_spec_management_tab(self):
         """QC 스펙 관리 탭으로 이동"""
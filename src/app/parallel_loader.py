@@ -0,0 +1,236 @@
+# 병렬 파일 로더 모듈
+# DBManager.load_folder의 다중 파일(.txt/.csv/.db) 파싱을 워커 풀에서 동시에 수행
+
+import os
+import queue
+import sqlite3
+import threading
+from collections import namedtuple
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+)
+
+import pandas as pd
+
+from app.parse_cache import resolve_parse_cache, source_signature
+
+# 파싱 캐시 namespace (parse_db_file 출력 형식을 바꾸면 버전을 올릴 것)
+DB_FILE_CACHE_NAMESPACE = 'db_file:1'
+
+# 텍스트 파일 표준 컬럼
+REQUIRED_TEXT_COLUMNS = ['Module', 'Part', 'ItemName', 'ItemType', 'ItemValue', 'ItemDescription']
+
+# 로더 → UI 이벤트 (kind: 'progress' | 'error' | 'done')
+LoadEvent = namedtuple('LoadEvent', ['kind', 'file_name', 'completed', 'total', 'message'])
+
+# 로드 결과
+LoadResult = namedtuple('LoadResult', ['merged_df', 'file_names', 'uploaded_files', 'errors', 'cancelled'])
+
+
+def parse_db_file(file_path, parse_cache=None):
+    """
+    단일 DB 파일을 DataFrame으로 파싱 (워커 프로세스에서 실행 가능하도록 모듈 수준 함수)
+
+    변경되지 않은 파일은 파싱 캐시(app.parse_cache)에서 바로 읽습니다.
+
+    Args:
+        file_path: .txt(탭 구분) / .csv / .db 파일 경로
+        parse_cache: ParseCache (None이면 기본 캐시, False면 캐시 사용 안 함)
+
+    Returns:
+        pd.DataFrame: Model 컬럼이 추가된 DataFrame
+    """
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    cache = resolve_parse_cache(parse_cache)
+    signature = source_signature(file_path) if cache is not None else None
+
+    df = cache.get_frame(file_path, DB_FILE_CACHE_NAMESPACE, signature) if cache is not None else None
+    if df is None:
+        df = _read_db_file(file_path)
+        if cache is not None:
+            cache.put_frame(file_path, DB_FILE_CACHE_NAMESPACE, df, signature)
+
+    df["Model"] = base_name
+    return df
+
+
+def _read_db_file(file_path):
+    """확장자별 DB 파일 읽기 (Model 컬럼 제외)"""
+    ext = os.path.splitext(file_path)[1].lower()
+
+    if ext == '.txt':
+        df = pd.read_csv(file_path, delimiter="\t", dtype=str)
+        if all(col in df.columns for col in REQUIRED_TEXT_COLUMNS):
+            # 표준 텍스트 파일 형식: ItemType 정보 보존
+            df = df[REQUIRED_TEXT_COLUMNS].copy()
+        else:
+            # 호환성을 위한 fallback: 기본 컬럼명 추가
+            if 'ItemType' not in df.columns:
+                df['ItemType'] = 'double'
+            if 'ItemDescription' not in df.columns:
+                df['ItemDescription'] = ''
+    elif ext == '.csv':
+        df = pd.read_csv(file_path, dtype=str)
+        if 'ItemType' not in df.columns:
+            df['ItemType'] = 'double'
+    elif ext == '.db':
+        conn = sqlite3.connect(file_path)
+        try:
+            df = pd.read_sql("SELECT * FROM main_table", conn)
+        finally:
+            conn.close()
+        if 'ItemType' not in df.columns:
+            df['ItemType'] = 'double'
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {ext}")
+    return df
+
+
+def default_worker_count(file_count):
+    """파일 수와 CPU 코어 수를 고려한 워커 수"""
+    return max(1, min(file_count, os.cpu_count() or 1))
+
+
+class ParallelFileLoader:
+    """
+    다중 DB 파일 병렬 로더
+
+    파싱은 프로세스 풀(기본) 또는 스레드 풀에서 동시에 수행하고, 진행 상황은
+    이벤트 큐로 스트리밍합니다. UI 스레드는 poll_events()를 after()로 주기적으로
+    호출해 진행률을 갱신하므로 로딩 중에도 창이 응답 상태를 유지합니다.
+    """
+
+    def __init__(self, files, max_workers=None, use_processes=True, parse_cache=None):
+        """
+        Args:
+            files: 로드할 파일 경로 리스트 (선택 순서가 병합 순서가 됨)
+            max_workers: 워커 수 (None이면 CPU 코어 수)
+            use_processes: True면 프로세스 풀, False면 스레드 풀 사용
+            parse_cache: ParseCache (None이면 기본 캐시, False면 캐시 사용 안 함)
+        """
+        self.files = list(files)
+        self.max_workers = max_workers or default_worker_count(len(self.files))
+        self.use_processes = use_processes
+        self.parse_cache = parse_cache
+
+        self._events = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._thread = None
+        self._result = None
+
+    # ------------------------------------------------------------
+    # 백그라운드 실행 API
+    # ------------------------------------------------------------
+    def start(self):
+        """백그라운드 스레드에서 로드 시작"""
+        self._thread = threading.Thread(target=self._run, name="ParallelFileLoader", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """로드 취소 요청 (아직 시작하지 않은 파일은 건너뜀)"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self):
+        return self._result is not None
+
+    @property
+    def result(self):
+        """완료 후 LoadResult (진행 중이면 None)"""
+        return self._result
+
+    def poll_events(self):
+        """큐에 쌓인 이벤트를 모두 꺼내 반환 (UI 스레드에서 호출)"""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self):
+        try:
+            self._result = self.load()
+        except Exception as e:
+            self._result = LoadResult(None, [], {}, [("", str(e))], self.cancelled)
+        self._events.put(LoadEvent('done', None, 0, len(self.files), ""))
+
+    # ------------------------------------------------------------
+    # 동기 실행 API
+    # ------------------------------------------------------------
+    def load(self, progress_callback=None):
+        """
+        모든 파일을 병렬로 파싱하고 병합
+
+        Args:
+            progress_callback: 파일 하나가 끝날 때마다 LoadEvent로 호출되는 콜백 (선택)
+
+        Returns:
+            LoadResult
+        """
+        total = len(self.files)
+        frames = [None] * total
+        errors = []
+        completed = 0
+
+        def emit(event):
+            self._events.put(event)
+            if progress_callback:
+                progress_callback(event)
+
+        if total == 0:
+            return LoadResult(None, [], {}, errors, False)
+
+        executor = self._create_executor()
+        try:
+            pending = {}
+            for idx, path in enumerate(self.files):
+                pending[executor.submit(parse_db_file, path, self.parse_cache)] = idx
+
+            while pending:
+                if self._cancel_event.is_set():
+                    break
+                finished, _ = wait(list(pending), timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    idx = pending.pop(future)
+                    file_name = os.path.basename(self.files[idx])
+                    completed += 1
+                    try:
+                        frames[idx] = future.result()
+                        emit(LoadEvent('progress', file_name, completed, total, ""))
+                    except Exception as e:
+                        errors.append((file_name, str(e)))
+                        emit(LoadEvent('error', file_name, completed, total, str(e)))
+        finally:
+            executor.shutdown(wait=not self._cancel_event.is_set(), cancel_futures=True)
+
+        if self._cancel_event.is_set():
+            return LoadResult(None, [], {}, errors, True)
+
+        # 선택 순서대로 병합 (완료 순서와 무관하게 결과가 결정적)
+        df_list = []
+        file_names = []
+        uploaded_files = {}
+        for path, df in zip(self.files, frames):
+            if df is None:
+                continue
+            file_name = os.path.basename(path)
+            df_list.append(df)
+            file_names.append(os.path.splitext(file_name)[0])
+            uploaded_files[file_name] = path
+
+        merged_df = pd.concat(df_list, ignore_index=True) if df_list else None
+        return LoadResult(merged_df, file_names, uploaded_files, errors, False)
+
+    def _create_executor(self):
+        """프로세스 풀 생성 (실패 시 스레드 풀로 대체)"""
+        if self.use_processes and len(self.files) > 1:
+            try:
+                return ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, NotImplementedError, ImportError) as e:
+                print(f"프로세스 풀 생성 실패, 스레드 풀 사용: {e}")
+        return ThreadPoolExecutor(max_workers=self.max_workers)
@@ -0,0 +1,388 @@
+# 파싱 결과 디스크 캐시 모듈
+# 같은 DB.txt 파일을 다시 열 때 텍스트 파싱을 건너뛰도록 파싱 결과를 컬럼 단위 바이너리(.npz)로 저장
+#
+# - 키: 파서 이름(namespace) + 파일 절대 경로 + 수정 시각(ns) + 크기 → 파일이 바뀌면 자동으로 새 키
+# - 형식: 문자열 컬럼은 UTF-8 바이트 + 구분자, 숫자 컬럼은 numpy 배열 그대로 (pickle 미사용)
+# - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU, 파일 mtime 기준)
+# - 파서 출력 형식을 바꾸면 해당 namespace의 버전을 올릴 것 (예: 'db_file:2')
+
+import hashlib
+import json
+import os
+import tempfile
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_PARSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, 'data', 'parse_cache')
+
+# 문자열 컬럼 구분자 후보 (값에 포함되지 않는 첫 번째 문자 사용)
+_SEPARATORS = ('\n', '\x1f', '\x1e', '\x00')
+_META_KEY = '__meta__'
+
+_default_cache = None
+_default_loaded = False
+
+
+def source_signature(file_path):
+    """캐시 키에 쓰는 원본 파일 상태 (수정 시각 ns, 크기)"""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_parse_cache_config():
+    """settings.json의 service_config.parse_cache 설정 로드 (없으면 빈 딕셔너리)"""
+    config_path = os.path.join(PROJECT_ROOT, 'config', 'settings.json')
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('service_config', {}).get('parse_cache', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def get_parse_cache():
+    """
+    기본 파싱 캐시 (프로세스별로 한 번 생성, 설정에서 비활성화하면 None)
+
+    워커 프로세스에서도 같은 디렉터리를 사용하므로 병렬 로드 결과도 공유됩니다.
+    """
+    global _default_cache, _default_loaded
+    if not _default_loaded:
+        config = load_parse_cache_config()
+        if config.get('enabled', True):
+            directory = config.get('directory') or DEFAULT_CACHE_DIR
+            if not os.path.isabs(directory):
+                directory = os.path.join(PROJECT_ROOT, directory)
+            _default_cache = ParseCache(directory, int(config.get('max_bytes', DEFAULT_PARSE_CACHE_MAX_BYTES)))
+        _default_loaded = True
+    return _default_cache
+
+
+def resolve_parse_cache(parse_cache):
+    """생성자/함수 인자 해석: None → 기본 캐시, False → 캐시 사용 안 함, 그 외 → 그대로"""
+    if parse_cache is None:
+        return get_parse_cache()
+    if parse_cache is False:
+        return None
+    return parse_cache
+
+
+class ParseCache:
+    """
+    파싱 결과 디스크 캐시
+
+    값은 컬럼 딕셔너리({컬럼 이름: 값 목록 또는 numpy 배열})로 저장하며, DataFrame(get_frame/put_frame)과
+    레코드 목록(get_records/put_records) 변환을 제공합니다. 저장할 수 없는 값(문자열/정수/None 외 객체가 섞인
+    컬럼 등)은 저장하지 않고 False를 반환하므로 호출자는 항상 원래 파싱 결과를 그대로 사용하면 됩니다.
+    캐시 오류는 파싱을 막지 않도록 경고만 출력합니다.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_PARSE_CACHE_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 파일 디렉터리 (없으면 처음 저장할 때 생성)
+            max_bytes: 캐시 파일 전체 크기 상한
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    # ------------------------------------------------------------
+    # 키 / 경로
+    # ------------------------------------------------------------
+    def entry_path(self, file_path, namespace, signature=None):
+        """원본 파일 상태에 대응하는 캐시 파일 경로"""
+        mtime_ns, size = signature or source_signature(file_path)
+        source = os.path.normcase(os.path.abspath(file_path))
+        key = f"{CACHE_FORMAT_VERSION}\0{namespace}\0{source}\0{mtime_ns}\0{size}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.npz')
+
+    # ------------------------------------------------------------
+    # 컬럼 딕셔너리
+    # ------------------------------------------------------------
+    def get(self, file_path, namespace, signature=None):
+        """
+        캐시된 컬럼 딕셔너리 조회
+
+        Returns:
+            tuple | None: (컬럼 딕셔너리, 컬럼 메타 목록), 없거나 읽을 수 없으면 None
+        """
+        import numpy as np
+
+        try:
+            path = self.entry_path(file_path, namespace, signature)
+        except OSError:
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(data[_META_KEY].tobytes().decode('utf-8'))
+                columns = {}
+                for index, column in enumerate(meta['columns']):
+                    columns[column['name']] = _decode_column(data, index, column, meta['rows'])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"파싱 캐시 읽기 실패 ({os.path.basename(file_path)}): {e}")
+            self._remove(path)
+            return None
+
+        # LRU: 사용 시각 갱신
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return columns, meta['columns']
+
+    def put(self, file_path, namespace, columns, signature=None, column_meta=None):
+        """
+        컬럼 딕셔너리 저장
+
+        Args:
+            columns: {컬럼 이름: list 또는 numpy 배열} (모든 컬럼 길이가 같아야 함)
+            signature: 파싱 전에 구한 source_signature (파싱 중 파일이 바뀌었으면 저장하지 않음)
+            column_meta: 컬럼별로 함께 저장할 추가 정보 {컬럼 이름: dict}
+
+        Returns:
+            bool: 저장 여부
+        """
+        import numpy as np
+
+        try:
+            current = source_signature(file_path)
+        except OSError:
+            return False
+        if signature is not None and tuple(signature) != current:
+            return False
+
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            return False
+        rows = lengths.pop() if lengths else 0
+
+        arrays = {}
+        meta_columns = []
+        for index, (name, values) in enumerate(columns.items()):
+            column = _encode_column(arrays, index, values)
+            if column is None:
+                return False
+            column['name'] = name
+            column.update((column_meta or {}).get(name, {}))
+            meta_columns.append(column)
+        meta = {'rows': rows, 'source': os.path.abspath(file_path), 'columns': meta_columns}
+        arrays[_META_KEY] = np.frombuffer(json.dumps(meta, ensure_ascii=False).encode('utf-8'), dtype=np.uint8)
+
+        path = self.entry_path(file_path, namespace, current)
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **arrays)
+            if os.path.getsize(tmp_path) > self.max_bytes:
+                return False
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError as e:
+            print(f"파싱 캐시 저장 실패 ({os.path.basename(file_path)}): {e}")
+            return False
+        finally:
+            if tmp_path is not None:
+                self._remove(tmp_path)
+
+        self.evict(keep=path)
+        return True
+
+    # ------------------------------------------------------------
+    # DataFrame / 레코드 변환
+    # ------------------------------------------------------------
+    def get_frame(self, file_path, namespace, signature=None):
+        """캐시된 DataFrame (없으면 None)"""
+        import pandas as pd
+
+        cached = self.get(file_path, namespace, signature)
+        if cached is None:
+            return None
+        columns, meta_columns = cached
+        frame = {}
+        for column in meta_columns:
+            values = columns[column['name']]
+            if column.get('na') == 'nan':
+                values = [float('nan') if value is None else value for value in values]
+            frame[column['name']] = pd.Series(values, dtype=column['dtype'], copy=False)
+        return pd.DataFrame(frame)
+
+    def put_frame(self, file_path, namespace, df, signature=None):
+        """
+        DataFrame 저장 (기본 RangeIndex, 고유한 문자열 컬럼 이름, 숫자/문자열 컬럼만 지원)
+
+        Returns:
+            bool: 저장 여부
+        """
+        import pandas as pd
+
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+            return False
+        if not df.columns.is_unique or not all(isinstance(name, str) for name in df.columns):
+            return False
+
+        columns = {}
+        column_meta = {}
+        for name in df.columns:
+            series = df[name]
+            column_meta[name] = {'dtype': str(series.dtype)}
+            if _is_plain_array(series.dtype):
+                columns[name] = series.to_numpy()
+                continue
+            values = series.tolist()
+            columns[name] = values
+            if set(map(type, values)) <= {str}:
+                continue
+            null_indexes = series.isna().to_numpy().nonzero()[0]
+            if series.dtype == object and len(null_indexes) and values[null_indexes[0]] is not None:
+                # read_csv 결과처럼 결측값이 NaN인 object 컬럼은 NaN으로 복원
+                column_meta[name]['na'] = 'nan'
+            for index in null_indexes:
+                values[index] = None
+        return self.put(file_path, namespace, columns, signature, column_meta)
+
+    def get_records(self, file_path, namespace, signature=None):
+        """캐시된 레코드(딕셔너리) 목록 (없으면 None)"""
+        cached = self.get(file_path, namespace, signature)
+        if cached is None:
+            return None
+        columns, meta_columns = cached
+        names = [column['name'] for column in meta_columns]
+        return [dict(zip(names, row)) for row in zip(*(columns[name] for name in names))]
+
+    def put_records(self, file_path, namespace, records, fields, signature=None):
+        """
+        레코드(딕셔너리) 목록 저장
+
+        Args:
+            fields: 레코드 키 목록 (모든 레코드가 같은 키를 가져야 함)
+
+        Returns:
+            bool: 저장 여부
+        """
+        try:
+            columns = {field: [record[field] for record in records] for field in fields}
+        except KeyError:
+            return False
+        if any(len(record) != len(fields) for record in records):
+            return False
+        return self.put(file_path, namespace, columns, signature)
+
+    # ------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------
+    def entries(self):
+        """캐시 항목 [(경로, 크기, 마지막 사용 시각)]"""
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith('.npz'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime_ns))
+        return entries
+
+    def total_bytes(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        """
+        전체 크기가 max_bytes 이하가 될 때까지 오래 사용하지 않은 항목 삭제
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if self._remove(path):
+                removed += 1
+            total -= size
+        return removed
+
+    def clear(self):
+        """모든 캐시 항목 삭제"""
+        for path, _, _ in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+def _is_plain_array(dtype):
+    """numpy 배열 그대로 저장할 수 있는 dtype (숫자/불리언/날짜, pandas 확장 타입 제외)"""
+    import numpy as np
+
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM'
+
+
+def _encode_column(arrays, index, values):
+    """컬럼을 npz 배열로 변환해 arrays에 추가하고 컬럼 메타 반환 (저장할 수 없으면 None)"""
+    import numpy as np
+
+    if isinstance(values, np.ndarray):
+        if not _is_plain_array(values.dtype):
+            values = values.tolist()
+        else:
+            arrays[f'a{index}'] = values
+            return {'kind': 'array'}
+
+    value_types = set(map(type, values))
+    if value_types == {int}:
+        try:
+            arrays[f'a{index}'] = np.array(values, dtype=np.int64)
+        except OverflowError:
+            return None
+        return {'kind': 'ints'}
+
+    if not value_types <= {str, type(None)}:
+        return None
+    nulls = [i for i, value in enumerate(values) if value is None] if type(None) in value_types else []
+    texts = ['' if value is None else value for value in values] if nulls else values
+    for separator in _SEPARATORS:
+        joined = separator.join(texts)
+        if joined.count(separator) == max(len(texts) - 1, 0):
+            break
+    else:
+        return None
+
+    arrays[f's{index}'] = np.frombuffer(joined.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+    if nulls:
+        arrays[f'n{index}'] = np.array(nulls, dtype=np.int64)
+    return {'kind': 'text', 'sep': separator}
+
+
+def _decode_column(data, index, column, rows):
+    """_encode_column의 역변환"""
+    kind = column['kind']
+    if kind == 'array':
+        return data[f'a{index}']
+    if kind == 'ints':
+        return data[f'a{index}'].tolist()
+
+    values = data[f's{index}'].tobytes().decode('utf-8', 'surrogatepass').split(column['sep']) if rows else []
+    null_key = f'n{index}'
+    if null_key in data.files:
+        for i in data[null_key].tolist():
+            values[i] = None
+    return values
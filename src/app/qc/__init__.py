@@ -61,11 +61,15 @@ from .qc_inspection_v2 import (
     get_engine
 )
 
-# 레거시 QC 함수들 (기존 호환성 유지)
-from app.qc_legacy import (
-    QCValidator,
-    add_qc_check_functions_to_class
-)
+# 레거시 QC 함수들 (기존 호환성 유지, app.qc_legacy 모듈이 없으면 생략)
+try:
+    from app.qc_legacy import (
+        QCValidator,
+        add_qc_check_functions_to_class
+    )
+    _LEGACY_EXPORTS = ['QCValidator', 'add_qc_check_functions_to_class']
+except ImportError:
+    _LEGACY_EXPORTS = []
 
 __all__ = [
     # Core Layer
@@ -97,10 +101,6 @@ __all__ = [
     'validate_item',
     'get_spec_display',
     'get_engine',
-
-    # 레거시
-    'QCValidator',
-    'add_qc_check_functions_to_class'
-]
+] + _LEGACY_EXPORTS
 
 __version__ = '2.0.0'
@@ -70,20 +70,25 @@ class ChecklistValidator:
             'details': []
         }
 
-        # 각 파라미터 검증
-        for idx, row in df.iterrows():
-            param_name = row.get('ItemName', '')
-            param_value = row.get('Value1', '') if 'Value1' in df.columns else ''
+        # 장비별 컴파일 매처를 한 번만 조회 (없으면 서비스의 단건 검증 사용)
+        if hasattr(self.checklist_service, 'get_compiled_matcher'):
+            validate = self.checklist_service.get_compiled_matcher(self.equipment_type_id).validate
+        else:
+            def validate(name, value):
+                return self.checklist_service.validate_parameter_against_checklist(
+                    self.equipment_type_id, name, value
+                )
+
+        names = df['ItemName'].tolist() if 'ItemName' in df.columns else []
+        values = df['Value1'].tolist() if 'Value1' in df.columns else [''] * len(df)
 
+        # 각 파라미터 검증
+        for idx, param_name, param_value in zip(df.index, names, values):
             if not param_name:
                 continue
 
             # Check list 검증
-            validation_result = self.checklist_service.validate_parameter_against_checklist(
-                self.equipment_type_id,
-                str(param_name),
-                str(param_value)
-            )
+            validation_result = validate(str(param_name), str(param_value))
 
             if validation_result['is_checklist']:
                 results['checklist_params'] += 1
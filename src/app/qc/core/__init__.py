@@ -2,15 +2,17 @@
 QC Core Layer - 핵심 비즈니스 로직
 """
 
-from .models import ChecklistItem, InspectionResult
+from .models import ChecklistItem, InspectionResult, InspectionResults
 from .inspection_engine import InspectionEngine
-from .spec_matcher import SpecMatcher
+from .spec_matcher import SpecMatcher, IndexedFileData
 from .checklist_provider import ChecklistProvider
 
 __all__ = [
     'ChecklistItem',
     'InspectionResult',
+    'InspectionResults',
     'InspectionEngine',
     'SpecMatcher',
+    'IndexedFileData',
     'ChecklistProvider',
 ]
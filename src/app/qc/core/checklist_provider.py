@@ -2,12 +2,54 @@
 Checklist Provider - QC Checklist 항목 제공자
 """
 
-from typing import List, Optional
+import threading
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from .models import ChecklistItem
 
+# Checklist 버전 (Checklist/예외 변경 시 증가, 프로세스 전체 공유)
+_version_lock = threading.Lock()
+_checklist_version = 0
+
+
+def get_checklist_version() -> int:
+    """현재 Checklist 버전"""
+    return _checklist_version
+
+
+def bump_checklist_version() -> int:
+    """
+    Checklist 버전 증가 (SpecService 쓰기 작업 후 호출)
+
+    Returns:
+        int: 새 버전
+    """
+    global _checklist_version
+    with _version_lock:
+        _checklist_version += 1
+        return _checklist_version
+
+
+class ChecklistSnapshot:
+    """특정 버전의 Checklist 메모리 스냅샷"""
+
+    __slots__ = ('version', 'items', 'exception_ids', 'exception_sets', 'inspection_items')
+
+    def __init__(self, version: int, items: Tuple[ChecklistItem, ...]):
+        self.version = version
+        self.items = items
+        # configuration_id → 예외 항목 ID (조회 순서 / 집합), 예외 제외 항목 목록
+        self.exception_ids: Dict[int, Tuple[int, ...]] = {}
+        self.exception_sets: Dict[int, FrozenSet[int]] = {}
+        self.inspection_items: Dict[Optional[int], Tuple[List[ChecklistItem], int]] = {}
+
 
 class ChecklistProvider:
-    """QC Checklist 항목 제공 클래스"""
+    """
+    QC Checklist 항목 제공 클래스
+
+    활성 항목과 Configuration별 예외 목록은 버전이 붙은 스냅샷으로 메모리에 유지하며,
+    bump_checklist_version()으로 버전이 바뀌기 전까지는 DB를 다시 조회하지 않습니다.
+    """
 
     def __init__(self, db_schema=None):
         """
@@ -22,13 +64,43 @@ class ChecklistProvider:
         else:
             self.db_schema = db_schema
 
+        self._snapshot: Optional[ChecklistSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+
+    def get_snapshot(self) -> ChecklistSnapshot:
+        """
+        현재 버전의 Checklist 스냅샷 (버전이 바뀌었으면 활성 항목을 다시 조회)
+
+        Returns:
+            ChecklistSnapshot: 캐시된 스냅샷
+        """
+        version = get_checklist_version()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = ChecklistSnapshot(version, tuple(self._load_active_items()))
+                self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self):
+        """스냅샷 폐기 (SpecService를 거치지 않고 DB가 변경된 경우)"""
+        self._snapshot = None
+
     def get_active_items(self) -> List[ChecklistItem]:
         """
-        활성화된 QC Checklist 항목 조회
+        활성화된 QC Checklist 항목 조회 (스냅샷 사용)
 
         Returns:
             List[ChecklistItem]: 활성화된 Check list 항목 목록
         """
+        return list(self.get_snapshot().items)
+
+    def _load_active_items(self) -> List[ChecklistItem]:
+        """활성화된 QC Checklist 항목 DB 조회"""
         with self.db_schema.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -59,7 +131,7 @@ class ChecklistProvider:
 
     def get_exception_item_ids(self, configuration_id: Optional[int]) -> List[int]:
         """
-        Configuration별 예외 항목 ID 목록 조회
+        Configuration별 예외 항목 ID 목록 조회 (스냅샷 사용)
 
         Args:
             configuration_id: Configuration ID (None이면 빈 목록 반환)
@@ -69,7 +141,34 @@ class ChecklistProvider:
         """
         if configuration_id is None:
             return []
+        return list(self._get_exceptions(configuration_id)[0])
+
+    def get_exception_item_set(self, configuration_id: Optional[int]) -> FrozenSet[int]:
+        """
+        Configuration별 예외 항목 ID 집합 (멤버십 확인용)
+
+        Args:
+            configuration_id: Configuration ID (None이면 빈 집합)
 
+        Returns:
+            FrozenSet[int]: 예외 항목 ID 집합
+        """
+        if configuration_id is None:
+            return frozenset()
+        return self._get_exceptions(configuration_id)[1]
+
+    def _get_exceptions(self, configuration_id: int) -> Tuple[Tuple[int, ...], FrozenSet[int]]:
+        """스냅샷의 예외 목록 (Configuration별 최초 1회만 DB 조회)"""
+        snapshot = self.get_snapshot()
+        ids = snapshot.exception_ids.get(configuration_id)
+        if ids is None:
+            ids = tuple(self._load_exception_item_ids(configuration_id))
+            snapshot.exception_sets[configuration_id] = frozenset(ids)
+            snapshot.exception_ids[configuration_id] = ids
+        return ids, snapshot.exception_sets[configuration_id]
+
+    def _load_exception_item_ids(self, configuration_id: int) -> List[int]:
+        """Configuration별 예외 항목 ID DB 조회"""
         with self.db_schema.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
@@ -94,7 +193,28 @@ class ChecklistProvider:
         Returns:
             List[ChecklistItem]: 예외 제외한 항목 목록
         """
-        all_items = self.get_active_items()
-        exception_ids = self.get_exception_item_ids(configuration_id)
+        items, _ = self.get_inspection_items(configuration_id)
+        return list(items)
 
-        return [item for item in all_items if item.id not in exception_ids]
+    def get_inspection_items(
+        self,
+        configuration_id: Optional[int] = None
+    ) -> Tuple[List[ChecklistItem], int]:
+        """
+        검수용 Checklist 항목과 예외 항목 수 조회 (활성 항목/예외 목록을 각각 한 번만 조회)
+
+        Args:
+            configuration_id: Configuration ID
+
+        Returns:
+            Tuple[List[ChecklistItem], int]: (예외 제외한 항목 목록, 예외 처리된 항목 수)
+                항목 목록은 스냅샷과 공유되므로 수정하지 않아야 합니다.
+        """
+        snapshot = self.get_snapshot()
+        cached = snapshot.inspection_items.get(configuration_id)
+        if cached is None:
+            exception_ids = self.get_exception_item_set(configuration_id)
+            items = [item for item in snapshot.items if item.id not in exception_ids]
+            cached = (items, len(snapshot.items) - len(items))
+            snapshot.inspection_items[configuration_id] = cached
+        return cached
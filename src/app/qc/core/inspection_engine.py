@@ -2,13 +2,36 @@
 Inspection Engine - QC 검수 엔진 (Phase 2)
 """
 
+import os
 import json
-from typing import Dict, List, Any, Optional
-from .models import ChecklistItem, InspectionResult
+from concurrent.futures import ThreadPoolExecutor
+import math
+from typing import Dict, List, Any, Optional, Tuple, Union
+from app.spec_kernel import SpecKernel
+from .models import ChecklistItem, InspectionResults
 from .checklist_provider import ChecklistProvider
 from .spec_matcher import SpecMatcher
 
 
+class CompiledChecklist:
+    """
+    검수용으로 준비된 Checklist (Configuration 단위)
+
+    Spec 숫자 변환/JSON 파싱을 항목별로 한 번만 수행해 두고(SpecKernel) 여러 파일 검수에 재사용합니다.
+    """
+
+    __slots__ = ('configuration_id', 'items', 'exception_count', 'kernel', 'positions', 'spec_displays')
+
+    def __init__(self, configuration_id: Optional[int], items: List[ChecklistItem], exception_count: int):
+        self.configuration_id = configuration_id
+        self.items = items
+        self.exception_count = exception_count
+        self.kernel = SpecKernel(items)
+        # id(항목) → 커널 위치 / Spec 표시 문자열
+        self.positions: Dict[int, int] = {id(item): pos for pos, item in enumerate(items)}
+        self.spec_displays: Dict[int, str] = {id(item): InspectionEngine.get_spec_display(item) for item in items}
+
+
 class InspectionEngine:
     """
     QC 검수 엔진
@@ -41,6 +64,7 @@ class InspectionEngine:
             file_data: 파일 데이터
                 - 옵션 1: ItemName → Value 매핑 (레거시)
                 - 옵션 2: (Module, Part, ItemName) → Value 매핑 (신규)
+                - 옵션 3: SpecMatcher.index_file_data() 결과 (같은 파일을 여러 번 검수할 때 재사용)
             configuration_id: Configuration ID (None이면 Type Common)
 
         Returns:
@@ -50,43 +74,57 @@ class InspectionEngine:
                     'total_count': int,        # 검증된 항목 수
                     'failed_count': int,       # 실패한 항목 수
                     'passed_count': int,       # 합격한 항목 수
-                    'results': List[Dict],     # 각 항목 검증 결과
+                    'results': InspectionResults,  # 각 항목 검증 결과 (행마다 딕셔너리 뷰)
                     'matched_count': int,      # 매칭된 항목 수
                     'exception_count': int     # 예외 처리된 항목 수
                 }
         """
-        # 1. 예외를 제외한 활성 Checklist 항목 조회
-        checklist_items = self.checklist_provider.get_items_excluding_exceptions(
-            configuration_id
+        checklist = self.compile_checklist(configuration_id)
+        return self.inspect_compiled(checklist, file_data)
+
+    def compile_checklist(self, configuration_id: Optional[int] = None) -> CompiledChecklist:
+        """
+        예외를 제외한 활성 Checklist 항목을 한 번 조회하여 검수용으로 준비
+
+        Args:
+            configuration_id: Configuration ID (None이면 Type Common)
+
+        Returns:
+            CompiledChecklist: 여러 파일 검수에 재사용 가능한 Checklist
+        """
+        items, exception_count = self.checklist_provider.get_inspection_items(configuration_id)
+        return CompiledChecklist(configuration_id, items, exception_count)
+
+    def inspect_compiled(self, checklist: CompiledChecklist, file_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        준비된 Checklist로 단일 파일 데이터 검수 (DB 조회 없음)
+
+        Args:
+            checklist: compile_checklist() 결과
+            file_data: 파일 데이터 (inspect()와 동일)
+
+        Returns:
+            Dict[str, Any]: inspect()와 같은 형식의 검수 결과
+        """
+        # 1. 파일 데이터와 매칭
+        matched_items = self.spec_matcher.match(checklist.items, file_data)
+
+        # 2. 각 항목 검증 (범위 항목은 배열 연산으로 일괄 계산)
+        items = [item for item, _, _ in matched_items]
+        file_values = [file_value for _, _, file_value in matched_items]
+        passed, deviation = checklist.kernel.evaluate(
+            [checklist.positions[id(item)] for item in items], file_values)
+
+        results = InspectionResults(
+            items,
+            file_values,
+            passed.tolist(),
+            [checklist.spec_displays[id(item)] for item in items],
+            [None if math.isnan(value) else value for value in deviation.tolist()]
         )
 
-        # 예외 항목 수
-        all_items = self.checklist_provider.get_active_items()
-        exception_count = len(all_items) - len(checklist_items)
-
-        # 2. 파일 데이터와 매칭
-        matched_items = self.spec_matcher.match(checklist_items, file_data)
-
-        # 3. 각 항목 검증
-        results = []
-        for item, file_key, file_value in matched_items:
-            is_valid = self.validate_item(item, file_value)
-
-            result = InspectionResult(
-                item_name=item.item_name,
-                module=item.module,
-                part=item.part,
-                display_name=item.display_name,
-                file_value=file_value,
-                is_valid=is_valid,
-                spec=self.get_spec_display(item),
-                category=item.category or 'Uncategorized',
-                description=item.description or ''
-            )
-            results.append(result.to_dict())
-
-        # 4. Pass/Fail 판정 (모든 항목이 Pass일 때만 전체 Pass)
-        failed_count = sum(1 for r in results if not r['is_valid'])
+        # 3. Pass/Fail 판정 (모든 항목이 Pass일 때만 전체 Pass)
+        failed_count = results.failed_count
         passed_count = len(results) - failed_count
         is_pass = failed_count == 0
 
@@ -97,7 +135,113 @@ class InspectionEngine:
             'passed_count': passed_count,
             'results': results,
             'matched_count': len(matched_items),
-            'exception_count': exception_count
+            'exception_count': checklist.exception_count
+        }
+
+    def inspect_batch(
+        self,
+        files: Union[Dict[str, Any], List[str]],
+        configuration_id: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 파일 일괄 검수 (Checklist는 한 번만 조회, 파일은 워커 풀에서 동시에 검수)
+
+        Args:
+            files: 파일 이름 → 파일 데이터 매핑, 또는 파일 경로 목록 (워커에서 로드)
+            configuration_id: Configuration ID (None이면 Type Common)
+            max_workers: 워커 수 (None이면 파일 수와 CPU 코어 수 기준)
+
+        Returns:
+            Dict[str, Any]: 일괄 검수 결과
+                {
+                    'configuration_id': int,
+                    'files': Dict[str, Dict],    # 파일별 inspect() 결과 (입력 순서)
+                    'errors': Dict[str, str],    # 로드/검수 실패 파일
+                    'summary': Dict              # 전체 통계
+                }
+        """
+        from ..utils.file_handler import FileHandler
+
+        checklist = self.compile_checklist(configuration_id)
+
+        if isinstance(files, dict):
+            tasks = list(files.items())
+        else:
+            tasks = [(path, path) for path in files]
+
+        def run(task: Tuple[str, Any]) -> Tuple[str, Optional[Dict], Optional[str]]:
+            name, source = task
+            try:
+                if isinstance(source, str):
+                    source, error = FileHandler.load_and_parse(source)
+                    if error:
+                        return name, None, error
+                return name, self.inspect_compiled(checklist, source), None
+            except Exception as e:
+                return name, None, f"검수 오류: {e}"
+
+        if max_workers is None:
+            max_workers = max(1, min(len(tasks), os.cpu_count() or 1))
+
+        if max_workers <= 1 or len(tasks) <= 1:
+            outcomes = [run(task) for task in tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(run, tasks))
+
+        file_results = {}
+        errors = {}
+        for name, result, error in outcomes:
+            if error is not None:
+                errors[name] = error
+            else:
+                file_results[name] = result
+
+        return {
+            'configuration_id': configuration_id,
+            'files': file_results,
+            'errors': errors,
+            'summary': self.summarize_batch(file_results, errors, checklist)
+        }
+
+    @staticmethod
+    def summarize_batch(
+        file_results: Dict[str, Dict[str, Any]],
+        errors: Dict[str, str],
+        checklist: CompiledChecklist
+    ) -> Dict[str, Any]:
+        """
+        일괄 검수 통계 생성
+
+        Returns:
+            Dict[str, Any]: 파일 수/합격률, 항목 수 합계, 항목별 실패 파일 수
+        """
+        passed_files = sum(1 for r in file_results.values() if r['is_pass'])
+        inspected = len(file_results)
+
+        # 항목(display_name)별 실패 파일 수 (많은 순)
+        item_failures = {}
+        for result in file_results.values():
+            results = result['results']
+            for row in results.failed_indices:
+                display_name = results.items[row].display_name
+                item_failures[display_name] = item_failures.get(display_name, 0) + 1
+        item_failures = dict(sorted(item_failures.items(), key=lambda kv: (-kv[1], kv[0])))
+
+        return {
+            'file_count': inspected + len(errors),
+            'inspected_count': inspected,
+            'error_count': len(errors),
+            'passed_files': passed_files,
+            'failed_files': inspected - passed_files,
+            'pass_rate': (passed_files / inspected * 100) if inspected > 0 else 0,
+            'checklist_count': len(checklist.items),
+            'exception_count': checklist.exception_count,
+            'total_items': sum(r['total_count'] for r in file_results.values()),
+            'failed_items': sum(r['failed_count'] for r in file_results.values()),
+            'item_failures': item_failures,
+            'is_pass': inspected > 0 and passed_files == inspected and not errors
         }
 
     @staticmethod
@@ -2,13 +2,17 @@
 QC 데이터 모델
 """
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChecklistItem:
-    """Check list 항목 데이터 클래스"""
+    """Check list 항목 데이터 클래스 (불변, ChecklistProvider 스냅샷에서 공유)"""
+    __slots__ = ('id', 'item_name', 'module', 'part', 'spec_min', 'spec_max',
+                 'expected_value', 'category', 'description', 'is_active')
+
     id: int
     item_name: str
     module: Optional[str]
@@ -50,6 +54,7 @@ class InspectionResult:
     spec: str
     category: str
     description: str
+    deviation: Optional[float] = None   # 범위 Spec 이탈량 (범위 안이면 0, 범위 항목이 아니면 None)
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -62,5 +67,134 @@ class InspectionResult:
             'is_valid': self.is_valid,
             'spec': self.spec,
             'category': self.category,
-            'description': self.description
+            'description': self.description,
+            'deviation': self.deviation
         }
+
+
+# 검수 결과 항목 필드 (InspectionResult.to_dict()와 같은 키/순서)
+RESULT_FIELDS = ('item_name', 'module', 'part', 'display_name', 'file_value', 'is_valid',
+                 'spec', 'category', 'description', 'deviation')
+
+_ITEM_FIELDS = {
+    'item_name': lambda item: item.item_name,
+    'module': lambda item: item.module,
+    'part': lambda item: item.part,
+    'display_name': lambda item: item.display_name,
+    'category': lambda item: item.category or 'Uncategorized',
+    'description': lambda item: item.description or '',
+}
+
+
+class InspectionResultView(Mapping):
+    """InspectionResults의 한 행을 딕셔너리처럼 읽는 뷰 (기존 result.get('...') 호출 호환)"""
+
+    __slots__ = ('_results', '_row')
+
+    def __init__(self, results: 'InspectionResults', row: int):
+        self._results = results
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._results.field(self._row, key)
+
+    def __iter__(self):
+        return iter(RESULT_FIELDS)
+
+    def __len__(self):
+        return len(RESULT_FIELDS)
+
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환"""
+        return dict(self)
+
+    def __repr__(self):
+        return f"InspectionResultView({self.to_dict()!r})"
+
+
+class InspectionResults(Sequence):
+    """
+    검수 결과 컬럼형 컨테이너
+
+    항목별 딕셔너리 대신 컬럼(항목 참조 / 값 / 판정 / Spec / 편차) 목록으로 저장하고,
+    인덱싱/순회 시 InspectionResultView를 반환합니다.
+    카테고리별 통계와 실패 항목 위치는 생성 시 한 번만 계산합니다.
+    """
+
+    __slots__ = ('items', 'file_values', 'is_valid', 'specs', 'deviations',
+                 'failed_indices', 'category_stats')
+
+    def __init__(self, items: List[ChecklistItem], file_values: List, is_valid: List[bool],
+                 specs: List[str], deviations: List[Optional[float]]):
+        self.items = items
+        self.file_values = file_values
+        self.is_valid = is_valid
+        self.specs = specs
+        self.deviations = deviations
+
+        failed_indices = []
+        category_stats: Dict[str, Dict[str, int]] = {}
+        for row, (item, valid) in enumerate(zip(items, is_valid)):
+            category = item.category or 'Uncategorized'
+            stats = category_stats.get(category)
+            if stats is None:
+                stats = category_stats[category] = {'passed': 0, 'failed': 0, 'total': 0}
+            stats['total'] += 1
+            if valid:
+                stats['passed'] += 1
+            else:
+                stats['failed'] += 1
+                failed_indices.append(row)
+
+        self.failed_indices: Tuple[int, ...] = tuple(failed_indices)
+        self.category_stats = category_stats
+
+    @classmethod
+    def empty(cls) -> 'InspectionResults':
+        return cls([], [], [], [], [])
+
+    def field(self, row: int, key: str):
+        """행/필드 값"""
+        getter = _ITEM_FIELDS.get(key)
+        if getter is not None:
+            return getter(self.items[row])
+        if key == 'file_value':
+            return self.file_values[row]
+        if key == 'is_valid':
+            return self.is_valid[row]
+        if key == 'spec':
+            return self.specs[row]
+        if key == 'deviation':
+            return self.deviations[row]
+        raise KeyError(key)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('result index out of range')
+        return InspectionResultView(self, index)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    @property
+    def failed_count(self) -> int:
+        return len(self.failed_indices)
+
+    def failed(self) -> List[InspectionResultView]:
+        """실패 항목 뷰 목록 (생성 시 계산된 위치 사용)"""
+        return [InspectionResultView(self, row) for row in self.failed_indices]
+
+    def to_dicts(self) -> List[dict]:
+        """항목별 딕셔너리 목록 (JSON 저장 등)"""
+        return [view.to_dict() for view in self]
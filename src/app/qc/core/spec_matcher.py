@@ -2,10 +2,37 @@
 Spec Matcher - Module.Part.ItemName 복합 키 기반 매칭
 """
 
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Union
 from .models import ChecklistItem
 
 
+def _type_common_order(file_key: Tuple) -> Tuple:
+    """Type Common 후보 정렬 키 (Module, Part 이름순, NULL 우선)"""
+    module, part, _ = file_key
+    return (module is not None, str(module or ''), part is not None, str(part or ''))
+
+
+class IndexedFileData:
+    """
+    파일 단위 매칭 인덱스
+
+    - parsed: (Module, Part, ItemName) → Value 매핑
+    - name_index: ItemName → [복합 키, ...] (Type Common 매칭용, 정렬된 후보 목록)
+
+    Checklist 내용과 무관하므로 한 번 만들어 두면 Checklist 버전/Configuration이
+    바뀌어도 그대로 재사용할 수 있습니다.
+    """
+
+    __slots__ = ('parsed', 'name_index')
+
+    def __init__(self, parsed: Dict[Tuple, Any]):
+        self.parsed = parsed
+        self.name_index = SpecMatcher.build_name_index(parsed)
+
+    def __len__(self):
+        return len(self.parsed)
+
+
 class SpecMatcher:
     """Module.Part.ItemName 복합 키 기반 파라미터 매칭 클래스"""
 
@@ -37,9 +64,50 @@ class SpecMatcher:
         return parsed
 
     @staticmethod
+    def build_name_index(file_data_parsed: Dict[Tuple, Any]) -> Dict[str, List[Tuple]]:
+        """
+        ItemName → 복합 키 목록 인덱스 생성
+
+        같은 ItemName이 여러 Module/Part에 있으면 (Module, Part) 이름순으로 정렬하여
+        파일 내 순서와 관계없이 항상 같은 키가 선택되도록 합니다.
+
+        Args:
+            file_data_parsed: 파싱된 파일 데이터
+
+        Returns:
+            Dict[str, List[Tuple]]: ItemName → [(Module, Part, ItemName), ...]
+        """
+        name_index = {}
+        for file_key in file_data_parsed:
+            name_index.setdefault(file_key[2], []).append(file_key)
+
+        for keys in name_index.values():
+            if len(keys) > 1:
+                keys.sort(key=_type_common_order)
+
+        return name_index
+
+    @classmethod
+    def index_file_data(cls, file_data: Union[Dict[str, Any], IndexedFileData]) -> IndexedFileData:
+        """
+        파일 데이터를 파싱하고 매칭 인덱스 생성 (파일당 한 번)
+
+        Args:
+            file_data: 원본 파일 데이터 또는 이미 인덱싱된 데이터
+
+        Returns:
+            IndexedFileData: 재사용 가능한 매칭 인덱스
+        """
+        if isinstance(file_data, IndexedFileData):
+            return file_data
+        return IndexedFileData(cls.parse_file_data(file_data))
+
+    @classmethod
     def match_items(
+        cls,
         checklist_items: List[ChecklistItem],
-        file_data_parsed: Dict[Tuple, Any]
+        file_data_parsed: Dict[Tuple, Any],
+        name_index: Optional[Dict[str, List[Tuple]]] = None
     ) -> List[Tuple[ChecklistItem, Tuple, Any]]:
         """
         Checklist 항목과 파일 데이터 매칭
@@ -51,10 +119,14 @@ class SpecMatcher:
         Args:
             checklist_items: Checklist 항목 목록
             file_data_parsed: 파싱된 파일 데이터
+            name_index: ItemName 인덱스 (None이면 생성)
 
         Returns:
             List[Tuple[ChecklistItem, Tuple, Any]]: (항목, 파일키, 값) 튜플 목록
         """
+        if name_index is None:
+            name_index = cls.build_name_index(file_data_parsed)
+
         matched = []
 
         for item in checklist_items:
@@ -67,10 +139,10 @@ class SpecMatcher:
 
             # 우선순위 2: module, part가 NULL이면 ItemName만 매칭 (Type Common)
             if item.module is None and item.part is None:
-                for file_key, file_value in file_data_parsed.items():
-                    if file_key[2] == item.item_name:  # ItemName만 비교
-                        matched.append((item, file_key, file_value))
-                        break
+                candidates = name_index.get(item.item_name)
+                if candidates:
+                    file_key = candidates[0]
+                    matched.append((item, file_key, file_data_parsed[file_key]))
 
         return matched
 
@@ -78,17 +150,17 @@ class SpecMatcher:
     def match(
         cls,
         checklist_items: List[ChecklistItem],
-        file_data: Dict[str, Any]
+        file_data: Union[Dict[str, Any], IndexedFileData]
     ) -> List[Tuple[ChecklistItem, Tuple, Any]]:
         """
         Checklist 항목과 파일 데이터 매칭 (All-in-One)
 
         Args:
             checklist_items: Checklist 항목 목록
-            file_data: 원본 파일 데이터
+            file_data: 원본 파일 데이터 또는 index_file_data() 결과 (여러 번 검수 시 재사용)
 
         Returns:
             List[Tuple[ChecklistItem, Tuple, Any]]: (항목, 파일키, 값) 튜플 목록
         """
-        file_data_parsed = cls.parse_file_data(file_data)
-        return cls.match_items(checklist_items, file_data_parsed)
+        indexed = cls.index_file_data(file_data)
+        return cls.match_items(checklist_items, indexed.parsed, indexed.name_index)
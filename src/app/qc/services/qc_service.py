@@ -6,10 +6,11 @@ Phase 2 리팩토링:
 - 검수 실행 및 결과 관리 통합
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
 from ..core import InspectionEngine, ChecklistProvider, SpecMatcher
+from ..utils.data_processor import DataProcessor
 
 
 class QCService:
@@ -29,7 +30,8 @@ class QCService:
         """
         self.db_schema = db_schema
         self.engine = InspectionEngine()
-        self.checklist_provider = ChecklistProvider()
+        # 엔진과 같은 Provider를 사용하여 Checklist 스냅샷 공유
+        self.checklist_provider = self.engine.checklist_provider
 
     def run_inspection(
         self,
@@ -60,6 +62,27 @@ class QCService:
         result['timestamp'] = datetime.now().isoformat()
         return result
 
+    def run_batch_inspection(
+        self,
+        files: Union[Dict[str, Any], List[str]],
+        configuration_id: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 파일 일괄 QC 검수 (출고 장비 여러 대를 같은 Configuration으로 검수)
+
+        Args:
+            files: 파일 이름 → 파일 데이터 매핑, 또는 파일 경로 목록
+            configuration_id: Configuration ID (None이면 Type Common)
+            max_workers: 워커 수 (None이면 자동)
+
+        Returns:
+            Dict: InspectionEngine.inspect_batch() 결과 + 'timestamp'
+        """
+        result = self.engine.inspect_batch(files, configuration_id, max_workers)
+        result['timestamp'] = datetime.now().isoformat()
+        return result
+
     def get_inspection_summary(self, result: Dict[str, Any]) -> str:
         """
         검수 결과 요약 문자열 생성
@@ -161,18 +184,8 @@ class QCService:
         passed = result.get('passed_count', 0)
         failed = result.get('failed_count', 0)
 
-        # 카테고리별 통계
-        category_stats = {}
-        for r in result.get('results', []):
-            category = r.get('category', 'Uncategorized')
-            if category not in category_stats:
-                category_stats[category] = {'passed': 0, 'failed': 0, 'total': 0}
-
-            category_stats[category]['total'] += 1
-            if r.get('is_valid'):
-                category_stats[category]['passed'] += 1
-            else:
-                category_stats[category]['failed'] += 1
+        # 카테고리별 통계 (InspectionResults는 생성 시 계산된 통계 사용)
+        category_stats = DataProcessor.count_by_category(result.get('results', []))
 
         return {
             'total': total,
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 import pandas as pd
 
+from ..utils.data_processor import DataProcessor
+
 
 class ReportService:
     """QC 검수 보고서 생성 서비스"""
@@ -97,7 +99,7 @@ class ReportService:
                 })
 
             # 3. 실패 항목만 필터링
-            failed_results = [r for r in results if not r.get('is_valid')]
+            failed_results = DataProcessor.filter_failed_only(results)
             if failed_results:
                 failed_data = []
                 for result in failed_results:
@@ -115,17 +117,7 @@ class ReportService:
                 })
 
             # 4. 카테고리별 통계
-            category_stats = {}
-            for result in results:
-                category = result.get('category', 'Uncategorized')
-                if category not in category_stats:
-                    category_stats[category] = {'passed': 0, 'failed': 0, 'total': 0}
-
-                category_stats[category]['total'] += 1
-                if result.get('is_valid'):
-                    category_stats[category]['passed'] += 1
-                else:
-                    category_stats[category]['failed'] += 1
+            category_stats = DataProcessor.count_by_category(results)
 
             category_data = []
             for category, stats in category_stats.items():
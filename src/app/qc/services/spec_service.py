@@ -7,6 +7,8 @@ Spec Service - QC Spec 관리 서비스
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from ..core.checklist_provider import bump_checklist_version
+
 
 class SpecService:
     """QC Spec 관리 서비스"""
@@ -144,6 +146,7 @@ class SpecService:
                  expected_value, category, description)
             )
             self.spec_cache.clear()
+            bump_checklist_version()
             return True
         except Exception as e:
             print(f"Checklist 항목 추가 오류: {e}")
@@ -189,6 +192,7 @@ class SpecService:
         try:
             self.db_schema.execute_update(query, values)
             self.spec_cache.clear()
+            bump_checklist_version()
             return True
         except Exception as e:
             print(f"Checklist 항목 업데이트 오류: {e}")
@@ -216,6 +220,7 @@ class SpecService:
         try:
             self.db_schema.execute_update(query, (item_id,))
             self.spec_cache.clear()
+            bump_checklist_version()
             return True
         except Exception as e:
             print(f"Checklist 항목 삭제 오류: {e}")
@@ -297,6 +302,7 @@ class SpecService:
                 query,
                 (configuration_id, checklist_item_id, reason)
             )
+            bump_checklist_version()
             return True
         except Exception as e:
             print(f"예외 항목 추가 오류: {e}")
@@ -322,6 +328,7 @@ class SpecService:
 
         try:
             self.db_schema.execute_update(query, (exception_id,))
+            bump_checklist_version()
             return True
         except Exception as e:
             print(f"예외 항목 제거 오류: {e}")
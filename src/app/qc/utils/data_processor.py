@@ -7,6 +7,8 @@ Data Processor - QC 검수 데이터 처리 유틸리티
 import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple
 
+from ..core.models import InspectionResults
+
 
 class DataProcessor:
     """QC 검수 데이터 처리 유틸리티"""
@@ -157,4 +159,33 @@ class DataProcessor:
         Returns:
             List[Dict]: 실패한 결과만
         """
+        if isinstance(results, InspectionResults):
+            return results.failed()
         return [r for r in results if not r.get('is_valid', True)]
+
+    @staticmethod
+    def count_by_category(results: List[Dict]) -> Dict[str, Dict[str, int]]:
+        """
+        카테고리별 Pass/Fail 통계
+
+        Args:
+            results: 검수 결과 리스트 (InspectionResults면 생성 시 계산된 통계 사용)
+
+        Returns:
+            Dict: 카테고리 → {'passed', 'failed', 'total'}
+        """
+        if isinstance(results, InspectionResults):
+            return {category: dict(stats) for category, stats in results.category_stats.items()}
+
+        category_stats = {}
+        for result in results:
+            category = result.get('category', 'Uncategorized')
+            if category not in category_stats:
+                category_stats[category] = {'passed': 0, 'failed': 0, 'total': 0}
+
+            category_stats[category]['total'] += 1
+            if result.get('is_valid'):
+                category_stats[category]['passed'] += 1
+            else:
+                category_stats[category]['failed'] += 1
+        return category_stats
@@ -92,14 +92,10 @@ class FileHandler:
             if value_column not in df.columns:
                 return None, f"Value 컬럼을 찾을 수 없음: {list(df.columns)}"
 
-            # 파라미터 추출
-            parameters = {}
-            for _, row in df.iterrows():
-                item_name = row[item_name_column]
-                value = row[value_column]
-
-                if pd.notna(item_name):
-                    parameters[str(item_name)] = value
+            # 파라미터 추출 (ItemName이 비어 있는 행 제외)
+            valid = df[item_name_column].notna()
+            names = df.loc[valid, item_name_column].astype(str)
+            parameters = dict(zip(names, df.loc[valid, value_column]))
 
             return parameters, None
 
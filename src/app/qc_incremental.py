@@ -0,0 +1,229 @@
+# Custom QC 증분 검수 모듈
+# (스펙, 파일) 셀 단위로 결과를 기억하고, 바뀐 스펙/파일에 해당하는 셀만 다시 평가
+
+from collections import namedtuple
+
+# 검수 셀 결과
+#   tag: 'pass' | 'fail' | 'error'
+#   row_values: 트리뷰 값 (No. 제외)
+#   record: 내보내기용 결과 딕셔너리 (error 셀은 None)
+CellResult = namedtuple('CellResult', ['tag', 'row_values', 'record'])
+
+# 증분 검수 변경 내역 (트리뷰 반영용)
+#   rows: 현재 표시할 셀 키 목록 (순서대로)
+#   added / updated / removed: 새로 생긴 / 내용이 바뀐 / 사라진 셀 키
+#   evaluated: 이번에 다시 평가한 셀 수
+InspectionDelta = namedtuple('InspectionDelta', ['rows', 'added', 'updated', 'removed', 'evaluated'])
+
+# 결과에 영향을 주는 스펙 필드
+SPEC_FIELDS = ('enabled', 'min_spec', 'max_spec', 'item_value', 'unit')
+
+
+def spec_fingerprint(spec):
+    """스펙 변경 감지용 값"""
+    return tuple(spec.get(field) for field in SPEC_FIELDS)
+
+
+def spec_keys(specs):
+    """
+    스펙별 키 (item_name, 같은 이름 내 순번) - 같은 ItemName 스펙이 여러 개여도 구분
+
+    Returns:
+        list: specs와 같은 순서의 키 목록
+    """
+    seen = {}
+    keys = []
+    for spec in specs:
+        name = spec['item_name']
+        occurrence = seen.get(name, 0)
+        seen[name] = occurrence + 1
+        keys.append((name, occurrence))
+    return keys
+
+
+def evaluate_cell(spec, measured_value, file_name, equipment_type):
+    """
+    단일 (스펙, 파일) 셀 검수 - 3가지 검증 모드
+
+    1. MinSpec, MaxSpec 있음 → 범위 검증
+    2. MinSpec, MaxSpec 없고 ItemValue 있음 → 정확한 값 매칭 (대소문자 무시)
+    3. 모두 없음 → 항목 존재만 확인
+
+    Returns:
+        CellResult
+    """
+    item_name = spec['item_name']
+    min_spec = spec.get('min_spec')
+    max_spec = spec.get('max_spec')
+    item_value = spec.get('item_value')
+    unit = spec.get('unit', '')
+
+    if min_spec is not None and max_spec is not None:
+        try:
+            measured_float = float(measured_value)
+        except ValueError:
+            # 숫자로 변환 불가능한 경우
+            return CellResult('error', (item_name, min_spec, max_spec, unit, measured_value,
+                                        "⚠️ Error", "값 변환 불가", file_name), None)
+
+        if min_spec <= measured_float <= max_spec:
+            result, tag = "✅ Pass", 'pass'
+        else:
+            result, tag = "❌ Fail", 'fail'
+
+        # 편차 계산
+        deviation = ""
+        if measured_float < min_spec:
+            deviation = f"▼ {min_spec - measured_float:.3f}"
+        elif measured_float > max_spec:
+            deviation = f"▲ {measured_float - max_spec:.3f}"
+
+        return CellResult(tag, (item_name, min_spec, max_spec, unit, measured_float,
+                                result, deviation, file_name), {
+            'item_name': item_name,
+            'min_spec': min_spec,
+            'max_spec': max_spec,
+            'unit': unit,
+            'measured_value': measured_float,
+            'result': result,
+            'deviation': deviation,
+            'file_name': file_name,
+            'equipment_type': equipment_type
+        })
+
+    if item_value:
+        if str(measured_value).upper() == str(item_value).upper():
+            result, tag, deviation = "✅ Pass", 'pass', ""
+        else:
+            result, tag, deviation = "❌ Fail", 'fail', f"기대값: {item_value}"
+
+        # MinSpec 컬럼에 기대값 표시, MaxSpec는 빈칸
+        return CellResult(tag, (item_name, f"={item_value}", "", unit, measured_value,
+                                result, deviation, file_name), {
+            'item_name': item_name,
+            'expected_value': item_value,
+            'unit': unit,
+            'measured_value': measured_value,
+            'result': result,
+            'deviation': deviation,
+            'file_name': file_name,
+            'equipment_type': equipment_type
+        })
+
+    return CellResult('pass', (item_name, "존재", "", unit, measured_value,
+                               "✅ Pass", "존재 확인", file_name), {
+        'item_name': item_name,
+        'unit': unit,
+        'measured_value': measured_value,
+        'result': "✅ Pass",
+        'deviation': "존재 확인",
+        'file_name': file_name,
+        'equipment_type': equipment_type
+    })
+
+
+class IncrementalQCInspector:
+    """
+    Custom QC 증분 검수기
+
+    셀 키 = (스펙 키, 파일명). 스펙 지문(SPEC_FIELDS)이나 파일 토큰이 바뀐 셀,
+    새로 생긴 셀만 다시 평가하고 나머지는 이전 결과를 재사용합니다.
+    """
+
+    def __init__(self, equipment_type):
+        self.equipment_type = equipment_type
+        self.cells = {}                 # 셀 키 → CellResult (값이 없는 셀은 None)
+        self.rows = []                  # 표시 중인 셀 키 (순서대로)
+        self.spec_fingerprints = {}     # 스펙 키 → 지문
+        self.file_tokens = {}           # 파일명 → 토큰
+
+    def update(self, specs, file_names, value_lookup, file_tokens=None):
+        """
+        증분 검수 실행
+
+        Args:
+            specs: 스펙 목록 (enabled=False 항목은 제외)
+            file_names: 검수 파일 목록 (표시 순서)
+            value_lookup: (file_name, item_name) → 측정값 (없으면 None)
+            file_tokens: 파일명 → 데이터 토큰 (바뀐 파일의 셀만 재평가, None이면 토큰 비교 생략)
+
+        Returns:
+            InspectionDelta
+        """
+        file_tokens = file_tokens or {}
+        changed_files = {name for name in file_names
+                         if file_tokens.get(name) != self.file_tokens.get(name)}
+
+        new_cells = {}
+        new_fingerprints = {}
+        rows = []
+        added, updated = [], []
+        evaluated = 0
+
+        for key, spec in zip(spec_keys(specs), specs):
+            if not spec.get('enabled', True):
+                continue  # 비활성화된 항목 건너뛰기
+
+            fingerprint = spec_fingerprint(spec)
+            new_fingerprints[key] = fingerprint
+            spec_changed = self.spec_fingerprints.get(key) != fingerprint
+
+            for file_name in file_names:
+                cell_key = (key, file_name)
+                if not spec_changed and file_name not in changed_files and cell_key in self.cells:
+                    cell = self.cells[cell_key]
+                else:
+                    evaluated += 1
+                    measured_value = value_lookup(file_name, spec['item_name'])
+                    cell = None if measured_value is None else evaluate_cell(
+                        spec, measured_value, file_name, self.equipment_type)
+
+                    previous = self.cells.get(cell_key)
+                    if cell is not None:
+                        if previous is None:
+                            added.append(cell_key)
+                        elif previous != cell:
+                            updated.append(cell_key)
+
+                new_cells[cell_key] = cell
+                if cell is not None:
+                    rows.append(cell_key)
+
+        current = set(rows)
+        removed = [cell_key for cell_key in self.rows if cell_key not in current]
+
+        self.cells = new_cells
+        self.rows = rows
+        self.spec_fingerprints = new_fingerprints
+        self.file_tokens = {name: file_tokens.get(name) for name in file_names}
+
+        return InspectionDelta(rows, added, updated, removed, evaluated)
+
+    def records(self):
+        """내보내기용 결과 목록 (error 셀 제외)"""
+        return [self.cells[key].record for key in self.rows if self.cells[key].record is not None]
+
+    def counts(self):
+        """(pass 수, fail 수)"""
+        pass_count = fail_count = 0
+        for key in self.rows:
+            tag = self.cells[key].tag
+            if tag == 'pass':
+                pass_count += 1
+            elif tag == 'fail':
+                fail_count += 1
+        return pass_count, fail_count
+
+    def row_numbers(self):
+        """
+        셀 키 → No. 컬럼 값
+
+        기존 표시 방식과 같이 No.는 결과(record) 수 기준이며, error 행은 다음 결과와 같은 번호를 씁니다.
+        """
+        numbers = {}
+        count = 0
+        for key in self.rows:
+            numbers[key] = count + 1
+            if self.cells[key].record is not None:
+                count += 1
+        return numbers
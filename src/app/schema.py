@@ -5,13 +5,32 @@ import sqlite3
 from datetime import datetime
 from contextlib import contextmanager
 
+from app.connection_pool import SQLiteConnectionPool, DEFAULT_POOL_SIZE, DEFAULT_HEALTH_CHECK_INTERVAL
+from app.index_catalog import ensure_indexes
+from app.schema_migrations import (Migration, MigrationRunner, table_columns, rename_columns, add_columns,
+                                   unique_constraints)
+from app.startup_profiler import profiled
+from app.storage_profile import (configured_storage_profile, resolve_storage_profile, connection_pragmas,
+                                 apply_journal_mode, run_maintenance, describe_storage)
+
+
+def _bump_checklist_version():
+    """QC Checklist/예외 변경 알림 - ChecklistProvider 스냅샷 무효화 (app.qc는 무거우므로 쓰기 시점에 import)"""
+    from app.qc.core.checklist_provider import bump_checklist_version
+    bump_checklist_version()
+
+
 class DBSchema:
     """
     DB Manager 애플리케이션의 로컬 데이터베이스 스키마를 관리하는 클래스
     장비 유형 및 Default DB 값 저장을 위한 테이블 구조를 생성하고 관리합니다.
     컨텍스트 매니저 패턴을 사용하여 데이터베이스 연결을 효율적으로 관리합니다.
+    연결은 SQLiteConnectionPool로 재사용하며, 종료 시 close()를 호출합니다.
+    저장소 프로필(safe / fast / bulk-import)에 따라 WAL 및 연결별 PRAGMA를 적용합니다.
     """
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, pool_size=DEFAULT_POOL_SIZE,
+                 health_check_interval=DEFAULT_HEALTH_CHECK_INTERVAL,
+                 storage_profile=None):
         if db_path is None:
             # 기존 데이터베이스 위치 사용 (프로젝트 루트/data/)
             app_data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data')
@@ -20,152 +39,69 @@ class DBSchema:
             self.db_path = os.path.join(app_data_dir, 'local_db.sqlite')
         else:
             self.db_path = db_path
+
+        # 프로필을 지정하지 않으면 settings.json 설정을 따름 (같은 DB 파일의 모든 연결에 같은 PRAGMA 적용)
+        self.storage_profile = (configured_storage_profile() if storage_profile is None
+                                else resolve_storage_profile(storage_profile))
+        self._pool = SQLiteConnectionPool(self.db_path, pool_size, health_check_interval,
+                                          init_statements=connection_pragmas(self.storage_profile))
+        with self.get_connection() as conn:
+            self.journal_mode = apply_journal_mode(conn, self.storage_profile)
+
+        # Default DB 파라미터 존재 인덱스 캐시: {(소문자 장비 유형명, 파라미터명)}
+        self._default_param_index = None
+        self._default_param_index_token = None
+
         self.create_tables()
 
     @contextmanager
     def get_connection(self, conn_override=None):
-        conn_provided = conn_override is not None
-        conn = conn_override if conn_provided else sqlite3.connect(self.db_path)
+        """풀에서 연결을 빌려 사용 후 반납 (conn_override가 있으면 그 연결을 그대로 사용)"""
+        if conn_override is not None:
+            yield conn_override
+            return
+
+        conn = self._pool.acquire()
         try:
             yield conn
         finally:
-            if not conn_provided and conn:
-                conn.close()
+            self._pool.release(conn)
 
-    def create_tables(self):
-        """핵심 테이블들만 생성"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # 장비 유형 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Types (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                type_name TEXT NOT NULL UNIQUE,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-            
-            # Default DB 값 테이블 (컬럼명 통일: module_name→module, part_name→part)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Default_DB_Values (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                equipment_type_id INTEGER NOT NULL,
-                parameter_name TEXT NOT NULL,
-                default_value TEXT NOT NULL,
-                min_spec TEXT,
-                max_spec TEXT,
-                occurrence_count INTEGER DEFAULT 1,
-                total_files INTEGER DEFAULT 1,
-                confidence_score REAL DEFAULT 1.0,
-                source_files TEXT,
-                description TEXT,
-                module TEXT,
-                part TEXT,
-                item_type TEXT,
-                is_checklist INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id),
-                UNIQUE(equipment_type_id, parameter_name)
-            )
-            ''')
+    def close(self):
+        """WAL 체크포인트 후 연결 풀 종료 (애플리케이션 종료 시 호출)"""
+        try:
+            self.run_maintenance(truncate=True)
+        except sqlite3.Error as e:
+            print(f"종료 시 DB 유지보수 실패: {str(e)}")
+        self._pool.close_all()
 
-            # Phase 1: QC Check list 마스터 테이블 (module, part, item_type 추가)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS QC_Checklist_Items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                item_name TEXT NOT NULL,
-                parameter_pattern TEXT NOT NULL,
-                is_common INTEGER DEFAULT 1,
-                severity_level TEXT CHECK(severity_level IN ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')) DEFAULT 'MEDIUM',
-                validation_rule TEXT,
-                description TEXT,
-                module TEXT,
-                part TEXT,
-                item_type TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(module, part, item_name)
-            )
-            ''')
+    def run_maintenance(self, truncate=False):
+        """WAL 체크포인트 및 PRAGMA optimize 실행 (주기적 호출)"""
+        with self.get_connection() as conn:
+            return run_maintenance(conn, truncate)
 
-            # Phase 1: 장비별 Check list 매핑 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Checklist_Mapping (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                equipment_type_id INTEGER NOT NULL,
-                checklist_item_id INTEGER NOT NULL,
-                is_required INTEGER DEFAULT 1,
-                custom_validation_rule TEXT,
-                priority INTEGER DEFAULT 100,
-                added_reason TEXT,
-                added_by TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
-                FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
-                UNIQUE(equipment_type_id, checklist_item_id)
-            )
-            ''')
+    def get_storage_info(self):
+        """현재 저장소 프로필 및 적용된 PRAGMA 값"""
+        with self.get_connection() as conn:
+            return describe_storage(conn, self.storage_profile)
 
-            # Phase 1: 장비별 Check list 예외 처리 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Checklist_Exceptions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                equipment_type_id INTEGER NOT NULL,
-                checklist_item_id INTEGER NOT NULL,
-                reason TEXT NOT NULL,
-                approved_by TEXT,
-                approved_date TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
-                FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
-                UNIQUE(equipment_type_id, checklist_item_id)
-            )
-            ''')
+    def get_pool_stats(self):
+        """연결 풀 통계 정보"""
+        return self._pool.get_stats()
 
-            # Phase 1: Check list 변경 이력 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Checklist_Audit_Log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                action TEXT CHECK(action IN ('ADD', 'REMOVE', 'MODIFY', 'APPROVE', 'REJECT')) NOT NULL,
-                target_table TEXT NOT NULL,
-                target_id INTEGER,
-                old_value TEXT,
-                new_value TEXT,
-                reason TEXT,
-                user TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
+    @profiled('DBSchema.create_tables')
+    def create_tables(self):
+        """
+        스키마 생성/마이그레이션 (app/schema_migrations.py)
 
-            conn.commit()
-            
-            # is_performance 컬럼이 있다면 is_checklist로 마이그레이션
-            self._migrate_performance_to_checklist(cursor, conn)
+        schema_version에 기록된 버전 이후의 단계만 실행하므로, 최신 DB는 버전 조회 1회로 끝납니다.
 
-    def _migrate_performance_to_checklist(self, cursor, conn):
-        """is_performance 컬럼을 is_checklist로 마이그레이션"""
-        try:
-            # 기존 컬럼이 있는지 확인
-            cursor.execute("PRAGMA table_info(Default_DB_Values)")
-            columns = [column[1] for column in cursor.fetchall()]
-            
-            if 'is_performance' in columns and 'is_checklist' not in columns:
-                # is_checklist 컬럼 추가
-                cursor.execute("ALTER TABLE Default_DB_Values ADD COLUMN is_checklist INTEGER DEFAULT 0")
-                
-                # 기존 is_performance 값을 is_checklist로 복사
-                cursor.execute("UPDATE Default_DB_Values SET is_checklist = is_performance")
-                
-                conn.commit()
-                print("✅ is_performance → is_checklist 마이그레이션 완료")
-                
-        except Exception as e:
-            print(f"마이그레이션 중 오류 (무시 가능): {e}")
+        Returns:
+            list: 이번에 적용한 마이그레이션 단계 목록
+        """
+        with self.get_connection() as conn:
+            self.applied_migrations = SCHEMA_MIGRATIONS.run(conn)
+        return self.applied_migrations
 
     # ==================== 장비 유형 관리 ====================
     
@@ -222,6 +158,7 @@ class DBSchema:
                 query = f"UPDATE Equipment_Types SET {', '.join(update_fields)} WHERE id = ?"
                 cursor.execute(query, params)
                 conn.commit()
+                self.invalidate_default_parameter_index()
                 return cursor.rowcount > 0
             
             return False
@@ -244,6 +181,7 @@ class DBSchema:
                 
                 # 트랜잭션 커밋
                 conn.commit()
+                self.invalidate_default_parameter_index()
                 
                 # 삭제된 항목이 있으면 성공
                 return deleted_types > 0
@@ -273,6 +211,7 @@ class DBSchema:
                       occurrence_count, total_files, confidence_score, source_files, description,
                       module, part, item_type, is_checklist))
                 conn.commit()
+                self.invalidate_default_parameter_index()
                 return cursor.lastrowid
             except sqlite3.IntegrityError:
                 return None
@@ -332,6 +271,7 @@ class DBSchema:
                 query = f"UPDATE Default_DB_Values SET {', '.join(update_fields)} WHERE id = ?"
                 cursor.execute(query, params)
                 conn.commit()
+                self.invalidate_default_parameter_index()
                 return cursor.rowcount > 0
 
             return False
@@ -342,9 +282,111 @@ class DBSchema:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM Default_DB_Values WHERE id = ?', (value_id,))
             conn.commit()
+            self.invalidate_default_parameter_index()
             return cursor.rowcount > 0
 
 
+    # 대량 쓰기 시 레코드 dict에서 읽는 컬럼 (is_checklist는 신규 추가 시에만 사용)
+    _BULK_VALUE_FIELDS = (
+        'default_value', 'min_spec', 'max_spec', 'occurrence_count', 'total_files',
+        'confidence_score', 'source_files', 'description', 'module', 'part', 'item_type'
+    )
+    _BULK_FIELD_DEFAULTS = {
+        'occurrence_count': 1, 'total_files': 1, 'confidence_score': 1.0,
+        'source_files': "", 'description': "", 'module': "", 'part': "", 'item_type': ""
+    }
+
+    def bulk_upsert_default_values(self, equipment_type_id, records, update_existing=True,
+                                   user="admin", conn_override=None):
+        """
+        Default DB 값 대량 추가/업데이트 (단일 트랜잭션)
+
+        기존 파라미터는 한 번의 조회로 확인하고, 추가/업데이트/감사 로그를 각각
+        executemany로 기록한 뒤 한 번만 커밋합니다. 실패 시 전체 롤백됩니다.
+
+        Args:
+            equipment_type_id: 장비 유형 ID
+            records: dict 리스트 (parameter_name, default_value 필수, 나머지는 _BULK_VALUE_FIELDS 참조)
+            update_existing: False면 이미 있는 파라미터는 건너뜀
+            user: 감사 로그 사용자
+
+        Returns:
+            dict: {'added': int, 'updated': int, 'skipped': int}
+        """
+        counts = {'added': 0, 'updated': 0, 'skipped': 0}
+
+        # 입력 정리: 이름/값이 없는 레코드와 배치 내 중복 이름은 건너뜀 (첫 번째 우선)
+        batch = {}
+        for record in records:
+            name = record.get('parameter_name')
+            if not name or record.get('default_value') is None or name in batch:
+                counts['skipped'] += 1
+                continue
+            values = {field: record.get(field, self._BULK_FIELD_DEFAULTS.get(field))
+                      for field in self._BULK_VALUE_FIELDS}
+            values['default_value'] = str(values['default_value'])
+            values['is_checklist'] = int(record.get('is_checklist', 0))
+            batch[name] = values
+
+        if not batch:
+            return counts
+
+        with self.get_connection(conn_override) as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    'SELECT id, parameter_name, default_value FROM Default_DB_Values WHERE equipment_type_id = ?',
+                    (equipment_type_id,)
+                )
+                existing = {name: (value_id, value) for value_id, name, value in cursor.fetchall()}
+
+                inserts, updates, audit_rows = [], [], []
+                for name, values in batch.items():
+                    field_values = [values[field] for field in self._BULK_VALUE_FIELDS]
+                    if name in existing:
+                        if not update_existing:
+                            counts['skipped'] += 1
+                            continue
+                        value_id, old_value = existing[name]
+                        updates.append(field_values + [value_id])
+                        audit_rows.append(('MODIFY', 'parameter', value_id, f"default: {old_value}",
+                                           f"default: {values['default_value']}", name, user))
+                    else:
+                        inserts.append([equipment_type_id, name] + field_values + [values['is_checklist']])
+                        audit_rows.append(('ADD', 'parameter', None, None,
+                                           f"default: {values['default_value']}", name, user))
+
+                columns = ', '.join(self._BULK_VALUE_FIELDS)
+                if inserts:
+                    placeholders = ', '.join('?' * (len(self._BULK_VALUE_FIELDS) + 3))
+                    cursor.executemany(f'''
+                    INSERT INTO Default_DB_Values
+                    (equipment_type_id, parameter_name, {columns}, is_checklist)
+                    VALUES ({placeholders})
+                    ''', inserts)
+                if updates:
+                    assignments = ', '.join(f"{field} = ?" for field in self._BULK_VALUE_FIELDS)
+                    cursor.executemany(f'''
+                    UPDATE Default_DB_Values SET {assignments}, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                    ''', updates)
+                if audit_rows:
+                    cursor.executemany('''
+                    INSERT INTO Checklist_Audit_Log
+                    (action, target_table, target_id, old_value, new_value, reason, user)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', audit_rows)
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        counts['added'] = len(inserts)
+        counts['updated'] = len(updates)
+        self.invalidate_default_parameter_index()
+        return counts
+
     def get_parameter_by_id(self, parameter_id, conn_override=None):
         """특정 ID의 파라미터 정보를 반환합니다"""
         with self.get_connection(conn_override) as conn:
@@ -436,6 +478,45 @@ class DBSchema:
             ''', (equipment_type_id,))
             return cursor.fetchone()[0]
 
+    def get_default_parameter_index(self, conn_override=None):
+        """
+        Default DB 파라미터 존재 인덱스 조회 (캐시)
+
+        모든 장비 유형의 (소문자 장비 유형명, 파라미터명) 집합을 한 번의 쿼리로 읽어
+        비교 뷰의 존재 여부 태깅을 O(1) 조회로 만듭니다.
+        쓰기 메서드 호출 또는 DB 파일 변경(다른 연결/서비스의 쓰기) 시 다시 읽습니다.
+        """
+        token = self._db_file_token()
+        if self._default_param_index is not None and token == self._default_param_index_token:
+            return self._default_param_index
+
+        with self.get_connection(conn_override) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+            SELECT LOWER(e.type_name), d.parameter_name
+            FROM Default_DB_Values d
+            JOIN Equipment_Types e ON d.equipment_type_id = e.id
+            ''')
+            self._default_param_index = frozenset(cursor.fetchall())
+        self._default_param_index_token = token
+        return self._default_param_index
+
+    def invalidate_default_parameter_index(self):
+        """Default DB 파라미터 존재 인덱스 캐시 무효화"""
+        self._default_param_index = None
+        self._default_param_index_token = None
+
+    def _db_file_token(self):
+        """DB 파일(및 WAL 파일)의 수정 시각/크기 - 외부 쓰기 감지용"""
+        token = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                stat = os.stat(path)
+                token.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                token.append(None)
+        return tuple(token)
+
     # ==================== Phase 1: Check list 관리 ====================
 
     def add_checklist_item(self, item_name, parameter_pattern, is_common=True,
@@ -450,6 +531,7 @@ class DBSchema:
                 VALUES (?, ?, ?, ?, ?, ?)
                 ''', (item_name, parameter_pattern, 1 if is_common else 0, severity_level, validation_rule, description))
                 conn.commit()
+                _bump_checklist_version()
                 return cursor.lastrowid
             except sqlite3.IntegrityError:
                 return None
@@ -543,6 +625,7 @@ class DBSchema:
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
                 ''', (equipment_type_id, checklist_item_id, reason, approved_by))
                 conn.commit()
+                _bump_checklist_version()
 
                 # Audit Log 기록
                 self._log_checklist_audit('ADD', 'Equipment_Checklist_Exceptions', cursor.lastrowid,
@@ -669,6 +752,7 @@ class DBSchema:
             WHERE id = ?
             ''', params)
             conn.commit()
+            _bump_checklist_version()
 
             # Audit Log 기록
             old_value = f"name={old_row[0]}, severity={old_row[2]}"
@@ -700,6 +784,7 @@ class DBSchema:
             # 항목 삭제
             cursor.execute('DELETE FROM QC_Checklist_Items WHERE id = ?', (item_id,))
             conn.commit()
+            _bump_checklist_version()
 
             # Audit Log 기록
             self._log_checklist_audit('REMOVE', 'QC_Checklist_Items', item_id,
@@ -731,4 +816,261 @@ class DBSchema:
             self._log_checklist_audit('REMOVE', 'Equipment_Checklist_Mapping', mapping_id,
                                      old_value, None, 'Mapping deleted', user, conn)
 
-            return True
\ No newline at end of file
+            return True
+
+
+# ==================== 스키마 마이그레이션 단계 ====================
+# 배포된 단계는 수정하지 말고 SCHEMA_MIGRATIONS 끝에 새 버전을 추가합니다.
+
+def _create_core_tables(conn):
+    """v1: 핵심 테이블 생성"""
+    # 장비 유형 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Types (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        type_name TEXT NOT NULL UNIQUE,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    # Default DB 값 테이블 (컬럼명 통일: module_name→module, part_name→part)
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Default_DB_Values (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_type_id INTEGER NOT NULL,
+        parameter_name TEXT NOT NULL,
+        default_value TEXT NOT NULL,
+        min_spec TEXT,
+        max_spec TEXT,
+        occurrence_count INTEGER DEFAULT 1,
+        total_files INTEGER DEFAULT 1,
+        confidence_score REAL DEFAULT 1.0,
+        source_files TEXT,
+        description TEXT,
+        module TEXT,
+        part TEXT,
+        item_type TEXT,
+        is_checklist INTEGER DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id),
+        UNIQUE(equipment_type_id, parameter_name)
+    )
+    ''')
+
+    # Phase 1: QC Check list 마스터 테이블 (module, part, item_type 추가)
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS QC_Checklist_Items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_name TEXT NOT NULL,
+        parameter_pattern TEXT NOT NULL,
+        is_common INTEGER DEFAULT 1,
+        severity_level TEXT CHECK(severity_level IN ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')) DEFAULT 'MEDIUM',
+        validation_rule TEXT,
+        description TEXT,
+        module TEXT,
+        part TEXT,
+        item_type TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(module, part, item_name)
+    )
+    ''')
+
+    # Phase 1: 장비별 Check list 매핑 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Checklist_Mapping (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_type_id INTEGER NOT NULL,
+        checklist_item_id INTEGER NOT NULL,
+        is_required INTEGER DEFAULT 1,
+        custom_validation_rule TEXT,
+        priority INTEGER DEFAULT 100,
+        added_reason TEXT,
+        added_by TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
+        FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
+        UNIQUE(equipment_type_id, checklist_item_id)
+    )
+    ''')
+
+    # Phase 1: 장비별 Check list 예외 처리 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Checklist_Exceptions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_type_id INTEGER NOT NULL,
+        checklist_item_id INTEGER NOT NULL,
+        reason TEXT NOT NULL,
+        approved_by TEXT,
+        approved_date TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
+        FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
+        UNIQUE(equipment_type_id, checklist_item_id)
+    )
+    ''')
+
+    # Phase 1: Check list 변경 이력 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Checklist_Audit_Log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        action TEXT CHECK(action IN ('ADD', 'REMOVE', 'MODIFY', 'APPROVE', 'REJECT')) NOT NULL,
+        target_table TEXT NOT NULL,
+        target_id INTEGER,
+        old_value TEXT,
+        new_value TEXT,
+        reason TEXT,
+        user TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+
+def _migrate_performance_to_checklist(conn):
+    """v2: is_performance 컬럼을 is_checklist로 마이그레이션"""
+    columns = table_columns(conn, 'Default_DB_Values')
+    if 'is_performance' in columns and 'is_checklist' not in columns:
+        conn.execute("ALTER TABLE Default_DB_Values ADD COLUMN is_checklist INTEGER DEFAULT 0")
+        conn.execute("UPDATE Default_DB_Values SET is_checklist = is_performance")
+        print("✅ is_performance → is_checklist 마이그레이션 완료")
+
+
+def _unify_module_part_columns(conn):
+    """
+    v3: 컬럼명 통일 (scripts/migrate_column_unification.py,
+    scripts/migrate_add_module_part_to_qc_checklist.py 대체)
+
+    - Default_DB_Values: module_name → module, part_name → part, 누락 컬럼 추가
+    - QC_Checklist_Items: module, part, item_type 컬럼 추가 (기존 항목은 NULL = Type Common)
+      ALTER TABLE은 제약을 바꾸지 않으므로 item_name UNIQUE → 복합 UNIQUE 재구성은 v4에서 수행
+    """
+    rename_columns(conn, 'Default_DB_Values', {'module_name': 'module', 'part_name': 'part'})
+    add_columns(conn, 'Default_DB_Values', {'module': 'TEXT', 'part': 'TEXT', 'item_type': 'TEXT',
+                                            'is_checklist': 'INTEGER DEFAULT 0'})
+    add_columns(conn, 'QC_Checklist_Items', {'module': 'TEXT', 'part': 'TEXT', 'item_type': 'TEXT'})
+
+
+# v1 QC_Checklist_Items 컬럼 정의 (재구성 시 기존 테이블에 있는 컬럼은 이 정의로 다시 생성)
+_QC_CHECKLIST_ITEM_COLUMNS = {
+    'id': 'INTEGER PRIMARY KEY AUTOINCREMENT',
+    'item_name': 'TEXT NOT NULL',
+    'parameter_pattern': 'TEXT NOT NULL',
+    'is_common': 'INTEGER DEFAULT 1',
+    'severity_level': "TEXT CHECK(severity_level IN ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')) DEFAULT 'MEDIUM'",
+    'validation_rule': 'TEXT',
+    'description': 'TEXT',
+    'module': 'TEXT',
+    'part': 'TEXT',
+    'item_type': 'TEXT',
+    'created_at': 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP',
+    'updated_at': 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP',
+}
+_QC_CHECKLIST_UNIQUE = ('module', 'part', 'item_name')
+
+
+def _rebuild_qc_checklist_items(conn):
+    """
+    QC_Checklist_Items를 UNIQUE(module, part, item_name)으로 재구성
+
+    ALTER TABLE로는 기존 item_name UNIQUE 제약을 바꿀 수 없으므로 새 테이블 생성 → 복사 →
+    기존 테이블 삭제 → 이름 변경 순서로 진행합니다. 기존 컬럼(Phase 1.5의 spec_min, is_active 등)은
+    모두 유지하고, 이미 복합 UNIQUE가 있으면 아무것도 하지 않습니다.
+    외래 키(PRAGMA foreign_keys)가 꺼진 연결에서 실행해야 매핑/예외 테이블이 CASCADE 삭제되지 않습니다.
+
+    Returns:
+        bool: 재구성 여부
+    """
+    table = 'QC_Checklist_Items'
+    info = conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+    if not info or _QC_CHECKLIST_UNIQUE in unique_constraints(conn, table):
+        return False
+
+    existing = [row[1] for row in info]
+    definitions = []
+    for _, name, col_type, notnull, default, _ in info:
+        definition = _QC_CHECKLIST_ITEM_COLUMNS.get(name)
+        if definition is None:
+            definition = col_type
+            if notnull:
+                definition += ' NOT NULL'
+            if default is not None:
+                definition += f' DEFAULT {default}'
+        definitions.append(f'"{name}" {definition}'.rstrip())
+    for name in ('module', 'part', 'item_type'):
+        if name not in existing:
+            definitions.append(f'"{name}" {_QC_CHECKLIST_ITEM_COLUMNS[name]}')
+    definitions.append(f'UNIQUE({", ".join(_QC_CHECKLIST_UNIQUE)})')
+
+    column_list = ', '.join(f'"{name}"' for name in existing)
+    conn.execute(f'CREATE TABLE "{table}_new" ({", ".join(definitions)})')
+    conn.execute(f'INSERT INTO "{table}_new" ({column_list}) SELECT {column_list} FROM "{table}"')
+    conn.execute(f'DROP TABLE "{table}"')
+    conn.execute(f'ALTER TABLE "{table}_new" RENAME TO "{table}"')
+    return True
+
+
+def _populate_qc_checklist_module_part(conn):
+    """
+    module/part가 비어 있는 QC_Checklist_Items 항목을 Default_DB_Values(parameter_name = item_name)에서 채움
+
+    여러 장비 유형에 같은 파라미터가 있으면 먼저 등록된 값을 사용하고,
+    같은 (module, part, item_name) 항목이 이미 있으면 건너뜁니다.
+
+    Returns:
+        int: 갱신한 항목 수
+    """
+    if not {'parameter_name', 'module', 'part', 'item_type'} <= table_columns(conn, 'Default_DB_Values'):
+        return 0
+
+    param_mapping = {}
+    rows = conn.execute("""
+        SELECT parameter_name, module, part, item_type FROM Default_DB_Values
+        WHERE module IS NOT NULL AND module != '' AND part IS NOT NULL AND part != ''
+        ORDER BY id
+    """).fetchall()
+    for name, module, part, item_type in rows:
+        param_mapping.setdefault(name, (module, part, item_type))
+
+    items = conn.execute("""
+        SELECT id, item_name FROM QC_Checklist_Items
+        WHERE module IS NULL OR module = '' OR part IS NULL OR part = ''
+    """).fetchall()
+    updated = 0
+    for item_id, item_name in items:
+        mapping = param_mapping.get(item_name)
+        if mapping is None:
+            continue
+        cursor = conn.execute("""
+            UPDATE OR IGNORE QC_Checklist_Items
+            SET module = ?, part = ?, item_type = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """, (*mapping, item_id))
+        updated += cursor.rowcount
+    return updated
+
+
+def _unique_checklist_per_module_part(conn):
+    """
+    v4: QC_Checklist_Items item_name UNIQUE → UNIQUE(module, part, item_name) (테이블 재구성)
+
+    v3의 ALTER TABLE ADD COLUMN은 기존 제약을 바꾸지 않으므로, v3까지 적용된 DB도 이 단계에서 재구성합니다.
+    이후 module/part가 비어 있는 항목을 Default_DB_Values에서 채웁니다
+    (scripts/migrate_column_unification.py의 populate_qc_checklist_module_part 대체).
+    """
+    if _rebuild_qc_checklist_items(conn):
+        print("✅ QC_Checklist_Items UNIQUE(module, part, item_name) 재구성 완료")
+    updated = _populate_qc_checklist_module_part(conn)
+    if updated:
+        print(f"✅ QC_Checklist_Items {updated}개 항목 module/part 채움")
+
+
+SCHEMA_MIGRATIONS = MigrationRunner('app.schema', [
+    Migration(1, 'create_core_tables', _create_core_tables),
+    Migration(2, 'performance_to_checklist', _migrate_performance_to_checklist),
+    Migration(3, 'unify_module_part_columns', _unify_module_part_columns),
+    Migration(4, 'unique_checklist_per_module_part', _unique_checklist_per_module_part),
+], after_apply=ensure_indexes)
@@ -0,0 +1,190 @@
+# 스키마 마이그레이션 모듈
+# schema_version 테이블에 구성요소(component)별 적용 버전을 기록하고, 아직 적용되지 않은 단계만 실행
+#
+# - 최신 DB를 열 때는 schema_version 기본 키 인덱스 조회 1회만 수행 (DDL / PRAGMA table_info 생략)
+# - 단계는 append-only: 이미 배포된 단계는 수정하지 말고 새 버전의 단계를 추가
+# - 인덱스 카탈로그(app/index_catalog.py)를 바꾼 경우에도 ensure_indexes를 실행하는 단계를 추가
+
+import sqlite3
+from collections import namedtuple
+
+from app.startup_profiler import profiled
+
+SCHEMA_VERSION_TABLE = 'schema_version'
+
+# version: 1부터 증가하는 정수, name: 단계 이름 (기록용), apply: apply(conn) - 커밋하지 않음
+Migration = namedtuple('Migration', ['version', 'name', 'apply'])
+
+
+class MigrationError(Exception):
+    """마이그레이션 단계 실행 실패"""
+
+    def __init__(self, component, migration, error):
+        super().__init__(f"{component} v{migration.version} ({migration.name}) 실패: {error}")
+        self.component = component
+        self.migration = migration
+        self.error = error
+
+
+def ensure_version_table(conn):
+    conn.execute(f'''
+    CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+        component TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (component, version)
+    )
+    ''')
+
+
+def get_version(conn, component):
+    """구성요소의 적용 버전 (schema_version 테이블이 없거나 기록이 없으면 0)"""
+    try:
+        row = conn.execute(f'SELECT MAX(version) FROM {SCHEMA_VERSION_TABLE} WHERE component = ?',
+                           (component,)).fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] or 0
+
+
+def record_version(conn, component, version, name):
+    """적용 버전 기록 (호출자가 커밋, 별도 스크립트로 실행하는 마이그레이션 기록에도 사용)"""
+    ensure_version_table(conn)
+    conn.execute(f'INSERT OR IGNORE INTO {SCHEMA_VERSION_TABLE} (component, version, name) VALUES (?, ?, ?)',
+                 (component, version, name))
+
+
+def get_history(conn):
+    """적용 기록 [(component, version, name, applied_at)]"""
+    try:
+        return conn.execute(f'SELECT component, version, name, applied_at FROM {SCHEMA_VERSION_TABLE} '
+                            f'ORDER BY component, version').fetchall()
+    except sqlite3.OperationalError:
+        return []
+
+
+# ------------------------------------------------------------
+# 단계에서 사용하는 보조 함수 (반복 실행해도 안전)
+# ------------------------------------------------------------
+def table_columns(conn, table):
+    """테이블 컬럼 이름 집합 (테이블이 없으면 빈 집합)"""
+    return {row[1] for row in conn.execute(f'PRAGMA table_info("{table}")').fetchall()}
+
+
+def unique_constraints(conn, table):
+    """테이블의 UNIQUE 제약/인덱스 컬럼 조합 집합 {(컬럼, ...)} (PRIMARY KEY 제외)"""
+    constraints = set()
+    for row in conn.execute(f'PRAGMA index_list("{table}")').fetchall():
+        if not row[2] or row[3] == 'pk':
+            continue
+        info = conn.execute(f'PRAGMA index_info("{row[1]}")').fetchall()
+        constraints.add(tuple(col[2] for col in sorted(info, key=lambda col: col[0])))
+    return constraints
+
+
+def rename_columns(conn, table, renames):
+    """
+    컬럼 이름 변경 (이전 이름이 있고 새 이름이 없을 때만)
+
+    Returns:
+        list: 변경한 (이전 이름, 새 이름) 목록
+    """
+    columns = table_columns(conn, table)
+    renamed = []
+    for old, new in renames.items():
+        if old in columns and new not in columns:
+            conn.execute(f'ALTER TABLE "{table}" RENAME COLUMN "{old}" TO "{new}"')
+            renamed.append((old, new))
+    return renamed
+
+
+def add_columns(conn, table, definitions):
+    """
+    없는 컬럼 추가 (테이블이 없으면 아무것도 하지 않음)
+
+    Args:
+        definitions: {컬럼 이름: 타입/기본값 정의} (예: {'is_checklist': 'INTEGER DEFAULT 0'})
+
+    Returns:
+        list: 추가한 컬럼 이름 목록
+    """
+    columns = table_columns(conn, table)
+    if not columns:
+        return []
+    added = []
+    for name, definition in definitions.items():
+        if name not in columns:
+            conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{name}" {definition}')
+            added.append(name)
+    return added
+
+
+class MigrationRunner:
+    """
+    구성요소별 마이그레이션 실행기
+
+    DBSchema(app/schema.py)와 계층 구조 스키마(db_schema.py)는 같은 DB 파일을 쓸 수 있으므로
+    schema_version에 구성요소 이름과 함께 버전을 기록합니다.
+    """
+
+    def __init__(self, component, migrations, after_apply=None):
+        """
+        Args:
+            component: 구성요소 이름 (schema_version.component)
+            migrations: Migration 목록 (버전 오름차순, 1부터 연속)
+            after_apply: 단계가 하나라도 적용된 뒤 호출할 함수 after_apply(conn) (예: ensure_indexes)
+        """
+        versions = [migration.version for migration in migrations]
+        if versions != list(range(1, len(versions) + 1)):
+            raise ValueError(f"{component}: 마이그레이션 버전은 1부터 연속이어야 합니다: {versions}")
+        self.component = component
+        self.migrations = tuple(migrations)
+        self.after_apply = after_apply
+
+    @property
+    def target_version(self):
+        return len(self.migrations)
+
+    def pending(self, conn):
+        """아직 적용되지 않은 단계 목록"""
+        return list(self.migrations[get_version(conn, self.component):])
+
+    @profiled('MigrationRunner.run')
+    def run(self, conn):
+        """
+        미적용 단계 실행
+
+        최신 상태면 버전 조회 1회 후 반환합니다. 각 단계는 자체 트랜잭션(BEGIN IMMEDIATE)에서
+        실행되고 버전 기록과 함께 커밋되며, 실패하면 해당 단계만 롤백하고 MigrationError를 발생시킵니다.
+        여러 프로세스가 동시에 열어도 쓰기 잠금을 잡은 뒤 버전을 다시 확인하므로 중복 적용되지 않습니다.
+
+        Returns:
+            list: 이번에 적용한 Migration 목록
+        """
+        if get_version(conn, self.component) >= self.target_version:
+            return []
+
+        if conn.in_transaction:
+            conn.commit()
+        ensure_version_table(conn)
+        conn.commit()
+
+        applied = []
+        for migration in self.migrations:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if get_version(conn, self.component) >= migration.version:
+                    conn.rollback()
+                    continue
+                migration.apply(conn)
+                record_version(conn, self.component, migration.version, migration.name)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise MigrationError(self.component, migration, e) from e
+            applied.append(migration)
+
+        if applied and self.after_apply is not None:
+            self.after_apply(conn)
+        return applied
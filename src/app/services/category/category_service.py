@@ -61,6 +61,8 @@ class CategoryService(ICategoryService):
             self._cache.delete(f"{self._CACHE_KEY_TYPES_BY_MODEL_PREFIX}{model_id}")
         if type_id:
             self._cache.delete(f"{self._CACHE_KEY_TYPE_PREFIX}{type_id}")
+            # ConfigurationService의 Type별 구성 목록 (type_name 포함)
+            self._cache.invalidate_tags(f"type:{type_id}")
         # 전체 목록 캐시도 무효화
         self._cache.delete(self._CACHE_KEY_ALL_MODELS)
         self._cache.delete(self._CACHE_KEY_ALL_TYPES)
@@ -0,0 +1,176 @@
+"""
+Check list 컴파일 매처
+
+장비별 Check list 항목의 parameter_pattern을 한 번만 컴파일하고,
+validation_rule JSON을 미리 파싱해 검증 함수로 만들어 둡니다.
+"""
+
+import re
+import json
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 결합 정규식에서 그룹 번호가 바뀌면 의미가 달라지는 패턴 (번호/이름 역참조)
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+_NOT_CHECKLIST = {
+    'is_checklist': False,
+    'severity_level': None,
+    'validation_passed': True,
+    'message': ''
+}
+
+
+def compile_validation_rule(validation_rule: str) -> Callable[[str], Tuple[bool, str]]:
+    """
+    validation_rule JSON을 검증 함수로 변환
+
+    validation_rule JSON 형식:
+    {
+        "type": "range" | "pattern" | "enum",
+        "min": float,
+        "max": float,
+        "pattern": str,
+        "values": [str, ...]
+    }
+
+    Returns:
+        value -> (passed, message) 함수
+    """
+    try:
+        rule = json.loads(validation_rule)
+    except json.JSONDecodeError:
+        return lambda value: (True, '검증 규칙 파싱 실패')
+
+    try:
+        rule_type = rule.get('type')
+
+        if rule_type == 'range':
+            min_val = rule.get('min')
+            max_val = rule.get('max')
+
+            def check(value):
+                try:
+                    number = float(value)
+                except ValueError:
+                    return False, "숫자 형식이 아닙니다"
+                if min_val is not None and number < min_val:
+                    return False, f"값이 최소값({min_val})보다 작습니다"
+                if max_val is not None and number > max_val:
+                    return False, f"값이 최대값({max_val})보다 큽니다"
+                return True, ''
+
+        elif rule_type == 'pattern':
+            pattern = rule.get('pattern')
+            compiled = re.compile(pattern) if pattern else None
+
+            def check(value):
+                if compiled is not None and not compiled.match(value):
+                    return False, f"패턴({pattern})과 일치하지 않습니다"
+                return True, ''
+
+        elif rule_type == 'enum':
+            values = rule.get('values', [])
+            allowed = set(values)
+
+            def check(value):
+                if value not in allowed:
+                    return False, f"허용된 값({', '.join(values)}) 중 하나가 아닙니다"
+                return True, ''
+
+        else:
+            def check(value):
+                return True, ''
+
+    except Exception as e:
+        message = f'검증 오류: {str(e)}'
+        return lambda value: (True, message)
+
+    def safe_check(value):
+        try:
+            return check(value)
+        except Exception as e:
+            return True, f'검증 오류: {str(e)}'
+
+    return safe_check
+
+
+class CompiledChecklistMatcher:
+    """
+    장비별 Check list 매처
+
+    - 항목 순서대로 첫 번째로 매칭되는 항목을 사용 (기존 re.search 루프와 동일)
+    - 모든 패턴을 하나의 결합 정규식으로 묶어, 어떤 항목에도 해당하지 않는 파라미터는 한 번의 검색으로 제외
+    - 파라미터 이름별 매칭 결과를 기억하여 여러 파일/행에 반복되는 이름은 다시 검색하지 않음
+    """
+
+    def __init__(self, checklist_items: List[Dict]):
+        self.source = checklist_items
+        self._items = []      # (item, compiled_pattern, validator)
+        self._name_cache: Dict[str, Optional[int]] = {}
+
+        for item in checklist_items:
+            pattern = item['parameter_pattern']
+            try:
+                compiled = re.compile(pattern, re.IGNORECASE)
+            except (re.error, TypeError) as e:
+                print(f"정규식 오류: {pattern} - {e}")
+                continue
+            rule = item.get('custom_validation_rule') or item.get('validation_rule')
+            validator = compile_validation_rule(rule) if rule else None
+            self._items.append((item, compiled, validator))
+
+        self._combined = self._build_combined([compiled.pattern for _, compiled, _ in self._items])
+
+    @staticmethod
+    def _build_combined(patterns: List[str]):
+        """모든 패턴의 결합 정규식 (역참조가 있거나 컴파일할 수 없으면 None)"""
+        if not patterns or any(_BACKREFERENCE.search(p) for p in patterns):
+            return None
+        try:
+            return re.compile('|'.join(f'(?P<i{idx}>{p})' for idx, p in enumerate(patterns)), re.IGNORECASE)
+        except re.error:
+            return None
+
+    def __len__(self):
+        return len(self._items)
+
+    def match_index(self, parameter_name: str) -> Optional[int]:
+        """첫 번째로 매칭되는 항목 번호 (없으면 None)"""
+        if parameter_name in self._name_cache:
+            return self._name_cache[parameter_name]
+
+        result = None
+        if self._combined is not None:
+            hit = self._combined.search(parameter_name)
+            if hit is not None:
+                # 결합 검색은 가장 왼쪽 위치의 항목을 찾으므로, 그보다 앞선 항목만 개별 확인
+                hit_index = int(hit.lastgroup[1:])
+                result = hit_index
+                for idx in range(hit_index):
+                    if self._items[idx][1].search(parameter_name):
+                        result = idx
+                        break
+        else:
+            for idx, (_, compiled, _) in enumerate(self._items):
+                if compiled.search(parameter_name):
+                    result = idx
+                    break
+
+        self._name_cache[parameter_name] = result
+        return result
+
+    def validate(self, parameter_name: str, parameter_value: str) -> Dict:
+        """validate_parameter_against_checklist와 같은 형식의 결과"""
+        idx = self.match_index(parameter_name)
+        if idx is None:
+            return dict(_NOT_CHECKLIST)
+
+        item, _, validator = self._items[idx]
+        passed, message = validator(parameter_value) if validator else (True, '')
+        return {
+            'is_checklist': True,
+            'severity_level': item['severity_level'],
+            'item_name': item['item_name'],
+            'validation_passed': passed,
+            'message': message
+        }
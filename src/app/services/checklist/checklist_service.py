@@ -2,16 +2,20 @@
 Check list 관리 서비스 구현
 """
 
-import re
 import json
 from typing import List, Dict, Optional, Tuple
 
 from ..interfaces.checklist_service_interface import IChecklistService
+from .checklist_matcher import CompiledChecklistMatcher, compile_validation_rule
 
 
 class ChecklistService(IChecklistService):
     """Check list 관리 서비스"""
 
+    # 캐시 의존 태그: 항목 마스터 변경은 전체, 매핑/예외 변경은 해당 장비만 무효화
+    _TAG_ITEMS = 'checklist'
+    _TAG_EQUIPMENT = 'checklist:type:{}'
+
     def __init__(self, db_schema, cache_service=None):
         """
         Args:
@@ -21,6 +25,9 @@ class ChecklistService(IChecklistService):
         self.db_schema = db_schema
         self.cache = cache_service
 
+        # 장비별 컴파일 매처 (get_equipment_checklist 결과 객체가 바뀌면 다시 컴파일)
+        self._matchers = {}
+
     def add_checklist_item(self, item_name: str, parameter_pattern: str,
                           is_common: bool = True, severity_level: str = 'MEDIUM',
                           validation_rule: Optional[str] = None,
@@ -49,38 +56,42 @@ class ChecklistService(IChecklistService):
 
         # 캐시 무효화
         if self.cache:
-            self.cache.invalidate_pattern('checklist_*')
+            self.cache.invalidate_tags(self._TAG_ITEMS)
 
         return result
 
     def get_common_checklist_items(self) -> List[Tuple]:
         """공통 Check list 항목 조회"""
         cache_key = 'checklist_common_items'
+        tags = (self._TAG_ITEMS,)
 
         # 캐시 조회
         if self.cache:
             cached = self.cache.get(cache_key)
             if cached is not None:
                 return cached
+            generation = self.cache.generation(tags)
 
         # DB 조회
         result = self.db_schema.get_checklist_items(common_only=True)
 
         # 캐시 저장
         if self.cache:
-            self.cache.set(cache_key, result, ttl_seconds=300)
+            self.cache.set(cache_key, result, ttl_seconds=300, tags=tags, generation=generation)
 
         return result
 
     def get_equipment_checklist(self, equipment_type_id: int) -> List[Dict]:
         """장비별 적용되는 Check list 조회"""
         cache_key = f'checklist_equipment_{equipment_type_id}'
+        tags = (self._TAG_ITEMS, self._TAG_EQUIPMENT.format(equipment_type_id))
 
         # 캐시 조회
         if self.cache:
             cached = self.cache.get(cache_key)
             if cached is not None:
                 return cached
+            generation = self.cache.generation(tags)
 
         # DB 조회
         raw_data = self.db_schema.get_equipment_checklist_items(equipment_type_id)
@@ -108,7 +119,7 @@ class ChecklistService(IChecklistService):
 
         # 캐시 저장
         if self.cache:
-            self.cache.set(cache_key, result, ttl_seconds=300)
+            self.cache.set(cache_key, result, ttl_seconds=300, tags=tags, generation=generation)
 
         return result
 
@@ -139,7 +150,8 @@ class ChecklistService(IChecklistService):
 
         # 캐시 무효화
         if self.cache:
-            self.cache.invalidate_pattern(f'checklist_equipment_{equipment_type_id}')
+            self.cache.invalidate_tags(self._TAG_EQUIPMENT.format(equipment_type_id))
+        self._matchers.pop(equipment_type_id, None)
 
         return result
 
@@ -160,7 +172,8 @@ class ChecklistService(IChecklistService):
 
         # 캐시 무효화
         if self.cache:
-            self.cache.invalidate_pattern(f'checklist_equipment_{equipment_type_id}')
+            self.cache.invalidate_tags(self._TAG_EQUIPMENT.format(equipment_type_id))
+        self._matchers.pop(equipment_type_id, None)
 
         return result
 
@@ -168,49 +181,25 @@ class ChecklistService(IChecklistService):
         """Check list 변경 이력 조회"""
         return self.db_schema.get_checklist_audit_log(limit=limit)
 
+    def get_compiled_matcher(self, equipment_type_id: int) -> CompiledChecklistMatcher:
+        """
+        장비별 컴파일 매처 조회
+
+        get_equipment_checklist의 캐시된 결과와 함께 유지되며,
+        캐시가 무효화되어 Check list가 다시 조회되면 새로 컴파일합니다.
+        """
+        checklist_items = self.get_equipment_checklist(equipment_type_id)
+        matcher = self._matchers.get(equipment_type_id)
+        if matcher is None or matcher.source is not checklist_items:
+            matcher = CompiledChecklistMatcher(checklist_items)
+            self._matchers[equipment_type_id] = matcher
+        return matcher
+
     def validate_parameter_against_checklist(self, equipment_type_id: int,
                                             parameter_name: str,
                                             parameter_value: str) -> Dict:
-        """파라미터가 Check list에 포함되는지 검증"""
-        # 장비별 Check list 조회
-        checklist_items = self.get_equipment_checklist(equipment_type_id)
-
-        # 파라미터 이름이 Check list 패턴과 매칭되는지 확인
-        for item in checklist_items:
-            pattern = item['parameter_pattern']
-            try:
-                if re.search(pattern, parameter_name, re.IGNORECASE):
-                    # Check list에 포함됨
-                    result = {
-                        'is_checklist': True,
-                        'severity_level': item['severity_level'],
-                        'item_name': item['item_name'],
-                        'validation_passed': True,
-                        'message': ''
-                    }
-
-                    # 검증 규칙이 있으면 적용
-                    validation_rule = item.get('custom_validation_rule') or item.get('validation_rule')
-                    if validation_rule:
-                        validation_result = self._apply_validation_rule(
-                            parameter_name, parameter_value, validation_rule
-                        )
-                        result['validation_passed'] = validation_result['passed']
-                        result['message'] = validation_result['message']
-
-                    return result
-
-            except re.error as e:
-                print(f"정규식 오류: {pattern} - {e}")
-                continue
-
-        # Check list에 없음
-        return {
-            'is_checklist': False,
-            'severity_level': None,
-            'validation_passed': True,
-            'message': ''
-        }
+        """파라미터가 Check list에 포함되는지 검증 (컴파일 매처 사용)"""
+        return self.get_compiled_matcher(equipment_type_id).validate(parameter_name, parameter_value)
 
     def _apply_validation_rule(self, parameter_name: str, parameter_value: str,
                               validation_rule: str) -> Dict:
@@ -226,56 +215,5 @@ class ChecklistService(IChecklistService):
             "values": [str, ...]
         }
         """
-        try:
-            rule = json.loads(validation_rule)
-            rule_type = rule.get('type')
-
-            if rule_type == 'range':
-                # 범위 검증
-                try:
-                    value = float(parameter_value)
-                    min_val = rule.get('min')
-                    max_val = rule.get('max')
-
-                    if min_val is not None and value < min_val:
-                        return {
-                            'passed': False,
-                            'message': f"값이 최소값({min_val})보다 작습니다"
-                        }
-
-                    if max_val is not None and value > max_val:
-                        return {
-                            'passed': False,
-                            'message': f"값이 최대값({max_val})보다 큽니다"
-                        }
-
-                except ValueError:
-                    return {
-                        'passed': False,
-                        'message': "숫자 형식이 아닙니다"
-                    }
-
-            elif rule_type == 'pattern':
-                # 패턴 검증
-                pattern = rule.get('pattern')
-                if pattern and not re.match(pattern, parameter_value):
-                    return {
-                        'passed': False,
-                        'message': f"패턴({pattern})과 일치하지 않습니다"
-                    }
-
-            elif rule_type == 'enum':
-                # 열거형 검증
-                values = rule.get('values', [])
-                if parameter_value not in values:
-                    return {
-                        'passed': False,
-                        'message': f"허용된 값({', '.join(values)}) 중 하나가 아닙니다"
-                    }
-
-            return {'passed': True, 'message': ''}
-
-        except json.JSONDecodeError:
-            return {'passed': True, 'message': '검증 규칙 파싱 실패'}
-        except Exception as e:
-            return {'passed': True, 'message': f'검증 오류: {str(e)}'}
+        passed, message = compile_validation_rule(validation_rule)(parameter_value)
+        return {'passed': passed, 'message': message}
@@ -3,123 +3,252 @@
 
 메모리 기반 캐싱을 제공하여 성능을 개선합니다.
 LRU(Least Recently Used) 캐시와 TTL(Time To Live) 기능을 지원합니다.
+
+- TTL은 단조 시계(time.monotonic)로 계산하며, 조회 시 시각을 기록하지 않습니다.
+- 항목 수(max_size)와 대략적인 메모리 크기(max_bytes) 모두로 LRU 제거합니다.
+- 항목에 의존 태그(예: 'config:12', 'type:3')를 붙여 두면 쓰기 시 관련 항목만 무효화할 수 있습니다.
+- 태그별 세대(generation) 번호로, 조회 중에 무효화된 결과가 다시 저장되는 것을 막습니다.
 """
 
-from typing import Any, Optional, Dict, TypeVar
-from datetime import datetime, timedelta
+from typing import Any, Optional, Dict, Iterable, Tuple, TypeVar
 from collections import OrderedDict
+import fnmatch
+import re
+import sys
 import threading
+import time
 import logging
 
 T = TypeVar('T')
 
+# 서비스 공용 캐시의 기본 크기 제한 (settings.json service_config.cache.max_bytes)
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 크기 추정 시 컨테이너에서 직접 측정하는 최대 원소 수 (나머지는 평균으로 추정)
+_SIZE_SAMPLE = 64
+_SIZE_MAX_DEPTH = 4
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    값의 대략적인 메모리 크기 (바이트)
+
+    큰 컨테이너는 앞쪽 원소 일부만 측정해 평균으로 추정하고, 일정 깊이 이하는 얕은 크기만 셉니다.
+    DataFrame / ndarray 등은 자체 크기 정보(memory_usage / nbytes)를 사용합니다.
+    """
+    try:
+        size = sys.getsizeof(value)
+    except TypeError:
+        return 64
+    if _depth >= _SIZE_MAX_DEPTH or isinstance(value, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return size + nbytes
+    memory_usage = getattr(value, 'memory_usage', None)
+    if callable(memory_usage) and hasattr(value, 'columns'):
+        try:
+            return size + int(memory_usage(index=True, deep=False).sum())
+        except Exception:
+            return size
+
+    if isinstance(value, dict):
+        items = value.items()
+        count = len(value)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+        count = len(value)
+    elif hasattr(value, '__dict__'):
+        # dataclass / 일반 객체: 속성 사전
+        return size + estimate_size(vars(value), _depth + 1)
+    else:
+        return size
+
+    if not count:
+        return size
+    measured = 0
+    sampled = 0
+    for item in items:
+        if isinstance(value, dict):
+            measured += estimate_size(item[0], _depth + 1) + estimate_size(item[1], _depth + 1)
+        else:
+            measured += estimate_size(item, _depth + 1)
+        sampled += 1
+        if sampled >= _SIZE_SAMPLE:
+            break
+    return size + measured * count // sampled
+
+
 class CacheEntry:
     """캐시 엔트리"""
-    
-    def __init__(self, value: Any, ttl_seconds: Optional[int] = None):
+
+    __slots__ = ('value', 'created_at', 'expires_at', 'access_count', 'size', 'tags')
+
+    def __init__(self, value: Any, ttl_seconds: Optional[float] = None, size: int = 0,
+                 tags: Tuple[str, ...] = ()):
         self.value = value
-        self.created_at = datetime.now()
-        self.expires_at = None
-        if ttl_seconds:
-            self.expires_at = self.created_at + timedelta(seconds=ttl_seconds)
+        self.created_at = time.monotonic()
+        self.expires_at = self.created_at + ttl_seconds if ttl_seconds else None
         self.access_count = 0
-        self.last_accessed = self.created_at
-    
-    def is_expired(self) -> bool:
+        self.size = size
+        self.tags = tags
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """만료 여부 확인"""
         if self.expires_at is None:
             return False
-        return datetime.now() > self.expires_at
-    
+        return (time.monotonic() if now is None else now) > self.expires_at
+
     def access(self) -> Any:
-        """값 접근 (접근 시간 및 횟수 업데이트)"""
-        self.last_accessed = datetime.now()
+        """값 접근 (접근 횟수 업데이트, 최근 사용 순서는 CacheService가 관리)"""
         self.access_count += 1
         return self.value
 
+
 class CacheService:
     """캐시 서비스 구현"""
-    
-    def __init__(self, max_size: int = 1000, default_ttl: Optional[int] = None):
+
+    def __init__(self, max_size: int = 1000, default_ttl: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
         """
         캐시 서비스 초기화
-        
+
         Args:
             max_size: 최대 캐시 항목 수
             default_ttl: 기본 TTL (초)
+            max_bytes: 최대 캐시 크기 (대략적인 바이트, None이면 제한 없음)
         """
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
         self._default_ttl = default_ttl
         self._lock = threading.RLock()
         self._logger = logging.getLogger(self.__class__.__name__)
-        
+
+        self._tag_index: Dict[str, set] = {}     # 태그 → 키 집합
+        self._generations: Dict[str, int] = {}   # 태그 → 무효화 세대
+        self._epoch = 0                          # clear() 세대
+        self._total_bytes = 0
+
         # 통계 정보
         self._hits = 0
         self._misses = 0
         self._evictions = 0
-    
+        self._invalidations = 0
+
+    # ------------------------------------------------------------
+    # 내부 관리
+    # ------------------------------------------------------------
+    def _remove(self, key: str) -> CacheEntry:
+        """항목 제거 (잠금 상태에서 호출)"""
+        entry = self._cache.pop(key)
+        self._total_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+        return entry
+
+    def _evict(self) -> None:
+        """항목 수 / 크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        while self._cache and (len(self._cache) > self._max_size or
+                               (self._max_bytes is not None and self._total_bytes > self._max_bytes)):
+            oldest_key = next(iter(self._cache))
+            self._remove(oldest_key)
+            self._evictions += 1
+            self._logger.debug(f"캐시 LRU 제거: {oldest_key}")
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
     def get(self, key: str) -> Optional[Any]:
         """
         캐시에서 값 조회
-        
+
         Args:
             key: 캐시 키
-            
+
         Returns:
             캐시된 값 또는 None
         """
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 self._misses += 1
                 return None
-            
-            entry = self._cache[key]
-            
+
             # 만료 확인
             if entry.is_expired():
-                del self._cache[key]
+                self._remove(key)
                 self._misses += 1
                 self._logger.debug(f"캐시 만료: {key}")
                 return None
-            
+
             # LRU 업데이트 (최근 사용된 항목을 끝으로 이동)
             self._cache.move_to_end(key)
             self._hits += 1
-            
+
             return entry.access()
-    
-    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+
+    def generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """
+        태그들의 현재 세대 (조회 시작 전에 받아 set(generation=...)에 전달)
+
+        조회하는 동안 해당 태그가 무효화되면 세대가 바뀌어, 오래된 결과는 저장되지 않습니다.
+        """
+        with self._lock:
+            return self._current_generation(tags)
+
+    def _current_generation(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        return (self._epoch,) + tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None,
+            tags: Optional[Iterable[str]] = None, size: Optional[int] = None,
+            generation: Optional[Tuple[int, ...]] = None) -> bool:
         """
         캐시에 값 저장
-        
+
         Args:
             key: 캐시 키
             value: 저장할 값
             ttl_seconds: TTL (초), None이면 default_ttl 사용
+            tags: 의존 태그 (invalidate_tags로 함께 무효화)
+            size: 크기 (바이트), None이면 추정
+            generation: generation(tags)로 받은 세대 (그 사이 무효화되었으면 저장하지 않음)
+
+        Returns:
+            저장 여부
         """
+        tags = tuple(tags) if tags else ()
+        if size is None:
+            size = estimate_size(value)
+
         with self._lock:
+            if generation is not None and generation != self._current_generation(tags):
+                self._logger.debug(f"캐시 저장 생략 (조회 중 무효화됨): {key}")
+                return False
+
             # TTL 결정
             effective_ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-            
-            # 새 엔트리 생성
-            entry = CacheEntry(value, effective_ttl)
-            
-            # 기존 키가 있으면 업데이트
+
+            # 기존 키가 있으면 교체
             if key in self._cache:
-                del self._cache[key]
-            
-            self._cache[key] = entry
-            
+                self._remove(key)
+
+            self._cache[key] = CacheEntry(value, effective_ttl, size, tags)
+            self._total_bytes += size
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+
             # 크기 제한 확인 (LRU 방식으로 제거)
-            while len(self._cache) > self._max_size:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._evictions += 1
-                self._logger.debug(f"캐시 LRU 제거: {oldest_key}")
-            
-            self._logger.debug(f"캐시 저장: {key} (TTL: {effective_ttl})")
-    
+            self._evict()
+
+            self._logger.debug(f"캐시 저장: {key} (TTL: {effective_ttl}, {size} bytes, tags: {tags})")
+            return key in self._cache
+
     def delete(self, key: str) -> bool:
         """
         캐시에서 키 삭제
@@ -132,31 +261,58 @@ class CacheService:
         """
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 self._logger.debug(f"캐시 삭제: {key}")
                 return True
             return False
 
+    # ------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        태그에 의존하는 항목만 무효화 (태그 세대도 증가)
+
+        Args:
+            tags: 무효화할 태그 (예: 'config:12', 'type:3')
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            removed = 0
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for key in list(self._tag_index.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+            self._invalidations += removed
+
+            if removed:
+                self._logger.debug(f"태그 {tags}로 {removed}개 캐시 항목 삭제")
+            return removed
+
     def invalidate_pattern(self, pattern: str) -> int:
         """
         패턴에 매칭되는 캐시 키들을 무효화
 
+        전체 키를 검사하므로, 자주 호출되는 쓰기 경로에서는 invalidate_tags를 사용하세요.
+
         Args:
             pattern: 패턴 (예: 'checklist_*', '*equipment*')
 
         Returns:
             삭제된 항목 수
         """
-        import fnmatch
-
         with self._lock:
-            keys_to_delete = []
-            for key in self._cache.keys():
-                if fnmatch.fnmatch(key, pattern):
-                    keys_to_delete.append(key)
+            if not any(ch in pattern for ch in '*?['):
+                return int(self.delete(pattern))
 
+            match = re.compile(fnmatch.translate(pattern)).match
+            keys_to_delete = [key for key in self._cache if match(key)]
             for key in keys_to_delete:
-                del self._cache[key]
+                self._remove(key)
+            self._invalidations += len(keys_to_delete)
 
             if keys_to_delete:
                 self._logger.debug(f"패턴 '{pattern}'로 {len(keys_to_delete)}개 캐시 항목 삭제")
@@ -164,69 +320,80 @@ class CacheService:
             return len(keys_to_delete)
 
     def clear(self) -> None:
-        """모든 캐시 제거"""
+        """모든 캐시 제거 (진행 중인 조회 결과도 저장되지 않도록 세대 증가)"""
         with self._lock:
             cleared_count = len(self._cache)
+            self._epoch += 1
             self._cache.clear()
+            self._tag_index.clear()
+            self._total_bytes = 0
             self._logger.info(f"캐시 전체 삭제: {cleared_count}개 항목")
-    
+
     def cleanup_expired(self) -> int:
         """
         만료된 항목들 정리
-        
+
         Returns:
             정리된 항목 수
         """
         with self._lock:
-            expired_keys = []
-            for key, entry in self._cache.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
-            
+            now = time.monotonic()
+            expired_keys = [key for key, entry in self._cache.items() if entry.is_expired(now)]
+
             for key in expired_keys:
-                del self._cache[key]
-            
+                self._remove(key)
+
             if expired_keys:
                 self._logger.info(f"만료된 캐시 항목 정리: {len(expired_keys)}개")
-            
+
             return len(expired_keys)
-    
+
+    # ------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------
     def get_statistics(self) -> Dict[str, Any]:
         """
         캐시 통계 정보 조회
-        
+
         Returns:
             통계 정보 딕셔너리
         """
         with self._lock:
             total_requests = self._hits + self._misses
             hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0
-            
+
             return {
                 'size': len(self._cache),
                 'max_size': self._max_size,
+                'bytes': self._total_bytes,
+                'max_bytes': self._max_bytes,
+                'tags': len(self._tag_index),
                 'hits': self._hits,
                 'misses': self._misses,
                 'hit_rate': round(hit_rate, 2),
                 'evictions': self._evictions,
+                'invalidations': self._invalidations,
                 'default_ttl': self._default_ttl
             }
-    
+
     def get_cache_info(self) -> Dict[str, Any]:
         """
         상세 캐시 정보 조회
-        
+
         Returns:
-            캐시 엔트리별 상세 정보
+            캐시 엔트리별 상세 정보 (시각은 현재 기준 경과/남은 초)
         """
         with self._lock:
+            now = time.monotonic()
             info = {}
             for key, entry in self._cache.items():
                 info[key] = {
-                    'created_at': entry.created_at.isoformat(),
-                    'last_accessed': entry.last_accessed.isoformat(),
+                    'age_seconds': round(now - entry.created_at, 3),
+                    'expires_in_seconds': (round(entry.expires_at - now, 3)
+                                           if entry.expires_at is not None else None),
                     'access_count': entry.access_count,
-                    'expires_at': entry.expires_at.isoformat() if entry.expires_at else None,
-                    'is_expired': entry.is_expired()
+                    'size': entry.size,
+                    'tags': list(entry.tags),
+                    'is_expired': entry.is_expired(now)
                 }
-            return info 
\ No newline at end of file
+            return info
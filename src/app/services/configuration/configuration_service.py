@@ -27,6 +27,12 @@ class ConfigurationService(IConfigurationService):
     _CACHE_KEY_DEFAULT_VALUES = "default_values:config:{}"
     _CACHE_KEY_CUSTOMERS = "configurations:customers"
 
+    # 캐시 의존 태그 (쓰기 시 관련 항목만 무효화)
+    _TAG_CONFIG_LISTS = "configurations"            # 구성 목록 / 고객 목록
+    _TAG_CONFIG = "config:{}"                       # 구성 1개 (및 그 구성의 Default DB Values)
+    _TAG_TYPE = "type:{}"                           # Type별 구성 목록
+    _TAG_DEFAULT_VALUES = "default_values:{}"       # 구성별 Default DB Values
+
     def __init__(self, db_schema, cache_service: Optional[CacheService] = None):
         """
         Args:
@@ -39,14 +45,19 @@ class ConfigurationService(IConfigurationService):
         self._logger = self._logging.get_logger(self.__class__.__name__)
 
     @contextmanager
-    def _transaction(self):
-        """트랜잭션 컨텍스트 매니저 (자동 캐시 무효화)"""
+    def _transaction(self, *tags):
+        """
+        트랜잭션 컨텍스트 매니저 (완료 시 태그에 의존하는 캐시만 무효화)
+
+        실행 중에 알게 된 태그는 yield된 집합에 추가합니다.
+        """
+        tags = set(tags)
         try:
-            yield
-            self._invalidate_cache()
+            yield tags
+            self._invalidate_cache(tags)
             self._logging.log_service_action(
                 "ConfigurationService",
-                "Transaction completed and cache invalidated"
+                f"Transaction completed and cache invalidated: {sorted(tags)}"
             )
         except Exception as e:
             self._logging.log_error(
@@ -56,9 +67,20 @@ class ConfigurationService(IConfigurationService):
             )
             raise
 
-    def _invalidate_cache(self):
-        """모든 캐시 무효화"""
-        self._cache.clear()
+    def _invalidate_cache(self, tags=None):
+        """태그에 의존하는 캐시 무효화 (tags=None이면 전체)"""
+        if tags is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate_tags(*tags)
+        if hasattr(self._db_schema, 'invalidate_default_parameter_index'):
+            self._db_schema.invalidate_default_parameter_index()
+
+    def _default_value_tags(self, cursor, value_id: int) -> List[str]:
+        """Default DB Value가 속한 구성의 캐시 태그 (값이 없으면 빈 목록)"""
+        cursor.execute("SELECT configuration_id FROM Default_DB_Values WHERE id = ?", (value_id,))
+        row = cursor.fetchone()
+        return [self._TAG_DEFAULT_VALUES.format(row[0])] if row else []
 
     def _row_to_configuration(self, row) -> EquipmentConfiguration:
         """DB Row를 EquipmentConfiguration 객체로 변환"""
@@ -108,6 +130,8 @@ class ConfigurationService(IConfigurationService):
         cached_result = self._cache.get(self._CACHE_KEY_ALL_CONFIGS)
         if cached_result is not None:
             return cached_result
+        tags = (self._TAG_CONFIG_LISTS,)
+        generation = self._cache.generation(tags)
 
         with self._db_schema.get_connection() as conn:
             cursor = conn.cursor()
@@ -126,7 +150,7 @@ class ConfigurationService(IConfigurationService):
             """)
 
             configurations = [self._row_to_configuration(row) for row in cursor.fetchall()]
-            self._cache.set(self._CACHE_KEY_ALL_CONFIGS, configurations)
+            self._cache.set(self._CACHE_KEY_ALL_CONFIGS, configurations, tags=tags, generation=generation)
             return configurations
 
     def get_configurations_by_type(self, type_id: int) -> List[EquipmentConfiguration]:
@@ -135,6 +159,8 @@ class ConfigurationService(IConfigurationService):
         cached_result = self._cache.get(cache_key)
         if cached_result is not None:
             return cached_result
+        tags = (self._TAG_CONFIG_LISTS, self._TAG_TYPE.format(type_id))
+        generation = self._cache.generation(tags)
 
         with self._db_schema.get_connection() as conn:
             cursor = conn.cursor()
@@ -154,7 +180,7 @@ class ConfigurationService(IConfigurationService):
             """, (type_id,))
 
             configurations = [self._row_to_configuration(row) for row in cursor.fetchall()]
-            self._cache.set(cache_key, configurations)
+            self._cache.set(cache_key, configurations, tags=tags, generation=generation)
             return configurations
 
     def get_configuration_by_id(self, config_id: int) -> Optional[EquipmentConfiguration]:
@@ -163,6 +189,8 @@ class ConfigurationService(IConfigurationService):
         cached_result = self._cache.get(cache_key)
         if cached_result is not None:
             return cached_result
+        tags = (self._TAG_CONFIG.format(config_id),)
+        generation = self._cache.generation(tags)
 
         with self._db_schema.get_connection() as conn:
             cursor = conn.cursor()
@@ -183,7 +211,7 @@ class ConfigurationService(IConfigurationService):
             row = cursor.fetchone()
             if row:
                 configuration = self._row_to_configuration(row)
-                self._cache.set(cache_key, configuration)
+                self._cache.set(cache_key, configuration, tags=tags, generation=generation)
                 return configuration
             return None
 
@@ -238,7 +266,7 @@ class ConfigurationService(IConfigurationService):
         if custom_options:
             custom_options_json = json.dumps(custom_options, ensure_ascii=False)
 
-        with self._transaction():
+        with self._transaction(self._TAG_CONFIG_LISTS):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -311,7 +339,7 @@ class ConfigurationService(IConfigurationService):
         updates.append("updated_at = CURRENT_TIMESTAMP")
         params.append(config_id)
 
-        with self._transaction():
+        with self._transaction(self._TAG_CONFIG_LISTS, self._TAG_CONFIG.format(config_id)):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(f"""
@@ -329,7 +357,7 @@ class ConfigurationService(IConfigurationService):
 
     def delete_configuration(self, config_id: int) -> bool:
         """장비 구성 삭제 (CASCADE: 관련 Default_DB_Values 삭제)"""
-        with self._transaction():
+        with self._transaction(self._TAG_CONFIG_LISTS, self._TAG_CONFIG.format(config_id)):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
 
@@ -361,7 +389,7 @@ class ConfigurationService(IConfigurationService):
         custom_options: Dict[str, Any]
     ) -> bool:
         """커스텀 옵션 JSON 업데이트"""
-        with self._transaction():
+        with self._transaction(self._TAG_CONFIG_LISTS, self._TAG_CONFIG.format(config_id)):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -410,6 +438,8 @@ class ConfigurationService(IConfigurationService):
         cached_result = self._cache.get(self._CACHE_KEY_CUSTOMERS)
         if cached_result is not None:
             return cached_result
+        tags = (self._TAG_CONFIG_LISTS,)
+        generation = self._cache.generation(tags)
 
         with self._db_schema.get_connection() as conn:
             cursor = conn.cursor()
@@ -421,7 +451,7 @@ class ConfigurationService(IConfigurationService):
             """)
 
             customers = [row['customer_name'] for row in cursor.fetchall()]
-            self._cache.set(self._CACHE_KEY_CUSTOMERS, customers)
+            self._cache.set(self._CACHE_KEY_CUSTOMERS, customers, tags=tags, generation=generation)
             return customers
 
     # ==================== Default DB Values ====================
@@ -436,6 +466,8 @@ class ConfigurationService(IConfigurationService):
         cached_result = self._cache.get(cache_key)
         if cached_result is not None and include_type_common:
             return cached_result
+        tags = (self._TAG_CONFIG.format(config_id), self._TAG_DEFAULT_VALUES.format(config_id))
+        generation = self._cache.generation(tags)
 
         with self._db_schema.get_connection() as conn:
             cursor = conn.cursor()
@@ -477,7 +509,7 @@ class ConfigurationService(IConfigurationService):
             values = [self._row_to_default_value(row) for row in cursor.fetchall()]
 
             if include_type_common:
-                self._cache.set(cache_key, values)
+                self._cache.set(cache_key, values, tags=tags, generation=generation)
             return values
 
     def get_default_value_by_name(
@@ -522,7 +554,7 @@ class ConfigurationService(IConfigurationService):
                 f"Parameter '{parameter_name}' already exists for configuration_id {configuration_id}"
             )
 
-        with self._transaction():
+        with self._transaction(self._TAG_DEFAULT_VALUES.format(configuration_id)):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -570,9 +602,10 @@ class ConfigurationService(IConfigurationService):
         updates.append("updated_at = CURRENT_TIMESTAMP")
         params.append(value_id)
 
-        with self._transaction():
+        with self._transaction() as tags:
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
+                tags.update(self._default_value_tags(cursor, value_id))
                 cursor.execute(f"""
                     UPDATE Default_DB_Values
                     SET {', '.join(updates)}
@@ -588,9 +621,10 @@ class ConfigurationService(IConfigurationService):
 
     def delete_default_value(self, value_id: int) -> bool:
         """Default DB Value 삭제"""
-        with self._transaction():
+        with self._transaction() as tags:
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
+                tags.update(self._default_value_tags(cursor, value_id))
                 cursor.execute("DELETE FROM Default_DB_Values WHERE id = ?", (value_id,))
                 conn.commit()
 
@@ -607,41 +641,81 @@ class ConfigurationService(IConfigurationService):
         configuration_id: int,
         values: List[Dict[str, Any]]
     ) -> int:
-        """Default DB Values 대량 생성"""
-        created_count = 0
+        """Default DB Values 대량 생성 (이미 있는 파라미터는 건너뜀)"""
+        return self.bulk_upsert_default_values(configuration_id, values, update_existing=False)['added']
 
-        with self._transaction():
+    def bulk_upsert_default_values(
+        self,
+        configuration_id: int,
+        values: List[Dict[str, Any]],
+        update_existing: bool = True
+    ) -> Dict[str, int]:
+        """Default DB Values 대량 추가/업데이트 (단일 트랜잭션, executemany)"""
+        counts = {'added': 0, 'updated': 0, 'skipped': 0}
+
+        # 이름/값이 없는 항목과 배치 내 중복 이름은 건너뜀 (첫 번째 우선)
+        batch = {}
+        for value_data in values:
+            parameter_name = value_data.get('parameter_name')
+            if not parameter_name or value_data.get('default_value') is None or parameter_name in batch:
+                counts['skipped'] += 1
+                continue
+            batch[parameter_name] = value_data
+
+        if not batch:
+            return counts
+
+        with self._transaction(self._TAG_DEFAULT_VALUES.format(configuration_id)):
             with self._db_schema.get_connection() as conn:
                 cursor = conn.cursor()
-
-                for value_data in values:
-                    parameter_name = value_data.get('parameter_name')
-                    default_value = value_data.get('default_value')
-                    is_type_common = value_data.get('is_type_common', False)
-                    notes = value_data.get('notes')
-
-                    # Skip if parameter already exists
-                    if not self.validate_parameter_name(configuration_id, parameter_name):
-                        continue
-
-                    cursor.execute("""
-                        INSERT INTO Default_DB_Values (
-                            configuration_id, parameter_name, default_value,
-                            is_type_common, notes
-                        ) VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        configuration_id, parameter_name, default_value,
-                        int(is_type_common), notes
-                    ))
-                    created_count += 1
-
-                conn.commit()
-
+                try:
+                    # 기존 파라미터를 한 번에 조회 (파라미터별 validate_parameter_name 호출 대체)
+                    cursor.execute(
+                        "SELECT id, parameter_name FROM Default_DB_Values WHERE configuration_id = ?",
+                        (configuration_id,)
+                    )
+                    existing = {row[1]: row[0] for row in cursor.fetchall()}
+
+                    inserts, updates = [], []
+                    for parameter_name, value_data in batch.items():
+                        default_value = str(value_data['default_value'])
+                        is_type_common = int(value_data.get('is_type_common', False))
+                        notes = value_data.get('notes')
+                        if parameter_name in existing:
+                            if update_existing:
+                                updates.append((default_value, is_type_common, notes, existing[parameter_name]))
+                            else:
+                                counts['skipped'] += 1
+                        else:
+                            inserts.append((configuration_id, parameter_name, default_value, is_type_common, notes))
+
+                    if inserts:
+                        cursor.executemany("""
+                            INSERT INTO Default_DB_Values (
+                                configuration_id, parameter_name, default_value,
+                                is_type_common, notes
+                            ) VALUES (?, ?, ?, ?, ?)
+                        """, inserts)
+                    if updates:
+                        cursor.executemany("""
+                            UPDATE Default_DB_Values
+                            SET default_value = ?, is_type_common = ?, notes = ?,
+                                updated_at = CURRENT_TIMESTAMP
+                            WHERE id = ?
+                        """, updates)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+                counts['added'] = len(inserts)
+                counts['updated'] = len(updates)
                 self._logging.log_service_action(
                     "ConfigurationService",
-                    f"Bulk created {created_count} default values for configuration {configuration_id}"
+                    f"Bulk upserted default values for configuration {configuration_id}: "
+                    f"added={counts['added']}, updated={counts['updated']}, skipped={counts['skipped']}"
                 )
-                return created_count
+                return counts
 
     # ==================== Hierarchy Operations ====================
 
@@ -274,6 +274,26 @@ class IConfigurationService(ABC):
         """
         pass
 
+    @abstractmethod
+    def bulk_upsert_default_values(
+        self,
+        configuration_id: int,
+        values: List[Dict[str, Any]],
+        update_existing: bool = True
+    ) -> Dict[str, int]:
+        """
+        Default DB Values 대량 추가/업데이트 (단일 트랜잭션)
+
+        Args:
+            configuration_id: Configuration ID
+            values: 파라미터 목록 (bulk_create_default_values와 같은 형식)
+            update_existing: False면 이미 있는 파라미터는 건너뜀
+
+        Returns:
+            {"added": 추가 수, "updated": 업데이트 수, "skipped": 건너뛴 수}
+        """
+        pass
+
     # ==================== Hierarchy Operations ====================
 
     @abstractmethod
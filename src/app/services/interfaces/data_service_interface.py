@@ -4,10 +4,15 @@
 파일 처리, 데이터 변환, 비교 분석을 위한 추상 인터페이스를 정의합니다.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-import pandas as pd
+
+if TYPE_CHECKING:
+    # 타입 표기 전용 (pandas는 구현체에서 필요할 때 로드)
+    import pandas as pd
 
 @dataclass
 class FileInfo:
@@ -4,11 +4,16 @@
 데이터 검증, QC 체크, 이상치 탐지를 위한 추상 인터페이스를 정의합니다.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
-import pandas as pd
+
+if TYPE_CHECKING:
+    # 타입 표기 전용 (pandas는 구현체에서 필요할 때 로드)
+    import pandas as pd
 
 class ValidationSeverity(Enum):
     """검증 결과 심각도"""
@@ -4,9 +4,144 @@ QC 검증 서비스
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+import numpy as np
+
+from app.spec_kernel import coerce_floats, evaluate_ranges, normalize_range
+
+_NOT_FOUND = object()
+
+# Override가 없는 검증(Type Common)에서 공유하는 빈 Override (호출마다 새 dict를 만들면 SpecResolver를 재사용할 수 없음)
+_NO_OVERRIDES = MappingProxyType({})
+
+# Boolean 검증 값
+_TRUE_VALUES = frozenset(['1', 'ON', 'TRUE', 'ENABLE', 'ENABLED', 'YES'])
+_FALSE_VALUES = frozenset(['0', 'OFF', 'FALSE', 'DISABLE', 'DISABLED', 'NO'])
+
+
+def _wildcard_to_regex(spec_name: str) -> str:
+    """와일드카드 Spec 이름을 정규식으로 변환 ("Temp.*" → "^Temp\\..*$")"""
+    pattern = spec_name.replace('.', r'\.')
+    pattern = pattern.replace('*', '.*')
+    pattern = pattern.replace('?', '.')
+    return f'^{pattern}$'
+
+
+def _literal_prefix(spec_name: str) -> Optional[str]:
+    """끝에만 '*'가 있는 순수 접두사 패턴(예: "Temp.*")이면 접두사 반환"""
+    if not spec_name.endswith('*') or '?' in spec_name:
+        return None
+    prefix = spec_name[:-1]
+    if '*' in prefix or re.escape(prefix) != prefix.replace('.', r'\.'):
+        return None
+    return prefix
+
+
+class SpecResolver:
+    """
+    ItemName → Spec 조회기
+
+    master_specs / overrides로 한 번 만들어 두고 재사용합니다.
+    - 정확한 이름: dict 조회 (Override 병합 결과는 미리 계산)
+    - "Temp.*" 형태: 접두사 트라이
+    - 그 외 와일드카드: 미리 컴파일한 정규식
+    여러 패턴이 매칭되면 master_specs 순서상 앞선 패턴을 사용합니다 (기존 find_spec과 동일).
+    조회 결과는 이름별로 기억하며, 반환되는 Spec 딕셔너리는 공유 객체이므로 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, master_specs: Dict, overrides: Dict):
+        self.master_specs = master_specs
+        self.overrides = overrides
+        self._exact: Dict[str, Dict] = {}
+        self._trie: Dict = {}               # 문자 → 하위 노드, None 키 → 패턴 순번
+        self._regexes: List[Tuple[int, Any]] = []   # (패턴 순번, 컴파일된 정규식)
+        self._pattern_specs: List[Dict] = []
+        self._cache: Dict[Any, Optional[Dict]] = {}
+
+        for spec_name, spec in master_specs.items():
+            self._exact[spec_name] = spec
+            if '*' in spec_name or '?' in spec_name:
+                self._add_pattern(spec_name, spec)
+
+        # Override: 제외 항목은 그대로, Master Spec이 있으면 병합 결과를 미리 생성
+        for item_name, override in overrides.items():
+            if override.get('is_excluded'):
+                self._exact[item_name] = override
+            elif item_name in master_specs:
+                self._exact[item_name] = self._merge_override(master_specs[item_name], override)
+
+    def _add_pattern(self, spec_name: str, spec: Dict):
+        order = len(self._pattern_specs)
+        spec_copy = spec.copy()
+        spec_copy['matched_by_pattern'] = True
+        self._pattern_specs.append(spec_copy)
+
+        prefix = _literal_prefix(spec_name)
+        if prefix is None:
+            try:
+                self._regexes.append((order, re.compile(_wildcard_to_regex(spec_name))))
+            except re.error as e:
+                print(f"Spec 패턴 오류: {spec_name} - {e}")
+            return
+
+        node = self._trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, order)  # 같은 접두사가 여러 번 나오면 앞선 패턴 유지
+
+    @staticmethod
+    def _merge_override(master_spec: Dict, override: Dict) -> Dict:
+        spec = master_spec.copy()
+        if override.get('override_min_spec') is not None:
+            spec['min_spec'] = override['override_min_spec']
+        if override.get('override_max_spec') is not None:
+            spec['max_spec'] = override['override_max_spec']
+        if override.get('override_expected_value') is not None:
+            spec['expected_value'] = override['override_expected_value']
+        spec['is_override'] = True
+        return spec
+
+    def _match_pattern(self, item_name: str) -> Optional[Dict]:
+        # 트라이: 이름의 접두사를 따라가며 가장 앞선 패턴 순번 선택
+        best = None
+        node = self._trie
+        if None in node:
+            best = node[None]
+        for char in item_name:
+            node = node.get(char)
+            if node is None:
+                break
+            order = node.get(None)
+            if order is not None and (best is None or order < best):
+                best = order
+
+        # 정규식: 트라이 결과보다 앞선 패턴만 확인
+        for order, regex in self._regexes:
+            if best is not None and order > best:
+                break
+            if regex.match(item_name):
+                best = order
+                break
+
+        return self._pattern_specs[best] if best is not None else None
+
+    def resolve(self, item_name: Any) -> Optional[Dict]:
+        """ItemName에 해당하는 Spec (없으면 None)"""
+        spec = self._cache.get(item_name, _NOT_FOUND)
+        if spec is not _NOT_FOUND:
+            return spec
+
+        spec = self._exact.get(item_name)
+        if spec is None and (self._trie or self._regexes):
+            spec = self._match_pattern(str(item_name))
+
+        self._cache[item_name] = spec
+        return spec
+
+
 class QCValidator:
     """QC 검증 서비스"""
     
@@ -18,6 +153,7 @@ class QCValidator:
         """
         self.db_schema = db_schema
         self.spec_service = spec_service
+        self._resolver: Optional[SpecResolver] = None
         
     def validate_file(self, file_path: str, 
                      equipment_type_id: int = None,
@@ -108,19 +244,21 @@ class QCValidator:
         master_specs = self.spec_service.get_master_specs()
         
         # Override 조회
-        overrides = {}
+        overrides = _NO_OVERRIDES
         if equipment_type_id or configuration_id:
             overrides = self.spec_service.get_overrides(
                 equipment_type_id, configuration_id
             )
         
+        resolver = self.get_spec_resolver(master_specs, overrides)
+        
         # 카테고리별 결과 집계
         category_results = {}
         
-        # 각 파라미터 검증
+        # 1. Spec 찾기 (Spec 없음/제외 항목은 건너뜀)
+        entries = []
         for item_name, value in parameters.items():
-            # Spec 찾기
-            spec = self.find_spec(item_name, master_specs, overrides)
+            spec = resolver.resolve(item_name)
             
             if not spec:
                 results['skipped'].append({
@@ -139,8 +277,17 @@ class QCValidator:
                 })
                 continue
             
-            # 검증 수행
-            is_valid, message = self.check_value(value, spec)
+            entries.append((item_name, value, spec))
+        
+        # 2. 범위 검증 일괄 계산 (통과한 항목만 확정, 나머지는 check_value로 메시지 생성)
+        range_passed = self.evaluate_range_entries(entries)
+        
+        # 3. 결과 집계
+        for row, (item_name, value, spec) in enumerate(entries):
+            if row in range_passed:
+                is_valid, message = True, "OK"
+            else:
+                is_valid, message = self.check_value(value, spec)
             
             # 카테고리별 집계
             category = spec.get('category', 'General')
@@ -186,6 +333,59 @@ class QCValidator:
         
         return results
     
+    @staticmethod
+    def evaluate_range_entries(entries: List[Tuple[str, Any, Dict]]) -> set:
+        """
+        range 검증 항목을 배열 연산으로 일괄 판정
+        
+        Args:
+            entries: (item_name, value, spec) 목록
+            
+        Returns:
+            범위 검증을 통과한 항목 위치 집합
+        """
+        rows, values, lows, highs = [], [], [], []
+        bounds_by_spec = {}
+        
+        for row, (_, value, spec) in enumerate(entries):
+            if spec.get('check_type', 'range') != 'range':
+                continue
+            
+            # Spec 정규화는 Spec 객체당 한 번 (변환 불가 Spec은 check_value에서 오류 처리)
+            key = id(spec)
+            if key not in bounds_by_spec:
+                try:
+                    bounds_by_spec[key] = normalize_range(spec.get('min_spec'), spec.get('max_spec')) \
+                        or (float('-inf'), float('inf'))
+                except (ValueError, TypeError):
+                    bounds_by_spec[key] = None
+            bounds = bounds_by_spec[key]
+            if bounds is None:
+                continue
+            
+            rows.append(row)
+            values.append(value)
+            lows.append(bounds[0])
+            highs.append(bounds[1])
+        
+        if not rows:
+            return set()
+        
+        passed, _ = evaluate_ranges(coerce_floats(values), np.array(lows), np.array(highs))
+        return {rows[i] for i in np.flatnonzero(passed)}
+    
+    def get_spec_resolver(self, master_specs: Dict, overrides: Dict) -> SpecResolver:
+        """
+        master_specs / overrides에 대한 SpecResolver (같은 객체면 재사용, 빈 Override끼리는 같은 것으로 취급)
+        """
+        resolver = self._resolver
+        same_overrides = resolver is not None and (
+            resolver.overrides is overrides or (not resolver.overrides and not overrides))
+        if resolver is None or resolver.master_specs is not master_specs or not same_overrides:
+            resolver = SpecResolver(master_specs, overrides)
+            self._resolver = resolver
+        return resolver
+
     def find_spec(self, item_name: str, master_specs: Dict, overrides: Dict) -> Optional[Dict]:
         """
         ItemName에 해당하는 Spec 찾기
@@ -196,46 +396,9 @@ class QCValidator:
             overrides: Override 딕셔너리
             
         Returns:
-            Spec 정보 또는 None
+            Spec 정보 또는 None (공유 객체이므로 수정하지 말 것)
         """
-        # 1. Override 확인
-        if item_name in overrides:
-            override = overrides[item_name]
-            if override.get('is_excluded'):
-                return override
-            
-            # Master spec과 병합
-            if item_name in master_specs:
-                spec = master_specs[item_name].copy()
-                # Override 값으로 덮어쓰기
-                if override.get('override_min_spec') is not None:
-                    spec['min_spec'] = override['override_min_spec']
-                if override.get('override_max_spec') is not None:
-                    spec['max_spec'] = override['override_max_spec']
-                if override.get('override_expected_value') is not None:
-                    spec['expected_value'] = override['override_expected_value']
-                spec['is_override'] = True
-                return spec
-        
-        # 2. Master Spec 정확한 매칭
-        if item_name in master_specs:
-            return master_specs[item_name].copy()
-        
-        # 3. 패턴 매칭 (와일드카드)
-        # 예: "Temp.*" 패턴이 "Temp.Chamber.Set"과 매칭
-        for spec_name, spec in master_specs.items():
-            if '*' in spec_name or '?' in spec_name:
-                pattern = spec_name.replace('.', r'\.')
-                pattern = pattern.replace('*', '.*')
-                pattern = pattern.replace('?', '.')
-                pattern = f'^{pattern}$'
-                
-                if re.match(pattern, item_name):
-                    spec_copy = spec.copy()
-                    spec_copy['matched_by_pattern'] = True
-                    return spec_copy
-        
-        return None
+        return self.get_spec_resolver(master_specs, overrides).resolve(item_name)
     
     def check_value(self, value: Any, spec: Dict) -> Tuple[bool, str]:
         """
@@ -278,17 +441,14 @@ class QCValidator:
                 value_str = str(value).upper()
                 expected = str(spec.get('expected_value', '1')).upper()
                 
-                true_values = ['1', 'ON', 'TRUE', 'ENABLE', 'ENABLED', 'YES']
-                false_values = ['0', 'OFF', 'FALSE', 'DISABLE', 'DISABLED', 'NO']
-                
-                if expected in true_values:
-                    if value_str in true_values:
+                if expected in _TRUE_VALUES:
+                    if value_str in _TRUE_VALUES:
                         return True, "OK"
                     else:
                         return False, f"기대값 ON, 실제값 {value}"
                         
-                elif expected in false_values:
-                    if value_str in false_values:
+                elif expected in _FALSE_VALUES:
+                    if value_str in _FALSE_VALUES:
                         return True, "OK"
                     else:
                         return False, f"기대값 OFF, 실제값 {value}"
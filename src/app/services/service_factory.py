@@ -9,8 +9,9 @@ from typing import Optional, Dict, Any
 import logging
 
 from .common.service_registry import ServiceRegistry
-from .common.cache_service import CacheService
+from .common.cache_service import CacheService, DEFAULT_CACHE_MAX_BYTES
 from .common.logging_service import LoggingService
+from app.startup_profiler import profiled
 
 # 인터페이스들
 from .interfaces.equipment_service_interface import IEquipmentService, IParameterService
@@ -51,13 +52,15 @@ class ServiceFactory:
         # 핵심 서비스들 등록
         self._register_services()
     
+    @profiled('ServiceFactory._setup_common_services')
     def _setup_common_services(self):
         """공통 서비스들 설정"""
         # 캐시 서비스 설정
         cache_config = self._config.get('cache', {})
         cache_service = CacheService(
             max_size=cache_config.get('max_size', 1000),
-            default_ttl=cache_config.get('default_ttl', 300)
+            default_ttl=cache_config.get('default_ttl', 300),
+            max_bytes=cache_config.get('max_bytes', DEFAULT_CACHE_MAX_BYTES)
         )
         
         # 공통 서비스들 등록
@@ -66,6 +69,7 @@ class ServiceFactory:
         
         self._logger.info("공통 서비스 설정 완료")
     
+    @profiled('ServiceFactory._register_services')
     def _register_services(self):
         """핵심 서비스들 등록"""
         try:
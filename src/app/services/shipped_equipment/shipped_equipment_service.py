@@ -10,6 +10,7 @@ from typing import List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
 from pathlib import Path
 
+from app.parse_cache import resolve_parse_cache, source_signature
 from app.services.interfaces.shipped_equipment_service_interface import (
     IShippedEquipmentService,
     ShippedEquipment,
@@ -22,12 +23,18 @@ from app.services.interfaces.shipped_equipment_service_interface import (
 class ShippedEquipmentService(IShippedEquipmentService):
     """출고 장비 관리 서비스 구현"""
 
-    def __init__(self, db_schema):
+    # parse_equipment_file 파라미터 키 / 파싱 캐시 namespace (파라미터 형식을 바꾸면 버전을 올릴 것)
+    PARAMETER_FIELDS = ['parameter_name', 'parameter_value', 'module', 'part', 'data_type']
+    PARSE_CACHE_NAMESPACE = 'shipped_file:1'
+
+    def __init__(self, db_schema, parse_cache=None):
         """
         Args:
             db_schema (DBSchema): 데이터베이스 스키마 인스턴스
+            parse_cache (ParseCache): 파일 파싱 캐시 (None이면 기본 캐시, False면 캐시 사용 안 함)
         """
         self.db_schema = db_schema
+        self.parse_cache = parse_cache
 
     # ==================== Shipped Equipment CRUD ====================
 
@@ -313,6 +320,8 @@ class ShippedEquipmentService(IShippedEquipmentService):
 
         파일 형식: TSV (Tab-separated values)
                   헤더: Module\tPart\tItemName\tItemType\tItemValue\tItemDescription
+
+        변경되지 않은 파일의 파라미터는 파싱 캐시(app.parse_cache)에서 바로 읽습니다.
         """
         try:
             # 1. 파일명 파싱
@@ -334,66 +343,14 @@ class ShippedEquipmentService(IShippedEquipmentService):
             customer_name = parts[1]
             model_name = '_'.join(parts[2:])  # 나머지는 모델명 (언더스코어 포함 가능)
 
-            # 2. 파일 내용 파싱
-            parameters = []
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # 첫 줄(헤더) 읽기
-                header_line = f.readline().strip()
-
-                # TSV 형식 확인 (탭으로 구분된 헤더)
-                is_tsv = '\t' in header_line
-
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-
-                    if is_tsv:
-                        # TSV 형식: Module\tPart\tItemName\tItemType\tItemValue\tItemDescription
-                        columns = line.split('\t')
-
-                        if len(columns) < 5:
-                            continue  # 필수 컬럼 부족
-
-                        module = columns[0]
-                        part = columns[1]
-                        item_name = columns[2]
-                        item_type = columns[3]
-                        item_value = columns[4]
-
-                        # Module.Part.ItemName 형식으로 parameter_name 생성
-                        parameter_name = f"{module}.{part}.{item_name}"
-
-                        param = {
-                            'parameter_name': parameter_name,
-                            'parameter_value': item_value,
-                            'module': module,
-                            'part': part,
-                            'data_type': item_type if item_type else self._infer_data_type(item_value)
-                        }
-                    else:
-                        # 기존 Key=Value 형식
-                        if '=' not in line:
-                            continue
-
-                        key, value = line.split('=', 1)
-                        key_parts = key.split('.')
-
-                        param = {
-                            'parameter_name': key,
-                            'parameter_value': value,
-                            'module': None,
-                            'part': None,
-                            'data_type': self._infer_data_type(value)
-                        }
-
-                        # Module.Part.ItemName 구조 파싱
-                        if len(key_parts) >= 3:
-                            param['module'] = key_parts[0]
-                            param['part'] = key_parts[1]
-
-                    parameters.append(param)
+            # 2. 파일 내용 파싱 (캐시 우선)
+            cache = resolve_parse_cache(self.parse_cache)
+            signature = source_signature(file_path) if cache is not None else None
+            parameters = cache.get_records(file_path, self.PARSE_CACHE_NAMESPACE, signature) if cache is not None else None
+            if parameters is None:
+                parameters = self._parse_parameters(file_path)
+                if cache is not None:
+                    cache.put_records(file_path, self.PARSE_CACHE_NAMESPACE, parameters, self.PARAMETER_FIELDS, signature)
 
             return FileParseResult(
                 serial_number=serial_number,
@@ -415,6 +372,70 @@ class ShippedEquipmentService(IShippedEquipmentService):
                 error_message=str(e)
             )
 
+    def _parse_parameters(self, file_path: str) -> List[Dict[str, Any]]:
+        """장비 데이터 파일 내용(TSV 또는 Key=Value)을 파라미터 목록으로 파싱"""
+        parameters = []
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            # 첫 줄(헤더) 읽기
+            header_line = f.readline().strip()
+
+            # TSV 형식 확인 (탭으로 구분된 헤더)
+            is_tsv = '\t' in header_line
+
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+
+                if is_tsv:
+                    # TSV 형식: Module\tPart\tItemName\tItemType\tItemValue\tItemDescription
+                    columns = line.split('\t')
+
+                    if len(columns) < 5:
+                        continue  # 필수 컬럼 부족
+
+                    module = columns[0]
+                    part = columns[1]
+                    item_name = columns[2]
+                    item_type = columns[3]
+                    item_value = columns[4]
+
+                    # Module.Part.ItemName 형식으로 parameter_name 생성
+                    parameter_name = f"{module}.{part}.{item_name}"
+
+                    param = {
+                        'parameter_name': parameter_name,
+                        'parameter_value': item_value,
+                        'module': module,
+                        'part': part,
+                        'data_type': item_type if item_type else self._infer_data_type(item_value)
+                    }
+                else:
+                    # 기존 Key=Value 형식
+                    if '=' not in line:
+                        continue
+
+                    key, value = line.split('=', 1)
+                    key_parts = key.split('.')
+
+                    param = {
+                        'parameter_name': key,
+                        'parameter_value': value,
+                        'module': None,
+                        'part': None,
+                        'data_type': self._infer_data_type(value)
+                    }
+
+                    # Module.Part.ItemName 구조 파싱
+                    if len(key_parts) >= 3:
+                        param['module'] = key_parts[0]
+                        param['part'] = key_parts[1]
+
+                parameters.append(param)
+
+        return parameters
+
     def import_from_file(
         self,
         file_path: str,
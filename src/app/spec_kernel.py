@@ -0,0 +1,151 @@
+# Spec 평가 커널 모듈
+# 범위(min/max) 검증을 NumPy 배열로 한 번에 계산하고, Enum/Exact 검증은 미리 만든 조회 집합으로 처리
+
+import json
+import math
+
+import numpy as np
+
+# 검증 유형 코드
+CHECK_NONE = 0      # Spec 없음 (항목 존재만 확인, 항상 Pass)
+CHECK_RANGE = 1     # Min/Max 범위
+CHECK_ENUM = 2      # 허용 값 목록 (JSON 배열)
+CHECK_EXACT = 3     # 기대값 일치 (대소문자 무시)
+CHECK_INVALID = 4   # Spec 숫자 변환 불가 (항상 Fail)
+
+
+def to_float(value):
+    """float() 변환 (실패 시 NaN)"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+def coerce_floats(values):
+    """
+    값 목록을 float 배열로 변환 (변환할 수 없는 값은 NaN)
+
+    Returns:
+        np.ndarray: float64 배열
+    """
+    try:
+        # 모든 값이 숫자로 변환되면 한 번에 변환 (None은 NaN)
+        return np.array(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        return np.fromiter((to_float(v) for v in values), dtype=np.float64, count=len(values))
+
+
+def normalize_range(spec_min, spec_max, require_both=False):
+    """
+    min/max Spec 문자열을 (low, high) float로 정규화
+
+    - 값이 비어 있으면 해당 방향 제한 없음 (-inf / inf)
+    - require_both=True이면 둘 중 하나라도 비어 있을 때 None (범위 검증 아님)
+
+    Returns:
+        tuple | None: (low, high), 범위 검증이 아니면 None
+
+    Raises:
+        ValueError, TypeError: Spec 값을 숫자로 변환할 수 없을 때
+    """
+    if require_both and not (spec_min and spec_max):
+        return None
+    if not (spec_min or spec_max):
+        return None
+    low = float(spec_min) if spec_min else -math.inf
+    high = float(spec_max) if spec_max else math.inf
+    return low, high
+
+
+def evaluate_ranges(numbers, lows, highs):
+    """
+    범위 검증 일괄 계산
+
+    Args:
+        numbers: 값 배열 (NaN은 숫자가 아닌 값)
+        lows, highs: 하한/상한 배열
+
+    Returns:
+        tuple: (passed bool 배열, deviation float 배열)
+            deviation: 범위 안이면 0, 벗어나면 가까운 경계까지의 거리, 숫자가 아니면 NaN
+    """
+    passed = (numbers >= lows) & (numbers <= highs)
+    with np.errstate(invalid='ignore'):
+        deviation = np.where(numbers < lows, lows - numbers,
+                             np.where(numbers > highs, numbers - highs, 0.0))
+    deviation[np.isnan(numbers)] = np.nan
+    return passed, deviation
+
+
+class SpecKernel:
+    """
+    Check list 항목 Spec 평가 커널
+
+    InspectionEngine.validate_item()과 같은 판정을 하되, 항목별 Spec은 생성 시 한 번만
+    정규화합니다 (codes / lows / highs 배열 + Enum/Exact 조회 값).
+    """
+
+    def __init__(self, items):
+        count = len(items)
+        self.codes = np.full(count, CHECK_NONE, dtype=np.int8)
+        self.lows = np.full(count, -math.inf)
+        self.highs = np.full(count, math.inf)
+        self.lookups = [None] * count
+
+        for pos, item in enumerate(items):
+            if item.spec_min and item.spec_max:
+                try:
+                    self.lows[pos], self.highs[pos] = normalize_range(item.spec_min, item.spec_max, True)
+                    self.codes[pos] = CHECK_RANGE
+                except (ValueError, TypeError):
+                    self.codes[pos] = CHECK_INVALID
+            elif item.expected_value:
+                try:
+                    allowed_values = json.loads(item.expected_value)
+                except (json.JSONDecodeError, TypeError):
+                    allowed_values = None
+
+                if isinstance(allowed_values, list):
+                    self.codes[pos] = CHECK_ENUM
+                    self.lookups[pos] = frozenset(str(v) for v in allowed_values)
+                else:
+                    self.codes[pos] = CHECK_EXACT
+                    self.lookups[pos] = str(item.expected_value).upper()
+
+    def __len__(self):
+        return len(self.codes)
+
+    def evaluate(self, positions, values):
+        """
+        매칭된 항목들의 Pass/Fail 및 편차 계산
+
+        Args:
+            positions: 항목 위치 목록 (생성 시 items 순서 기준)
+            values: 각 항목의 파일 값
+
+        Returns:
+            tuple: (passed bool 배열, deviation float 배열 - 범위 항목 외에는 NaN)
+        """
+        positions = np.asarray(positions, dtype=np.intp)
+        codes = self.codes[positions]
+        passed = codes == CHECK_NONE
+        deviation = np.full(len(positions), np.nan)
+
+        # 범위 항목: 값 변환 1회 + 배열 비교
+        range_rows = np.flatnonzero(codes == CHECK_RANGE)
+        if len(range_rows):
+            numbers = coerce_floats([values[row] for row in range_rows])
+            spec_positions = positions[range_rows]
+            passed[range_rows], deviation[range_rows] = evaluate_ranges(
+                numbers, self.lows[spec_positions], self.highs[spec_positions])
+
+        # Enum / Exact 항목: 미리 만든 집합/대문자 기대값과 비교
+        for row in np.flatnonzero((codes == CHECK_ENUM) | (codes == CHECK_EXACT)):
+            lookup = self.lookups[positions[row]]
+            if codes[row] == CHECK_ENUM:
+                passed[row] = str(values[row]) in lookup
+            else:
+                passed[row] = str(values[row]).upper() == lookup
+
+        return passed, deviation
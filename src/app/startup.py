@@ -0,0 +1,81 @@
+# 시작(startup) 파이프라인 모듈
+# 스플래시 화면, 첫 활성화 시 생성되는 지연 탭 (단계별 시간 기록: app.startup_profiler)
+
+import tkinter as tk
+from tkinter import ttk
+
+# 단계별 시간 기록은 tkinter 없이 쓸 수 있도록 startup_profiler에 있음
+from app.startup_profiler import StartupTimer
+
+
+class SplashScreen:
+    """
+    시작 중 표시하는 스플래시 창
+
+    메인 창은 구성이 끝날 때까지 숨겨 두고, 단계 이름만 갱신합니다.
+    """
+
+    def __init__(self, root, title="DB Manager", width=320, height=90):
+        self.top = tk.Toplevel(root)
+        self.top.overrideredirect(True)
+        frame = ttk.Frame(self.top, padding=15, relief=tk.RIDGE)
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text=title, font=('Segoe UI', 12, 'bold')).pack()
+        self.status_label = ttk.Label(frame, text="시작 중...")
+        self.status_label.pack(pady=(8, 0))
+
+        x = (self.top.winfo_screenwidth() - width) // 2
+        y = (self.top.winfo_screenheight() - height) // 2
+        self.top.geometry(f"{width}x{height}+{x}+{y}")
+        self.top.update_idletasks()
+
+    def set_status(self, text):
+        self.status_label.config(text=text)
+        self.top.update_idletasks()
+
+    def close(self):
+        self.top.destroy()
+
+
+class LazyTabs:
+    """
+    노트북 탭 지연 생성
+
+    add()로 빈 프레임만 탭으로 등록하고, 탭이 처음 선택될 때 builder(frame)를 호출해 내용을 만듭니다.
+    """
+
+    def __init__(self, notebook):
+        self.notebook = notebook
+        self._builders = {}     # 프레임 이름 → builder
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def add(self, text, builder):
+        """지연 탭 등록 (프레임 반환)"""
+        # 노트북에서 제거된(파괴된) 탭의 builder 정리
+        self._builders = {name: entry for name, entry in self._builders.items()
+                          if entry[0].winfo_exists()}
+        frame = ttk.Frame(self.notebook)
+        self._builders[str(frame)] = (frame, builder)
+        self.notebook.add(frame, text=text)
+        return frame
+
+    def is_built(self, frame):
+        return str(frame) not in self._builders
+
+    def build(self, frame):
+        """탭 내용 생성 (이미 만들었으면 무시)"""
+        entry = self._builders.pop(str(frame), None)
+        if entry is not None:
+            entry[1](entry[0])
+
+    def build_all(self):
+        for name in list(self._builders):
+            self.build(name)
+
+    def _on_tab_changed(self, event=None):
+        try:
+            selected = self.notebook.select()
+        except tk.TclError:
+            return
+        if selected:
+            self.build(selected)
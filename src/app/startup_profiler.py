@@ -0,0 +1,335 @@
+# 시작(startup) 프로파일러 모듈
+# 단계별(중첩) 소요 시간과 모듈별 import 시간을 기록하고 JSON / flamegraph(folded stack) 보고서로 저장
+#
+# 사용법:
+#   DB_MANAGER_PROFILE_STARTUP=1 python src/main.py          → data/startup_profile.json
+#   python src/main.py --profile-startup=/tmp/profile.json
+#   (같은 이름의 .folded 파일은 flamegraph.pl / speedscope 입력으로 사용 가능)
+
+import functools
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = 'DB_MANAGER_PROFILE_STARTUP'
+PROFILE_FLAG = '--profile-startup'
+DEFAULT_REPORT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'data', 'startup_profile.json')
+
+# 현재 시작 과정을 기록 중인 StartupTimer (없으면 profile_phase / profiled는 아무것도 하지 않음)
+_active_timer = None
+
+
+def get_profile_path(argv=None, environ=None):
+    """
+    프로파일 보고서 경로 (프로파일링이 꺼져 있으면 None)
+
+    - CLI: --profile-startup (기본 경로) / --profile-startup=PATH
+    - 환경 변수: DB_MANAGER_PROFILE_STARTUP=1 (기본 경로) / =PATH, 0·false·빈 값이면 꺼짐
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    environ = os.environ if environ is None else environ
+
+    for arg in argv:
+        if arg == PROFILE_FLAG:
+            return DEFAULT_REPORT_PATH
+        if arg.startswith(PROFILE_FLAG + '='):
+            return arg.split('=', 1)[1] or DEFAULT_REPORT_PATH
+
+    value = environ.get(PROFILE_ENV, '').strip()
+    if value.lower() in ('', '0', 'false', 'no', 'off'):
+        return None
+    if value.lower() in ('1', 'true', 'yes', 'on'):
+        return DEFAULT_REPORT_PATH
+    return value
+
+
+def set_active_timer(timer):
+    """profile_phase() / @profiled 기록 대상 지정 (None이면 기록 중지)"""
+    global _active_timer
+    _active_timer = timer
+
+
+def get_active_timer():
+    return _active_timer
+
+
+@contextmanager
+def profile_phase(name):
+    """활성 StartupTimer가 있으면 하위 단계로 기록"""
+    timer = _active_timer
+    if timer is None or not timer.records_current_thread():
+        yield
+        return
+    with timer.phase(name):
+        yield
+
+
+def profiled(name):
+    """함수 실행을 시작 단계로 기록하는 데코레이터 (시작 과정이 아닐 때는 전역 변수 확인 1회)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active_timer is None:
+                return func(*args, **kwargs)
+            with profile_phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class StartupTimer:
+    """
+    시작 단계별 소요 시간 기록
+
+    phase() 컨텍스트로 각 단계(imports, window, database, services, tabs 등)를 측정하고,
+    mark_ready()로 창이 입력을 받을 수 있게 된 시점을 기록합니다. 단계는 중첩될 수 있으며
+    (예: database/DBSchema.create_tables), 최상위 단계만 phases에 요약됩니다.
+    """
+
+    def __init__(self, start=None, report_path=None):
+        """
+        Args:
+            start: 기준 시각 (time.perf_counter() 값, None이면 지금)
+            report_path: 프로파일 보고서 경로 (None이면 보고서를 쓰지 않음)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.report_path = report_path
+        self.phases = []        # [(최상위 단계 이름, 소요 시간 초)]
+        self.spans = []         # 모든 단계 {'name', 'path', 'depth', 'start', 'seconds'}
+        self.ready_at = None    # 기준 시각부터 준비 완료까지 (초)
+        self.import_profiler = None
+
+        self._stack = []
+        self._thread_id = threading.get_ident()
+
+    def records_current_thread(self):
+        return threading.get_ident() == self._thread_id
+
+    @property
+    def current_path(self):
+        """현재 진행 중인 단계 경로 (예: ('database', 'DBSchema.create_tables'))"""
+        return tuple(self._stack)
+
+    @contextmanager
+    def phase(self, name):
+        """단계 소요 시간 측정"""
+        started = time.perf_counter()
+        self._stack.append(name)
+        path = '/'.join(self._stack)
+        depth = len(self._stack) - 1
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            self._stack.pop()
+            self.spans.append({'name': name, 'path': path, 'depth': depth,
+                               'start': started - self.start, 'seconds': seconds})
+            if depth == 0:
+                self.phases.append((name, seconds))
+
+    def start_import_profiling(self):
+        """이후 import되는 모듈의 로드 시간 기록 시작"""
+        if self.import_profiler is None:
+            self.import_profiler = ImportProfiler(lambda: self.current_path)
+            self.import_profiler.install()
+        return self.import_profiler
+
+    def mark_ready(self):
+        """준비 완료 시점 기록 (처음 한 번만)"""
+        if self.ready_at is None:
+            self.ready_at = time.perf_counter() - self.start
+        return self.ready_at
+
+    def finish(self):
+        """
+        시작 완료 처리: 준비 시점 기록, import 기록/단계 기록 중지, 보고서 저장
+
+        Returns:
+            str | None: 저장한 보고서 경로
+        """
+        self.mark_ready()
+        if self.import_profiler is not None:
+            self.import_profiler.uninstall()
+        if _active_timer is self:
+            set_active_timer(None)
+        if self.report_path:
+            return self.write_report(self.report_path)
+        return None
+
+    def to_dict(self):
+        return {
+            'phases': [{'name': name, 'seconds': round(seconds, 6)} for name, seconds in self.phases],
+            'ready_seconds': None if self.ready_at is None else round(self.ready_at, 6),
+        }
+
+    def summary(self):
+        """로그용 한 줄 요약"""
+        phases = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.phases)
+        ready = "측정 전" if self.ready_at is None else f"{self.ready_at * 1000:.0f}ms"
+        return f"시작 시간 {ready} ({phases})"
+
+    # ------------------------------------------------------------
+    # 보고서
+    # ------------------------------------------------------------
+    def build_report(self):
+        """
+        프로파일 보고서 딕셔너리
+
+        - phases: 최상위 단계 요약 / spans: 모든 단계 (중첩 경로, 시작 오프셋, 소요 시간), 시작 순서
+        - imports: 모듈별 누적/자체 import 시간 (누적 시간 내림차순)
+        - folded: flamegraph 입력용 "startup;단계;모듈 자체시간(µs)" 줄 목록
+        """
+        imports = self.import_profiler.records if self.import_profiler else []
+        report = self.to_dict()
+        report.update({
+            'version': 1,
+            'python': sys.version.split()[0],
+            'platform': sys.platform,
+            'spans': [dict(span, start=round(span['start'], 6), seconds=round(span['seconds'], 6))
+                      for span in sorted(self.spans, key=lambda span: span['start'])],
+            'imports': [dict(record, self_seconds=round(record['self_seconds'], 6),
+                             cumulative_seconds=round(record['cumulative_seconds'], 6))
+                        for record in sorted(imports, key=lambda r: -r['cumulative_seconds'])],
+            'import_total_seconds': round(sum(r['cumulative_seconds'] for r in imports if r['depth'] == 0), 6),
+            'folded': self._folded_stacks(imports),
+        })
+        return report
+
+    def _folded_stacks(self, imports):
+        """단계/모듈별 자체 시간을 folded stack 형식으로 변환 (단위: µs)"""
+        self_time = {}
+        for span in self.spans:
+            self_time[span['path']] = self_time.get(span['path'], 0.0) + span['seconds']
+            parent = span['path'].rsplit('/', 1)[0] if span['depth'] else None
+            if parent is not None:
+                self_time[parent] = self_time.get(parent, 0.0) - span['seconds']
+
+        lines = []
+        for record in imports:
+            phase_path = '/'.join(record['phase'])
+            if record['depth'] == 0 and phase_path in self_time:
+                self_time[phase_path] -= record['cumulative_seconds']
+            stack = ['startup'] + list(record['phase']) + ['import ' + name for name in record['stack']]
+            lines.append((';'.join(stack), record['self_seconds']))
+
+        lines.extend((';'.join(['startup'] + path.split('/')), seconds) for path, seconds in self_time.items())
+        return [f"{stack} {int(round(max(seconds, 0.0) * 1e6))}" for stack, seconds in lines]
+
+    def write_report(self, path):
+        """JSON 보고서와 같은 이름의 .folded 파일 저장"""
+        report = self.build_report()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        with open(os.path.splitext(path)[0] + '.folded', 'w', encoding='utf-8') as f:
+            f.write('\n'.join(report['folded']) + '\n')
+        return path
+
+
+class ImportProfiler:
+    """
+    모듈별 import 시간 기록기
+
+    sys.meta_path 맨 앞에 finder를 넣어 다른 finder가 찾은 spec의 loader를 감싸고, exec_module()
+    소요 시간을 중첩 import 스택과 함께 기록합니다. 설치한 스레드의 import만 기록하며,
+    import가 끝나면 모듈의 __loader__ / __spec__.loader는 원래 loader로 되돌립니다.
+    """
+
+    def __init__(self, phase_provider=None):
+        """
+        Args:
+            phase_provider: import 시점의 시작 단계 경로를 반환하는 함수 (보고서 분류용)
+        """
+        self.records = []       # {'module', 'stack', 'depth', 'phase', 'self_seconds', 'cumulative_seconds'}
+        self._phase_provider = phase_provider or (lambda: ())
+        self._stack = []        # [모듈 이름, 시작 시각, 하위 import 누적 시간]
+        self._finder = None
+        self._thread_id = None
+
+    def install(self):
+        if self._finder is None:
+            self._thread_id = threading.get_ident()
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def _enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self):
+        name, started, children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][2] += cumulative
+        self.records.append({
+            'module': name,
+            'stack': [entry[0] for entry in self._stack] + [name],
+            'depth': len(self._stack),
+            'phase': list(self._phase_provider()),
+            'self_seconds': cumulative - children,
+            'cumulative_seconds': cumulative,
+        })
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """뒤에 있는 finder들에 위임하고, 찾은 spec의 loader를 시간 측정 loader로 교체"""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._searching = set()
+
+    def find_spec(self, fullname, path, target=None):
+        if threading.get_ident() != self._profiler._thread_id or fullname in self._searching:
+            return None
+        self._searching.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                        spec.loader = _TimingLoader(spec.loader, self._profiler)
+                    return spec
+            return None
+        finally:
+            self._searching.discard(fullname)
+
+
+class _TimingLoader:
+    """exec_module() 시간을 측정하는 loader 래퍼 (그 외 속성은 원래 loader에 위임)"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, 'create_module', None)
+        return create_module(spec) if create_module is not None else None
+
+    def exec_module(self, module):
+        self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit()
+            module.__loader__ = self._loader
+            spec = getattr(module, '__spec__', None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
@@ -0,0 +1,110 @@
+# SQLite 저장소 프로필 모듈
+# local_db.sqlite의 저널 모드 / 동기화 수준 / 페이지 캐시 / mmap / temp_store 설정을 배포 환경별로 선택
+
+import json
+import os
+
+DEFAULT_STORAGE_PROFILE = "safe"
+SETTINGS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "config", "settings.json")
+
+# 프로필별 PRAGMA 설정
+# - journal_mode: DB 파일에 영구 저장 (WAL: 읽기 연결이 쓰기를 막지 않음)
+# - 나머지: 연결마다 적용
+STORAGE_PROFILES = {
+    # 전원 차단에도 커밋 보장 (WAL + FULL 동기화)
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8192,            # KiB 단위 (약 8MB)
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "wal_autocheckpoint": 1000,
+    },
+    # 일반 사용 (WAL + NORMAL: 체크포인트 시에만 fsync, mmap 읽기)
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -32768,           # 약 32MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 1000,
+    },
+    # 대량 가져오기 (fsync 없음, 큰 캐시, 체크포인트 간격 확대)
+    "bulk-import": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -131072,          # 약 128MB
+        "mmap_size": 512 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "wal_autocheckpoint": 10000,
+    },
+}
+
+# 연결마다 적용하는 PRAGMA 순서
+CONNECTION_PRAGMAS = ("synchronous", "cache_size", "mmap_size", "temp_store", "wal_autocheckpoint")
+
+
+def resolve_storage_profile(name):
+    """프로필 이름 확인 (알 수 없는 이름이면 기본 프로필 사용)"""
+    if name in STORAGE_PROFILES:
+        return name
+    if name:
+        print(f"알 수 없는 저장소 프로필 '{name}' - '{DEFAULT_STORAGE_PROFILE}' 프로필을 사용합니다")
+    return DEFAULT_STORAGE_PROFILE
+
+
+def configured_storage_profile(settings_path=SETTINGS_PATH):
+    """
+    settings.json의 service_config.database.storage_profile (없으면 기본 프로필)
+
+    storage_profile을 지정하지 않은 DBSchema(보조 인스턴스, 도구 스크립트 등)도
+    같은 DB 파일에 대해 DBManager와 같은 PRAGMA를 사용하도록 합니다.
+    """
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            name = json.load(f).get("service_config", {}).get("database", {}).get("storage_profile")
+    except (OSError, ValueError):
+        return DEFAULT_STORAGE_PROFILE
+    return resolve_storage_profile(name)
+
+
+def connection_pragmas(name):
+    """새 연결에 실행할 PRAGMA 문 리스트"""
+    profile = STORAGE_PROFILES[resolve_storage_profile(name)]
+    return [f"PRAGMA {key} = {profile[key]}" for key in CONNECTION_PRAGMAS]
+
+
+def apply_journal_mode(conn, name):
+    """DB 파일의 저널 모드 설정 후 실제 적용된 모드 반환"""
+    profile = STORAGE_PROFILES[resolve_storage_profile(name)]
+    return conn.execute(f"PRAGMA journal_mode = {profile['journal_mode']}").fetchone()[0]
+
+
+def run_maintenance(conn, truncate=False):
+    """
+    주기적 유지보수: WAL 체크포인트 + PRAGMA optimize
+
+    Args:
+        truncate: True면 WAL 파일을 비움 (종료 시), False면 PASSIVE 체크포인트 (실행 중)
+    """
+    mode = "TRUNCATE" if truncate else "PASSIVE"
+    checkpoint = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+    conn.execute("PRAGMA optimize")
+    return checkpoint
+
+
+def describe_storage(conn, name):
+    """About 대화상자용 저장소 설정 요약"""
+    synchronous_names = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+    temp_store_names = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+    cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+    mmap_size = conn.execute("PRAGMA mmap_size").fetchone()[0]
+    return {
+        "profile": resolve_storage_profile(name),
+        "journal_mode": str(conn.execute("PRAGMA journal_mode").fetchone()[0]).upper(),
+        "synchronous": synchronous_names.get(conn.execute("PRAGMA synchronous").fetchone()[0], "?"),
+        "cache_size": f"{-cache_size // 1024} MB" if cache_size < 0 else f"{cache_size} pages",
+        "mmap_size": f"{mmap_size // (1024 * 1024)} MB",
+        "temp_store": temp_store_names.get(conn.execute("PRAGMA temp_store").fetchone()[0], "?"),
+    }
@@ -7,6 +7,8 @@ from datetime import datetime
 import tkinter as tk
 from tkinter import messagebox
 
+from app.parse_cache import resolve_parse_cache, source_signature
+
 class TextFileHandler:
     """
     장비 설정 텍스트 파일의 Import/Export 기능을 처리하는 클래스
@@ -18,13 +20,20 @@ class TextFileHandler:
 
     # 하위 호환성을 위한 기본 헤더 (6컬럼)
     TEXT_FILE_HEADER = TEXT_FILE_HEADER_6
+
+    # parse_text_file 결과 레코드 키 / 파싱 캐시 namespace (레코드 형식을 바꾸면 버전을 올릴 것)
+    PARSED_FIELDS = ['module', 'part', 'item_name', 'item_type', 'item_value', 'item_description',
+                     'min_spec', 'max_spec', 'line_number']
+    PARSE_CACHE_NAMESPACE = 'text_file:1'
     
-    def __init__(self, db_schema):
+    def __init__(self, db_schema, parse_cache=None):
         """
         Args:
             db_schema: DBSchema 인스턴스
+            parse_cache: ParseCache (None이면 기본 캐시, False면 캐시 사용 안 함)
         """
         self.db_schema = db_schema
+        self.parse_cache = parse_cache
     
     def validate_text_file_format(self, file_path: str) -> Tuple[bool, str]:
         """
@@ -67,6 +76,8 @@ class TextFileHandler:
     def parse_text_file(self, file_path: str) -> Tuple[bool, List[Dict], str]:
         """
         텍스트 파일을 파싱하여 데이터를 추출합니다.
+
+        변경되지 않은 파일은 파싱 캐시(app.parse_cache)에서 바로 읽습니다.
         
         Args:
             file_path (str): 파싱할 파일 경로
@@ -75,6 +86,13 @@ class TextFileHandler:
             Tuple[bool, List[Dict], str]: (성공 여부, 파싱된 데이터 리스트, 오류 메시지)
         """
         try:
+            cache = resolve_parse_cache(self.parse_cache)
+            if cache is not None:
+                signature = source_signature(file_path)
+                parsed_data = cache.get_records(file_path, self.PARSE_CACHE_NAMESPACE, signature)
+                if parsed_data is not None:
+                    return True, parsed_data, f"성공적으로 {len(parsed_data)}개의 항목을 파싱했습니다."
+
             # 파일 형식 검증
             is_valid, error_msg = self.validate_text_file_format(file_path)
             if not is_valid:
@@ -136,6 +154,9 @@ class TextFileHandler:
                         continue
                     
                     parsed_data.append(data_row)
+
+            if cache is not None:
+                cache.put_records(file_path, self.PARSE_CACHE_NAMESPACE, parsed_data, self.PARSED_FIELDS, signature)
             
             return True, parsed_data, f"성공적으로 {len(parsed_data)}개의 항목을 파싱했습니다."
             
@@ -4,8 +4,6 @@
 import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import pandas as pd
-import numpy as np
 import sqlite3
 from datetime import datetime
 
@@ -5,9 +5,9 @@ from typing import Dict, List, Callable, Optional, Tuple, Any
 class CheckboxTreeview(ttk.Treeview):
     """체크박스 기능이 있는 트리뷰 위젯"""
     def __init__(self, master=None, checkbox_column="checkbox", **kwargs):
-        # 트리뷰 초기화
-        columns = kwargs.pop('columns', ())
-        if checkbox_column not in columns:
+        # 트리뷰 초기화 (checkbox_column=None이면 체크박스 열 없이 생성)
+        columns = tuple(kwargs.pop('columns', ()))
+        if checkbox_column and checkbox_column not in columns:
             columns = (checkbox_column,) + columns
 
         super().__init__(master, columns=columns, **kwargs)
@@ -17,12 +17,13 @@ class CheckboxTreeview(ttk.Treeview):
         self.checkboxes: Dict[str, tk.BooleanVar] = {}
         self.checkbox_images = self._create_checkbox_images()
 
-        # 체크박스 열 설정
-        self.column(checkbox_column, width=40, anchor='center', stretch=False)
-        self.heading(checkbox_column, text='✓')
+        if checkbox_column:
+            # 체크박스 열 설정
+            self.column(checkbox_column, width=40, anchor='center', stretch=False)
+            self.heading(checkbox_column, text='✓')
 
-        # 클릭 이벤트 바인딩
-        self.bind('<ButtonRelease-1>', self._on_click)
+            # 클릭 이벤트 바인딩
+            self.bind('<ButtonRelease-1>', self._on_click)
 
     def _create_checkbox_images(self) -> Dict[str, tk.PhotoImage]:
         """체크박스 이미지 생성"""
@@ -87,6 +88,594 @@ class CheckboxTreeview(ttk.Treeview):
         return [item for item in self.checkboxes if self.checkboxes[item].get()]
 
 
+def _natural_sort_key(value):
+    """정렬 키 - 숫자는 숫자 크기 순, 그 외는 문자열 순 (숫자가 먼저)"""
+    try:
+        return (0, float(value), "")
+    except (ValueError, TypeError):
+        return (1, 0.0, str(value))
+
+
+class VirtualRowModel:
+    """
+    가상 트리뷰의 행 데이터 모델
+
+    행(text/values/tags/open/checked)과 부모-자식 관계를 보관하고, 정렬과 필터를
+    적용한 "가시 행 목록"(닫힌 노드의 자식 제외)을 계산합니다. 위젯은 이 목록의
+    일부 구간만 실제 Treeview 아이템으로 만듭니다.
+    """
+
+    def __init__(self):
+        self.sort_spec = None  # (컬럼 이름, values 인덱스 또는 None(text), 역순 여부)
+        self.clear()
+
+    def clear(self):
+        """모든 행 제거 (정렬 설정은 유지, 필터는 해제)"""
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        self.children: Dict[str, List[str]] = {'': []}
+        self.filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None
+        self._next_id = 0
+        self._sort_dirty = self.sort_spec is not None
+        self._invalidate()
+
+    def _invalidate(self):
+        self._visible = None
+        self._visible_index = None
+
+    def add(self, parent='', iid=None, index='end', text='', values=(), tags=(), open=False) -> str:
+        """행 추가 후 아이템 ID 반환"""
+        parent = parent or ''
+        if parent not in self.children:
+            raise KeyError(f"부모 아이템이 없습니다: {parent}")
+        if iid is None:
+            self._next_id += 1
+            iid = f"V{self._next_id:06X}"
+        elif iid in self.rows:
+            raise ValueError(f"중복된 아이템 ID: {iid}")
+
+        self.rows[iid] = {
+            'iid': iid,
+            'parent': parent,
+            'text': text,
+            'values': tuple(values) if isinstance(values, (list, tuple)) else (values,),
+            'tags': (tags,) if isinstance(tags, str) else tuple(tags),
+            'open': bool(open),
+            'checked': False,
+        }
+        self.children[iid] = []
+        siblings = self.children[parent]
+        if index == 'end':
+            siblings.append(iid)
+        else:
+            siblings.insert(int(index), iid)
+
+        if self.sort_spec is not None:
+            self._sort_dirty = True
+        self._invalidate()
+        return iid
+
+    def remove(self, iids) -> List[str]:
+        """행과 하위 행 모두 제거 후 제거된 ID 목록 반환"""
+        removed = []
+        stack = [iid for iid in iids if iid in self.rows]
+        while stack:
+            iid = stack.pop()
+            removed.append(iid)
+            stack.extend(self.children.get(iid, ()))
+
+        removed_set = set(removed)
+        parents = {self.rows[iid]['parent'] for iid in removed}
+        for parent in parents:
+            if parent in self.children and parent not in removed_set:
+                self.children[parent] = [c for c in self.children[parent] if c not in removed_set]
+        for iid in removed:
+            self.rows.pop(iid, None)
+            self.children.pop(iid, None)
+
+        self._invalidate()
+        return removed
+
+    def update(self, iid, **fields):
+        """행 필드 갱신 (text/values/tags/open/checked)"""
+        row = self.rows[iid]
+        if 'values' in fields:
+            values = fields['values']
+            fields['values'] = tuple(values) if isinstance(values, (list, tuple)) else (values,)
+        if 'tags' in fields and isinstance(fields['tags'], str):
+            fields['tags'] = (fields['tags'],)
+        if 'open' in fields:
+            fields['open'] = bool(fields['open'])
+        row.update(fields)
+
+        # 펼침 상태나 (필터/정렬 대상이 될 수 있는) 값이 바뀌면 가시 목록 재계산
+        if 'open' in fields or self.filter_func is not None:
+            self._invalidate()
+        if self.sort_spec is not None and ('values' in fields or 'text' in fields):
+            self._sort_dirty = True
+            self._invalidate()
+
+    def set_filter(self, func):
+        """행 필터 설정 (None이면 해제). 자식이 있는 행은 하위 행이 하나라도 통과하면 표시"""
+        self.filter_func = func
+        self._invalidate()
+
+    def set_sort(self, column, value_index, reverse=False):
+        """형제 행 단위 정렬 설정 (value_index가 None이면 text 기준)"""
+        self.sort_spec = (column, value_index, reverse)
+        self._sort_dirty = True
+        self._invalidate()
+
+    def _apply_sort(self):
+        if not self._sort_dirty or self.sort_spec is None:
+            return
+        _, value_index, reverse = self.sort_spec
+        rows = self.rows
+
+        def key(iid):
+            row = rows[iid]
+            if value_index is None:
+                return _natural_sort_key(row['text'])
+            values = row['values']
+            return _natural_sort_key(values[value_index] if value_index < len(values) else '')
+
+        for parent, siblings in self.children.items():
+            if len(siblings) > 1:
+                siblings.sort(key=key, reverse=reverse)
+        self._sort_dirty = False
+
+    def _matches(self, iid) -> bool:
+        """필터 통과 여부 (자식이 있으면 하위 행 중 하나라도 통과하면 True)"""
+        if self.filter_func is None:
+            return True
+        kids = self.children[iid]
+        if kids:
+            return any(self._matches(child) for child in kids)
+        return bool(self.filter_func(self.rows[iid]))
+
+    def shown_children(self, parent='') -> List[str]:
+        """필터를 통과한 직계 자식 목록 (정렬 반영)"""
+        self._apply_sort()
+        kids = self.children.get(parent or '', [])
+        if self.filter_func is None:
+            return list(kids)
+        return [iid for iid in kids if self._matches(iid)]
+
+    def visible(self) -> List[str]:
+        """표시 순서대로의 가시 행 ID 목록 (닫힌 노드의 자식과 필터 제외 행은 빠짐)"""
+        if self._visible is None:
+            self._apply_sort()
+            out: List[str] = []
+            stack = [iter(self.shown_children(''))]
+            while stack:
+                iid = next(stack[-1], None)
+                if iid is None:
+                    stack.pop()
+                    continue
+                out.append(iid)
+                if self.rows[iid]['open'] and self.children[iid]:
+                    stack.append(iter(self.shown_children(iid)))
+            self._visible = out
+        return self._visible
+
+    def index_of(self, iid) -> Optional[int]:
+        """가시 목록에서의 위치 (보이지 않으면 None)"""
+        if self._visible_index is None:
+            self._visible_index = {iid: idx for idx, iid in enumerate(self.visible())}
+        return self._visible_index.get(iid)
+
+    def ancestors(self, iid) -> List[str]:
+        """부모부터 최상위까지의 조상 ID 목록"""
+        result = []
+        parent = self.rows[iid]['parent']
+        while parent:
+            result.append(parent)
+            parent = self.rows[parent]['parent']
+        return result
+
+    def count_visible(self, predicate=None) -> int:
+        """가시 행 수 (predicate 지정 시 해당 조건을 만족하는 행 수)"""
+        visible = self.visible()
+        if predicate is None:
+            return len(visible)
+        return sum(1 for iid in visible if predicate(self.rows[iid]))
+
+
+class VirtualTreeview(CheckboxTreeview):
+    """
+    가상화 트리뷰 - 화면에 보이는 행과 약간의 버퍼만 실제 Treeview 아이템으로 생성
+
+    insert/delete/item/set/get_children/selection 은 VirtualRowModel에 대해 동작하므로
+    기존 ttk.Treeview 사용 코드를 거의 그대로 쓸 수 있습니다. 스크롤, 헤더 클릭 정렬,
+    필터는 모두 모델에서 처리되어 렌더링 비용이 전체 행 수와 무관합니다.
+    닫힌 노드는 펼침 표시를 위해 자리표시 자식 아이템을 하나 가집니다.
+    """
+
+    PLACEHOLDER_SUFFIX = "::placeholder"
+    DEFAULT_ROW_HEIGHT = 20
+
+    def __init__(self, master=None, checkbox_column=None, buffer_rows=10, sortable=True, **kwargs):
+        """
+        Args:
+            master: 부모 위젯
+            checkbox_column: 체크박스 열 이름 (None이면 체크박스 열 없음)
+            buffer_rows: 화면 높이 외에 추가로 생성할 행 수
+            sortable: 헤더 클릭 정렬 사용 여부
+        """
+        yscrollcommand = kwargs.pop('yscrollcommand', None)
+        yscroll = kwargs.pop('yscroll', None)
+        self._yscrollcommand = yscrollcommand or yscroll
+
+        self.model = VirtualRowModel()
+        self.buffer_rows = buffer_rows
+        self.sortable = sortable
+        self._offset = 0
+        self._selected: Dict[str, None] = {}
+        self._materialized = set()
+        self._render_pending = False
+
+        super().__init__(master, checkbox_column=checkbox_column, **kwargs)
+
+        # 내부 이벤트는 인스턴스 전용 bindtag로 처리 (외부 bind() 호출이 덮어쓰지 않도록)
+        tag = f"VirtualTreeview{id(self)}"
+        self.bindtags((tag,) + self.bindtags())
+        self.bind_class(tag, '<Configure>', lambda e: self._schedule_render())
+        self.bind_class(tag, '<MouseWheel>', self._on_mousewheel)
+        self.bind_class(tag, '<Button-4>', lambda e: self._scroll_units(-3))
+        self.bind_class(tag, '<Button-5>', lambda e: self._scroll_units(3))
+        self.bind_class(tag, '<<TreeviewSelect>>', self._on_select)
+        self.bind_class(tag, '<<TreeviewOpen>>', lambda e: self._on_toggle(True))
+        self.bind_class(tag, '<<TreeviewClose>>', lambda e: self._on_toggle(False))
+        self.bind_class(tag, '<Up>', lambda e: self._move_focus(-1))
+        self.bind_class(tag, '<Down>', lambda e: self._move_focus(1))
+        self.bind_class(tag, '<Prior>', lambda e: self._move_focus(-self._page_size()))
+        self.bind_class(tag, '<Next>', lambda e: self._move_focus(self._page_size()))
+
+    # ------------------------------------------------------------
+    # 렌더링
+    # ------------------------------------------------------------
+    def _row_height(self) -> int:
+        style = str(self.cget('style') or 'Treeview')
+        try:
+            height = ttk.Style(self).lookup(style, 'rowheight')
+            return int(height) if height else self.DEFAULT_ROW_HEIGHT
+        except (tk.TclError, ValueError):
+            return self.DEFAULT_ROW_HEIGHT
+
+    def _page_size(self) -> int:
+        """현재 위젯 높이에 들어가는 행 수"""
+        height = self.winfo_height()
+        row_height = self._row_height()
+        if height <= 1:
+            return max(1, int(self.cget('height')))
+        header = row_height if 'headings' in str(self.cget('show')) else 0
+        return max(1, (height - header) // row_height)
+
+    def _schedule_render(self):
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _render(self):
+        """가시 구간(+버퍼)만 실제 아이템으로 다시 생성"""
+        self._render_pending = False
+        if not self.winfo_exists():
+            return
+
+        visible = self.model.visible()
+        page = self._page_size()
+        self._offset = max(0, min(self._offset, len(visible) - page))
+        window = visible[self._offset:self._offset + page + self.buffer_rows]
+
+        focus = ttk.Treeview.focus(self)
+        existing = ttk.Treeview.get_children(self)
+        if existing:
+            ttk.Treeview.delete(self, *existing)
+        self._materialized = set()
+
+        for iid in window:
+            for ancestor in reversed(self.model.ancestors(iid)):
+                if ancestor not in self._materialized:
+                    self._materialize(ancestor)
+            self._materialize(iid)
+
+        ttk.Treeview.selection_set(self, [iid for iid in self._selected if iid in self._materialized])
+        if focus in self._materialized:
+            ttk.Treeview.focus(self, focus)
+
+        if self._yscrollcommand:
+            self._yscrollcommand(*self._fractions(len(visible), page))
+
+    def _materialize(self, iid):
+        row = self.model.rows[iid]
+        has_children = bool(self.model.children[iid])
+        options = {
+            'text': row['text'],
+            'values': row['values'],
+            'tags': row['tags'],
+            'open': row['open'] and has_children,
+        }
+        if self.checkbox_column:
+            options['image'] = self.checkbox_images["checked" if row['checked'] else "unchecked"]
+        parent = row['parent'] if row['parent'] in self._materialized else ''
+        ttk.Treeview.insert(self, parent, 'end', iid=iid, **options)
+        self._materialized.add(iid)
+
+        # 닫힌 노드에 펼침 표시가 나타나도록 자리표시 자식 추가
+        if has_children and not row['open']:
+            ttk.Treeview.insert(self, iid, 'end', iid=iid + self.PLACEHOLDER_SUFFIX)
+
+    def _fractions(self, total, page):
+        if total <= 0:
+            return 0.0, 1.0
+        return self._offset / total, min(1.0, (self._offset + page) / total)
+
+    # ------------------------------------------------------------
+    # 이벤트 처리
+    # ------------------------------------------------------------
+    def _scroll_units(self, count):
+        self._offset += count
+        self._render()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        step = -int(event.delta / 120) if abs(event.delta) >= 120 else (-1 if event.delta > 0 else 1)
+        return self._scroll_units(step * 3)
+
+    def _on_select(self, event=None):
+        """실제 선택 상태를 모델 선택 상태로 동기화 (화면 밖 선택은 유지)"""
+        current = ttk.Treeview.selection(self)
+        kept = [iid for iid in self._selected if iid not in self._materialized]
+        self._selected = dict.fromkeys(kept + [iid for iid in current if iid in self.model.rows])
+
+    def _on_toggle(self, opened):
+        iid = ttk.Treeview.focus(self)
+        if iid in self.model.rows:
+            self.model.update(iid, open=opened)
+            self._schedule_render()
+
+    def _move_focus(self, delta):
+        visible = self.model.visible()
+        if not visible:
+            return "break"
+        index = self.model.index_of(ttk.Treeview.focus(self))
+        if index is None:
+            index = self._offset
+        index = max(0, min(len(visible) - 1, index + delta))
+        iid = visible[index]
+        self.see(iid)
+        self.selection_set(iid)
+        ttk.Treeview.focus(self, iid)
+        return "break"
+
+    def _on_click(self, event):
+        """체크박스(트리 열 이미지) 클릭 시 모델의 체크 상태 전환"""
+        if self.identify('region', event.x, event.y) != "tree":
+            return
+        item = self.identify_row(event.y)
+        if item in self.model.rows:
+            self.toggle(item)
+            self.event_generate('<<CheckboxToggled>>', when='tail')
+
+    # ------------------------------------------------------------
+    # 데이터 모델 API (ttk.Treeview 호환)
+    # ------------------------------------------------------------
+    def insert(self, parent, index, iid=None, **kwargs) -> str:
+        """모델에 행 추가 (실제 아이템 생성은 렌더링 시점까지 지연)"""
+        item = self.model.add(
+            parent, iid, index,
+            text=kwargs.get('text', ''),
+            values=kwargs.get('values', ()),
+            tags=kwargs.get('tags', ()),
+            open=kwargs.get('open', False),
+        )
+        self._schedule_render()
+        return item
+
+    def delete(self, *items):
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        for iid in self.model.remove(items):
+            self._selected.pop(iid, None)
+        self._schedule_render()
+
+    def clear(self):
+        """모든 행 제거 (대량 삭제 시 delete(*get_children()) 대신 사용)"""
+        self.model.clear()
+        self._selected.clear()
+        self._offset = 0
+        self._render()
+
+    def get_children(self, item=None):
+        """필터를 통과한 자식 행 ID 튜플"""
+        item = item or ''
+        if item in self.model.children:
+            return tuple(self.model.shown_children(item))
+        return ttk.Treeview.get_children(self, item)
+
+    def exists(self, item) -> bool:
+        return item in self.model.rows
+
+    def parent(self, item):
+        if item in self.model.rows:
+            return self.model.rows[item]['parent']
+        return ttk.Treeview.parent(self, item)
+
+    def index(self, item):
+        if item in self.model.rows:
+            return self.model.children[self.model.rows[item]['parent']].index(item)
+        return ttk.Treeview.index(self, item)
+
+    def item(self, item, option=None, **kw):
+        if item not in self.model.rows:
+            return ttk.Treeview.item(self, item, option, **kw)
+
+        if kw:
+            fields = {key: kw[key] for key in ('text', 'values', 'tags', 'open') if key in kw}
+            self.model.update(item, **fields)
+            if item in self._materialized:
+                real = {key: value for key, value in kw.items() if key != 'open'}
+                if real:
+                    ttk.Treeview.item(self, item, **real)
+            if 'open' in kw or self.model.filter_func is not None or self.model.sort_spec is not None:
+                self._schedule_render()
+            return None
+
+        row = self.model.rows[item]
+        info = {
+            'text': row['text'],
+            'image': '',
+            'values': row['values'],
+            'open': row['open'],
+            'tags': row['tags'],
+        }
+        return info[option] if option else info
+
+    def set(self, item, column=None, value=None):
+        if item not in self.model.rows:
+            return ttk.Treeview.set(self, item, column, value)
+        columns = list(self.tk.splitlist(self['columns']))
+        values = list(self.model.rows[item]['values'])
+        values += [''] * (len(columns) - len(values))
+        if column is None:
+            return dict(zip(columns, values))
+        index = columns.index(column)
+        if value is None:
+            return values[index]
+        values[index] = value
+        self.item(item, values=values)
+        return None
+
+    def selection(self):
+        return tuple(iid for iid in self._selected if iid in self.model.rows)
+
+    def selection_set(self, *items):
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        self._selected = dict.fromkeys(iid for iid in items if iid in self.model.rows)
+        ttk.Treeview.selection_set(self, [iid for iid in self._selected if iid in self._materialized])
+
+    def selection_add(self, *items):
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        self.selection_set(list(self._selected) + [iid for iid in items if iid not in self._selected])
+
+    def selection_remove(self, *items):
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        removed = set(items)
+        self.selection_set([iid for iid in self._selected if iid not in removed])
+
+    def see(self, item):
+        """행이 보이도록 조상 노드를 펼치고 스크롤"""
+        if item not in self.model.rows:
+            return ttk.Treeview.see(self, item)
+        for ancestor in self.model.ancestors(item):
+            if not self.model.rows[ancestor]['open']:
+                self.model.update(ancestor, open=True)
+        index = self.model.index_of(item)
+        if index is None:
+            return None
+        page = self._page_size()
+        if index < self._offset:
+            self._offset = index
+        elif index >= self._offset + page:
+            self._offset = index - page + 1
+        self._render()
+        return None
+
+    # ------------------------------------------------------------
+    # 스크롤 / 정렬 / 필터
+    # ------------------------------------------------------------
+    def yview(self, *args):
+        """스크롤바 연동 - 실제 Treeview 대신 모델 오프셋을 이동"""
+        total = len(self.model.visible())
+        page = self._page_size()
+        if not args:
+            return self._fractions(total, page)
+        if args[0] == 'moveto':
+            self._offset = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = page if str(args[2]).startswith('page') else 1
+            self._offset += int(args[1]) * step
+        self._render()
+        return None
+
+    def yview_moveto(self, fraction):
+        return self.yview('moveto', fraction)
+
+    def yview_scroll(self, number, what):
+        return self.yview('scroll', number, what)
+
+    def configure(self, cnf=None, **kw):
+        if isinstance(cnf, dict):
+            kw = {**cnf, **kw}
+            cnf = None
+        handled = False
+        for key in ('yscrollcommand', 'yscroll'):
+            if key in kw:
+                self._yscrollcommand = kw.pop(key)
+                handled = True
+        if handled:
+            self._schedule_render()
+            if not kw:
+                return None
+        return ttk.Treeview.configure(self, cnf, **kw)
+
+    config = configure
+
+    def heading(self, column, option=None, **kw):
+        # 정렬 사용 시 헤더 클릭 명령을 자동으로 연결 (컬럼 재설정 후에도 유지)
+        if self.sortable and kw and option is None and 'command' not in kw:
+            kw['command'] = lambda c=column: self.sort_by(c)
+        return ttk.Treeview.heading(self, column, option, **kw)
+
+    def sort_by(self, column, reverse=None):
+        """컬럼 기준 정렬 (같은 컬럼을 다시 누르면 역순)"""
+        if reverse is None:
+            previous = self.model.sort_spec
+            reverse = not previous[2] if previous and previous[0] == column else False
+        value_index = None if column == '#0' else list(self.tk.splitlist(self['columns'])).index(column)
+        self.model.set_sort(column, value_index, reverse)
+        self._render()
+
+    def set_filter(self, func):
+        """행 필터 설정 (row dict를 받아 bool 반환, None이면 해제)"""
+        self.model.set_filter(func)
+        self._offset = 0
+        self._render()
+
+    def visible_count(self, predicate=None) -> int:
+        """필터/펼침 상태 기준 가시 행 수"""
+        return self.model.count_visible(predicate)
+
+    # ------------------------------------------------------------
+    # 체크박스 API (모델 기반)
+    # ------------------------------------------------------------
+    def _set_checked(self, item, state):
+        row = self.model.rows.get(item)
+        if row is None:
+            return
+        row['checked'] = bool(state)
+        if self.checkbox_column and item in self._materialized:
+            ttk.Treeview.item(self, item, image=self.checkbox_images["checked" if state else "unchecked"])
+
+    def is_checked(self, item) -> bool:
+        row = self.model.rows.get(item)
+        return bool(row and row['checked'])
+
+    def check(self, item):
+        self._set_checked(item, True)
+
+    def uncheck(self, item):
+        self._set_checked(item, False)
+
+    def toggle(self, item):
+        self._set_checked(item, not self.is_checked(item))
+
+    def get_checked_items(self) -> List[str]:
+        return [iid for iid, row in self.model.rows.items() if row['checked']]
+
+
 class ScrollableTreeview(ttk.Frame):
     """스크롤바가 있는 트리뷰 프레임"""
     def __init__(self, master=None, treeview_class=ttk.Treeview, **kwargs):
@@ -10,6 +10,12 @@ import sqlite3
 from datetime import datetime
 from contextlib import contextmanager
 
+from app.connection_pool import SQLiteConnectionPool, DEFAULT_POOL_SIZE, DEFAULT_HEALTH_CHECK_INTERVAL
+from app.index_catalog import ensure_indexes
+from app.schema_migrations import Migration, MigrationRunner
+from app.storage_profile import (configured_storage_profile, resolve_storage_profile, connection_pragmas,
+                                 apply_journal_mode, run_maintenance)
+
 class DBSchema:
     """
     DB Manager 애플리케이션의 로컬 데이터베이스 스키마를 관리하는 클래스
@@ -17,12 +23,18 @@ class DBSchema:
     컨텍스트 매니저 패턴을 사용하여 데이터베이스 연결을 효율적으로 관리합니다.
     """
     
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, pool_size=DEFAULT_POOL_SIZE,
+                 health_check_interval=DEFAULT_HEALTH_CHECK_INTERVAL,
+                 storage_profile=None):
         """
         DBSchema 클래스 초기화
         
         Args:
             db_path (str, optional): 데이터베이스 파일 경로. 기본값은 애플리케이션 폴더 내 'data/local_db.sqlite'
+            pool_size (int, optional): 재사용할 유휴 연결 최대 수
+            health_check_interval (float, optional): 유휴 연결 상태 확인 주기 (초)
+            storage_profile (str, optional): 저장소 프로필 ('safe', 'fast', 'bulk-import'),
+                None이면 settings.json의 service_config.database.storage_profile
         """
         if db_path is None:
             # 기본 데이터 디렉토리 설정
@@ -36,6 +48,14 @@ class DBSchema:
         else:
             self.db_path = db_path
             
+        # 프로필을 지정하지 않으면 settings.json 설정을 따름 (같은 DB 파일의 모든 연결에 같은 PRAGMA 적용)
+        self.storage_profile = (configured_storage_profile() if storage_profile is None
+                                else resolve_storage_profile(storage_profile))
+        self._pool = SQLiteConnectionPool(self.db_path, pool_size, health_check_interval,
+                                          row_factory=sqlite3.Row,
+                                          init_statements=connection_pragmas(self.storage_profile))
+        with self.get_connection() as conn:
+            apply_journal_mode(conn, self.storage_profile)
         self.create_tables()
         
     @contextmanager
@@ -49,202 +69,41 @@ class DBSchema:
         Yields:
             sqlite3.Connection: 데이터베이스 연결 객체
         """
-        conn_provided = conn_override is not None
-        conn = conn_override if conn_provided else sqlite3.connect(self.db_path)
-
-        # Row factory 설정: dict 형식 접근 가능
-        conn.row_factory = sqlite3.Row
+        if conn_override is not None:
+            # Row factory 설정: dict 형식 접근 가능
+            conn_override.row_factory = sqlite3.Row
+            yield conn_override
+            return
 
+        # 풀 연결은 row_factory=sqlite3.Row로 생성/반납됨
+        conn = self._pool.acquire()
         try:
             yield conn
         finally:
-            if not conn_provided and conn:
-                conn.close()
+            self._pool.release(conn)
+
+    def close(self):
+        """WAL 체크포인트 후 연결 풀 종료 (애플리케이션 종료 시 호출)"""
+        try:
+            with self.get_connection() as conn:
+                run_maintenance(conn, truncate=True)
+        except sqlite3.Error as e:
+            print(f"종료 시 DB 유지보수 실패: {str(e)}")
+        self._pool.close_all()
     
     def create_tables(self):
         """
-        필요한 테이블 구조를 생성합니다.
-        - Equipment_Types: 장비 유형 정보
+        필요한 테이블 구조를 생성합니다. (미적용 마이그레이션 단계만 실행, app/schema_migrations.py)
+        - Equipment_Models / Equipment_Types / Equipment_Configurations: 장비 계층
         - Default_DB_Values: 장비 유형별 기본 DB 값
+
+        Returns:
+            list: 이번에 적용한 마이그레이션 단계 목록
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Phase 1.5: 장비 모델 테이블 (최상위 계층)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Models (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                model_name TEXT NOT NULL UNIQUE,
-                description TEXT,
-                display_order INTEGER DEFAULT 999,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-
-            # Phase 1.5: 장비 유형 테이블 (Equipment_Models의 하위 계층)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Types (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                model_id INTEGER,
-                type_name TEXT NOT NULL,
-                description TEXT,
-                display_order INTEGER DEFAULT 999,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (model_id) REFERENCES Equipment_Models(id) ON DELETE CASCADE,
-                UNIQUE (model_id, type_name)
-            )
-            ''')
-
-            # Phase 1.5: 장비 구성 테이블 (Equipment_Types의 하위 계층)
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Configurations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                type_id INTEGER NOT NULL,
-                configuration_name TEXT NOT NULL,
-                port_type TEXT,
-                port_count INTEGER,
-                wafer_size TEXT,
-                wafer_count INTEGER,
-                custom_options TEXT,
-                is_customer_specific INTEGER DEFAULT 0,
-                customer_name TEXT,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
-                UNIQUE (type_id, configuration_name)
-            )
-            ''')
-            
-            # 기본 DB 값 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Default_DB_Values (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                equipment_type_id INTEGER NOT NULL,
-                parameter_name TEXT NOT NULL,
-                default_value TEXT NOT NULL,
-                min_spec TEXT,
-                max_spec TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id),
-                UNIQUE (equipment_type_id, parameter_name)
-            )
-            ''')
-
-            # Phase 1: QC Check list 마스터 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS QC_Checklist_Items (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                item_name TEXT NOT NULL UNIQUE,
-                parameter_pattern TEXT NOT NULL,
-                is_common INTEGER DEFAULT 1,
-                severity_level TEXT CHECK(severity_level IN ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')) DEFAULT 'MEDIUM',
-                validation_rule TEXT,
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-
-            # Phase 1: 장비별 Check list 매핑 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Checklist_Mapping (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                equipment_type_id INTEGER NOT NULL,
-                checklist_item_id INTEGER NOT NULL,
-                is_required INTEGER DEFAULT 1,
-                custom_validation_rule TEXT,
-                priority INTEGER DEFAULT 100,
-                added_reason TEXT,
-                added_by TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
-                FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
-                UNIQUE(equipment_type_id, checklist_item_id)
-            )
-            ''')
-
-            # Phase 1: 장비별 Check list 예외 처리 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Equipment_Checklist_Exceptions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                equipment_type_id INTEGER NOT NULL,
-                checklist_item_id INTEGER NOT NULL,
-                reason TEXT NOT NULL,
-                approved_by TEXT,
-                approved_date TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
-                FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
-                UNIQUE(equipment_type_id, checklist_item_id)
-            )
-            ''')
-
-            # Phase 1: Check list 변경 이력 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Checklist_Audit_Log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                action TEXT CHECK(action IN ('ADD', 'REMOVE', 'MODIFY', 'APPROVE', 'REJECT')) NOT NULL,
-                target_table TEXT NOT NULL,
-                target_id INTEGER,
-                old_value TEXT,
-                new_value TEXT,
-                reason TEXT,
-                user TEXT,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            ''')
-
-            # Phase 2: 출고 장비 메타데이터 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Shipped_Equipment (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                equipment_type_id INTEGER NOT NULL,
-                configuration_id INTEGER NOT NULL,
-                serial_number TEXT NOT NULL UNIQUE,
-                customer_name TEXT NOT NULL,
-                ship_date DATE,
-                is_refit INTEGER DEFAULT 0,
-                original_serial_number TEXT,
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE RESTRICT,
-                FOREIGN KEY (configuration_id) REFERENCES Equipment_Configurations(id) ON DELETE RESTRICT
-            )
-            ''')
-
-            # Phase 2: 출고 장비 파라미터 Raw Data 테이블
-            cursor.execute('''
-            CREATE TABLE IF NOT EXISTS Shipped_Equipment_Parameters (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                shipped_equipment_id INTEGER NOT NULL,
-                parameter_name TEXT NOT NULL,
-                parameter_value TEXT NOT NULL,
-                module TEXT,
-                part TEXT,
-                data_type TEXT,
-                FOREIGN KEY (shipped_equipment_id) REFERENCES Shipped_Equipment(id) ON DELETE CASCADE,
-                UNIQUE (shipped_equipment_id, parameter_name)
-            )
-            ''')
-
-            # Phase 2: 인덱스 생성
-            cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_shipped_params_equipment
-            ON Shipped_Equipment_Parameters(shipped_equipment_id)
-            ''')
+            self.applied_migrations = SCHEMA_MIGRATIONS.run(conn)
+        return self.applied_migrations
 
-            cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_shipped_params_name
-            ON Shipped_Equipment_Parameters(parameter_name)
-            ''')
-
-            conn.commit()
-    
     def add_equipment_type(self, type_name, description=""):
         """
         새 장비 유형을 추가합니다.
@@ -489,3 +348,177 @@ class DBSchema:
             except Exception as e:
                 print(f"기본 DB 값 삭제 중 오류 발생: {str(e)}")
                 return False
+
+
+# ==================== 스키마 마이그레이션 단계 ====================
+# 배포된 단계는 수정하지 말고 SCHEMA_MIGRATIONS 끝에 새 버전을 추가합니다.
+# (Shipped_Equipment_Parameters.data_type은 ShippedEquipmentService가 사용하므로 이름을 바꾸지 않음)
+
+def _create_hierarchy_tables(conn):
+    """v1: 장비 계층 / Check list / 출고 장비 테이블 생성"""
+    # Phase 1.5: 장비 모델 테이블 (최상위 계층)
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Models (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        model_name TEXT NOT NULL UNIQUE,
+        description TEXT,
+        display_order INTEGER DEFAULT 999,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    # Phase 1.5: 장비 유형 테이블 (Equipment_Models의 하위 계층)
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Types (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        model_id INTEGER,
+        type_name TEXT NOT NULL,
+        description TEXT,
+        display_order INTEGER DEFAULT 999,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (model_id) REFERENCES Equipment_Models(id) ON DELETE CASCADE,
+        UNIQUE (model_id, type_name)
+    )
+    ''')
+
+    # Phase 1.5: 장비 구성 테이블 (Equipment_Types의 하위 계층)
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Configurations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        type_id INTEGER NOT NULL,
+        configuration_name TEXT NOT NULL,
+        port_type TEXT,
+        port_count INTEGER,
+        wafer_size TEXT,
+        wafer_count INTEGER,
+        custom_options TEXT,
+        is_customer_specific INTEGER DEFAULT 0,
+        customer_name TEXT,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
+        UNIQUE (type_id, configuration_name)
+    )
+    ''')
+
+    # 기본 DB 값 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Default_DB_Values (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_type_id INTEGER NOT NULL,
+        parameter_name TEXT NOT NULL,
+        default_value TEXT NOT NULL,
+        min_spec TEXT,
+        max_spec TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id),
+        UNIQUE (equipment_type_id, parameter_name)
+    )
+    ''')
+
+    # Phase 1: QC Check list 마스터 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS QC_Checklist_Items (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        item_name TEXT NOT NULL UNIQUE,
+        parameter_pattern TEXT NOT NULL,
+        is_common INTEGER DEFAULT 1,
+        severity_level TEXT CHECK(severity_level IN ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW')) DEFAULT 'MEDIUM',
+        validation_rule TEXT,
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    # Phase 1: 장비별 Check list 매핑 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Checklist_Mapping (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_type_id INTEGER NOT NULL,
+        checklist_item_id INTEGER NOT NULL,
+        is_required INTEGER DEFAULT 1,
+        custom_validation_rule TEXT,
+        priority INTEGER DEFAULT 100,
+        added_reason TEXT,
+        added_by TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
+        FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
+        UNIQUE(equipment_type_id, checklist_item_id)
+    )
+    ''')
+
+    # Phase 1: 장비별 Check list 예외 처리 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Equipment_Checklist_Exceptions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_type_id INTEGER NOT NULL,
+        checklist_item_id INTEGER NOT NULL,
+        reason TEXT NOT NULL,
+        approved_by TEXT,
+        approved_date TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE CASCADE,
+        FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE,
+        UNIQUE(equipment_type_id, checklist_item_id)
+    )
+    ''')
+
+    # Phase 1: Check list 변경 이력 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Checklist_Audit_Log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        action TEXT CHECK(action IN ('ADD', 'REMOVE', 'MODIFY', 'APPROVE', 'REJECT')) NOT NULL,
+        target_table TEXT NOT NULL,
+        target_id INTEGER,
+        old_value TEXT,
+        new_value TEXT,
+        reason TEXT,
+        user TEXT,
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    # Phase 2: 출고 장비 메타데이터 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Shipped_Equipment (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        equipment_type_id INTEGER NOT NULL,
+        configuration_id INTEGER NOT NULL,
+        serial_number TEXT NOT NULL UNIQUE,
+        customer_name TEXT NOT NULL,
+        ship_date DATE,
+        is_refit INTEGER DEFAULT 0,
+        original_serial_number TEXT,
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (equipment_type_id) REFERENCES Equipment_Types(id) ON DELETE RESTRICT,
+        FOREIGN KEY (configuration_id) REFERENCES Equipment_Configurations(id) ON DELETE RESTRICT
+    )
+    ''')
+
+    # Phase 2: 출고 장비 파라미터 Raw Data 테이블
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS Shipped_Equipment_Parameters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        shipped_equipment_id INTEGER NOT NULL,
+        parameter_name TEXT NOT NULL,
+        parameter_value TEXT NOT NULL,
+        module TEXT,
+        part TEXT,
+        data_type TEXT,
+        FOREIGN KEY (shipped_equipment_id) REFERENCES Shipped_Equipment(id) ON DELETE CASCADE,
+        UNIQUE (shipped_equipment_id, parameter_name)
+    )
+    ''')
+
+
+SCHEMA_MIGRATIONS = MigrationRunner('db_schema', [
+    Migration(1, 'create_hierarchy_tables', _create_hierarchy_tables),
+], after_apply=ensure_indexes)  # 인덱스 카탈로그: app/index_catalog.py (Phase 2 출고 장비 인덱스 포함)
@@ -3,6 +3,11 @@
 DB Manager 애플리케이션 메인 진입점
 """
 
+import time
+
+# 시작 시간 측정 기준 (가장 먼저 기록)
+_STARTED_AT = time.perf_counter()
+
 import sys
 import os
 
@@ -11,12 +16,17 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-from app.manager import DBManager
-
 def main():
     """메인 함수"""
     try:
-        app = DBManager()
+        # 시작 프로파일링: DB_MANAGER_PROFILE_STARTUP=1 또는 --profile-startup[=경로]
+        from app.startup_profiler import StartupTimer, get_profile_path
+        startup = StartupTimer(_STARTED_AT, report_path=get_profile_path())
+        if startup.report_path:
+            startup.start_import_profiling()
+        with startup.phase('imports'):
+            from app.manager import DBManager
+        app = DBManager(startup=startup)
         app.window.mainloop()
     except Exception as e:
         print(f"애플리케이션 실행 중 오류 발생: {e}")
@@ -24,4 +34,7 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # 병렬 파일 로더의 프로세스 풀이 패키징된 실행 파일에서도 동작하도록 함
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,83 @@
+"""
+Default DB 대량 쓰기 API 테스트
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.schema import DBSchema
+
+
+class TestBulkUpsertDefaultValues(unittest.TestCase):
+    """DBSchema.bulk_upsert_default_values 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_schema = DBSchema(os.path.join(self.temp_dir, 'test.sqlite'))
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("INSERT INTO Equipment_Types (type_name) VALUES ('Dsp')")
+            self.type_id = cursor.lastrowid
+            conn.commit()
+        self.db_schema.add_default_value(self.type_id, 'Gain', '1.0', is_checklist=1)
+
+    def tearDown(self):
+        self.db_schema.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def values(self):
+        return {row[1]: row for row in self.db_schema.get_default_values(self.type_id)}
+
+    def audit_count(self):
+        with self.db_schema.get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM Checklist_Audit_Log").fetchone()[0]
+
+    def test_added_updated_skipped_counts(self):
+        records = [
+            {'parameter_name': 'Gain', 'default_value': 1.5, 'module': 'Dsp', 'confidence_score': 0.8},
+            {'parameter_name': 'Offset', 'default_value': '0', 'min_spec': '-1', 'max_spec': '1'},
+            {'parameter_name': 'Offset', 'default_value': '9'},   # 배치 내 중복
+            {'parameter_name': '', 'default_value': '1'},         # 이름 없음
+            {'parameter_name': 'Mode', 'default_value': None},    # 값 없음
+        ]
+        result = self.db_schema.bulk_upsert_default_values(self.type_id, records)
+        self.assertEqual(result, {'added': 1, 'updated': 1, 'skipped': 3})
+
+        values = self.values()
+        self.assertEqual(values['Gain'][2], '1.5')
+        self.assertEqual(values['Gain'][11], 'Dsp')
+        self.assertEqual(values['Gain'][14], 1)  # 업데이트 시 is_checklist 유지
+        self.assertEqual((values['Offset'][2], values['Offset'][3], values['Offset'][4]), ('0', '-1', '1'))
+        self.assertEqual(self.audit_count(), 2)
+
+    def test_skip_existing(self):
+        records = [{'parameter_name': 'Gain', 'default_value': '2.0'},
+                   {'parameter_name': 'Speed', 'default_value': '10'}]
+        result = self.db_schema.bulk_upsert_default_values(self.type_id, records, update_existing=False)
+        self.assertEqual(result, {'added': 1, 'updated': 0, 'skipped': 1})
+        self.assertEqual(self.values()['Gain'][2], '1.0')
+
+    def test_failure_rolls_back_everything(self):
+        records = [{'parameter_name': 'P1', 'default_value': '1'},
+                   {'parameter_name': 'P2', 'default_value': '2', 'description': object()}]
+        with self.assertRaises(Exception):
+            self.db_schema.bulk_upsert_default_values(self.type_id, records)
+        self.assertEqual(set(self.values()), {'Gain'})
+        self.assertEqual(self.audit_count(), 0)
+
+    def test_large_batch_updates_existence_index(self):
+        records = [{'parameter_name': f'P{i}', 'default_value': str(i)} for i in range(2000)]
+        self.db_schema.get_default_parameter_index()
+        result = self.db_schema.bulk_upsert_default_values(self.type_id, records)
+        self.assertEqual(result['added'], 2000)
+        self.assertIn(('dsp', 'P1999'), self.db_schema.get_default_parameter_index())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+CacheService 테스트 (크기 제한, 태그 무효화, 세대, 단조 시계 TTL)
+"""
+
+import os
+import sys
+import time
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.services.common.cache_service import CacheService, estimate_size
+from app.services.configuration.configuration_service import ConfigurationService
+
+
+class TestCacheService(unittest.TestCase):
+    """CacheService 테스트"""
+
+    def test_estimate_size_grows_with_content(self):
+        small = estimate_size(['x' * 10] * 10)
+        large = estimate_size(['x' * 10] * 10000)
+        self.assertGreater(large, small * 100)
+        self.assertGreater(estimate_size({'key': 'v' * 1000}), 1000)
+
+    def test_byte_limit_evicts_least_recently_used(self):
+        cache = CacheService(max_size=100, max_bytes=250)
+        cache.set('a', 1, size=100)
+        cache.set('b', 2, size=100)
+        cache.get('a')
+        cache.set('c', 3, size=100)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c')), (1, 3))
+        stats = cache.get_statistics()
+        self.assertEqual((stats['bytes'], stats['evictions']), (200, 1))
+
+        # 제한보다 큰 값은 저장되지 않음
+        self.assertFalse(cache.set('huge', 4, size=1000))
+        self.assertEqual(cache.get_statistics()['bytes'], 0)
+
+    def test_invalidate_tags_only_removes_dependents(self):
+        cache = CacheService()
+        cache.set('config:1', 'c1', tags=['config:1'])
+        cache.set('values:1', 'v1', tags=['config:1', 'default_values:1'])
+        cache.set('values:2', 'v2', tags=['config:2', 'default_values:2'])
+        cache.set('all', 'all', tags=['configurations'])
+
+        self.assertEqual(cache.invalidate_tags('default_values:1'), 1)
+        self.assertIsNone(cache.get('values:1'))
+        self.assertEqual(cache.get('config:1'), 'c1')
+
+        self.assertEqual(cache.invalidate_tags('config:1', 'config:2'), 2)
+        self.assertEqual(cache.get('all'), 'all')
+        self.assertEqual(cache.get_statistics()['tags'], 1)
+
+    def test_generation_rejects_stale_result(self):
+        cache = CacheService()
+        generation = cache.generation(['config:1'])
+        cache.invalidate_tags('config:1')  # 조회 중 쓰기
+        self.assertFalse(cache.set('config:1', 'stale', tags=['config:1'], generation=generation))
+        self.assertIsNone(cache.get('config:1'))
+
+        generation = cache.generation(['config:1'])
+        cache.clear()
+        self.assertFalse(cache.set('config:1', 'stale', tags=['config:1'], generation=generation))
+        generation = cache.generation(['config:1'])
+        self.assertTrue(cache.set('config:1', 'fresh', tags=['config:1'], generation=generation))
+
+    def test_ttl_and_pattern(self):
+        cache = CacheService(default_ttl=0.05)
+        cache.set('checklist_a', 1)
+        cache.set('checklist_b', 2, ttl_seconds=60)
+        cache.set('other', 3, ttl_seconds=60)
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('checklist_a'))
+        self.assertEqual(cache.cleanup_expired(), 0)
+        self.assertEqual(cache.invalidate_pattern('checklist_*'), 1)
+        self.assertEqual(cache.invalidate_pattern('other'), 1)
+        self.assertEqual(len(cache.get_cache_info()), 0)
+
+
+class TestConfigurationServiceInvalidation(unittest.TestCase):
+    """ConfigurationService 쓰기 시 관련 캐시만 무효화"""
+
+    def test_transaction_keeps_unrelated_entries(self):
+        cache = CacheService()
+        service = ConfigurationService(None, cache)
+        cache.set('configurations:all', ['c1', 'c2'], tags=[service._TAG_CONFIG_LISTS])
+        cache.set('default_values:config:1', ['v'], tags=['config:1', 'default_values:1'])
+        cache.set('default_values:config:2', ['w'], tags=['config:2', 'default_values:2'])
+
+        with service._transaction(service._TAG_DEFAULT_VALUES.format(1)):
+            pass
+        self.assertIsNone(cache.get('default_values:config:1'))
+        self.assertIsNotNone(cache.get('configurations:all'))
+        self.assertIsNotNone(cache.get('default_values:config:2'))
+
+        with service._transaction(service._TAG_CONFIG_LISTS, service._TAG_CONFIG.format(2)):
+            pass
+        self.assertIsNone(cache.get('configurations:all'))
+        self.assertIsNone(cache.get('default_values:config:2'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Check list 컴파일 매처 테스트
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.schema import DBSchema
+from app.services.checklist.checklist_service import ChecklistService
+from app.services.common.cache_service import CacheService
+from app.services.checklist.checklist_matcher import CompiledChecklistMatcher, compile_validation_rule
+
+
+def make_item(name, pattern, severity='MEDIUM', rule=None):
+    return {'item_name': name, 'parameter_pattern': pattern, 'severity_level': severity,
+            'validation_rule': rule, 'custom_validation_rule': None}
+
+
+def reference_match(items, name):
+    """기존 re.search 루프와 같은 첫 번째 매칭 항목"""
+    for idx, item in enumerate(items):
+        try:
+            if re.search(item['parameter_pattern'], name, re.IGNORECASE):
+                return idx
+        except re.error:
+            continue
+    return None
+
+
+class TestCompiledChecklistMatcher(unittest.TestCase):
+    """CompiledChecklistMatcher 테스트"""
+
+    def test_first_item_in_list_order_wins(self):
+        # 결합 검색은 "A" 위치(0)를 먼저 찾지만, 목록상 앞선 "B" 항목이 우선
+        items = [make_item('b', 'B'), make_item('a', 'A'), make_item('c', 'C')]
+        matcher = CompiledChecklistMatcher(items)
+        for name in ['AB', 'A', 'cab', 'xyz', 'c']:
+            self.assertEqual(matcher.match_index(name), reference_match(items, name), name)
+
+    def test_invalid_and_backreference_patterns(self):
+        items = [make_item('bad', '(['), make_item('rep', r'(a)\1'), make_item('x', 'x$')]
+        matcher = CompiledChecklistMatcher(items)
+        self.assertEqual(len(matcher), 2)
+        self.assertEqual(matcher.validate('AA', '')['item_name'], 'rep')
+        self.assertEqual(matcher.validate('max', '')['item_name'], 'x')
+
+    def test_validation_rules(self):
+        range_rule = compile_validation_rule('{"type": "range", "min": 0, "max": 10}')
+        self.assertEqual(range_rule('5'), (True, ''))
+        self.assertEqual(range_rule('11'), (False, "값이 최대값(10)보다 큽니다"))
+        self.assertEqual(range_rule('abc'), (False, "숫자 형식이 아닙니다"))
+
+        enum_rule = compile_validation_rule('{"type": "enum", "values": ["on", "off"]}')
+        self.assertEqual(enum_rule('auto'), (False, "허용된 값(on, off) 중 하나가 아닙니다"))
+        self.assertEqual(compile_validation_rule('{"type": "pattern", "pattern": "^v"}')('x')[0], False)
+        self.assertEqual(compile_validation_rule('not json')('x'), (True, '검증 규칙 파싱 실패'))
+        self.assertTrue(compile_validation_rule('{"type": "range", "min": "0"}')('1')[1].startswith('검증 오류'))
+
+
+class TestChecklistServiceMatcher(unittest.TestCase):
+    """ChecklistService 컴파일 매처 통합 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_schema = DBSchema(os.path.join(self.temp_dir, 'test.sqlite'))
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("INSERT INTO Equipment_Types (type_name) VALUES ('Dsp')")
+            self.type_id = cursor.lastrowid
+            conn.commit()
+        for i in range(50):
+            self.db_schema.add_checklist_item(f'Item{i}', f'^Param{i}_', severity_level='HIGH',
+                                              validation_rule='{"type": "range", "min": 0, "max": 100}')
+        self.service = ChecklistService(self.db_schema)
+
+    def tearDown(self):
+        self.db_schema.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_validate_parameter(self):
+        result = self.service.validate_parameter_against_checklist(self.type_id, 'param3_gain', '150')
+        self.assertTrue(result['is_checklist'])
+        self.assertEqual(result['item_name'], 'Item3')
+        self.assertFalse(result['validation_passed'])
+        self.assertFalse(self.service.validate_parameter_against_checklist(
+            self.type_id, 'Other', '1')['is_checklist'])
+
+    def test_validate_10k_parameters(self):
+        names = [f'Param{i % 80}_{i}' for i in range(10000)]
+        values = [str(i % 120) for i in range(10000)]
+
+        start = time.perf_counter()
+        matcher = self.service.get_compiled_matcher(self.type_id)
+        results = [matcher.validate(name, value) for name, value in zip(names, values)]
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(sum(r['is_checklist'] for r in results), sum(1 for i in range(10000) if i % 80 < 50))
+        self.assertEqual(sum(not r['validation_passed'] for r in results),
+                         sum(1 for i in range(10000) if i % 80 < 50 and i % 120 > 100))
+        self.assertLess(elapsed, 1.0)
+
+    def test_matcher_reused_until_checklist_changes(self):
+        matcher = self.service.get_compiled_matcher(self.type_id)
+        cached_service = ChecklistService(self.db_schema, CacheService())
+        first = cached_service.get_compiled_matcher(self.type_id)
+        self.assertIs(cached_service.get_compiled_matcher(self.type_id), first)
+
+        cached_service.add_checklist_item('New', '^NewParam$')
+        rebuilt = cached_service.get_compiled_matcher(self.type_id)
+        self.assertIsNot(rebuilt, first)
+        self.assertTrue(rebuilt.validate('NewParam', '1')['is_checklist'])
+        self.assertEqual(len(matcher), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+ChecklistProvider 버전 스냅샷 테스트
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import contextmanager
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.qc.core.checklist_provider import ChecklistProvider, get_checklist_version
+from app.qc.core.inspection_engine import InspectionEngine
+from app.qc.services.spec_service import SpecService
+from app.schema import DBSchema
+
+
+class Phase15Store:
+    """Phase 1.5 테이블 구조의 SQLite DB (get_connection / execute_update 제공)"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.connections = 0
+        with self.get_connection() as conn:
+            conn.executescript("""
+                CREATE TABLE QC_Checklist_Items (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, item_name TEXT NOT NULL UNIQUE, module TEXT, part TEXT,
+                    spec_min TEXT, spec_max TEXT, expected_value TEXT, category TEXT, description TEXT,
+                    is_active BOOLEAN DEFAULT 1);
+                CREATE TABLE Equipment_Checklist_Exceptions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, configuration_id INTEGER NOT NULL,
+                    checklist_item_id INTEGER NOT NULL, reason TEXT, UNIQUE (configuration_id, checklist_item_id));
+                INSERT INTO QC_Checklist_Items (item_name, spec_min, spec_max) VALUES ('Gain', '0', '1');
+                INSERT INTO QC_Checklist_Items (item_name, expected_value) VALUES ('Mode', 'Auto');
+                INSERT INTO QC_Checklist_Items (item_name, is_active) VALUES ('Old', 0);
+            """)
+        self.connections = 0
+
+    @contextmanager
+    def get_connection(self):
+        self.connections += 1
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def execute_update(self, query, params=()):
+        with self.get_connection() as conn:
+            conn.execute(query, params)
+
+
+class TestChecklistSnapshot(unittest.TestCase):
+    """ChecklistProvider 스냅샷 캐시 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = Phase15Store(os.path.join(self.temp_dir, 'qc.sqlite'))
+        self.provider = ChecklistProvider(self.store)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_repeated_reads_hit_snapshot(self):
+        items, exception_count = self.provider.get_inspection_items(1)
+        self.assertEqual([item.item_name for item in items], ['Gain', 'Mode'])
+        self.assertEqual(exception_count, 0)
+        self.assertEqual(self.store.connections, 2)
+
+        for _ in range(10):
+            self.provider.get_active_items()
+            self.provider.get_inspection_items(1)
+            self.assertFalse(self.provider.get_exception_item_set(1))
+        self.assertEqual(self.store.connections, 2)
+
+    def test_spec_service_write_bumps_version(self):
+        self.provider.get_inspection_items(7)
+        version = get_checklist_version()
+
+        gain_id = self.provider.get_active_items()[0].id
+        self.assertTrue(SpecService(self.store).add_exception(7, gain_id, 'not installed'))
+        self.assertGreater(get_checklist_version(), version)
+
+        items, exception_count = self.provider.get_inspection_items(7)
+        self.assertEqual([item.item_name for item in items], ['Mode'])
+        self.assertEqual(exception_count, 1)
+        self.assertEqual(self.provider.get_exception_item_ids(7), [gain_id])
+
+    def test_external_change_needs_invalidate(self):
+        self.provider.get_active_items()
+        with self.store.get_connection() as conn:
+            conn.execute("UPDATE QC_Checklist_Items SET is_active = 0 WHERE item_name = 'Mode'")
+        self.assertEqual(len(self.provider.get_active_items()), 2)
+
+        self.provider.invalidate()
+        self.assertEqual(len(self.provider.get_active_items()), 1)
+
+
+class TestSchemaWritesBumpVersion(unittest.TestCase):
+    """DBSchema Checklist 쓰기 후 장기 실행 검수 엔진이 변경을 반영하는지 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_schema = DBSchema(os.path.join(self.temp_dir, 'local.sqlite'))
+        self.addCleanup(self.db_schema.close)
+        # Phase 1.5 Checklist 컬럼 (tools/migrate_phase1_5.py step5)
+        with self.db_schema.get_connection() as conn:
+            for definition in ('spec_min TEXT', 'spec_max TEXT', 'expected_value TEXT',
+                               'category TEXT', 'is_active BOOLEAN DEFAULT 1'):
+                conn.execute(f'ALTER TABLE QC_Checklist_Items ADD COLUMN {definition}')
+            conn.execute("INSERT INTO QC_Checklist_Items (item_name, parameter_pattern, spec_min, spec_max) "
+                         "VALUES ('Gain', 'Gain', '0', '10')")
+            conn.commit()
+        self.engine = InspectionEngine(ChecklistProvider(self.db_schema))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_reinspection_sees_schema_edits(self):
+        file_data = {'Gain': '5', 'Mode': 'Auto'}
+        self.assertEqual(self.engine.inspect(file_data)['total_count'], 1)
+
+        mode_id = self.db_schema.add_checklist_item('Mode', 'Mode')
+        self.assertIsNotNone(mode_id)
+        self.assertEqual(self.engine.inspect(file_data)['total_count'], 2)
+
+        self.assertTrue(self.db_schema.update_checklist_item(mode_id, description='운전 모드'))
+        self.assertEqual(self.engine.checklist_provider.get_active_items()[1].description, '운전 모드')
+
+        self.assertTrue(self.db_schema.delete_checklist_item(mode_id))
+        self.assertEqual(self.engine.inspect(file_data)['total_count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
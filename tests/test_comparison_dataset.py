@@ -0,0 +1,142 @@
+"""
+비교 데이터셋 테스트
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.comparison_dataset import (DIFF_MISSING_IN_DEFAULT, DIFF_MISSING_IN_FILE, DIFF_VALUE, ComparisonDataset,
+                                    build_comparison_data, categorize_columns)
+
+
+def make_frame():
+    rows = [
+        # Module, Part, ItemName, ItemType, ItemValue, ItemDescription, Model
+        ('Dsp', 'XScanner', 'Gain', 'double', '1.0', 'gain', 'A'),
+        ('Dsp', 'XScanner', 'Gain', 'double', '1.5', 'gain', 'B'),
+        ('Dsp', 'XScanner', 'Offset', 'double', '0', None, 'A'),
+        ('Dsp', 'XScanner', 'Offset', 'double', '0', None, 'B'),
+        ('Stage', 'Z', 'Speed', 'int', '10', 'speed', 'B'),
+        ('Stage', 'Z', 'Speed', 'int', '99', 'speed', 'B'),  # 중복: 첫 번째 값 사용
+        ('Dsp', 'XScanner', 'Gain', 'double', '2.0', 'gain', 'Unknown'),
+    ]
+    return pd.DataFrame(rows, columns=['Module', 'Part', 'ItemName', 'ItemType',
+                                       'ItemValue', 'ItemDescription', 'Model'])
+
+
+def groupby_reference(df, file_names):
+    """기존 뷰의 groupby 기반 값 추출 로직"""
+    result = []
+    for (module, part, item_name), group in df.groupby(["Module", "Part", "ItemName"]):
+        values = []
+        for model in file_names:
+            model_data = group[group["Model"] == model]
+            values.append(str(model_data["ItemValue"].iloc[0]) if not model_data.empty else "-")
+        non_empty = [v for v in values if v != "-"]
+        result.append((module, part, item_name, values, len(set(non_empty)) > 1))
+    return result
+
+
+class TestComparisonDataset(unittest.TestCase):
+    """ComparisonDataset 테스트"""
+
+    def setUp(self):
+        self.df = make_frame()
+        self.file_names = ['A', 'B']
+        self.dataset = ComparisonDataset.from_frame(self.df, self.file_names)
+
+    def test_rows_match_groupby(self):
+        self.assertEqual(list(self.dataset.iter_rows()), groupby_reference(self.df, self.file_names))
+
+    def test_value_matrix_shape_and_dictionary(self):
+        self.assertEqual(self.dataset.value_codes.shape, (3, 2))
+        self.assertEqual(self.dataset.value_codes.dtype, np.int32)
+        # 값 사전은 고유값만 보관
+        self.assertEqual(len(self.dataset.value_categories), len(set(self.dataset.value_categories)))
+
+    def test_find_and_item_meta(self):
+        self.assertEqual(self.dataset.find('Stage', 'Z', 'Speed'), 2)
+        self.assertIsNone(self.dataset.find('Stage', 'Z', 'None'))
+        self.assertEqual(self.dataset.item_meta('Stage', 'Z', 'Speed'), ('int', 'speed'))
+        self.assertEqual(self.dataset.item_meta('Dsp', 'XScanner', 'Offset'), ('double', ''))
+        self.assertEqual(self.dataset.item_meta('X', 'Y', 'Z'), ('double', ''))
+
+    def test_modules_and_parts(self):
+        self.assertEqual(self.dataset.modules, ['Dsp', 'Stage'])
+        self.assertEqual(self.dataset.parts, ['XScanner', 'Z'])
+
+    def test_categorical_frame_gives_same_rows(self):
+        categorized = categorize_columns(make_frame())
+        self.assertIsInstance(categorized['Module'].dtype, pd.CategoricalDtype)
+        dataset = ComparisonDataset.from_frame(categorized, self.file_names)
+        self.assertEqual(list(dataset.iter_rows()), list(self.dataset.iter_rows()))
+
+    def test_diff_flags_and_counts(self):
+        self.assertEqual(self.dataset.has_difference.tolist(), [True, False, False])
+        self.assertEqual(self.dataset.diff_count, 1)
+        self.assertEqual(self.dataset.module_counts, {'Dsp': (2, 1), 'Stage': (1, 0)})
+        self.assertEqual(self.dataset.part_counts, {('Dsp', 'XScanner'): (2, 1), ('Stage', 'Z'): (1, 0)})
+        self.assertEqual([row[2] for row in self.dataset.iter_rows(diff_only=True)], ['Gain'])
+
+    def test_classify_differences(self):
+        # Gain: A/B 값 다름, Offset: 같음, Speed: A에 없음
+        result = self.dataset.classify_differences()
+        self.assertEqual(result.row_index.tolist(), [0, 0, 2])
+        self.assertEqual(result.file_index.tolist(), [0, 1, 0])
+        self.assertEqual(result.diff_flags.tolist(), [DIFF_VALUE, DIFF_VALUE, DIFF_MISSING_IN_FILE])
+        self.assertEqual(result.rows('value').tolist(), np.flatnonzero(self.dataset.has_difference).tolist())
+        self.assertEqual(result.rows('all').tolist(), [0, 2])
+
+        # Default DB에 Offset만 없음 → 값이 있는 셀 모두 표시
+        result = self.dataset.classify_differences([True, False, True])
+        self.assertEqual(result.rows('missing_default').tolist(), [1])
+        self.assertEqual(result.rows('missing_file').tolist(), [2])
+        self.assertEqual(result.rows('missing').tolist(), [1, 2])
+        self.assertEqual(result.rows('all').tolist(), [0, 1, 2])
+        self.assertEqual(int(result.mask('missing_default').sum()), 2)
+        self.assertEqual(result.row_counts(), {'값 차이': 1, '파일에 없음': 1, 'Default DB에 없음': 1})
+
+        # Speed는 파일에 없음 + Default DB에 없음 (값이 있는 B 셀만)
+        result = self.dataset.classify_differences([True, True, False])
+        self.assertEqual(result.row_labels(2), ['파일에 없음', 'Default DB에 없음'])
+        self.assertEqual(result.diff_flags[result.row_index == 2].tolist(),
+                         [DIFF_MISSING_IN_FILE, DIFF_MISSING_IN_DEFAULT])
+
+    def test_dash_value_treated_as_missing(self):
+        df = pd.DataFrame({
+            'Module': ['M'] * 3, 'Part': ['P'] * 3, 'ItemName': ['I'] * 3,
+            'ItemValue': ['-', '1', '1'], 'Model': ['A', 'B', 'C'],
+        })
+        dataset = ComparisonDataset.from_frame(df, ['A', 'B', 'C'])
+        self.assertFalse(dataset.has_difference[0])
+
+    def test_duplicate_file_names(self):
+        # A.txt / A.csv처럼 확장자만 다른 파일은 같은 Model 이름이 됨
+        file_names = ['A', 'B', 'A']
+        dataset = ComparisonDataset.from_frame(self.df, file_names)
+        self.assertEqual(dataset.value_codes.shape, (3, 3))
+        self.assertEqual(list(dataset.iter_rows()), groupby_reference(self.df, file_names))
+
+    def test_build_comparison_data(self):
+        dataset, store = build_comparison_data(make_frame(), self.file_names)
+        self.assertEqual(list(dataset.iter_rows()), list(self.dataset.iter_rows()))
+        self.assertEqual(store.get('B', 'Speed'), '10')
+        self.assertEqual(store.get_keyed('A', 'Dsp', 'XScanner', 'Gain'), '1.0')
+        self.assertEqual(build_comparison_data(None, self.file_names), (None, None))
+
+    def test_empty(self):
+        dataset = ComparisonDataset.from_frame(None, self.file_names)
+        self.assertEqual(len(dataset), 0)
+        self.assertEqual(list(dataset.iter_rows()), [])
+        self.assertEqual(len(dataset.classify_differences([])), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+SQLite 연결 풀 테스트
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.connection_pool import SQLiteConnectionPool
+from app.schema import DBSchema
+
+
+class TestSQLiteConnectionPool(unittest.TestCase):
+    """SQLiteConnectionPool 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'pool.sqlite')
+        self.pool = SQLiteConnectionPool(self.db_path, pool_size=2, health_check_interval=0)
+
+    def tearDown(self):
+        self.pool.close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_connection_is_reused(self):
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+        self.assertIs(self.pool.acquire(), conn)
+        self.assertEqual(self.pool.get_stats()['created'], 1)
+
+    def test_nested_acquire_does_not_block(self):
+        conns = [self.pool.acquire() for _ in range(3)]
+        self.assertEqual(len({id(c) for c in conns}), 3)
+        for conn in conns:
+            self.pool.release(conn)
+        # pool_size 초과분은 닫힘
+        self.assertEqual(self.pool.get_stats()['idle'], 2)
+
+    def test_uncommitted_changes_rolled_back_on_release(self):
+        conn = self.pool.acquire()
+        conn.execute('CREATE TABLE t (x INTEGER)')
+        conn.commit()
+        conn.execute('INSERT INTO t VALUES (1)')
+        self.pool.release(conn)
+
+        conn = self.pool.acquire()
+        self.assertFalse(conn.in_transaction)
+        self.assertEqual(conn.execute('SELECT COUNT(*) FROM t').fetchone()[0], 0)
+        self.pool.release(conn)
+
+    def test_broken_connection_replaced(self):
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+        conn.close()  # 유휴 연결이 외부에서 닫힌 경우
+
+        fresh = self.pool.acquire()
+        self.assertIsNot(fresh, conn)
+        self.assertEqual(fresh.execute('SELECT 1').fetchone()[0], 1)
+
+    def test_close_all(self):
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+        self.pool.close_all()
+        self.assertEqual(self.pool.get_stats()['idle'], 0)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute('SELECT 1')
+
+        # 종료 후에도 일회용 연결로 동작
+        late = self.pool.acquire()
+        self.pool.release(late)
+        self.assertEqual(self.pool.get_stats()['idle'], 0)
+
+
+class TestDBSchemaPooling(unittest.TestCase):
+    """DBSchema 연결 재사용 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_schema = DBSchema(os.path.join(self.temp_dir, 'test.sqlite'))
+
+    def tearDown(self):
+        self.db_schema.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_repeated_calls_reuse_connection(self):
+        for _ in range(20):
+            self.db_schema.get_equipment_types()
+        self.assertEqual(self.db_schema.get_pool_stats()['created'], 1)
+
+    def test_conn_override_still_used(self):
+        conn = sqlite3.connect(self.db_schema.db_path)
+        try:
+            conn.execute("INSERT INTO Equipment_Types (type_name) VALUES ('Dsp')")
+            # 커밋 전 데이터가 보이면 같은 연결을 사용한 것
+            names = [row[1] for row in self.db_schema.get_equipment_types(conn_override=conn)]
+            self.assertEqual(names, ['Dsp'])
+            self.assertEqual(self.db_schema.get_equipment_types(), [])
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Default DB 파라미터 존재 인덱스 테스트
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.schema import DBSchema
+
+
+class TestDefaultParameterIndex(unittest.TestCase):
+    """DBSchema.get_default_parameter_index 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_schema = DBSchema(os.path.join(self.temp_dir, 'test.sqlite'))
+        with self.db_schema.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("INSERT INTO Equipment_Types (type_name) VALUES ('Dsp')")
+            self.type_id = cursor.lastrowid
+            conn.commit()
+        self.db_schema.add_default_value(self.type_id, 'Gain', '1.0')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_index_contents(self):
+        index = self.db_schema.get_default_parameter_index()
+        self.assertIn(('dsp', 'Gain'), index)
+        self.assertNotIn(('dsp', 'Offset'), index)
+
+    def test_index_is_cached_until_write(self):
+        first = self.db_schema.get_default_parameter_index()
+        self.assertIs(self.db_schema.get_default_parameter_index(), first)
+
+        value_id = self.db_schema.add_default_value(self.type_id, 'Offset', '0')
+        self.assertIn(('dsp', 'Offset'), self.db_schema.get_default_parameter_index())
+
+        self.db_schema.delete_default_value(value_id)
+        self.assertNotIn(('dsp', 'Offset'), self.db_schema.get_default_parameter_index())
+
+    def test_external_write_detected(self):
+        self.db_schema.get_default_parameter_index()
+        # 다른 연결에서의 쓰기 (DBSchema 쓰기 메서드 미사용)
+        with self.db_schema.get_connection() as conn:
+            conn.execute("UPDATE Default_DB_Values SET parameter_name = 'Gain2', "
+                         "default_value = '1.00000' WHERE parameter_name = 'Gain'")
+            conn.commit()
+        index = self.db_schema.get_default_parameter_index()
+        self.assertIn(('dsp', 'Gain2'), index)
+
+
+if __name__ == '__main__':
+    unittest.main()
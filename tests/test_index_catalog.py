@@ -0,0 +1,175 @@
+"""
+인덱스 카탈로그 테스트 (EXPLAIN QUERY PLAN으로 전체 테이블 스캔 여부 확인)
+"""
+
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.index_catalog import INDEX_CATALOG, IndexSpec, ensure_indexes
+from app.schema import DBSchema
+
+# Phase 1.5 마이그레이션 이후 테이블 구조 (tools/migrate_phase1_5.py 기준)
+PHASE_1_5_TABLES = [
+    '''CREATE TABLE Equipment_Models (id INTEGER PRIMARY KEY AUTOINCREMENT, model_name TEXT NOT NULL UNIQUE)''',
+    '''CREATE TABLE Equipment_Types (id INTEGER PRIMARY KEY AUTOINCREMENT, model_id INTEGER,
+        type_name TEXT NOT NULL, UNIQUE (model_id, type_name))''',
+    '''CREATE TABLE Equipment_Configurations (id INTEGER PRIMARY KEY AUTOINCREMENT, type_id INTEGER NOT NULL,
+        configuration_name TEXT NOT NULL, UNIQUE (type_id, configuration_name))''',
+    '''CREATE TABLE Default_DB_Values (id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER NOT NULL,
+        configuration_id INTEGER, parameter_name TEXT NOT NULL, default_value TEXT NOT NULL,
+        is_type_common INTEGER DEFAULT 0, notes TEXT, created_at TIMESTAMP, updated_at TIMESTAMP,
+        UNIQUE (equipment_type_id, configuration_id, parameter_name))''',
+    '''CREATE TABLE QC_Checklist_Items (id INTEGER PRIMARY KEY AUTOINCREMENT, item_name TEXT NOT NULL UNIQUE,
+        module TEXT, part TEXT, spec_min TEXT, spec_max TEXT, expected_value TEXT, category TEXT,
+        description TEXT, is_active BOOLEAN DEFAULT 1)''',
+    '''CREATE TABLE Equipment_Checklist_Exceptions (id INTEGER PRIMARY KEY AUTOINCREMENT,
+        configuration_id INTEGER NOT NULL, checklist_item_id INTEGER NOT NULL, reason TEXT,
+        UNIQUE (configuration_id, checklist_item_id))''',
+    '''CREATE TABLE Checklist_Audit_Log (id INTEGER PRIMARY KEY AUTOINCREMENT, action TEXT, target_table TEXT,
+        target_id INTEGER, old_value TEXT, new_value TEXT, reason TEXT, user TEXT, timestamp TIMESTAMP)''',
+]
+
+PHASE_1_5_QUERIES = {
+    'default_values_by_configuration': ('''
+        SELECT d.id, d.configuration_id, d.parameter_name, d.default_value, d.is_type_common, d.notes,
+               d.created_at, d.updated_at, c.configuration_name, t.type_name, m.model_name
+        FROM Default_DB_Values d
+        LEFT JOIN Equipment_Configurations c ON d.configuration_id = c.id
+        LEFT JOIN Equipment_Types t ON c.type_id = t.id
+        LEFT JOIN Equipment_Models m ON t.model_id = m.id
+        WHERE d.configuration_id = ?
+        ORDER BY d.parameter_name''', (1,)),
+    'exception_item_ids': ('''
+        SELECT checklist_item_id FROM Equipment_Checklist_Exceptions WHERE configuration_id = ?''', (1,)),
+    'active_checklist_items': ('''
+        SELECT id, item_name, module, part, spec_min, spec_max, expected_value, category, description, is_active
+        FROM QC_Checklist_Items WHERE is_active = 1 ORDER BY module, part, item_name''', ()),
+}
+
+# 정렬 + LIMIT 조회: 인덱스 순서대로 앞부분만 읽어야 함 (정렬용 임시 B-TREE 금지)
+AUDIT_LOG_QUERY = ('''
+    SELECT id, action, target_table, target_id, old_value, new_value, reason, user, timestamp
+    FROM Checklist_Audit_Log ORDER BY timestamp DESC LIMIT ?''', (100,))
+
+SCHEMA_QUERIES = {
+    'equipment_checklist_items': ('''
+        SELECT c.id, c.item_name, c.parameter_pattern, c.is_common, c.severity_level,
+               c.validation_rule, c.description, NULL, NULL, NULL, 'COMMON' as source
+        FROM QC_Checklist_Items c
+        WHERE c.is_common = 1
+          AND c.id NOT IN (SELECT checklist_item_id FROM Equipment_Checklist_Exceptions WHERE equipment_type_id = ?)
+        UNION
+        SELECT c.id, c.item_name, c.parameter_pattern, c.is_common, c.severity_level,
+               COALESCE(m.custom_validation_rule, c.validation_rule), c.description, m.is_required,
+               m.custom_validation_rule, m.priority, 'SPECIFIC' as source
+        FROM QC_Checklist_Items c
+        JOIN Equipment_Checklist_Mapping m ON c.id = m.checklist_item_id
+        WHERE m.equipment_type_id = ?
+        ORDER BY severity_level, item_name''', (1, 1)),
+    'default_values_by_type': ('''
+        SELECT d.id, d.parameter_name, d.default_value, e.type_name
+        FROM Default_DB_Values d JOIN Equipment_Types e ON d.equipment_type_id = e.id
+        WHERE d.equipment_type_id = ? ORDER BY d.parameter_name''', (1,)),
+}
+
+# "SCAN t" / "SCAN t USING INDEX ..." 모두 전체 스캔 (SEARCH만 허용)
+FULL_SCAN = re.compile(r'^SCAN (?!CONSTANT ROW)')
+TABLE_SCAN = re.compile(r'^SCAN \w+$')
+
+
+def query_plan(conn, sql, params):
+    return [row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params).fetchall()]
+
+
+def full_scans(conn, sql, params):
+    """EXPLAIN QUERY PLAN 결과 중 테이블(또는 인덱스) 전체를 읽는 단계"""
+    return [detail for detail in query_plan(conn, sql, params) if FULL_SCAN.match(detail)]
+
+
+def ordered_limit_problems(conn, sql, params):
+    """정렬 + LIMIT 조회에서 인덱스 없는 스캔 또는 정렬용 임시 B-TREE 단계"""
+    return [detail for detail in query_plan(conn, sql, params)
+            if TABLE_SCAN.match(detail) or detail == 'USE TEMP B-TREE FOR ORDER BY']
+
+
+class TestIndexCatalog(unittest.TestCase):
+    """ensure_indexes 및 핫 쿼리 실행 계획 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_phase_1_5_hot_queries_use_indexes(self):
+        conn = sqlite3.connect(os.path.join(self.temp_dir, 'phase15.sqlite'))
+        self.addCleanup(conn.close)
+        for statement in PHASE_1_5_TABLES:
+            conn.execute(statement)
+        report = ensure_indexes(conn)
+        self.assertIn('idx_default_values_configuration', report['created'])
+        self.assertIn('idx_checklist_exceptions_configuration', report['covered'])
+
+        for name, (sql, params) in PHASE_1_5_QUERIES.items():
+            with self.subTest(query=name):
+                self.assertEqual(full_scans(conn, sql, params), [])
+        self.assertEqual(ordered_limit_problems(conn, *AUDIT_LOG_QUERY), [])
+
+    def test_schema_hot_queries_use_indexes(self):
+        db_schema = DBSchema(os.path.join(self.temp_dir, 'schema.sqlite'))
+        self.addCleanup(db_schema.close)
+        with db_schema.get_connection() as conn:
+            for name, (sql, params) in SCHEMA_QUERIES.items():
+                with self.subTest(query=name):
+                    self.assertEqual(full_scans(conn, sql, params), [])
+            self.assertEqual(ordered_limit_problems(conn, *AUDIT_LOG_QUERY), [])
+
+    def test_changed_definition_is_rebuilt(self):
+        conn = sqlite3.connect(os.path.join(self.temp_dir, 'rebuild.sqlite'))
+        self.addCleanup(conn.close)
+        conn.execute('CREATE TABLE Checklist_Audit_Log (id INTEGER PRIMARY KEY, user TEXT, timestamp TIMESTAMP)')
+        conn.execute('CREATE INDEX idx_checklist_audit_timestamp ON Checklist_Audit_Log(user)')
+
+        report = ensure_indexes(conn)
+        self.assertIn('idx_checklist_audit_timestamp', report['rebuilt'])
+        info = conn.execute('PRAGMA index_info(idx_checklist_audit_timestamp)').fetchall()
+        self.assertEqual([row[2] for row in info], ['timestamp'])
+
+        # 두 번째 실행은 변경 없음
+        report = ensure_indexes(conn)
+        self.assertEqual(report['created'] + report['rebuilt'], [])
+
+    def test_missing_table_or_column_skipped(self):
+        conn = sqlite3.connect(':memory:')
+        self.addCleanup(conn.close)
+        conn.execute('CREATE TABLE Default_DB_Values (id INTEGER PRIMARY KEY, parameter_name TEXT)')
+        report = ensure_indexes(conn, [
+            IndexSpec('idx_a', 'Default_DB_Values', ('configuration_id',)),
+            IndexSpec('idx_b', 'No_Such_Table', ('x',)),
+        ])
+        self.assertEqual(report['skipped'], ['idx_a', 'idx_b'])
+
+    def test_row_factory_connection(self):
+        conn = sqlite3.connect(':memory:')
+        self.addCleanup(conn.close)
+        conn.row_factory = sqlite3.Row
+        conn.execute('CREATE TABLE Checklist_Audit_Log (id INTEGER PRIMARY KEY, user TEXT, timestamp TIMESTAMP)')
+        conn.execute('CREATE INDEX idx_audit_user_time ON Checklist_Audit_Log(user, timestamp)')
+        report = ensure_indexes(conn)
+        self.assertIn('idx_checklist_audit_timestamp', report['created'])
+
+    def test_catalog_names_unique(self):
+        names = [spec.name for spec in INDEX_CATALOG]
+        self.assertEqual(len(names), len(set(names)))
+
+
+if __name__ == '__main__':
+    unittest.main()
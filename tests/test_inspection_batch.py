@@ -0,0 +1,120 @@
+"""
+InspectionEngine 일괄 검수 테스트
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.qc.core.checklist_provider import ChecklistProvider
+from app.qc.core.inspection_engine import InspectionEngine
+from app.qc.core.models import ChecklistItem
+
+
+def make_item(item_id, item_name, module=None, part=None, spec_min=None, spec_max=None, expected_value=None):
+    return ChecklistItem(id=item_id, item_name=item_name, module=module, part=part,
+                         spec_min=spec_min, spec_max=spec_max, expected_value=expected_value,
+                         category='Cat', description=None, is_active=True)
+
+
+class CountingProvider(ChecklistProvider):
+    """DB 대신 고정 항목을 제공하고 조회 횟수를 기록하는 Provider"""
+
+    def __init__(self, items, exception_ids):
+        super().__init__(db_schema=object())
+        self.items = items
+        self.exception_ids = exception_ids
+        self.queries = 0
+
+    def _load_active_items(self):
+        self.queries += 1
+        return list(self.items)
+
+    def _load_exception_item_ids(self, configuration_id):
+        self.queries += 1
+        return list(self.exception_ids)
+
+
+ITEMS = [
+    make_item(1, 'Gain', 'Dsp', 'X', spec_min='0.5', spec_max='2.0'),
+    make_item(2, 'Mode', expected_value='["Auto", "Manual"]'),
+    make_item(3, 'Fan', expected_value='on'),
+    make_item(4, 'Excluded', spec_min='0', spec_max='1'),
+    make_item(5, 'BadSpec', spec_min='abc', spec_max='1'),
+]
+
+
+def unit_data(unit):
+    return {
+        ('Dsp', 'X', 'Gain'): str(1.0 if unit % 10 else 3.0),
+        'Mode': 'Auto',
+        'Fan': 'ON',
+        'Excluded': '5',
+    }
+
+
+class TestInspectBatch(unittest.TestCase):
+    """inspect_batch 테스트"""
+
+    def setUp(self):
+        self.provider = CountingProvider(ITEMS, [4])
+        self.engine = InspectionEngine(self.provider)
+
+    def test_batch_matches_single_inspection(self):
+        files = {f'unit{i}': unit_data(i) for i in range(20)}
+        batch = self.engine.inspect_batch(files, configuration_id=1, max_workers=4)
+
+        self.assertEqual(list(batch['files']), list(files))
+        for name, data in files.items():
+            self.assertEqual(batch['files'][name], self.engine.inspect(data, configuration_id=1))
+
+        summary = batch['summary']
+        self.assertEqual(summary['file_count'], 20)
+        self.assertEqual(summary['failed_files'], 2)
+        self.assertEqual(summary['exception_count'], 1)
+        self.assertEqual(summary['item_failures'], {'Dsp.X.Gain': 2})
+        self.assertFalse(summary['is_pass'])
+
+    def test_checklist_loaded_once(self):
+        self.engine.inspect(unit_data(1), configuration_id=1)
+        self.assertEqual(self.provider.queries, 2)
+
+        # 버전이 바뀌지 않으면 이후 검수는 DB 조회 없음
+        self.engine.inspect_batch({f'unit{i}': unit_data(i) for i in range(200)}, configuration_id=1)
+        self.engine.inspect(unit_data(2), configuration_id=1)
+        self.assertEqual(self.provider.queries, 2)
+
+    def test_file_paths_loaded_in_workers(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        good = os.path.join(temp_dir, 'good.csv')
+        with open(good, 'w') as f:
+            f.write('ItemName,Value\nMode,Manual\nFan,off\n')
+        missing = os.path.join(temp_dir, 'missing.csv')
+
+        batch = self.engine.inspect_batch([good, missing], configuration_id=1)
+        self.assertEqual(batch['files'][good]['failed_count'], 1)
+        self.assertIn(missing, batch['errors'])
+        self.assertEqual(batch['summary']['error_count'], 1)
+
+    def test_200_units_is_fast(self):
+        files = {f'unit{i}': dict(unit_data(i), **{f'P{j}': str(j) for j in range(2000)}) for i in range(200)}
+        items = ITEMS + [make_item(100 + j, f'P{j}', spec_min='0', spec_max='1000') for j in range(500)]
+        engine = InspectionEngine(CountingProvider(items, [4]))
+
+        start = time.perf_counter()
+        batch = engine.inspect_batch(files, configuration_id=1)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(batch['summary']['inspected_count'], 200)
+        self.assertLess(elapsed, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
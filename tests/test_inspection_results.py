@@ -0,0 +1,69 @@
+"""
+검수 결과 컬럼형 컨테이너 테스트
+"""
+
+import os
+import sys
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.qc.core.models import ChecklistItem, InspectionResult, InspectionResults
+from app.qc.services.qc_service import QCService
+from app.qc.utils.data_processor import DataProcessor
+
+
+def make_item(item_id, item_name, module=None, category=None):
+    return ChecklistItem(id=item_id, item_name=item_name, module=module, part=None,
+                         spec_min='0', spec_max='1', expected_value=None,
+                         category=category, description=None, is_active=True)
+
+
+def make_results():
+    items = [make_item(1, 'Gain', 'Dsp', 'Scan'), make_item(2, 'Offset', None, 'Scan'), make_item(3, 'Fan')]
+    return InspectionResults(items, ['0.5', '3', 'x'], [True, False, False], ['0 ~ 1'] * 3, [0.0, 2.0, None])
+
+
+class TestInspectionResults(unittest.TestCase):
+    """InspectionResults 테스트"""
+
+    def test_views_match_inspection_result_dicts(self):
+        results = make_results()
+        expected = InspectionResult(item_name='Offset', module=None, part=None, display_name='Offset',
+                                    file_value='3', is_valid=False, spec='0 ~ 1', category='Scan',
+                                    description='', deviation=2.0).to_dict()
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[1], expected)
+        self.assertEqual(results[1].get('display_name'), 'Offset')
+        self.assertEqual(results[0]['display_name'], 'Dsp.Gain')
+        self.assertEqual(results[-1]['category'], 'Uncategorized')
+        self.assertEqual(list(results[1]), list(expected))
+        self.assertIsNone(results[0].get('unknown'))
+        with self.assertRaises(IndexError):
+            results[3]
+
+    def test_precomputed_failed_and_categories(self):
+        results = make_results()
+        self.assertEqual(results.failed_indices, (1, 2))
+        self.assertEqual([r['item_name'] for r in DataProcessor.filter_failed_only(results)], ['Offset', 'Fan'])
+        self.assertEqual(DataProcessor.count_by_category(results), {
+            'Scan': {'passed': 1, 'failed': 1, 'total': 2},
+            'Uncategorized': {'passed': 0, 'failed': 1, 'total': 1},
+        })
+
+        # 기존 딕셔너리 목록과 같은 통계
+        dicts = results.to_dicts()
+        self.assertEqual(DataProcessor.count_by_category(dicts), DataProcessor.count_by_category(results))
+        self.assertEqual(DataProcessor.filter_failed_only(dicts), DataProcessor.filter_failed_only(results))
+
+    def test_statistics(self):
+        results = make_results()
+        stats = QCService.get_statistics(None, {'total_count': 3, 'passed_count': 1, 'failed_count': 2,
+                                                'results': results})
+        stats['by_category']['Scan']['total'] = 99
+        self.assertEqual(results.category_stats['Scan']['total'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+항목 값 저장소 테스트
+"""
+
+import os
+import random
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.comparison_dataset import categorize_columns
+from app.item_value_store import ItemValueStore
+from app.qc_incremental import IncrementalQCInspector
+
+
+def mask_lookup(df, file_name, item_name):
+    """기존 run_custom_qc_inspection의 DataFrame 마스크 조회"""
+    matching_rows = df[(df['ItemName'] == item_name) & (df['Model'] == file_name)]
+    if matching_rows.empty:
+        return None
+    return matching_rows.iloc[0]['ItemValue']
+
+
+def make_frame(files, items, rng):
+    rows = []
+    for model in files:
+        for i in range(items):
+            if rng.random() < 0.05:
+                continue
+            rows.append({'Model': model, 'Module': f'M{i % 3}', 'Part': f'P{i % 7}',
+                         'ItemName': f'Item{i % (items // 2)}', 'ItemValue': f'{rng.uniform(0, 10):.3f}'})
+    return pd.DataFrame(rows)
+
+
+class TestItemValueStore(unittest.TestCase):
+    """ItemValueStore 테스트"""
+
+    def test_matches_mask_lookup(self):
+        df = make_frame(['A', 'B', 'C'], 60, random.Random(1))
+        df.loc[len(df)] = {'Model': 'A', 'Module': 'M', 'Part': 'P', 'ItemName': np.nan, 'ItemValue': '1'}
+        categorize_columns(df)
+        store = ItemValueStore.from_frame(df)
+        for model in ['A', 'B', 'C', 'Z']:
+            for i in range(35):
+                self.assertEqual(store.get(model, f'Item{i}'), mask_lookup(df, model, f'Item{i}'))
+
+        first = df[(df['Model'] == 'B') & (df['ItemName'] == 'Item1')].iloc[0]
+        self.assertEqual(store.get_keyed('B', first['Module'], first['Part'], 'Item1'), first['ItemValue'])
+        self.assertIsNone(store.get_keyed('B', 'X', 'Y', 'Item1'))
+
+    def test_file_tokens_follow_file_content(self):
+        df = make_frame(['A', 'B'], 20, random.Random(2))
+        tokens = ItemValueStore.from_frame(df).file_tokens
+        changed = df.copy()
+        changed.loc[changed['Model'] == 'B', 'ItemValue'] = '0'
+        changed_tokens = ItemValueStore.from_frame(changed).file_tokens
+        self.assertEqual(tokens['A'], changed_tokens['A'])
+        self.assertNotEqual(tokens['B'], changed_tokens['B'])
+        self.assertEqual(len(ItemValueStore.from_frame(None)), 0)
+
+    def test_large_custom_qc_inspection(self):
+        files = [f'File{i}' for i in range(50)]
+        df = make_frame(files, 4000, random.Random(3))
+        categorize_columns(df)
+        specs = [{'item_name': f'Item{i}', 'min_spec': 1.0, 'max_spec': 9.0, 'enabled': True}
+                 for i in range(0, 2000, 4)]
+
+        # 처리 시간 비교는 tools/benchmark_item_value_store.py 참고
+        store = ItemValueStore.from_frame(df)
+        inspector = IncrementalQCInspector('Dsp')
+        inspector.update(specs, files, store.get, store.file_tokens)
+
+        self.assertGreater(len(inspector.rows), 20000)
+        for model, item_name in [('File0', 'Item0'), ('File17', 'Item400'), ('File49', 'Item1996')]:
+            self.assertEqual(store.get(model, item_name), mask_lookup(df, model, item_name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+백그라운드 작업 스케줄러 테스트
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.job_scheduler import JobScheduler, JOB_CANCELLED, JOB_DONE, JOB_FAILED
+
+
+class FakeRoot:
+    """after() 호출만 기록하는 Tk 대용"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+
+    def run_pending(self):
+        pending, self.scheduled = self.scheduled, []
+        for func in pending:
+            func()
+
+
+class TestJobScheduler(unittest.TestCase):
+    """JobScheduler 테스트"""
+
+    def setUp(self):
+        self.statuses = []
+        self.scheduler = JobScheduler(None, max_workers=2, status_callback=self.statuses.append)
+
+    def tearDown(self):
+        self.scheduler.shutdown()
+
+    def test_result_delivered_on_polling_thread(self):
+        delivered = []
+
+        def work(job, a, b):
+            job.report(50, "half")
+            return a + b
+
+        job = self.scheduler.submit(work, 2, 3, name="add",
+                                    on_done=lambda r: delivered.append((r, threading.current_thread())))
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual(delivered, [(5, threading.current_thread())])
+        self.assertEqual(job.status, JOB_DONE)
+        self.assertEqual(self.statuses, ["⏳ 작업 1개 진행 중: add", None])
+
+    def test_progress_error_and_cancel(self):
+        progress, errors, cancelled = [], [], []
+        started = threading.Event()
+
+        def long_job(job):
+            started.set()
+            while True:
+                job.report(10, "working")
+                job.check_cancelled()
+
+        job = self.scheduler.submit(long_job, on_progress=lambda v, m: progress.append((v, m)),
+                                    on_cancel=lambda: cancelled.append(True))
+        failing = self.scheduler.submit(lambda job: 1 / 0, on_error=errors.append)
+        started.wait(5)
+        self.scheduler.poll()
+        job.cancel()
+        self.assertTrue(self.scheduler.wait(5))
+
+        self.assertIn((10, "working"), progress)
+        self.assertEqual(cancelled, [True])
+        self.assertEqual(job.status, JOB_CANCELLED)
+        self.assertEqual(failing.status, JOB_FAILED)
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+    def test_jobs_run_concurrently_and_cancel_before_start(self):
+        barrier = threading.Barrier(2, timeout=5)
+        ran = []
+        first = self.scheduler.submit(lambda job: barrier.wait())
+        second = self.scheduler.submit(lambda job: barrier.wait())
+        queued = self.scheduler.submit(lambda job: ran.append(True))
+        queued.cancel()
+        self.assertEqual(len(self.scheduler.active_jobs), 3)
+        self.assertTrue(self.scheduler.wait(5))
+        self.assertEqual((first.status, second.status), (JOB_DONE, JOB_DONE))
+        self.assertEqual((queued.status, ran), (JOB_CANCELLED, []))
+
+        callbacks = []
+        queued.add_cancel_callback(lambda: callbacks.append(True))
+        self.assertEqual(callbacks, [True])
+
+    def test_after_polling(self):
+        root = FakeRoot()
+        scheduler = JobScheduler(root)
+        done = threading.Event()
+        results = []
+        scheduler.submit(lambda job: done.wait(5) and 'ok', on_done=results.append)
+        scheduler.submit(lambda job: 'second', on_done=results.append)
+        self.assertEqual(len(root.scheduled), 1)
+
+        done.set()
+        for _ in range(500):
+            if not root.scheduled:
+                break
+            root.run_pending()
+            threading.Event().wait(0.01)
+        self.assertEqual(sorted(results), ['ok', 'second'])
+        self.assertEqual(root.scheduled, [])
+        scheduler.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+병렬 파일 로더 테스트
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.parallel_loader import ParallelFileLoader, parse_db_file
+from app.parse_cache import ParseCache
+
+
+class TestParallelFileLoader(unittest.TestCase):
+    """ParallelFileLoader 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # 저장소의 data/parse_cache 대신 임시 캐시 사용
+        self.cache = ParseCache(os.path.join(self.temp_dir.name, 'cache'))
+        self.files = []
+        for i in range(4):
+            path = os.path.join(self.temp_dir.name, f"eq{i}.txt")
+            pd.DataFrame({
+                'Module': ['Dsp', 'Dsp'],
+                'Part': ['XScanner', 'YScanner'],
+                'ItemName': ['Gain', 'Offset'],
+                'ItemType': ['double', 'double'],
+                'ItemValue': [str(i), '0.5'],
+                'ItemDescription': ['', ''],
+                'Extra': ['x', 'y'],
+            }).to_csv(path, sep='\t', index=False)
+            self.files.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parse_txt_keeps_required_columns(self):
+        df = parse_db_file(self.files[0], False)
+        self.assertNotIn('Extra', df.columns)
+        self.assertEqual(list(df['Model'].unique()), ['eq0'])
+
+    def test_parse_csv_and_db(self):
+        csv_path = os.path.join(self.temp_dir.name, "c.csv")
+        pd.DataFrame({'Module': ['A'], 'ItemName': ['X'], 'ItemValue': ['1']}).to_csv(csv_path, index=False)
+        db_path = os.path.join(self.temp_dir.name, "d.db")
+        conn = sqlite3.connect(db_path)
+        pd.DataFrame({'Module': ['A'], 'ItemName': ['X'], 'ItemValue': ['1']}).to_sql('main_table', conn, index=False)
+        conn.close()
+
+        for path, model in ((csv_path, 'c'), (db_path, 'd')):
+            df = parse_db_file(path, False)
+            self.assertEqual(df['ItemType'].iloc[0], 'double')
+            self.assertEqual(df['Model'].iloc[0], model)
+
+    def test_load_preserves_selection_order(self):
+        for use_processes in (False, True):
+            events = []
+            loader = ParallelFileLoader(self.files, max_workers=2, use_processes=use_processes,
+                                        parse_cache=self.cache)
+            result = loader.load(progress_callback=events.append)
+
+            self.assertFalse(result.cancelled)
+            self.assertEqual(result.file_names, ['eq0', 'eq1', 'eq2', 'eq3'])
+            self.assertEqual(list(result.merged_df['Model'].unique()), result.file_names)
+            self.assertEqual(len(result.merged_df), 8)
+            self.assertEqual(sorted(e.completed for e in events), [1, 2, 3, 4])
+
+    def test_bad_file_reported_as_error(self):
+        bad = os.path.join(self.temp_dir.name, "bad.xyz")
+        open(bad, 'w').close()
+        loader = ParallelFileLoader(self.files[:1] + [bad], use_processes=False, parse_cache=self.cache)
+        result = loader.load()
+
+        self.assertEqual(result.file_names, ['eq0'])
+        self.assertEqual([name for name, _ in result.errors], ['bad.xyz'])
+
+    def test_cancel_before_start(self):
+        loader = ParallelFileLoader(self.files, use_processes=False, parse_cache=self.cache)
+        loader.cancel()
+        result = loader.load()
+
+        self.assertTrue(result.cancelled)
+        self.assertIsNone(result.merged_df)
+
+    def test_background_start_and_poll(self):
+        loader = ParallelFileLoader(self.files, use_processes=False, parse_cache=self.cache)
+        loader.start()
+        loader._thread.join(timeout=30)
+
+        kinds = [e.kind for e in loader.poll_events()]
+        self.assertTrue(loader.done)
+        self.assertEqual(kinds[-1], 'done')
+        self.assertEqual(kinds.count('progress'), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
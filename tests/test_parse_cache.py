@@ -0,0 +1,164 @@
+"""
+파싱 결과 디스크 캐시 테스트 (적중/무효화, LRU 크기 제한, 파서 연동)
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import pandas as pd
+
+from app.parallel_loader import DB_FILE_CACHE_NAMESPACE, parse_db_file
+from app.parse_cache import ParseCache
+from app.text_file_handler import TextFileHandler
+from app.services.shipped_equipment.shipped_equipment_service import ShippedEquipmentService
+
+DB_TEXT = (
+    "Module\tPart\tItemName\tItemType\tItemValue\tItemDescription\n"
+    "Dsp\tXY\tGain\tdouble\t1.5\t설명\n"
+    "Dsp\tXY\tOffset\tint\t3\t\n"
+    "Head\tZ\tMode\tstring\tauto\tline\x1fwith separator\n"
+)
+
+
+class TestParseCache(unittest.TestCase):
+    """ParseCache 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = ParseCache(os.path.join(self.temp_dir, 'cache'))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_records_round_trip(self):
+        path = self.write('a.txt', 'x')
+        records = [{'name': 'a\nb', 'value': None, 'line': 1},
+                   {'name': '', 'value': '한글', 'line': 2}]
+        self.assertIsNone(self.cache.get_records(path, 'test'))
+        self.assertTrue(self.cache.put_records(path, 'test', records, ['name', 'value', 'line']))
+        self.assertEqual(self.cache.get_records(path, 'test'), records)
+        self.assertIsNone(self.cache.get_records(path, 'other'))
+
+        # 저장할 수 없는 값은 건너뜀
+        self.assertFalse(self.cache.put_records(path, 'test', [{'name': 1.5}], ['name']))
+
+    def test_changed_file_misses(self):
+        path = self.write('a.txt', 'x')
+        self.cache.put_records(path, 'test', [{'v': 'old'}], ['v'])
+
+        # 크기 변경
+        self.write('a.txt', 'xy')
+        self.assertIsNone(self.cache.get_records(path, 'test'))
+
+        # 같은 크기, 수정 시각 변경
+        self.cache.put_records(path, 'test', [{'v': 'new'}], ['v'])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(self.cache.get_records(path, 'test'))
+
+    def test_signature_mismatch_is_not_stored(self):
+        path = self.write('a.txt', 'x')
+        self.assertFalse(self.cache.put_records(path, 'test', [{'v': 'a'}], ['v'], signature=(0, 1)))
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_lru_eviction_by_total_size(self):
+        paths = [self.write(f'{name}.txt', name) for name in 'abc']
+        records = [{'v': 'x' * 2000}]
+        self.cache.put_records(paths[0], 'test', records, ['v'])
+        entry_size = self.cache.total_bytes()
+        self.cache.max_bytes = entry_size * 2 + entry_size // 2
+        self.cache.put_records(paths[1], 'test', records, ['v'])
+
+        # a를 최근 사용으로 갱신한 뒤 c 저장 → b 삭제
+        old = time.time() - 100
+        for entry_path, _, _ in self.cache.entries():
+            os.utime(entry_path, (old, old))
+        self.assertIsNotNone(self.cache.get_records(paths[0], 'test'))
+        self.cache.put_records(paths[2], 'test', records, ['v'])
+
+        self.assertEqual(len(self.cache.entries()), 2)
+        self.assertLessEqual(self.cache.total_bytes(), self.cache.max_bytes)
+        self.assertIsNotNone(self.cache.get_records(paths[0], 'test'))
+        self.assertIsNone(self.cache.get_records(paths[1], 'test'))
+        self.assertIsNotNone(self.cache.get_records(paths[2], 'test'))
+
+        # 상한보다 큰 항목은 저장하지 않음
+        self.cache.max_bytes = 10
+        self.assertFalse(self.cache.put_records(paths[1], 'test', records, ['v']))
+
+    def test_corrupt_entry_is_discarded(self):
+        path = self.write('a.txt', 'x')
+        self.cache.put_records(path, 'test', [{'v': 'a'}], ['v'])
+        entry_path = self.cache.entry_path(path, 'test')
+        with open(entry_path, 'wb') as f:
+            f.write(b'broken')
+        self.assertIsNone(self.cache.get_records(path, 'test'))
+        self.assertFalse(os.path.exists(entry_path))
+
+    def test_parse_db_file_uses_cache(self):
+        path = self.write('MODEL_A.txt', DB_TEXT)
+        parsed = parse_db_file(path, self.cache)
+        self.assertEqual(len(self.cache.entries()), 1)
+
+        cached = parse_db_file(path, self.cache)
+        pd.testing.assert_frame_equal(cached, parsed)
+        pd.testing.assert_frame_equal(self.cache.get_frame(path, DB_FILE_CACHE_NAMESPACE),
+                                      parsed.drop(columns=['Model']))
+        pd.testing.assert_frame_equal(parse_db_file(path, False), parsed)
+
+    def test_parse_db_file_sqlite_frame(self):
+        path = os.path.join(self.temp_dir, 'MODEL_B.db')
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE main_table (ItemName TEXT, ItemValue REAL, Count INTEGER, Note TEXT)")
+        conn.executemany("INSERT INTO main_table VALUES (?, ?, ?, ?)",
+                         [('a', 1.5, 1, None), ('b', None, 2, 'memo')])
+        conn.commit()
+        conn.close()
+
+        parsed = parse_db_file(path, self.cache)
+        pd.testing.assert_frame_equal(parse_db_file(path, self.cache), parsed)
+
+    def test_text_file_handler_uses_cache(self):
+        path = self.write('QC.txt', (
+            "Module\tPart\tItemName\tItemType\tItemValue\tItemDescription\tMinSpec\tMaxSpec\n"
+            "Dsp\tXY\tGain\tdouble\t1.5\tdesc\t1\t2\n"
+            "Dsp\tXY\tOffset\tint\t3\tdesc\t\t\n"
+        ))
+        handler = TextFileHandler(None, parse_cache=self.cache)
+        success, parsed, message = handler.parse_text_file(path)
+        self.assertTrue(success)
+        self.assertEqual(len(self.cache.entries()), 1)
+
+        cached = handler.parse_text_file(path)
+        self.assertEqual(cached, (True, parsed, message))
+        self.assertIsNone(cached[1][1]['min_spec'])
+        self.assertEqual(cached[1][1]['line_number'], 3)
+
+    def test_shipped_equipment_parse_uses_cache(self):
+        path = self.write('U27005-100225_Samsung_NX-Mask.txt', DB_TEXT)
+        service = ShippedEquipmentService(None, parse_cache=self.cache)
+        parsed = service.parse_equipment_file(path)
+        self.assertTrue(parsed.success)
+        self.assertEqual(len(self.cache.entries()), 1)
+
+        cached = service.parse_equipment_file(path)
+        self.assertEqual(cached.parameters, parsed.parameters)
+        self.assertEqual((cached.serial_number, cached.model_name), ('U27005-100225', 'NX-Mask'))
+
+
+if __name__ == '__main__':
+    unittest.main()
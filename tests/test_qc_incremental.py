@@ -0,0 +1,108 @@
+"""
+Custom QC 증분 검수 테스트
+"""
+
+import os
+import sys
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.qc_incremental import IncrementalQCInspector, evaluate_cell
+
+
+def make_spec(name, min_spec=None, max_spec=None, item_value=None, enabled=True):
+    return {'item_name': name, 'min_spec': min_spec, 'max_spec': max_spec,
+            'item_value': item_value, 'unit': 'mm', 'enabled': enabled}
+
+
+def full_inspection(specs, file_names, values):
+    """기존 run_custom_qc_inspection과 같은 전체 검수 (행 값 목록)"""
+    rows = []
+    for spec in specs:
+        if not spec.get('enabled', True):
+            continue
+        for file_name in file_names:
+            measured = values.get((file_name, spec['item_name']))
+            if measured is not None:
+                rows.append(evaluate_cell(spec, measured, file_name, 'Dsp').row_values)
+    return rows
+
+
+class TestIncrementalQCInspector(unittest.TestCase):
+    """IncrementalQCInspector 테스트"""
+
+    def setUp(self):
+        self.files = ['A', 'B']
+        self.values = {('A', 'Gain'): '1.5', ('B', 'Gain'): '3.0', ('A', 'Mode'): 'auto',
+                       ('B', 'Mode'): 'Manual', ('A', 'Head'): 'x', ('B', 'Head'): 'abc'}
+        self.specs = [make_spec('Gain', 1.0, 2.0), make_spec('Mode', item_value='AUTO'),
+                      make_spec('Head', 0.0, 1.0), make_spec('Off', enabled=False)]
+        self.inspector = IncrementalQCInspector('Dsp')
+
+    def lookup(self, file_name, item_name):
+        return self.values.get((file_name, item_name))
+
+    def rows(self):
+        return [self.inspector.cells[key].row_values for key in self.inspector.rows]
+
+    def test_first_run_matches_full_inspection(self):
+        delta = self.inspector.update(self.specs, self.files, self.lookup)
+        self.assertEqual(self.rows(), full_inspection(self.specs, self.files, self.values))
+        self.assertEqual(delta.evaluated, 6)
+        self.assertEqual(len(delta.added), 6)
+        self.assertEqual(self.inspector.counts(), (2, 2))
+        self.assertEqual(len(self.inspector.records()), 4)
+        # error 행은 다음 결과와 같은 번호
+        self.assertEqual(list(self.inspector.row_numbers().values()), [1, 2, 3, 4, 5, 5])
+
+    def test_spec_change_reevaluates_only_its_cells(self):
+        self.inspector.update(self.specs, self.files, self.lookup)
+        self.specs[0] = make_spec('Gain', 1.0, 5.0)
+        delta = self.inspector.update(self.specs, self.files, self.lookup)
+        self.assertEqual(delta.evaluated, 2)
+        # 표시되는 MaxSpec 값이 바뀌므로 두 행 모두 갱신
+        self.assertEqual(delta.updated, [(('Gain', 0), 'A'), (('Gain', 0), 'B')])
+        self.assertEqual((delta.added, delta.removed), ([], []))
+        self.assertEqual(self.inspector.counts(), (3, 1))
+        self.assertEqual(self.rows(), full_inspection(self.specs, self.files, self.values))
+
+        # 변경 없음 → 재평가 없음
+        self.assertEqual(self.inspector.update(self.specs, self.files, self.lookup).evaluated, 0)
+
+    def test_remove_disable_and_reorder(self):
+        self.inspector.update(self.specs, self.files, self.lookup)
+        # 스펙 수정 시 목록 끝으로 이동하는 경우와 비활성화
+        specs = [self.specs[1], make_spec('Head', 0.0, 1.0, enabled=False), self.specs[0]]
+        delta = self.inspector.update(specs, self.files, self.lookup)
+        self.assertEqual(delta.evaluated, 0)
+        self.assertEqual(delta.removed, [(('Head', 0), 'A'), (('Head', 0), 'B')])
+        self.assertEqual(delta.rows[0], (('Mode', 0), 'A'))
+        self.assertEqual(self.rows(), full_inspection(specs, self.files, self.values))
+
+    def test_file_token_change(self):
+        self.inspector.update(self.specs, self.files, self.lookup, {'A': 1, 'B': 1})
+        self.values[('B', 'Gain')] = '1.2'
+        del self.values[('B', 'Mode')]
+        delta = self.inspector.update(self.specs, self.files, self.lookup, {'A': 1, 'B': 2})
+        self.assertEqual(delta.evaluated, 3)
+        self.assertEqual(delta.updated, [(('Gain', 0), 'B')])
+        self.assertEqual(delta.removed, [(('Mode', 0), 'B')])
+        self.assertEqual(self.rows(), full_inspection(self.specs, self.files, self.values))
+
+        # 파일 추가 → 새 파일 셀만 평가
+        self.values[('C', 'Gain')] = '1.1'
+        delta = self.inspector.update(self.specs, self.files + ['C'], self.lookup, {'A': 1, 'B': 2, 'C': 1})
+        self.assertEqual(delta.evaluated, 3)
+        self.assertEqual(delta.added, [(('Gain', 0), 'C')])
+
+    def test_duplicate_item_names_are_separate_cells(self):
+        specs = [make_spec('Gain', 1.0, 2.0), make_spec('Gain', 0.0, 10.0)]
+        self.inspector.update(specs, self.files, self.lookup)
+        self.assertEqual(len(self.inspector.rows), 4)
+        self.assertEqual(self.inspector.counts(), (3, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
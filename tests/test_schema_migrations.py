@@ -0,0 +1,168 @@
+"""
+스키마 마이그레이션 테스트 (schema_version, 미적용 단계만 실행)
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.schema import DBSchema, SCHEMA_MIGRATIONS
+from app.schema_migrations import (Migration, MigrationError, MigrationRunner, get_history, get_version,
+                                   record_version, table_columns, unique_constraints)
+
+
+class TestSchemaMigrations(unittest.TestCase):
+    """DBSchema 마이그레이션 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def open_schema(self):
+        schema = DBSchema(self.db_path)
+        self.addCleanup(schema.close)
+        return schema
+
+    def test_fresh_database_applies_all_steps_once(self):
+        schema = self.open_schema()
+        self.assertEqual([m.version for m in schema.applied_migrations], [1, 2, 3, 4])
+        self.assertEqual(self.open_schema().applied_migrations, [])
+
+        with schema.get_connection() as conn:
+            self.assertEqual(get_version(conn, 'app.schema'), SCHEMA_MIGRATIONS.target_version)
+            self.assertEqual(len(get_history(conn)), SCHEMA_MIGRATIONS.target_version)
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn('idx_checklist_audit_timestamp', indexes)
+
+    def test_up_to_date_database_costs_single_read(self):
+        self.open_schema()
+        conn = sqlite3.connect(self.db_path)
+        self.addCleanup(conn.close)
+        statements = []
+        conn.set_trace_callback(statements.append)
+        self.assertEqual(SCHEMA_MIGRATIONS.run(conn), [])
+        self.assertEqual(len(statements), 1)
+        self.assertIn('schema_version', statements[0])
+
+    def test_legacy_columns_are_migrated(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''CREATE TABLE Default_DB_Values (
+            id INTEGER PRIMARY KEY, equipment_type_id INTEGER, parameter_name TEXT, default_value TEXT,
+            module_name TEXT, part_name TEXT, is_performance INTEGER)''')
+        conn.execute("INSERT INTO Default_DB_Values VALUES (1, 1, 'Gain', '1.0', 'Dsp', 'Xy', 1)")
+        conn.execute("CREATE TABLE QC_Checklist_Items (id INTEGER PRIMARY KEY, item_name TEXT, parameter_pattern TEXT)")
+        conn.commit()
+        conn.close()
+
+        schema = self.open_schema()
+        with schema.get_connection() as conn:
+            self.assertLessEqual({'module', 'part', 'item_type', 'is_checklist'},
+                                 table_columns(conn, 'Default_DB_Values'))
+            self.assertLessEqual({'module', 'part', 'item_type'}, table_columns(conn, 'QC_Checklist_Items'))
+            row = conn.execute("SELECT module, part, is_checklist FROM Default_DB_Values").fetchone()
+        self.assertEqual(tuple(row), ('Dsp', 'Xy', 1))
+
+    def create_legacy_checklist(self, conn):
+        """db_schema.py 형식 (item_name UNIQUE) 테이블 + 매핑"""
+        conn.execute('''CREATE TABLE QC_Checklist_Items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, item_name TEXT NOT NULL UNIQUE, parameter_pattern TEXT NOT NULL,
+            is_common INTEGER DEFAULT 1, severity_level TEXT DEFAULT 'MEDIUM', validation_rule TEXT,
+            description TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)''')
+        conn.execute("INSERT INTO QC_Checklist_Items (id, item_name, parameter_pattern) VALUES (7, 'Gain', 'Gain')")
+        conn.execute("INSERT INTO QC_Checklist_Items (id, item_name, parameter_pattern) VALUES (8, 'Unknown', 'Unknown')")
+        conn.execute('''CREATE TABLE Equipment_Checklist_Mapping (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, equipment_type_id INTEGER NOT NULL,
+            checklist_item_id INTEGER NOT NULL,
+            FOREIGN KEY (checklist_item_id) REFERENCES QC_Checklist_Items(id) ON DELETE CASCADE)''')
+        conn.execute("INSERT INTO Equipment_Checklist_Mapping VALUES (1, 1, 7)")
+
+    def assert_checklist_rebuilt(self, schema):
+        with schema.get_connection() as conn:
+            self.assertEqual(unique_constraints(conn, 'QC_Checklist_Items'), {('module', 'part', 'item_name')})
+            rows = conn.execute("SELECT id, item_name, module, part, item_type FROM QC_Checklist_Items "
+                                "ORDER BY id").fetchall()
+            self.assertEqual([tuple(row) for row in rows],
+                             [(7, 'Gain', 'Dsp', 'Xy', 'double'), (8, 'Unknown', None, None, None)])
+            self.assertEqual(conn.execute("SELECT checklist_item_id FROM Equipment_Checklist_Mapping").fetchall()[0][0], 7)
+
+            # 같은 항목 이름을 다른 Module/Part로 추가 가능, 같은 Module/Part는 중복 불가
+            conn.execute("INSERT INTO QC_Checklist_Items (item_name, parameter_pattern, module, part) "
+                         "VALUES ('Gain', 'Gain', 'Other', 'Xy')")
+            with self.assertRaises(sqlite3.IntegrityError):
+                conn.execute("INSERT INTO QC_Checklist_Items (item_name, parameter_pattern, module, part) "
+                             "VALUES ('Gain', 'Gain', 'Other', 'Xy')")
+            self.assertGreater(conn.execute("SELECT MAX(id) FROM QC_Checklist_Items").fetchone()[0], 8)
+
+    def test_legacy_checklist_unique_is_rebuilt(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''CREATE TABLE Default_DB_Values (
+            id INTEGER PRIMARY KEY, equipment_type_id INTEGER, parameter_name TEXT, default_value TEXT,
+            module_name TEXT, part_name TEXT, item_type TEXT)''')
+        conn.execute("INSERT INTO Default_DB_Values VALUES (1, 1, 'Gain', '1.0', 'Dsp', 'Xy', 'double')")
+        conn.execute("INSERT INTO Default_DB_Values VALUES (2, 2, 'Gain', '1.0', 'Head', 'Z', 'double')")
+        self.create_legacy_checklist(conn)
+        conn.commit()
+        conn.close()
+
+        self.assert_checklist_rebuilt(self.open_schema())
+
+    def test_checklist_unique_rebuilt_after_v3(self):
+        # v3까지 적용된 DB: ALTER TABLE로 추가된 module/part 컬럼, item_name UNIQUE 유지
+        conn = sqlite3.connect(self.db_path)
+        self.create_legacy_checklist(conn)
+        SCHEMA_MIGRATIONS.migrations[0].apply(conn)
+        conn.execute("INSERT INTO Default_DB_Values (equipment_type_id, parameter_name, default_value, module, "
+                     "part, item_type) VALUES (1, 'Gain', '1.0', 'Dsp', 'Xy', 'double')")
+        for migration in SCHEMA_MIGRATIONS.migrations[1:3]:
+            migration.apply(conn)
+            record_version(conn, 'app.schema', migration.version, migration.name)
+        record_version(conn, 'app.schema', 1, SCHEMA_MIGRATIONS.migrations[0].name)
+        conn.commit()
+        self.assertIn(('item_name',), unique_constraints(conn, 'QC_Checklist_Items'))
+        conn.close()
+
+        schema = self.open_schema()
+        self.assertEqual([m.version for m in schema.applied_migrations], [4])
+        self.assert_checklist_rebuilt(schema)
+
+    def test_failed_step_is_rolled_back_and_retried(self):
+        calls = []
+
+        def create(conn):
+            conn.execute("CREATE TABLE T (id INTEGER)")
+
+        def broken(conn):
+            calls.append(1)
+            conn.execute("INSERT INTO T VALUES (1)")
+            raise RuntimeError("boom")
+
+        conn = sqlite3.connect(self.db_path)
+        self.addCleanup(conn.close)
+        runner = MigrationRunner('test', [Migration(1, 'create', create), Migration(2, 'broken', broken)])
+        with self.assertRaises(MigrationError) as ctx:
+            runner.run(conn)
+        self.assertEqual(ctx.exception.migration.version, 2)
+        self.assertEqual(get_version(conn, 'test'), 1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM T").fetchone()[0], 0)
+
+        fixed = MigrationRunner('test', [Migration(1, 'create', create), Migration(2, 'fixed', lambda c: None)])
+        self.assertEqual([m.name for m in fixed.run(conn)], ['fixed'])
+        self.assertEqual(len(calls), 1)
+
+    def test_versions_must_be_contiguous(self):
+        with self.assertRaises(ValueError):
+            MigrationRunner('test', [Migration(2, 'skip', lambda conn: None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
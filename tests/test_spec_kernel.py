@@ -0,0 +1,81 @@
+"""
+Spec 평가 커널 테스트 (스칼라 검증 경로와 결과 비교)
+"""
+
+import math
+import os
+import random
+import sys
+import unittest
+
+import numpy as np
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.spec_kernel import SpecKernel, evaluate_ranges, normalize_range
+from app.qc.core.inspection_engine import InspectionEngine
+from app.qc.core.models import ChecklistItem
+from app.services.qc_validator import QCValidator
+
+SPEC_VALUES = [None, '', '0', '1', '-2.5', '1e3', 'abc', ' 3 ', 0, 1.5]
+EXPECTED_VALUES = [None, '', 'Pass', 'on', '["Auto", "Manual"]', '[1, 2]', '5', '{"a": 1}', '[']
+FILE_VALUES = ['0', '1', '-3', '2.5', '1000', '1e4', 'abc', '', None, 'Pass', 'PASS', 'Auto', '1', 1, 2.0,
+               float('nan'), 'nan', 'inf', '-inf', ' 7 ', True, 'ON', 'Manual']
+
+
+def make_item(item_id, spec_min, spec_max, expected_value):
+    return ChecklistItem(id=item_id, item_name=f'Item{item_id}', module=None, part=None,
+                         spec_min=spec_min, spec_max=spec_max, expected_value=expected_value,
+                         category=None, description=None, is_active=True)
+
+
+class TestSpecKernel(unittest.TestCase):
+    """SpecKernel / evaluate_ranges 테스트"""
+
+    def test_matches_validate_item(self):
+        items = [make_item(i, spec_min, spec_max, expected)
+                 for i, (spec_min, spec_max, expected) in enumerate(
+                     (a, b, c) for a in SPEC_VALUES for b in SPEC_VALUES for c in EXPECTED_VALUES)]
+        kernel = SpecKernel(items)
+
+        rng = random.Random(0)
+        positions = [rng.randrange(len(items)) for _ in range(5000)]
+        values = [rng.choice(FILE_VALUES) for _ in positions]
+        passed, _ = kernel.evaluate(positions, values)
+
+        for row, (pos, value) in enumerate(zip(positions, values)):
+            self.assertEqual(bool(passed[row]), InspectionEngine.validate_item(items[pos], value),
+                             (items[pos], value))
+
+    def test_deviation(self):
+        numbers = np.array([0.5, 1.0, 2.5, -1.0, np.nan])
+        passed, deviation = evaluate_ranges(numbers, np.full(5, 0.0), np.full(5, 2.0))
+        self.assertEqual(passed.tolist(), [True, True, False, False, False])
+        self.assertEqual(deviation[:4].tolist(), [0.0, 0.0, 0.5, 1.0])
+        self.assertTrue(math.isnan(deviation[4]))
+
+    def test_normalize_range(self):
+        self.assertEqual(normalize_range('1', None), (1.0, math.inf))
+        self.assertIsNone(normalize_range('1', None, require_both=True))
+        self.assertIsNone(normalize_range('', None))
+        with self.assertRaises(ValueError):
+            normalize_range('x', '1')
+
+    def test_qc_validator_bulk_range_matches_check_value(self):
+        validator = QCValidator(None, None)
+        rng = random.Random(1)
+        specs = [{'check_type': 'range', 'min_spec': a, 'max_spec': b} for a in SPEC_VALUES for b in SPEC_VALUES]
+        specs += [{'min_spec': '0', 'max_spec': '10'}, {'check_type': 'exact', 'expected_value': 'on'}]
+        entries = [(f'P{i}', rng.choice(FILE_VALUES), rng.choice(specs)) for i in range(3000)]
+
+        # 일괄 판정에서 통과한 항목은 check_value도 통과 (나머지는 check_value로 다시 판정)
+        range_passed = validator.evaluate_range_entries(entries)
+        self.assertTrue(range_passed)
+        for row in range_passed:
+            _, value, spec = entries[row]
+            self.assertEqual(validator.check_value(value, spec), (True, 'OK'), (value, spec))
+
+
+if __name__ == '__main__':
+    unittest.main()
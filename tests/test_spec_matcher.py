@@ -0,0 +1,56 @@
+"""
+SpecMatcher ItemName 인덱스 테스트
+"""
+
+import os
+import sys
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.qc.core.models import ChecklistItem
+from app.qc.core.spec_matcher import SpecMatcher, IndexedFileData
+
+
+def make_item(item_id, item_name, module=None, part=None):
+    return ChecklistItem(id=item_id, item_name=item_name, module=module, part=part,
+                         spec_min=None, spec_max=None, expected_value=None,
+                         category=None, description=None, is_active=True)
+
+
+class TestSpecMatcherIndex(unittest.TestCase):
+    """SpecMatcher 매칭 테스트"""
+
+    def test_exact_key_before_type_common(self):
+        file_data = {('Dsp', 'XScanner', 'Gain'): '1.0', 'Offset': '0.5'}
+        items = [make_item(1, 'Gain', 'Dsp', 'XScanner'), make_item(2, 'Offset'), make_item(3, 'Missing')]
+        matched = SpecMatcher.match(items, file_data)
+        self.assertEqual([(item.id, key, value) for item, key, value in matched],
+                         [(1, ('Dsp', 'XScanner', 'Gain'), '1.0'), (2, (None, None, 'Offset'), '0.5')])
+
+    def test_type_common_tie_break_ignores_file_order(self):
+        keys = [('Dsp', 'YScanner', 'Gain'), ('Dsp', 'XScanner', 'Gain'), ('Afm', 'Head', 'Gain')]
+        item = make_item(1, 'Gain')
+        for order in (keys, list(reversed(keys))):
+            file_data = {key: key[0] + key[1] for key in order}
+            _, file_key, value = SpecMatcher.match([item], file_data)[0]
+            self.assertEqual(file_key, ('Afm', 'Head', 'Gain'))
+            self.assertEqual(value, 'AfmHead')
+
+    def test_indexed_file_data_reused_across_checklists(self):
+        file_data = {('M', f'P{i}', f'Item{i}'): str(i) for i in range(1000)}
+        indexed = SpecMatcher.index_file_data(file_data)
+        self.assertIsInstance(indexed, IndexedFileData)
+        self.assertIs(SpecMatcher.index_file_data(indexed), indexed)
+        self.assertEqual(len(indexed), 1000)
+
+        first = SpecMatcher.match([make_item(i, f'Item{i}') for i in range(0, 1000, 2)], indexed)
+        second = SpecMatcher.match([make_item(i, f'Item{i}') for i in range(1, 1000, 2)], indexed)
+        self.assertEqual(len(first), 500)
+        self.assertEqual(len(second), 500)
+        self.assertEqual(second[0][1:], (('M', 'P1', 'Item1'), '1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
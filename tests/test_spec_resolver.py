@@ -0,0 +1,102 @@
+"""
+QCValidator SpecResolver 테스트
+"""
+
+import os
+import re
+import sys
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.services.qc_validator import QCValidator, SpecResolver
+
+
+def reference_find_spec(item_name, master_specs, overrides):
+    """기존 find_spec 구현 (비교용)"""
+    if item_name in overrides:
+        override = overrides[item_name]
+        if override.get('is_excluded'):
+            return override
+        if item_name in master_specs:
+            spec = master_specs[item_name].copy()
+            if override.get('override_min_spec') is not None:
+                spec['min_spec'] = override['override_min_spec']
+            if override.get('override_max_spec') is not None:
+                spec['max_spec'] = override['override_max_spec']
+            if override.get('override_expected_value') is not None:
+                spec['expected_value'] = override['override_expected_value']
+            spec['is_override'] = True
+            return spec
+    if item_name in master_specs:
+        return master_specs[item_name].copy()
+    for spec_name, spec in master_specs.items():
+        if '*' in spec_name or '?' in spec_name:
+            pattern = '^' + spec_name.replace('.', r'\.').replace('*', '.*').replace('?', '.') + '$'
+            if re.match(pattern, item_name):
+                spec_copy = spec.copy()
+                spec_copy['matched_by_pattern'] = True
+                return spec_copy
+    return None
+
+
+MASTER_SPECS = {
+    'Temp.Chamber.Set': {'min_spec': '20', 'max_spec': '25', 'category': 'Temp'},
+    'Temp.Chamber.*': {'min_spec': '0', 'max_spec': '50', 'category': 'Temp'},
+    'Temp.*': {'min_spec': '-10', 'max_spec': '100', 'category': 'Temp'},
+    'Fan?.Speed': {'min_spec': '100', 'max_spec': '200', 'category': 'Fan'},
+    'Te*.Limit': {'min_spec': '1', 'max_spec': '2', 'category': 'Limit'},
+    'Laser.Power': {'min_spec': '1', 'max_spec': '5', 'category': 'Safety'},
+    'Stage.*': {'check_type': 'exact', 'expected_value': 'OK', 'category': 'Stage'},
+}
+
+OVERRIDES = {
+    'Laser.Power': {'override_max_spec': '4'},
+    'Stage.Z': {'is_excluded': True, 'reason': 'Not installed'},
+    'Temp.Unknown': {'override_min_spec': '0'},
+}
+
+
+class TestSpecResolver(unittest.TestCase):
+    """SpecResolver 테스트"""
+
+    def test_matches_reference_find_spec(self):
+        resolver = SpecResolver(MASTER_SPECS, OVERRIDES)
+        names = ['Temp.Chamber.Set', 'Temp.Chamber.Real', 'Temp.Limit', 'Temp.Unknown', 'Temp',
+                 'Tex.Limit', 'Fan1.Speed', 'Fan12.Speed', 'Laser.Power', 'Stage.Z', 'Stage.X',
+                 'Other', '']
+        for name in names:
+            with self.subTest(name=name):
+                self.assertEqual(resolver.resolve(name), reference_find_spec(name, MASTER_SPECS, OVERRIDES))
+
+    def test_lookups_share_spec_objects(self):
+        resolver = SpecResolver(MASTER_SPECS, OVERRIDES)
+        self.assertIs(resolver.resolve('Temp.A'), resolver.resolve('Temp.B'))
+        self.assertIs(resolver.resolve('Laser.Power'), resolver.resolve('Laser.Power'))
+        self.assertNotIn('is_override', MASTER_SPECS['Laser.Power'])
+
+    def test_validator_reuses_resolver(self):
+        validator = QCValidator(None, None)
+        spec = validator.find_spec('Laser.Power', MASTER_SPECS, OVERRIDES)
+        self.assertEqual(spec['max_spec'], '4')
+        resolver = validator.get_spec_resolver(MASTER_SPECS, OVERRIDES)
+        self.assertIs(validator.get_spec_resolver(MASTER_SPECS, OVERRIDES), resolver)
+        self.assertIsNot(validator.get_spec_resolver(MASTER_SPECS, {}), resolver)
+
+    def test_type_common_validation_reuses_resolver(self):
+        class SpecService:
+            def get_master_specs(self):
+                return MASTER_SPECS
+
+        validator = QCValidator(None, SpecService())
+        validator.validate_parameters({'Laser.Power': '3'})
+        resolver = validator._resolver
+        validator.validate_parameters({'Temp.A': '1'})
+        self.assertIs(validator._resolver, resolver)
+        # 호출자가 넘긴 빈 dict도 같은 resolver 사용
+        self.assertIs(validator.get_spec_resolver(MASTER_SPECS, {}), resolver)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+시작 파이프라인 테스트 (단계별 시간 기록, 지연 import, 지연 탭)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.startup import StartupTimer, LazyTabs
+
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'concurrent.futures.process']
+
+
+class TestStartupTimer(unittest.TestCase):
+    """StartupTimer 테스트"""
+
+    def test_phases_and_ready(self):
+        timer = StartupTimer(time.perf_counter() - 0.5)
+        with timer.phase('imports'):
+            pass
+        with self.assertRaises(RuntimeError):
+            with timer.phase('window'):
+                raise RuntimeError()
+        ready = timer.mark_ready()
+        self.assertGreaterEqual(ready, 0.5)
+        self.assertEqual(timer.mark_ready(), ready)
+        self.assertEqual([p['name'] for p in timer.to_dict()['phases']], ['imports', 'window'])
+        self.assertIn('imports', timer.summary())
+
+
+class TestLazyImports(unittest.TestCase):
+    """app.manager import 시 무거운 모듈을 불러오지 않는지 확인 (새 프로세스)"""
+
+    def test_manager_import_skips_heavy_modules(self):
+        code = (
+            "import sys, json; sys.path.insert(0, {src!r}); import app.manager; "
+            "print(json.dumps([m for m in {mods!r} if m in sys.modules]))"
+        ).format(src=os.path.join(project_root, 'src'), mods=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                check=True, cwd=project_root).stdout
+        self.assertEqual(json.loads(output.strip().splitlines()[-1]), [])
+
+
+class TestLazyTabs(unittest.TestCase):
+    """LazyTabs 테스트 (디스플레이가 없으면 건너뜀)"""
+
+    def setUp(self):
+        import tkinter as tk
+        from tkinter import ttk
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("디스플레이 없음")
+        self.root.withdraw()
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack()
+        self.notebook.add(ttk.Frame(self.notebook), text="first")
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_built_on_first_selection(self):
+        built = []
+        tabs = LazyTabs(self.notebook)
+        frame = tabs.add("lazy", built.append)
+        self.root.update()
+        self.assertEqual(built, [])
+        self.notebook.select(frame)
+        self.root.update()
+        self.notebook.select(0)
+        self.notebook.select(frame)
+        self.root.update()
+        self.assertEqual(built, [frame])
+        self.assertTrue(tabs.is_built(frame))
+
+
+if __name__ == '__main__':
+    unittest.main()
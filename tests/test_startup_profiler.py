@@ -0,0 +1,161 @@
+"""
+시작 프로파일러 테스트 (활성화 설정, 중첩 단계, import 기록, 시작 시간 예산)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.startup_profiler import (DEFAULT_REPORT_PATH, PROFILE_ENV, ImportProfiler, StartupTimer,
+                                  get_profile_path, profiled, set_active_timer)
+
+# 시작 시간 예산 (초) - CI 머신 편차를 고려한 상한
+STARTUP_BUDGET_SECONDS = 1.5
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+class TestProfilePath(unittest.TestCase):
+    """프로파일링 활성화 설정 테스트"""
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_profile_path([], {}))
+        self.assertIsNone(get_profile_path([], {PROFILE_ENV: '0'}))
+
+    def test_env_and_flag(self):
+        self.assertEqual(get_profile_path([], {PROFILE_ENV: '1'}), DEFAULT_REPORT_PATH)
+        self.assertEqual(get_profile_path([], {PROFILE_ENV: '/tmp/p.json'}), '/tmp/p.json')
+        self.assertEqual(get_profile_path(['--profile-startup'], {}), DEFAULT_REPORT_PATH)
+        self.assertEqual(get_profile_path(['--profile-startup=/tmp/q.json'], {PROFILE_ENV: '0'}), '/tmp/q.json')
+
+
+class TestStartupTimerReport(unittest.TestCase):
+    """중첩 단계 기록 및 보고서 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        set_active_timer(None)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_nested_spans_and_folded_output(self):
+        calls = []
+
+        @profiled('work')
+        def work():
+            calls.append(1)
+
+        work()  # 활성 타이머 없음 → 기록 안 함
+        path = os.path.join(self.temp_dir, 'profile.json')
+        timer = StartupTimer(report_path=path)
+        set_active_timer(timer)
+        with timer.phase('database'):
+            work()
+        self.assertEqual(timer.finish(), path)
+        work()  # finish() 후 비활성
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual([p[0] for p in timer.phases], ['database'])
+        self.assertEqual([s['path'] for s in timer.spans], ['database/work', 'database'])
+
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual([s['path'] for s in report['spans']], ['database', 'database/work'])
+        self.assertIsNotNone(report['ready_seconds'])
+        with open(os.path.splitext(path)[0] + '.folded', encoding='utf-8') as f:
+            stacks = [line.rsplit(' ', 1)[0] for line in f.read().splitlines()]
+        self.assertIn('startup;database;work', stacks)
+        self.assertIn('startup;database', stacks)
+
+    def test_import_profiler_records_module(self):
+        package_dir = os.path.join(self.temp_dir, 'profiled_pkg')
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, '__init__.py'), 'w') as f:
+            f.write("from . import child\n")
+        with open(os.path.join(package_dir, 'child.py'), 'w') as f:
+            f.write("VALUE = 1\n")
+
+        sys.path.insert(0, self.temp_dir)
+        profiler = ImportProfiler(lambda: ('imports',))
+        profiler.install()
+        try:
+            import profiled_pkg
+        finally:
+            profiler.uninstall()
+            sys.path.remove(self.temp_dir)
+            sys.modules.pop('profiled_pkg.child', None)
+            sys.modules.pop('profiled_pkg', None)
+
+        records = {r['module']: r for r in profiler.records}
+        self.assertEqual(records['profiled_pkg.child']['stack'], ['profiled_pkg', 'profiled_pkg.child'])
+        self.assertEqual(records['profiled_pkg']['depth'], 0)
+        self.assertEqual(records['profiled_pkg']['phase'], ['imports'])
+        self.assertGreaterEqual(records['profiled_pkg']['cumulative_seconds'],
+                                records['profiled_pkg.child']['cumulative_seconds'])
+        # 원래 loader로 복원
+        self.assertNotIn('_TimingLoader', type(profiled_pkg.__loader__).__name__)
+        self.assertEqual(profiled_pkg.child.VALUE, 1)
+
+
+class TestStartupBudget(unittest.TestCase):
+    """GUI를 제외한 시작 경로(import → DB 스키마 → 서비스)의 시간 예산 (새 프로세스)"""
+
+    SCRIPT = """
+import os, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {src!r})
+from app.startup_profiler import StartupTimer, get_profile_path, set_active_timer
+timer = StartupTimer(started, report_path=get_profile_path())
+timer.start_import_profiling()
+set_active_timer(timer)
+with timer.phase('imports'):
+    import app.manager
+with timer.phase('database'):
+    from app.schema import DBSchema
+    schema = DBSchema({db!r})
+with timer.phase('services'):
+    from app.services import ServiceFactory
+    factory = ServiceFactory(schema)
+timer.finish()
+"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_startup_within_budget(self):
+        report_path = os.path.join(self.temp_dir, 'startup_profile.json')
+        script = self.SCRIPT.format(src=os.path.join(project_root, 'src'),
+                                    db=os.path.join(self.temp_dir, 'budget.db'))
+        env = dict(os.environ, **{PROFILE_ENV: report_path})
+        subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                       check=True, cwd=self.temp_dir, env=env)
+
+        with open(report_path, encoding='utf-8') as f:
+            report = json.load(f)
+        phases = {p['name']: p['seconds'] for p in report['phases']}
+        self.assertEqual(list(phases), ['imports', 'database', 'services'])
+        self.assertIn('database/DBSchema.create_tables', [s['path'] for s in report['spans']])
+        self.assertTrue(os.path.exists(os.path.splitext(report_path)[0] + '.folded'))
+
+        imported = {r['module'] for r in report['imports']}
+        self.assertIn('app.manager', imported)
+        self.assertNotIn('pandas', imported)
+
+        self.assertLess(phases['imports'], IMPORT_BUDGET_SECONDS,
+                        f"import 시간 예산 초과: {report['imports'][:5]}")
+        self.assertLess(report['ready_seconds'], STARTUP_BUDGET_SECONDS,
+                        f"시작 시간 예산 초과: {report['phases']}")
+
+
+if __name__ == '__main__':
+    unittest.main()
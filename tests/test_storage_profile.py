@@ -0,0 +1,90 @@
+"""
+SQLite 저장소 프로필 테스트
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.schema import DBSchema
+from db_schema import DBSchema as LegacyDBSchema
+from app.storage_profile import STORAGE_PROFILES, configured_storage_profile, resolve_storage_profile
+
+
+class TestStorageProfile(unittest.TestCase):
+    """DBSchema 저장소 프로필 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_schema(self, profile):
+        db_schema = DBSchema(self.db_path, storage_profile=profile)
+        self.addCleanup(db_schema.close)
+        return db_schema
+
+    def test_profiles_applied(self):
+        expected = {'safe': 'FULL', 'fast': 'NORMAL', 'bulk-import': 'OFF'}
+        for profile, synchronous in expected.items():
+            with self.subTest(profile=profile):
+                info = self.make_schema(profile).get_storage_info()
+                self.assertEqual(info['profile'], profile)
+                self.assertEqual(info['journal_mode'], 'WAL')
+                self.assertEqual(info['synchronous'], synchronous)
+        self.assertEqual(set(STORAGE_PROFILES), set(expected))
+
+    def test_unknown_profile_falls_back(self):
+        self.assertEqual(resolve_storage_profile(None), 'safe')
+        self.assertEqual(self.make_schema('turbo').storage_profile, 'safe')
+
+    def test_configured_profile_used_by_default(self):
+        settings_path = os.path.join(self.temp_dir, 'settings.json')
+        with open(settings_path, 'w', encoding='utf-8') as f:
+            json.dump({'service_config': {'database': {'storage_profile': 'bulk-import'}}}, f)
+        self.assertEqual(configured_storage_profile(settings_path), 'bulk-import')
+        self.assertEqual(configured_storage_profile(os.path.join(self.temp_dir, 'none.json')), 'safe')
+
+        # 프로필을 지정하지 않은 보조 인스턴스도 settings.json 프로필 사용
+        for schema_class in (DBSchema, LegacyDBSchema):
+            with self.subTest(schema=schema_class.__module__):
+                db_schema = schema_class(os.path.join(self.temp_dir, f'{schema_class.__module__}.sqlite'))
+                self.addCleanup(db_schema.close)
+                self.assertEqual(db_schema.storage_profile, configured_storage_profile())
+
+    def test_reader_does_not_block_writer(self):
+        db_schema = self.make_schema('fast')
+        reader = sqlite3.connect(self.db_path, timeout=0)
+        try:
+            reader.execute('BEGIN')
+            reader.execute('SELECT COUNT(*) FROM Equipment_Types').fetchone()
+            # 읽기 트랜잭션이 열려 있어도 쓰기 커밋 가능 (WAL)
+            with db_schema.get_connection() as conn:
+                conn.execute("INSERT INTO Equipment_Types (type_name) VALUES ('Dsp')")
+                conn.commit()
+            self.assertEqual(reader.execute('SELECT COUNT(*) FROM Equipment_Types').fetchone()[0], 0)
+        finally:
+            reader.close()
+        self.assertEqual(len(db_schema.get_equipment_types()), 1)
+
+    def test_maintenance_checkpoint(self):
+        db_schema = self.make_schema('fast')
+        busy, _, _ = db_schema.run_maintenance()
+        self.assertEqual(busy, 0)
+        db_schema.close()
+        # 종료 시 TRUNCATE 체크포인트로 WAL 파일 비움
+        wal_path = self.db_path + '-wal'
+        self.assertTrue(not os.path.exists(wal_path) or os.path.getsize(wal_path) == 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+가상 트리뷰 데이터 모델 테스트
+"""
+
+import os
+import sys
+import unittest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.widgets import VirtualRowModel
+
+
+class TestVirtualRowModel(unittest.TestCase):
+    """VirtualRowModel 테스트"""
+
+    def setUp(self):
+        self.model = VirtualRowModel()
+        self.module = self.model.add('', text='Dsp', open=True)
+        self.part = self.model.add(self.module, text='XScanner', open=True)
+        self.items = [
+            self.model.add(self.part, text=name, values=(value,))
+            for name, value in (('Gain', '10'), ('Offset', '2'), ('Mode', 'auto'))
+        ]
+        self.other = self.model.add('', text='Stage', open=False)
+        self.model.add(self.other, text='Speed', values=('5',))
+
+    def texts(self, iids):
+        return [self.model.rows[iid]['text'] for iid in iids]
+
+    def test_visible_skips_closed_children(self):
+        self.assertEqual(self.texts(self.model.visible()),
+                         ['Dsp', 'XScanner', 'Gain', 'Offset', 'Mode', 'Stage'])
+
+        self.model.update(self.other, open=True)
+        self.assertEqual(self.texts(self.model.visible())[-1], 'Speed')
+
+    def test_sort_is_numeric_aware_and_kept_for_new_rows(self):
+        self.model.set_sort('value', 0)
+        self.assertEqual(self.texts(self.model.shown_children(self.part)), ['Offset', 'Gain', 'Mode'])
+
+        self.model.add(self.part, text='Bias', values=('1',))
+        self.assertEqual(self.texts(self.model.shown_children(self.part))[0], 'Bias')
+
+        self.model.set_sort('value', 0, reverse=True)
+        self.assertEqual(self.texts(self.model.shown_children(self.part))[0], 'Mode')
+
+    def test_filter_keeps_matching_ancestors(self):
+        self.model.set_filter(lambda row: row['text'].startswith('O'))
+        self.assertEqual(self.texts(self.model.visible()), ['Dsp', 'XScanner', 'Offset'])
+        self.assertEqual(self.model.count_visible(), 3)
+
+        self.model.set_filter(None)
+        self.assertEqual(self.model.count_visible(), 6)
+
+    def test_index_and_ancestors(self):
+        offset_id = self.items[1]
+        self.assertEqual(self.model.index_of(offset_id), 3)
+        self.assertEqual(self.model.ancestors(offset_id), [self.part, self.module])
+
+    def test_remove_subtree(self):
+        removed = self.model.remove([self.part])
+        self.assertEqual(len(removed), 4)
+        self.assertEqual(self.texts(self.model.visible()), ['Dsp', 'Stage'])
+
+    def test_window_of_large_flat_model(self):
+        model = VirtualRowModel()
+        for i in range(100000):
+            model.add('', values=(str(i),))
+        visible = model.visible()
+        self.assertEqual(len(visible), 100000)
+        self.assertEqual(model.rows[visible[50000]]['values'], ('50000',))
+        self.assertEqual(model.index_of(visible[99999]), 99999)
+
+
+if __name__ == '__main__':
+    unittest.main()
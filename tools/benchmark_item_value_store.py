@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+항목 값 저장소 벤치마크
+
+커스텀 QC 검수의 값 조회를 기존 DataFrame 마스크 조회와 ItemValueStore 키 조회로 비교합니다.
+마스크 조회는 매우 느리므로 --sample 건만 측정해 전체 조회 수로 환산합니다.
+
+사용법:
+    python tools/benchmark_item_value_store.py [--files 50] [--items 4000] [--sample 200]
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import pandas as pd
+
+from app.comparison_dataset import categorize_columns
+from app.item_value_store import ItemValueStore
+from app.qc_incremental import IncrementalQCInspector
+
+
+def build_frame(files, items, rng):
+    """파일별 항목 값 (약 5% 누락, ItemName은 파트 간 중복)"""
+    rows = []
+    for model in files:
+        for i in range(items):
+            if rng.random() < 0.05:
+                continue
+            rows.append({'Model': model, 'Module': f'M{i % 3}', 'Part': f'P{i % 7}',
+                         'ItemName': f'Item{i % (items // 2)}', 'ItemValue': f'{rng.uniform(0, 10):.3f}'})
+    return categorize_columns(pd.DataFrame(rows))
+
+
+def mask_lookup(df, file_name, item_name):
+    """기존 run_custom_qc_inspection의 DataFrame 마스크 조회"""
+    matching_rows = df[(df['ItemName'] == item_name) & (df['Model'] == file_name)]
+    if matching_rows.empty:
+        return None
+    return matching_rows.iloc[0]['ItemValue']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='항목 값 저장소 벤치마크')
+    parser.add_argument('--files', type=int, default=50, help='파일 수')
+    parser.add_argument('--items', type=int, default=4000, help='파일당 항목 수')
+    parser.add_argument('--sample', type=int, default=200, help='측정할 마스크 조회 수')
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    files = [f'File{i}' for i in range(args.files)]
+    df = build_frame(files, args.items, rng)
+    specs = [{'item_name': f'Item{i}', 'min_spec': 1.0, 'max_spec': 9.0, 'enabled': True}
+             for i in range(0, args.items // 2, 4)]
+    lookups = [(model, spec['item_name']) for spec in specs for model in files]
+
+    start = time.perf_counter()
+    store = ItemValueStore.from_frame(df)
+    inspector = IncrementalQCInspector('Dsp')
+    inspector.update(specs, files, store.get, store.file_tokens)
+    store_time = time.perf_counter() - start
+
+    sample = rng.sample(lookups, min(args.sample, len(lookups)))
+    start = time.perf_counter()
+    mask_results = [mask_lookup(df, model, item_name) for model, item_name in sample]
+    mask_time = (time.perf_counter() - start) / len(sample) * len(lookups)
+    matches = mask_results == [store.get(model, item_name) for model, item_name in sample]
+
+    print(f">> 파일 {args.files}개 x Spec {len(specs)}개 = 조회 {len(lookups)}건 (검수 행 {len(inspector.rows)}개)")
+    print(f"  - DataFrame 마스크 조회 (환산): {mask_time * 1000:.1f} ms")
+    print(f"  - ItemValueStore 생성 + 검수:   {store_time * 1000:.1f} ms")
+    print(f"  - 속도 향상: {mask_time / store_time:.1f}x")
+    print(f"  - 결과 일치: {'✅' if matches else '❌'}")
+
+    return 0 if matches else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Spec 평가 커널 벤치마크
+
+InspectionEngine.validate_item() 스칼라 경로와 SpecKernel 일괄 평가를 비교합니다.
+
+사용법:
+    python tools/benchmark_spec_kernel.py [--items 5000] [--files 50] [--repeat 3]
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+# Windows 콘솔 인코딩 문제 해결
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 경로 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(current_dir)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from app.spec_kernel import SpecKernel
+from app.qc.core.inspection_engine import InspectionEngine
+from app.qc.core.models import ChecklistItem
+
+
+def build_items(count, rng):
+    """범위 80% / Enum 10% / Exact 10% 구성의 Check list 항목"""
+    items = []
+    for i in range(count):
+        kind = rng.random()
+        spec_min = spec_max = expected = None
+        if kind < 0.8:
+            low = rng.uniform(-100, 100)
+            spec_min, spec_max = f'{low:.3f}', f'{low + rng.uniform(1, 50):.3f}'
+        elif kind < 0.9:
+            expected = '["Auto", "Manual", "Off"]'
+        else:
+            expected = 'Pass'
+        items.append(ChecklistItem(id=i, item_name=f'Item{i}', module=None, part=None,
+                                   spec_min=spec_min, spec_max=spec_max, expected_value=expected,
+                                   category=None, description=None, is_active=True))
+    return items
+
+
+def build_values(items, rng):
+    """파일 한 개 분량의 값 (숫자 문자열 위주, 일부 비정상 값 포함)"""
+    values = []
+    for item in items:
+        if item.spec_min:
+            values.append('N/A' if rng.random() < 0.01 else f'{rng.uniform(-120, 150):.4f}')
+        else:
+            values.append(rng.choice(['Auto', 'Manual', 'pass', 'Fail']))
+    return values
+
+
+def measure(func, repeat):
+    """최소 실행 시간 (초)"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Spec 평가 커널 벤치마크')
+    parser.add_argument('--items', type=int, default=5000, help='Check list 항목 수')
+    parser.add_argument('--files', type=int, default=50, help='검수 파일 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소값 사용)')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    items = build_items(args.items, rng)
+    files = [build_values(items, rng) for _ in range(args.files)]
+    positions = list(range(len(items)))
+
+    def scalar():
+        return [[InspectionEngine.validate_item(item, value) for item, value in zip(items, values)]
+                for values in files]
+
+    def vectorized():
+        kernel = SpecKernel(items)
+        return [kernel.evaluate(positions, values)[0].tolist() for values in files]
+
+    scalar_result, scalar_time = measure(scalar, args.repeat)
+    kernel_result, kernel_time = measure(vectorized, args.repeat)
+
+    evaluations = args.items * args.files
+    print(f">> 항목 {args.items}개 x 파일 {args.files}개 = {evaluations}건")
+    print(f"  - 스칼라 경로 (validate_item): {scalar_time * 1000:.1f} ms")
+    print(f"  - SpecKernel 일괄 평가:        {kernel_time * 1000:.1f} ms")
+    print(f"  - 속도 향상: {scalar_time / kernel_time:.1f}x")
+    print(f"  - 결과 일치: {'✅' if scalar_result == kernel_result else '❌'}")
+
+    return 0 if scalar_result == kernel_result else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
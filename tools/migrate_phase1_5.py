@@ -24,6 +24,13 @@ import json
 from datetime import datetime
 from contextlib import contextmanager
 
+from app.schema_migrations import get_version, record_version
+
+# schema_version 기록 (구성요소, 버전, 이름) - 이미 적용된 DB에서는 다시 실행하지 않음
+MIGRATION_COMPONENT = 'phase1_5'
+MIGRATION_VERSION = 1
+MIGRATION_NAME = 'equipment_hierarchy'
+
 
 class Phase15Migration:
     """Phase 1.5 마이그레이션 클래스"""
@@ -631,6 +638,12 @@ class Phase15Migration:
         if dry_run:
             print("\n[DRY RUN] 실제 변경은 수행되지 않습니다.\n")
 
+        if os.path.exists(self.db_path):
+            with self.get_connection() as conn:
+                if get_version(conn, MIGRATION_COMPONENT) >= MIGRATION_VERSION:
+                    print("[OK] 이미 적용된 마이그레이션입니다 (schema_version). 스킵.")
+                    return True
+
         # 1. 백업
         if not self.backup_database():
             print("[ERROR] 백업 실패. 마이그레이션 중단.")
@@ -657,6 +670,7 @@ class Phase15Migration:
                     print("\n[WARN]  DRY RUN 모드: 변경사항 롤백")
                     conn.rollback()
                 else:
+                    record_version(conn, MIGRATION_COMPONENT, MIGRATION_VERSION, MIGRATION_NAME)
                     print("\n[OK] 모든 마이그레이션 완료")
                     conn.commit()
 
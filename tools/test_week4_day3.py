@@ -38,7 +38,7 @@ def test_1_parse_equipment_file():
             test_db_path = os.path.join(temp_dir, "test.sqlite")
             db_schema = DBSchema(test_db_path)
 
-            service = ShippedEquipmentService(db_schema)
+            service = ShippedEquipmentService(db_schema, parse_cache=False)
 
             # 파일 파싱
             start_time = time.time()
@@ -122,7 +122,7 @@ def test_2_match_configuration():
             return True  # Skip은 PASS로 처리
 
         db_schema = DBSchema(str(db_path))
-        service = ShippedEquipmentService(db_schema)
+        service = ShippedEquipmentService(db_schema, parse_cache=False)
 
         # Model 이름 기반 Configuration 매칭
         model_name = "NX-Hybrid WLI"
@@ -188,7 +188,7 @@ def test_3_import_from_file():
 
                 conn.commit()
 
-            service = ShippedEquipmentService(db_schema)
+            service = ShippedEquipmentService(db_schema, parse_cache=False)
 
             # Import from file (auto-matching)
             print(f"\n   Importing file: {TEST_FILE.name}")
@@ -285,7 +285,7 @@ def test_4_refit_order():
 
                 conn.commit()
 
-            service = ShippedEquipmentService(db_schema)
+            service = ShippedEquipmentService(db_schema, parse_cache=False)
 
             # 1. 원본 장비 생성
             original_id = service.create_shipped_equipment(
@@ -355,7 +355,7 @@ def test_5_performance():
             test_db_path = os.path.join(temp_dir, "test.sqlite")
             db_schema = DBSchema(test_db_path)
 
-            service = ShippedEquipmentService(db_schema)
+            service = ShippedEquipmentService(db_schema, parse_cache=False)
 
             # 1. 파일 파싱 성능
             start_time = time.time()